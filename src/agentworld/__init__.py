@@ -1,11 +1,26 @@
 """AgentWorld - A multi-agent simulation framework."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from agentworld.core.models import Message, SimulationConfig, SimulationStatus
-from agentworld.personas.traits import TraitVector
-from agentworld.agents.agent import Agent
-from agentworld.simulation.runner import Simulation
+if TYPE_CHECKING:
+    from agentworld.core.models import Message, SimulationConfig, SimulationStatus
+    from agentworld.personas.traits import TraitVector
+    from agentworld.agents.agent import Agent
+    from agentworld.simulation.runner import Simulation
+
+# Exports are imported on first access so that importing a submodule (e.g.
+# the CLI entry point) does not load the LLM and API stacks.
+_EXPORTS = {
+    "Agent": "agentworld.agents.agent",
+    "Message": "agentworld.core.models",
+    "Simulation": "agentworld.simulation.runner",
+    "SimulationConfig": "agentworld.core.models",
+    "SimulationStatus": "agentworld.core.models",
+    "TraitVector": "agentworld.personas.traits",
+}
 
 __all__ = [
     "Agent",
@@ -16,3 +31,16 @@ __all__ = [
     "TraitVector",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,14 +2,42 @@
 
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from agentworld.core.models import Message, AgentConfig, LLMResponse
 from agentworld.personas.traits import TraitVector
-from agentworld.personas.prompts import generate_system_prompt
-from agentworld.llm.provider import LLMProvider, get_provider
+from agentworld.personas.prompts import cached_system_prompt
 from agentworld.memory.base import Memory, MemoryConfig
 from agentworld.memory.observation import Observation
+from agentworld.memory.store import MemoryStore
+from agentworld.memory.clock import MemoryClock
+
+if TYPE_CHECKING:
+    from agentworld.llm.provider import LLMProvider
+
+
+class _SystemPrompt:
+    """Descriptor that builds an agent's system prompt on first read.
+
+    Explicit prompts are stored as given. Otherwise the prompt is generated
+    from the agent's persona through the shared prompt cache the first time
+    it is needed, so creating many agents formats no strings up front and
+    agents sharing a persona share one prompt. Setting None regenerates it
+    on the next read.
+    """
+
+    def __get__(self, agent: "Agent | None", owner: type | None = None) -> str | None:
+        if agent is None:
+            # Dataclass field default
+            return None
+        prompt = agent.__dict__.get("_system_prompt")
+        if prompt is None:
+            prompt = cached_system_prompt(agent.traits, agent.name, agent.background)
+            agent.__dict__["_system_prompt"] = prompt
+        return prompt
+
+    def __set__(self, agent: "Agent", value: str | None) -> None:
+        agent.__dict__["_system_prompt"] = value
 
 
 @dataclass
@@ -25,37 +53,31 @@ class Agent:
     traits: TraitVector
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
     background: str = ""
-    system_prompt: str | None = None
+    system_prompt: str | None = _SystemPrompt()
     model: str | None = None
     simulation_id: str | None = None
     memory_config: MemoryConfig | None = None
+    memory_store: MemoryStore | None = field(default=None, repr=False)
+    memory_clock: MemoryClock | None = field(default=None, repr=False)
 
     # Runtime state
-    _provider: LLMProvider | None = field(default=None, repr=False)
+    _provider: "LLMProvider | None" = field(default=None, repr=False)
     _memory: Memory | None = field(default=None, repr=False)
     _message_history: list[Message] = field(default_factory=list, repr=False)
     _total_tokens: int = field(default=0, repr=False)
     _total_cost: float = field(default=0.0, repr=False)
 
-    def __post_init__(self) -> None:
-        """Initialize agent after dataclass creation."""
-        # Generate system prompt if not provided
-        if self.system_prompt is None:
-            self.system_prompt = generate_system_prompt(
-                traits=self.traits,
-                name=self.name,
-                background=self.background,
-            )
-
     @property
-    def provider(self) -> LLMProvider:
-        """Get the LLM provider."""
+    def provider(self) -> "LLMProvider":
+        """Get the LLM provider (imported on first use; it loads litellm)."""
         if self._provider is None:
+            from agentworld.llm.provider import get_provider
+
             self._provider = get_provider()
         return self._provider
 
     @provider.setter
-    def provider(self, value: LLMProvider) -> None:
+    def provider(self, value: "LLMProvider") -> None:
         """Set the LLM provider."""
         self._provider = value
 
@@ -64,7 +86,12 @@ class Agent:
         """Get the memory system."""
         if self._memory is None:
             config = self.memory_config or MemoryConfig()
-            self._memory = Memory(config=config, llm_provider=self._provider)
+            self._memory = Memory(
+                config=config,
+                llm_provider=self._provider,
+                store=self.memory_store,
+                clock=self.memory_clock,
+            )
         return self._memory
 
     @memory.setter
@@ -136,12 +163,14 @@ class Agent:
             "total_cost": self._total_cost,
         }
 
-    async def think(self, context: str, step: int = 0) -> str:
+    async def think(self, context: str, step: int = 0, prefix: str | None = None) -> str:
         """Generate a thought based on context.
 
         Args:
             context: Context to think about
             step: Current simulation step
+            prefix: Stable context shared across turns (e.g. the topic
+                header), sent ahead of the context so it can be cached
 
         Returns:
             Generated thought/response
@@ -152,6 +181,7 @@ class Agent:
             system_prompt=self.system_prompt,
             agent_id=self.id,
             step=step,
+            prompt_prefix=prefix,
         )
 
         self._total_tokens += response.tokens_used
@@ -226,6 +256,7 @@ class Agent:
         prompt: str,
         receiver_id: str | None = None,
         step: int = 0,
+        prefix: str | None = None,
     ) -> Message:
         """Generate a new message.
 
@@ -233,11 +264,13 @@ class Agent:
             prompt: Prompt for message generation
             receiver_id: Optional receiver ID
             step: Current simulation step
+            prefix: Stable context shared across turns, sent ahead of the
+                prompt
 
         Returns:
             Generated message
         """
-        content = await self.think(prompt, step=step)
+        content = await self.think(prompt, step=step, prefix=prefix)
 
         message = Message(
             sender_id=self.id,
@@ -1,5 +1,19 @@
 """AgentWorld API package."""
 
-from agentworld.api.app import create_app
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentworld.api.app import create_app
 
 __all__ = ["create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    # The app (and FastAPI with it) is imported on first access, so that
+    # importing a submodule such as agentworld.api.events stays cheap.
+    if name == "create_app":
+        from agentworld.api.app import create_app
+
+        globals()[name] = create_app
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,11 +13,14 @@ from agentworld.persistence.database import init_db
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    from agentworld.api.websocket import manager
+
     # Startup
     init_db()
+    manager.attach()
     yield
     # Shutdown
-    pass
+    manager.detach()
 
 
 def create_app(
@@ -64,6 +67,7 @@ def create_app(
         health,
         evaluation,
         export,
+        topology,
     )
 
     app.include_router(health.router, tags=["Health"])
@@ -73,6 +77,7 @@ def create_app(
     app.include_router(personas.router, prefix="/api/v1", tags=["Personas"])
     app.include_router(evaluation.router, prefix="/api/v1", tags=["Evaluation"])
     app.include_router(export.router, prefix="/api/v1", tags=["Export"])
+    app.include_router(topology.router, prefix="/api/v1", tags=["Topology"])
 
     # Register WebSocket
     from agentworld.api.websocket import register_websocket
@@ -0,0 +1,171 @@
+"""Per-client event delivery for WebSocket broadcasts.
+
+Each connected client gets a ClientChannel: a bounded queue of already
+serialized events and a writer task that sends them. Broadcasting only
+appends the event's JSON text to each client's queue, so a slow client
+never holds up the simulation or other clients.
+
+The writer coalesces whatever is queued, after a short flush interval,
+into one frame: a single event is sent as is, several as a batch
+envelope ``{"type": "batch", "events": [...]}`` spliced from the
+serialized texts. When a client falls ``max_pending`` events behind,
+low-priority events (agent thinking/responded) are shed first, then the
+oldest events; the client is told what it missed with an
+``events.dropped`` event carrying counts per event type.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Callable, Optional
+
+from agentworld.core.events import EventType
+
+logger = logging.getLogger(__name__)
+
+
+# Per ADR-012: a client may fall this many events behind before shedding
+DEFAULT_MAX_PENDING = 1000
+
+# Seconds the writer waits to coalesce events into one frame
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+# Most events sent in one frame
+MAX_BATCH_EVENTS = 200
+
+# Events shed first from a lagging client's queue
+LOW_PRIORITY_EVENTS = frozenset({EventType.AGENT_THINKING, EventType.AGENT_RESPONDED})
+
+
+def batch_frame(texts: list[str]) -> str:
+    """Frame for serialized events: the event itself, or a batch envelope.
+
+    Args:
+        texts: JSON texts of the events, in order
+
+    Returns:
+        Frame text
+    """
+    if len(texts) == 1:
+        return texts[0]
+    return f'{{"type": "{EventType.BATCH}", "events": [{", ".join(texts)}]}}'
+
+
+class ClientChannel:
+    """Bounded, coalescing send queue for one WebSocket client.
+
+    Attributes:
+        websocket: Connection the events are sent to
+        max_pending: Events queued before shedding starts
+        flush_interval: Seconds to wait for more events before a frame
+        closed: Whether the channel stopped sending
+    """
+
+    def __init__(
+        self,
+        websocket: Any,
+        on_error: Optional[Callable[[Any], None]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize the channel (the writer starts with the first event).
+
+        Args:
+            websocket: Connection with an async ``send_text``
+            on_error: Called with the websocket when a send fails
+            max_pending: Events queued before shedding starts
+            flush_interval: Seconds to wait for more events before a frame
+        """
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.closed = False
+        self._on_error = on_error
+        self._pending: deque[tuple[str, str]] = deque()
+        self._dropped: dict[str, int] = {}
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued events."""
+        return len(self._pending)
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        """Events shed since the last frame, by type."""
+        return dict(self._dropped)
+
+    def send(self, event_type: str, text: str) -> None:
+        """Queue a serialized event without waiting for delivery.
+
+        Must be called from the event loop the writer runs on.
+
+        Args:
+            event_type: Type of the event (decides its priority)
+            text: JSON text of the event
+        """
+        if self.closed:
+            return
+        if len(self._pending) >= self.max_pending:
+            if event_type in LOW_PRIORITY_EVENTS:
+                self._drop(event_type)
+                return
+            self._shed()
+        self._pending.append((event_type, text))
+        self._ready.set()
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._write())
+
+    def _drop(self, event_type: str) -> None:
+        self._dropped[event_type] = self._dropped.get(event_type, 0) + 1
+
+    def _shed(self) -> None:
+        """Make room: drop all queued low-priority events, else the oldest."""
+        kept: deque[tuple[str, str]] = deque()
+        for item in self._pending:
+            if item[0] in LOW_PRIORITY_EVENTS:
+                self._drop(item[0])
+            else:
+                kept.append(item)
+        if len(kept) >= self.max_pending:
+            self._drop(kept.popleft()[0])
+        self._pending = kept
+
+    def _next_frame(self) -> str:
+        """Take up to MAX_BATCH_EVENTS queued events as one frame."""
+        texts = []
+        if self._dropped:
+            texts.append(json.dumps({"type": EventType.EVENTS_DROPPED, "dropped": self._dropped}))
+            self._dropped = {}
+        pending = self._pending
+        for _ in range(min(len(pending), MAX_BATCH_EVENTS - len(texts))):
+            texts.append(pending.popleft()[1])
+        return batch_frame(texts)
+
+    async def _write(self) -> None:
+        """Send queued events until closed."""
+        try:
+            while True:
+                if not self._pending:
+                    self._ready.clear()
+                    await self._ready.wait()
+                if self.flush_interval and len(self._pending) < MAX_BATCH_EVENTS:
+                    await asyncio.sleep(self.flush_interval)
+                await self.websocket.send_text(self._next_frame())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug("WebSocket send failed, closing channel", exc_info=True)
+            self.close()
+            if self._on_error is not None:
+                self._on_error(self.websocket)
+
+    def close(self) -> None:
+        """Stop sending and discard queued events."""
+        self.closed = True
+        self._pending.clear()
+        writer, self._writer = self._writer, None
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
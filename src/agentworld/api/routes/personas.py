@@ -7,9 +7,11 @@ from fastapi import APIRouter, HTTPException, Query
 
 from agentworld.persistence.database import init_db
 from agentworld.persistence.repository import Repository
+from agentworld.persistence.search import parse_trait_ranges
 from agentworld.api.schemas.personas import (
     PersonaResponse,
     PersonaListResponse,
+    PersonaSearchResponse,
     CreatePersonaRequest,
     UpdatePersonaRequest,
     CollectionResponse,
@@ -80,20 +82,46 @@ async def list_personas(
     )
 
 
-@router.get("/personas/search", response_model=PersonaListResponse)
+@router.get("/personas/search", response_model=PersonaSearchResponse)
 async def search_personas(
-    q: str = Query(..., description="Search query", min_length=1),
+    q: Optional[str] = Query(None, description="Search query"),
+    tags: Optional[str] = Query(None, description="Comma-separated tags (any match)"),
+    occupation: Optional[str] = Query(None, description="Filter by occupation"),
+    traits: Optional[str] = Query(
+        None, description="Trait ranges, e.g. 'openness>0.7,neuroticism<0.3'"
+    ),
     limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
 ):
-    """Search personas by name, description, or occupation."""
+    """Search personas by text, tags, occupation and trait ranges.
+
+    Results are ranked by relevance when a query is given. ``total`` counts
+    all matches and ``facets`` breaks them down by occupation.
+    """
     repo = get_repo()
 
-    personas = repo.search_personas(q, limit=limit)
-    responses = [persona_to_response(p) for p in personas]
+    try:
+        trait_ranges = parse_trait_ranges(traits)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={
+            "code": "INVALID_TRAIT_FILTER",
+            "message": str(e),
+        })
+    tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else None
+    filters = {
+        "query_text": q,
+        "tags": tag_list,
+        "occupation": occupation,
+        "trait_ranges": trait_ranges,
+    }
 
-    return PersonaListResponse(
-        personas=responses,
-        total=len(responses),
+    personas = repo.search_personas(limit=limit, offset=offset, **filters)
+    facets = repo.persona_occupation_facets(**filters)
+
+    return PersonaSearchResponse(
+        personas=[persona_to_response(p) for p in personas],
+        total=sum(facets.values()),
+        facets={name: count for name, count in facets.items() if name is not None},
     )
 
 
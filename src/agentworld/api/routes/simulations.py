@@ -29,6 +29,7 @@ from agentworld.api.schemas.injection import (
     HealthCheckResponse,
 )
 from agentworld.api.schemas.common import MetaResponse
+from agentworld.api.routes.topology import drop_layout_engines
 
 
 router = APIRouter()
@@ -173,6 +174,7 @@ async def delete_simulation(simulation_id: str):
         })
 
     repo.delete_simulation(simulation_id)
+    drop_layout_engines(simulation_id)
 
     return {
         "success": True,
@@ -274,6 +276,8 @@ async def execute_step(simulation_id: str, request: StepRequest):
             name=agent_data.get("name", "Agent"),
             traits=agent_data.get("traits", {}),
             background=agent_data.get("background", ""),
+            # Reuse the stored prompt instead of regenerating it
+            system_prompt=agent_data.get("system_prompt"),
             model=agent_data.get("model"),
         ))
 
@@ -292,6 +296,8 @@ async def execute_step(simulation_id: str, request: StepRequest):
     sim.id = simulation_id
     sim.current_step = sim_data.get("current_step", 0)
     sim.status = SimulationStatus(sim_data.get("status", "pending"))
+    sim.repository = repo
+    sim.persist_memory = True
 
     # Match agent IDs with stored agents
     for i, agent in enumerate(sim.agents):
@@ -0,0 +1,245 @@
+"""Topology layout API endpoints.
+
+Layout and community detection are CPU-bound, so the handlers are plain
+functions that FastAPI runs in its threadpool rather than on the event
+loop.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+import threading
+
+from fastapi import APIRouter, HTTPException, Query
+
+from agentworld.persistence.database import init_db
+from agentworld.persistence.repository import Repository
+from agentworld.topology.base import Topology
+from agentworld.topology.layout import LayoutConfig, LayoutEngine
+from agentworld.topology.types import CustomTopology, create_topology
+from agentworld.api.schemas.topology import (
+    TopologyEdgeResponse,
+    TopologyLayoutResponse,
+    CommunityLayoutResponse,
+)
+
+
+router = APIRouter()
+
+LAYOUT_ALGORITHMS = ("force", "spectral")
+
+# Most layout engines kept in memory, least recently used evicted first
+MAX_LAYOUT_ENGINES = 32
+
+
+@dataclass
+class _CachedEngine:
+    """Layout engine of one (simulation, algorithm) and what it was built from."""
+    engine: Optional[LayoutEngine] = None
+    # Stored edges the engine's topology was last synced to
+    edges_key: Optional[frozenset] = None
+    # Held while syncing or laying out, which mutate the engine
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# Layout engines per (simulation, algorithm); kept in memory so repeated
+# requests reuse cached positions and only re-settle changed nodes
+_layout_engines: "OrderedDict[tuple[str, str], _CachedEngine]" = OrderedDict()
+_layout_engines_lock = threading.Lock()
+
+
+def get_repo() -> Repository:
+    """Get a repository instance."""
+    init_db()
+    return Repository()
+
+
+def _build_topology(simulation_id: str, edges: list[dict], repo: Repository) -> Topology:
+    """Build a topology from stored edges, or from the stored config."""
+    agent_ids = [agent["id"] for agent in repo.get_agents_for_simulation(simulation_id)]
+    config = repo.get_topology_config(simulation_id) or {}
+    directed = bool(config.get("directed", False))
+
+    if edges:
+        topology = CustomTopology(directed=directed)
+        topology.build(
+            agent_ids,
+            edges=[(e["source_id"], e["target_id"], e["weight"]) for e in edges],
+        )
+        return topology
+    return create_topology(
+        config.get("topology_type", "mesh"),
+        agent_ids,
+        directed=directed,
+        **config.get("config", {}),
+    )
+
+
+def _sync_topology(topology: Topology, fresh: Topology) -> None:
+    """Apply the differences between two topologies through the Topology API.
+
+    Going through the API records the changes, so the layout engine can
+    update positions incrementally.
+    """
+    for node in fresh.get_all_nodes():
+        if not topology.graph.has_node(node):
+            topology.add_node(node)
+    for source, target in topology.get_all_edges():
+        if not fresh.graph.has_edge(source, target):
+            topology.remove_edge(source, target)
+    for source, target, data in fresh.graph.edges(data=True):
+        if not topology.graph.has_edge(source, target):
+            topology.add_edge(source, target, weight=data.get("weight", 1.0))
+    for node in list(topology.get_all_nodes()):
+        if not fresh.graph.has_node(node):
+            topology.remove_node(node)
+
+
+def _cached_engine(simulation_id: str, algorithm: str) -> _CachedEngine:
+    """Get the cache entry for a simulation's layout, marking it recently used."""
+    key = (simulation_id, algorithm)
+    with _layout_engines_lock:
+        entry = _layout_engines.get(key)
+        if entry is None:
+            entry = _layout_engines[key] = _CachedEngine()
+            while len(_layout_engines) > MAX_LAYOUT_ENGINES:
+                _layout_engines.popitem(last=False)
+        else:
+            _layout_engines.move_to_end(key)
+        return entry
+
+
+def drop_layout_engines(simulation_id: str) -> None:
+    """Forget the cached layout engines of a simulation.
+
+    Args:
+        simulation_id: Simulation ID
+    """
+    with _layout_engines_lock:
+        for key in [key for key in _layout_engines if key[0] == simulation_id]:
+            del _layout_engines[key]
+
+
+@contextmanager
+def layout_engine(simulation_id: str, algorithm: str, repo: Repository) -> Iterator[LayoutEngine]:
+    """Use the layout engine for a simulation, synced with stored edges.
+
+    The engine is locked for the duration of the block, since computing
+    layouts updates it.
+
+    Args:
+        simulation_id: Simulation ID
+        algorithm: Layout algorithm
+        repo: Repository to read the topology from
+
+    Yields:
+        Layout engine whose topology matches the stored topology
+    """
+    entry = _cached_engine(simulation_id, algorithm)
+    with entry.lock:
+        edges = repo.get_topology_edges(simulation_id)
+        if entry.engine is None or edges:
+            # Without stored edges the topology is generated from config and
+            # random types would differ on every rebuild, so keep the first
+            edges_key = frozenset((e["source_id"], e["target_id"], e["weight"]) for e in edges)
+            if entry.engine is None or edges_key != entry.edges_key:
+                _refresh_engine(entry, simulation_id, algorithm, edges, repo)
+                entry.edges_key = edges_key
+        yield entry.engine
+
+
+def _refresh_engine(
+    entry: _CachedEngine,
+    simulation_id: str,
+    algorithm: str,
+    edges: list[dict],
+    repo: Repository,
+) -> None:
+    """Rebuild the stored topology and sync the cached engine to it."""
+    fresh = _build_topology(simulation_id, edges, repo)
+    if entry.engine is None or entry.engine.topology.directed != fresh.directed:
+        entry.engine = LayoutEngine(fresh, LayoutConfig(algorithm=algorithm))
+    else:
+        _sync_topology(entry.engine.topology, fresh)
+
+
+def _check_request(simulation_id: str, algorithm: str, repo: Repository) -> None:
+    """Raise 404/400 for unknown simulations or algorithms."""
+    if not repo.get_simulation(simulation_id):
+        raise HTTPException(status_code=404, detail={
+            "code": "SIMULATION_NOT_FOUND",
+            "message": f"Simulation '{simulation_id}' not found",
+        })
+    if algorithm not in LAYOUT_ALGORITHMS:
+        raise HTTPException(status_code=400, detail={
+            "code": "INVALID_LAYOUT_ALGORITHM",
+            "message": f"Layout algorithm must be one of {', '.join(LAYOUT_ALGORITHMS)}",
+        })
+
+
+@router.get(
+    "/simulations/{simulation_id}/topology/layout",
+    response_model=TopologyLayoutResponse,
+)
+def get_topology_layout(
+    simulation_id: str,
+    algorithm: str = Query("force"),
+    since: Optional[int] = Query(None, ge=0),
+):
+    """Get precomputed node positions for a simulation's topology.
+
+    Pass the last version received as ``since`` to get only the nodes that
+    moved after topology changes.
+    """
+    repo = get_repo()
+    _check_request(simulation_id, algorithm, repo)
+
+    with layout_engine(simulation_id, algorithm, repo) as engine:
+        layout = engine.get_layout()
+        changed = engine.changed_since(since) if since is not None else None
+
+        if changed is None:
+            data = layout.to_dict()
+            edges = [
+                TopologyEdgeResponse(source=source, target=target)
+                for source, target in engine.topology.get_all_edges()
+            ]
+            removed: list[str] = []
+        else:
+            data = layout.to_dict(changed)
+            edges = None
+            removed = sorted(node for node in changed if node not in layout.index)
+
+    return TopologyLayoutResponse(
+        simulation_id=simulation_id,
+        algorithm=algorithm,
+        version=data["version"],
+        full=changed is None,
+        approximate=data["approximate"],
+        node_count=len(layout.nodes),
+        positions=data["positions"],
+        removed=removed,
+        edges=edges,
+    )
+
+
+@router.get(
+    "/simulations/{simulation_id}/topology/communities",
+    response_model=CommunityLayoutResponse,
+)
+def get_topology_communities(
+    simulation_id: str,
+    algorithm: str = Query("force"),
+):
+    """Get the community-collapsed view of a simulation's topology."""
+    repo = get_repo()
+    _check_request(simulation_id, algorithm, repo)
+
+    with layout_engine(simulation_id, algorithm, repo) as engine:
+        view = engine.community_view()
+    return CommunityLayoutResponse(
+        simulation_id=simulation_id,
+        algorithm=algorithm,
+        **view.to_dict(),
+    )
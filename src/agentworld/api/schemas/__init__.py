@@ -24,6 +24,7 @@ from agentworld.api.schemas.messages import (
 from agentworld.api.schemas.personas import (
     PersonaResponse,
     PersonaListResponse,
+    PersonaSearchResponse,
     CreatePersonaRequest,
     CollectionResponse,
     CollectionListResponse,
@@ -45,6 +46,7 @@ __all__ = [
     "MessageListResponse",
     "PersonaResponse",
     "PersonaListResponse",
+    "PersonaSearchResponse",
     "CreatePersonaRequest",
     "CollectionResponse",
     "CollectionListResponse",
@@ -42,6 +42,12 @@ class PersonaListResponse(BaseModel):
     total: int
 
 
+class PersonaSearchResponse(PersonaListResponse):
+    """Page of persona search results."""
+
+    facets: dict[str, int] = Field(default_factory=dict)  # Matches per occupation
+
+
 class CreatePersonaRequest(BaseModel):
     """Create persona request."""
 
@@ -0,0 +1,58 @@
+"""Topology API schemas."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TopologyEdgeResponse(BaseModel):
+    """Edge between two agents."""
+
+    source: str
+    target: str
+
+
+class TopologyLayoutResponse(BaseModel):
+    """Precomputed node positions for a simulation's topology.
+
+    When ``full`` is False, ``positions`` only holds nodes that moved since
+    the requested version, ``removed`` lists nodes to drop, and ``edges`` is
+    omitted.
+    """
+
+    simulation_id: str
+    algorithm: str
+    version: int
+    full: bool
+    approximate: bool
+    node_count: int
+    positions: dict[str, list[float]]
+    removed: list[str] = []
+    edges: Optional[list[TopologyEdgeResponse]] = None
+
+
+class CommunityResponse(BaseModel):
+    """A community collapsed to a single node."""
+
+    id: int
+    size: int
+    position: list[float]
+    members: list[str]
+
+
+class CommunityEdgeResponse(BaseModel):
+    """Aggregated edges between two communities."""
+
+    source: int
+    target: int
+    weight: int
+
+
+class CommunityLayoutResponse(BaseModel):
+    """Community-collapsed level-of-detail view."""
+
+    simulation_id: str
+    algorithm: str
+    version: int
+    communities: list[CommunityResponse]
+    edges: list[CommunityEdgeResponse]
@@ -3,20 +3,50 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Set
+import threading
+from typing import Callable, Dict, Optional, Set
 from dataclasses import dataclass, field
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+from agentworld.api.broadcast import DEFAULT_FLUSH_INTERVAL, DEFAULT_MAX_PENDING, ClientChannel
+from agentworld.core.events import EventBus, EventType, get_event_bus
+
+__all__ = [
+    "ConnectionManager",
+    "EventType",
+    "emit_event",
+    "manager",
+    "register_websocket",
+    "router",
+]
+
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _event(event_type: str, simulation_id: Optional[str], data: Optional[dict]) -> dict:
+    """Build the JSON event sent to clients."""
+    event = {
+        "type": event_type,
+        **(data or {}),
+    }
+    if simulation_id:
+        event["simulation_id"] = simulation_id
+    return event
+
+
 @dataclass
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """Manages WebSocket connections for real-time updates.
+
+    Broadcasts serialize each event once and queue it on every recipient's
+    ClientChannel, which batches and sends it (see agentworld.api.broadcast);
+    they never wait for clients. While attached to an event bus, events
+    published there are broadcast the same way.
+    """
 
     # Connections per simulation
     simulation_connections: Dict[str, Set[WebSocket]] = field(default_factory=dict)
@@ -24,6 +54,70 @@ class ConnectionManager:
     # Global connections (receive all events)
     global_connections: Set[WebSocket] = field(default_factory=set)
 
+    # Delivery settings for new connections
+    max_pending: int = DEFAULT_MAX_PENDING
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL
+
+    # Runtime state
+    _channels: Dict[WebSocket, ClientChannel] = field(default_factory=dict, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+    _loop_thread: Optional[int] = field(default=None, repr=False)
+    _unsubscribe: Optional[Callable[[], None]] = field(default=None, repr=False)
+
+    def attach(self, bus: Optional[EventBus] = None) -> None:
+        """Start broadcasting events published on a bus.
+
+        Must be called from the event loop that serves the connections;
+        events published from other threads are handed over to it.
+
+        Args:
+            bus: Bus to subscribe to (defaults to the process-wide bus)
+        """
+        self.detach()
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._unsubscribe = (bus if bus is not None else get_event_bus()).subscribe(self._on_event)
+
+    def detach(self) -> None:
+        """Stop broadcasting bus events."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_event(self, event_type: str, simulation_id: Optional[str], data: Optional[dict]) -> None:
+        """Bus subscriber: broadcast an event on the server's loop."""
+        if not (self.simulation_connections or self.global_connections):
+            return
+        event = _event(event_type, simulation_id, data)
+        if threading.get_ident() == self._loop_thread:
+            self._dispatch(simulation_id, event)
+        else:
+            self._loop.call_soon_threadsafe(self._dispatch, simulation_id, event)
+
+    def _dispatch(self, simulation_id: Optional[str], event: dict) -> None:
+        """Serialize an event once and queue it for its recipients."""
+        text = json.dumps(event)
+        event_type = event.get("type", "")
+        if simulation_id:
+            self._queue_to(self.simulation_connections.get(simulation_id, ()), event_type, text)
+        self._queue_to(self.global_connections, event_type, text)
+
+    def _queue_to(self, connections: Set[WebSocket], event_type: str, text: str) -> None:
+        for connection in connections:
+            self._channel(connection).send(event_type, text)
+
+    def _channel(self, websocket: WebSocket) -> ClientChannel:
+        """Get or create the send channel of a connection."""
+        channel = self._channels.get(websocket)
+        if channel is None:
+            channel = self._channels[websocket] = ClientChannel(
+                websocket,
+                on_error=self._remove,
+                max_pending=self.max_pending,
+                flush_interval=self.flush_interval,
+            )
+        return channel
+
     async def connect(self, websocket: WebSocket, simulation_id: str = None):
         """Accept a WebSocket connection."""
         await websocket.accept()
@@ -37,50 +131,30 @@ class ConnectionManager:
             self.simulation_connections[simulation_id].add(websocket)
         else:
             self.global_connections.add(websocket)
+        self._channel(websocket)
 
     def disconnect(self, websocket: WebSocket, simulation_id: str = None):
-        """Remove a WebSocket connection."""
-        if simulation_id and simulation_id in self.simulation_connections:
+        """Remove a WebSocket connection (from every pool it is in)."""
+        self._remove(websocket)
+
+    def _remove(self, websocket: WebSocket) -> None:
+        """Drop a connection and close its channel."""
+        self.global_connections.discard(websocket)
+        for simulation_id in [sid for sid, conns in self.simulation_connections.items() if websocket in conns]:
             self.simulation_connections[simulation_id].discard(websocket)
             if not self.simulation_connections[simulation_id]:
                 del self.simulation_connections[simulation_id]
-        else:
-            self.global_connections.discard(websocket)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
 
     async def broadcast_to_simulation(self, simulation_id: str, event: dict):
-        """Send event to all connections watching a simulation."""
-        message = json.dumps(event)
-
-        # Send to simulation-specific connections
-        if simulation_id in self.simulation_connections:
-            disconnected = set()
-            for connection in self.simulation_connections[simulation_id]:
-                try:
-                    await connection.send_text(message)
-                except Exception:
-                    disconnected.add(connection)
-
-            # Clean up disconnected
-            for conn in disconnected:
-                self.simulation_connections[simulation_id].discard(conn)
-
-        # Also send to global connections
-        await self.broadcast_global(event)
+        """Queue event for all connections watching a simulation (and global ones)."""
+        self._dispatch(simulation_id, event)
 
     async def broadcast_global(self, event: dict):
-        """Send event to all global connections."""
-        message = json.dumps(event)
-        disconnected = set()
-
-        for connection in self.global_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.add(connection)
-
-        # Clean up disconnected
-        for conn in disconnected:
-            self.global_connections.discard(conn)
+        """Queue event for all global connections."""
+        self._dispatch(None, event)
 
     async def send_personal(self, websocket: WebSocket, event: dict):
         """Send event to a specific connection."""
@@ -210,38 +284,6 @@ def register_websocket(app):
     app.include_router(router, tags=["websocket"])
 
 
-# Event types for type hints
-class EventType:
-    """WebSocket event types."""
-
-    # Connection events
-    CONNECTED = "connected"
-    DISCONNECTED = "disconnected"
-    SUBSCRIBED = "subscribed"
-
-    # Simulation events
-    SIMULATION_CREATED = "simulation.created"
-    SIMULATION_STARTED = "simulation.started"
-    SIMULATION_PAUSED = "simulation.paused"
-    SIMULATION_RESUMED = "simulation.resumed"
-    SIMULATION_COMPLETED = "simulation.completed"
-    SIMULATION_ERROR = "simulation.error"
-
-    # Step events
-    STEP_STARTED = "step.started"
-    STEP_COMPLETED = "step.completed"
-
-    # Agent events
-    AGENT_THINKING = "agent.thinking"
-    AGENT_RESPONDED = "agent.responded"
-
-    # Message events
-    MESSAGE_CREATED = "message.created"
-
-    # Memory events
-    MEMORY_CREATED = "memory.created"
-
-
 async def emit_event(event_type: str, simulation_id: str = None, data: dict = None):
     """Emit an event to connected clients.
 
@@ -250,13 +292,8 @@ async def emit_event(event_type: str, simulation_id: str = None, data: dict = No
         simulation_id: Optional simulation ID to target specific connections
         data: Optional additional data to include in the event
     """
-    event = {
-        "type": event_type,
-        **(data or {}),
-    }
-
+    event = _event(event_type, simulation_id, data)
     if simulation_id:
-        event["simulation_id"] = simulation_id
         await manager.broadcast_to_simulation(simulation_id, event)
     else:
         await manager.broadcast_global(event)
@@ -1,13 +1,93 @@
-"""Main CLI application."""
+"""Main CLI application.
+
+Commands are registered by name and imported only when invoked, so
+``agentworld --help`` and quick commands do not pay for the LLM and API
+stacks that other commands need.
+"""
+
+import importlib
+from typing import Any, Optional
 
 import typer
-from typing import Optional
+from typer.core import TyperCommand, TyperGroup
 
 from agentworld import __version__
 
 
+# Command name -> (module, attribute, short help). The attribute is either a
+# command function or a Typer app registered as a command group. The short
+# help is listed by --help without importing the module; tests check it
+# against the command's own help.
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "run": ("agentworld.cli.commands.run", "run", "Run a simulation from a configuration file."),
+    "list": ("agentworld.cli.commands.list_cmd", "list_simulations", "List all simulations."),
+    "inspect": ("agentworld.cli.commands.inspect", "inspect", "Inspect a simulation's details."),
+    "show": ("agentworld.cli.commands.show", "show", "Show detailed information about a simulation."),
+    "resume": ("agentworld.cli.commands.resume", "resume", "Resume a paused or failed simulation."),
+    "export": ("agentworld.cli.commands.export", "export", "Export simulation data to various formats."),
+    "step": ("agentworld.cli.commands.step", "step", "Advance a simulation by one or more steps."),
+    "inject": ("agentworld.cli.commands.inject", "inject", "Inject a stimulus into a running simulation."),
+    "create": ("agentworld.cli.commands.create", "create", "Create a new simulation."),
+    "analyze": ("agentworld.cli.commands.analyze", "analyze", "Analyze simulation results and generate insights."),
+    "serve": ("agentworld.cli.commands.serve", "serve", "Start a web server for simulation visualization."),
+    "open": ("agentworld.cli.commands.open", "open_simulation", "Open simulation data in external applications."),
+    "config": ("agentworld.cli.commands.config", "config", "Manage AgentWorld configuration."),
+    "checkpoint": ("agentworld.cli.commands.checkpoint", "checkpoint_app", "Checkpoint management commands"),
+    "cfg": ("agentworld.cli.commands.config", "config_app", "Configuration management"),
+    "plugins": ("agentworld.plugins.cli", "plugin_app", "Manage AgentWorld plugins"),
+    "persona": ("agentworld.cli.commands.persona", "persona_app", "Manage the persona library"),
+    "bench": ("agentworld.cli.commands.bench", "bench_app", "Performance benchmarks"),
+}
+
+
+def load_command(name: str) -> TyperCommand | TyperGroup:
+    """Import a registered command and build it.
+
+    Args:
+        name: Command name in LAZY_COMMANDS
+
+    Returns:
+        The command, or a group for Typer apps
+    """
+    module_name, attribute, _ = LAZY_COMMANDS[name]
+    target: Any = getattr(importlib.import_module(module_name), attribute)
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        single = typer.Typer(add_completion=False)
+        single.command(name=name)(target)
+        command = typer.main.get_command(single)
+    command.name = name
+    return command
+
+
+class _PendingCommand(TyperCommand):
+    """Placeholder listed in help until the real command is loaded."""
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group whose commands are imported on first use.
+
+    Listing commands (help, completion of command names) uses placeholders
+    carrying the static short help; resolving a command to run it replaces
+    the placeholder with the real command.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for name, (_, _, short_help) in LAZY_COMMANDS.items():
+            self.commands.setdefault(name, _PendingCommand(name, short_help=short_help))
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]) -> tuple[Optional[str], Any, list[str]]:
+        name, command, args = super().resolve_command(ctx, args)
+        if name is not None and isinstance(command, _PendingCommand):
+            command = self.commands[name] = load_command(name)
+        return name, command, args
+
+
 app = typer.Typer(
     name="agentworld",
+    cls=LazyGroup,
     help="AgentWorld - Multi-agent simulation framework",
     no_args_is_help=True,
 )
@@ -35,33 +115,6 @@ def main(
     pass
 
 
-# Import and register commands
-from agentworld.cli.commands import run, list_cmd, inspect, step, inject, checkpoint
-from agentworld.cli.commands import show, resume, export as export_cmd
-from agentworld.cli.commands import create, analyze, serve, open as open_cmd, config
-from agentworld.cli.commands import persona
-from agentworld.plugins.cli import plugin_app
-
-
-app.command(name="run")(run.run)
-app.command(name="list")(list_cmd.list_simulations)
-app.command(name="inspect")(inspect.inspect)
-app.command(name="show")(show.show)
-app.command(name="resume")(resume.resume)
-app.command(name="export")(export_cmd.export)
-app.command(name="step")(step.step)
-app.command(name="inject")(inject.inject)
-app.command(name="create")(create.create)
-app.command(name="analyze")(analyze.analyze)
-app.command(name="serve")(serve.serve)
-app.command(name="open")(open_cmd.open_simulation)
-app.command(name="config")(config.config)
-app.add_typer(checkpoint.checkpoint_app, name="checkpoint")
-app.add_typer(config.config_app, name="cfg")
-app.add_typer(plugin_app, name="plugins")
-app.add_typer(persona.persona_app, name="persona")
-
-
 def main():
     """Entry point for the CLI."""
     app()
@@ -0,0 +1,164 @@
+"""Benchmark commands for measuring performance."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from agentworld.cli.output import print_error, print_info, print_json, print_success
+
+
+console = Console()
+
+bench_app = typer.Typer(
+    name="bench",
+    help="Performance benchmarks",
+    no_args_is_help=True,
+)
+
+
+@bench_app.command(name="memory")
+def bench_memory(
+    sizes: str = typer.Option(
+        "1000,10000,100000",
+        "--sizes",
+        "-s",
+        help="Comma-separated corpus sizes",
+    ),
+    only: Optional[str] = typer.Option(
+        None,
+        "--only",
+        help="Comma-separated benchmarks to run (add_observation, retrieve, maybe_prune, generate_reflections)",
+    ),
+    dimensions: int = typer.Option(256, "--dimensions", "-d", help="Embedding dimensions"),
+    baseline: Optional[Path] = typer.Option(
+        None,
+        "--baseline",
+        "-b",
+        help="Baseline file to compare against, e.g. benchmarks/memory.json",
+    ),
+    save_baseline: Optional[Path] = typer.Option(
+        None,
+        "--save-baseline",
+        help="Write results to this baseline file",
+    ),
+    tolerance: float = typer.Option(
+        0.2,
+        "--tolerance",
+        "-t",
+        help="Allowed fractional slowdown versus baseline",
+    ),
+    memory: bool = typer.Option(
+        False,
+        "--memory",
+        "-m",
+        help="Also measure each case's peak memory (runs every case twice)",
+    ),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+) -> None:
+    """Benchmark the memory system on synthetic corpora.
+
+    Uses deterministic embeddings and a stubbed LLM. When a baseline is
+    given, exits with status 1 if any benchmark is slower than the baseline
+    beyond the tolerance. Baselines are machine-specific, so compare against
+    one recorded on the same hardware.
+
+    Example:
+        agentworld bench memory --sizes 1000,10000
+        agentworld bench memory --memory
+        agentworld bench memory --save-baseline benchmarks/memory.json
+        agentworld bench memory --baseline benchmarks/memory.json
+    """
+    from agentworld.memory.benchmark import (
+        BenchmarkResult,
+        compare_to_baseline,
+        load_baseline,
+        run_memory_benchmarks,
+        save_baseline as write_baseline,
+    )
+
+    try:
+        size_list = [int(s) for s in sizes.split(",") if s.strip()]
+    except ValueError:
+        print_error(f"Invalid sizes: {sizes}")
+        raise typer.Exit(1)
+    names = [n.strip() for n in only.split(",") if n.strip()] if only else None
+
+    baseline_data = None
+    if baseline is not None:
+        if not baseline.exists():
+            print_error(f"Baseline file not found: {baseline}")
+            raise typer.Exit(1)
+        baseline_data = load_baseline(baseline)
+
+    def report(result: BenchmarkResult) -> None:
+        print_info(f"{result.key}: {result.ops_per_sec:,.1f} ops/sec")
+
+    try:
+        results = run_memory_benchmarks(
+            size_list,
+            dimensions=dimensions,
+            names=names,
+            on_result=None if json_output else report,
+            measure_memory=memory,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    regressions = []
+    if baseline_data is not None:
+        regressions = compare_to_baseline(results, baseline_data, tolerance)
+
+    if save_baseline is not None:
+        write_baseline(results, save_baseline)
+
+    if json_output:
+        print_json({
+            "results": [r.to_dict() for r in results],
+            "regressions": [
+                {
+                    "key": r.key,
+                    "baseline_ops_per_sec": r.baseline_ops_per_sec,
+                    "ops_per_sec": r.ops_per_sec,
+                    "slowdown": r.slowdown,
+                }
+                for r in regressions
+            ],
+        })
+    else:
+        table = Table(title="Memory Benchmarks")
+        table.add_column("Benchmark", style="cyan")
+        table.add_column("Size", justify="right")
+        table.add_column("Ops", justify="right")
+        table.add_column("Ops/sec", justify="right")
+        table.add_column("Peak memory (MB)", justify="right")
+        if baseline_data is not None:
+            table.add_column("Baseline", justify="right")
+
+        for r in results:
+            row = [
+                r.name,
+                f"{r.size:,}",
+                str(r.operations),
+                f"{r.ops_per_sec:,.1f}",
+                f"{r.peak_memory_mb:,.1f}" if r.peak_memory_mb is not None else "-",
+            ]
+            if baseline_data is not None:
+                expected = baseline_data.get(r.key)
+                row.append(f"{expected:,.1f}" if expected is not None else "-")
+            table.add_row(*row)
+        console.print(table)
+
+        if save_baseline is not None:
+            print_success(f"Baseline saved to {save_baseline}")
+        for reg in regressions:
+            print_error(
+                f"{reg.key} regressed {reg.slowdown:.0%} "
+                f"({reg.ops_per_sec:,.1f} vs baseline {reg.baseline_ops_per_sec:,.1f} ops/sec)"
+            )
+
+    if regressions:
+        raise typer.Exit(1)
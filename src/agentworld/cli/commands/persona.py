@@ -9,9 +9,10 @@ import typer
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
-from agentworld.cli.output import console, print_error, print_success, print_info
+from agentworld.cli.output import console, create_progress, print_error, print_success, print_info
 from agentworld.persistence.database import init_db
 from agentworld.persistence.repository import Repository
+from agentworld.persistence.search import parse_trait_ranges
 
 
 persona_app = typer.Typer(
@@ -156,6 +157,12 @@ def show_persona(
         ...,
         help="Persona ID or name",
     ),
+    prompt: bool = typer.Option(
+        False,
+        "--prompt",
+        "-p",
+        help="Also show the generated system prompt",
+    ),
 ) -> None:
     """Show details of a persona."""
     init_db()
@@ -192,6 +199,9 @@ def show_persona(
     if persona.get("tags"):
         console.print(f"\n[bold]Tags:[/bold] {', '.join(persona['tags'])}")
 
+    if prompt:
+        console.print(f"\n[bold]System Prompt:[/bold]\n{repo.get_persona_prompt(persona['id'])}")
+
     console.print(f"\n[dim]Used {persona.get('usage_count', 0)} times[/dim]")
 
 
@@ -229,10 +239,27 @@ def delete_persona(
 
 @persona_app.command(name="search")
 def search_personas(
-    query: str = typer.Argument(
-        ...,
+    query: Optional[str] = typer.Argument(
+        None,
         help="Search query",
     ),
+    tags: Optional[str] = typer.Option(
+        None,
+        "--tags",
+        "-t",
+        help="Comma-separated tags (any match)",
+    ),
+    occupation: Optional[str] = typer.Option(
+        None,
+        "--occupation",
+        "-o",
+        help="Filter by occupation",
+    ),
+    traits: Optional[str] = typer.Option(
+        None,
+        "--traits",
+        help="Trait ranges, e.g. 'openness>0.7,neuroticism<0.3'",
+    ),
     limit: int = typer.Option(
         10,
         "--limit",
@@ -240,12 +267,25 @@ def search_personas(
         help="Maximum number of results",
     ),
 ) -> None:
-    """Search personas by name, description, or occupation."""
+    """Search personas by text, tags, occupation and trait ranges."""
+    try:
+        trait_ranges = parse_trait_ranges(traits)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
     init_db()
     repo = Repository()
 
-    personas = repo.search_personas(query, limit=limit)
+    personas = repo.search_personas(
+        query,
+        limit=limit,
+        tags=tags.split(",") if tags else None,
+        occupation=occupation,
+        trait_ranges=trait_ranges,
+    )
 
+    query = query or traits or tags or occupation or ""
     if not personas:
         print_info(f"No personas found matching '{query}'")
         return
@@ -277,8 +317,25 @@ def import_personas(
         help="JSON file to import",
         exists=True,
     ),
+    batch_size: int = typer.Option(
+        5000,
+        "--batch-size",
+        help="Personas written per transaction",
+        min=1,
+    ),
+    update: bool = typer.Option(
+        True,
+        "--update/--skip-existing",
+        help="Update personas whose ID exists, or skip names already in the library",
+    ),
 ) -> None:
-    """Import personas from a JSON file."""
+    """Import personas from a JSON file.
+
+    Personas are written in batched transactions. By default they are
+    upserted by ID, so re-importing an edited export updates it. With
+    --skip-existing, names already in the library are skipped, so an
+    interrupted import can be re-run to resume.
+    """
     init_db()
     repo = Repository()
 
@@ -295,17 +352,104 @@ def import_personas(
     else:
         personas = data
 
-    imported = 0
+    valid = []
     for p in personas:
+        if not isinstance(p, dict) or not p.get("name"):
+            print_error(f"Failed to import entry without a name: {str(p)[:60]}")
+            continue
         if "id" not in p:
             p["id"] = str(uuid.uuid4())
-        try:
-            repo.save_persona(p)
-            imported += 1
-        except Exception as e:
-            print_error(f"Failed to import '{p.get('name', 'unknown')}': {e}")
+        valid.append(p)
+
+    imported, skipped = _save_personas(
+        repo, valid, batch_size, "Importing personas...", update_existing=update
+    )
 
     print_success(f"Imported {imported} persona(s)")
+    if skipped:
+        print_info(f"Skipped {skipped} persona(s) already in the library")
+
+
+@persona_app.command(name="populate")
+def populate_personas(
+    template_name: str = typer.Argument(..., help="Population template name or ID"),
+    count: Optional[int] = typer.Option(
+        None,
+        "--count",
+        "-c",
+        help="Number of personas (defaults to the template's count)",
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Random seed (defaults to the template's seed)",
+    ),
+    prefix: Optional[str] = typer.Option(
+        None,
+        "--prefix",
+        help="Persona name prefix (defaults to the template name)",
+    ),
+    batch_size: int = typer.Option(
+        5000,
+        "--batch-size",
+        help="Personas written per transaction",
+        min=1,
+    ),
+) -> None:
+    """Generate personas from a population template into the library.
+
+    Names are numbered from the prefix, so re-running with the same seed
+    skips the personas already written and resumes an interrupted run.
+    """
+    from agentworld.personas.population import generate_personas
+
+    init_db()
+    repo = Repository()
+
+    template = repo.get_population_template_by_name(template_name) or repo.get_population_template(template_name)
+    if not template:
+        print_error(f"Population template not found: {template_name}")
+        raise typer.Exit(1)
+
+    try:
+        personas = generate_personas(template, count=count, seed=seed, name_prefix=prefix)
+    except Exception as e:
+        print_error(f"Failed to generate population: {e}")
+        raise typer.Exit(1)
+
+    imported, skipped = _save_personas(repo, personas, batch_size, "Saving population...")
+    repo.increment_template_usage(template["id"])
+
+    print_success(f"Generated {imported} persona(s) from '{template['name']}'")
+    if skipped:
+        print_info(f"Skipped {skipped} persona(s) already in the library")
+
+
+def _save_personas(
+    repo: Repository,
+    personas: list[dict],
+    batch_size: int,
+    description: str,
+    update_existing: bool = False,
+) -> tuple[int, int]:
+    """Bulk-save personas with a progress bar, reporting each failed persona."""
+    def report(persona: dict, error: Exception) -> None:
+        reason = getattr(error, "orig", None) or error
+        print_error(f"Failed to import '{persona.get('name', 'unknown')}': {reason}")
+
+    try:
+        with create_progress() as progress:
+            task = progress.add_task(description, total=len(personas))
+            return repo.save_personas_bulk(
+                personas,
+                batch_size=batch_size,
+                progress=lambda done, total: progress.update(task, completed=done),
+                update_existing=update_existing,
+                on_error=report,
+            )
+    except Exception as e:
+        print_error(f"Failed to save personas: {e}")
+        raise typer.Exit(1)
 
 
 @persona_app.command(name="export")
@@ -1,5 +1,6 @@
 """Core protocols, models, and exceptions."""
 
+from agentworld.core.events import EventBus, EventType, get_event_bus
 from agentworld.core.models import Message, SimulationConfig, SimulationStatus
 from agentworld.core.exceptions import (
     AgentWorldError,
@@ -12,10 +13,13 @@ from agentworld.core.exceptions import (
 __all__ = [
     "AgentWorldError",
     "ConfigurationError",
+    "EventBus",
+    "EventType",
     "LLMError",
     "Message",
     "PersistenceError",
     "SimulationConfig",
     "SimulationError",
     "SimulationStatus",
+    "get_event_bus",
 ]
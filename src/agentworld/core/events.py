@@ -0,0 +1,245 @@
+"""In-process event bus for simulation updates.
+
+Simulations publish lifecycle, step, agent and message events to an
+EventBus, and anything interested (the API server's WebSocket manager,
+loggers, tests) subscribes a callback. Publishing is a plain loop over the
+subscribers in the publishing thread, and the emitter returns before
+building an event payload when a bus has no subscribers, so headless runs
+pay one attribute check per event and import no web stack.
+"""
+
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Called with (event_type, simulation_id, data)
+EventSubscriber = Callable[[str, Optional[str], Optional[dict]], None]
+
+
+class EventType:
+    """Event types."""
+
+    # Connection events
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    SUBSCRIBED = "subscribed"
+
+    # Simulation events
+    SIMULATION_CREATED = "simulation.created"
+    SIMULATION_STARTED = "simulation.started"
+    SIMULATION_PAUSED = "simulation.paused"
+    SIMULATION_RESUMED = "simulation.resumed"
+    SIMULATION_COMPLETED = "simulation.completed"
+    SIMULATION_ERROR = "simulation.error"
+
+    # Step events
+    STEP_STARTED = "step.started"
+    STEP_COMPLETED = "step.completed"
+
+    # Agent events
+    AGENT_THINKING = "agent.thinking"
+    AGENT_RESPONDED = "agent.responded"
+
+    # Message events
+    MESSAGE_CREATED = "message.created"
+
+    # Memory events
+    MEMORY_CREATED = "memory.created"
+
+    # Delivery events (WebSocket frames)
+    BATCH = "batch"
+    EVENTS_DROPPED = "events.dropped"
+
+
+class EventBus:
+    """Synchronous publish/subscribe hub for events.
+
+    Subscribers are called in subscription order, in the publishing
+    thread, and should return quickly (hand slow or async work to a
+    queue). A subscriber that raises is logged and does not stop delivery
+    to the others.
+    """
+
+    def __init__(self):
+        """Initialize a bus with no subscribers."""
+        # Replaced rather than mutated, so publishing can iterate safely
+        # while subscribers come and go
+        self._subscribers: tuple[EventSubscriber, ...] = ()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether anything is listening."""
+        return bool(self._subscribers)
+
+    def subscribe(self, subscriber: EventSubscriber) -> Callable[[], None]:
+        """Add a subscriber.
+
+        Args:
+            subscriber: Callable taking (event_type, simulation_id, data)
+
+        Returns:
+            Function that removes the subscriber again
+        """
+        self._subscribers += (subscriber,)
+        return lambda: self.unsubscribe(subscriber)
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        """Remove a subscriber (no-op if not subscribed).
+
+        Args:
+            subscriber: Subscriber to remove
+        """
+        self._subscribers = tuple(s for s in self._subscribers if s != subscriber)
+
+    def publish(
+        self,
+        event_type: str,
+        simulation_id: Optional[str] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Deliver an event to every subscriber.
+
+        Args:
+            event_type: Event type (use EventType constants)
+            simulation_id: Simulation the event belongs to, if any
+            data: Event payload
+        """
+        for subscriber in self._subscribers:
+            try:
+                subscriber(event_type, simulation_id, data)
+            except Exception:
+                logger.exception("Event subscriber %r failed on %s", subscriber, event_type)
+
+
+_default_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus simulations publish to by default."""
+    return _default_bus
+
+
+def _preview(text: Optional[str]) -> Optional[str]:
+    """First 100 characters of a text for event payloads."""
+    return text[:100] if text else None
+
+
+class SimulationEventEmitter:
+    """Publishes a simulation's events to an event bus.
+
+    Each method returns immediately when the bus has no subscribers.
+    """
+
+    def __init__(self, simulation_id: str, bus: Optional[EventBus] = None):
+        """Initialize emitter for a specific simulation.
+
+        Args:
+            simulation_id: The simulation to emit events for
+            bus: Bus to publish to (defaults to the process-wide bus)
+        """
+        self.simulation_id = simulation_id
+        self.bus = bus if bus is not None else get_event_bus()
+
+    def _emit(self, event_type: str, data: Optional[dict] = None) -> None:
+        """Publish an event for this simulation."""
+        self.bus.publish(event_type, self.simulation_id, data)
+
+    def simulation_started(self):
+        """Emit simulation started event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.SIMULATION_STARTED)
+
+    def simulation_paused(self):
+        """Emit simulation paused event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.SIMULATION_PAUSED)
+
+    def simulation_resumed(self):
+        """Emit simulation resumed event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.SIMULATION_RESUMED)
+
+    def simulation_completed(self, stats: dict = None):
+        """Emit simulation completed event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.SIMULATION_COMPLETED, {"stats": stats or {}})
+
+    def simulation_error(self, error: str):
+        """Emit simulation error event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.SIMULATION_ERROR, {"error": error})
+
+    def step_started(self, step: int, total_steps: int):
+        """Emit step started event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.STEP_STARTED, {
+                "step": step,
+                "total_steps": total_steps,
+            })
+
+    def step_completed(self, step: int, total_steps: int, messages_generated: int = 0):
+        """Emit step completed event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.STEP_COMPLETED, {
+                "step": step,
+                "total_steps": total_steps,
+                "messages_generated": messages_generated,
+            })
+
+    def agent_thinking(self, agent_id: str, agent_name: str):
+        """Emit agent thinking event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.AGENT_THINKING, {
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+            })
+
+    def agent_responded(self, agent_id: str, agent_name: str, response_preview: str = None):
+        """Emit agent responded event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.AGENT_RESPONDED, {
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+                "response_preview": _preview(response_preview),
+            })
+
+    def message_created(
+        self,
+        message_id: str,
+        sender_id: str,
+        sender_name: str,
+        receiver_id: str = None,
+        receiver_name: str = None,
+        content_preview: str = None,
+        step: int = None,
+    ):
+        """Emit message created event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.MESSAGE_CREATED, {
+                "message_id": message_id,
+                "sender_id": sender_id,
+                "sender_name": sender_name,
+                "receiver_id": receiver_id,
+                "receiver_name": receiver_name,
+                "content_preview": _preview(content_preview),
+                "step": step,
+            })
+
+    def memory_created(
+        self,
+        memory_id: str,
+        agent_id: str,
+        agent_name: str,
+        memory_type: str,
+        content_preview: str = None,
+    ):
+        """Emit memory created event."""
+        if self.bus.has_subscribers:
+            self._emit(EventType.MEMORY_CREATED, {
+                "memory_id": memory_id,
+                "agent_id": agent_id,
+                "agent_name": agent_name,
+                "memory_type": memory_type,
+                "content_preview": _preview(content_preview),
+            })
@@ -144,6 +144,7 @@ class LLMResponse:
     cost: float
     model: str
     cached: bool = False
+    cached_tokens: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert response to dictionary."""
@@ -155,4 +156,5 @@ class LLMResponse:
             "cost": self.cost,
             "model": self.model,
             "cached": self.cached,
+            "cached_tokens": self.cached_tokens,
         }
@@ -1,12 +1,42 @@
 """LLM provider abstraction layer."""
 
-from agentworld.llm.provider import LLMCallRecord, LLMProvider, complete
-from agentworld.llm.templates import PromptTemplate, render_template
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentworld.llm.provider import LLMCallRecord, LLMProvider, complete
+    from agentworld.llm.stub import StubCompletion
+    from agentworld.llm.templates import PromptTemplate, render_template
+
+# Imported on first access: the provider and stub import litellm, which
+# submodules such as agentworld.llm.cost and agentworld.llm.tokens don't need.
+_EXPORTS = {
+    "LLMCallRecord": "agentworld.llm.provider",
+    "LLMProvider": "agentworld.llm.provider",
+    "PromptTemplate": "agentworld.llm.templates",
+    "StubCompletion": "agentworld.llm.stub",
+    "complete": "agentworld.llm.provider",
+    "render_template": "agentworld.llm.templates",
+}
 
 __all__ = [
     "LLMCallRecord",
     "LLMProvider",
     "PromptTemplate",
+    "StubCompletion",
     "complete",
     "render_template",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,26 +4,32 @@ from typing import NamedTuple
 
 
 class ModelPricing(NamedTuple):
-    """Pricing per 1M tokens."""
+    """Pricing per 1M tokens.
+
+    Models without prompt caching leave the cache rates unset, which bills
+    cached and cache-write tokens as ordinary input.
+    """
 
     input: float  # $ per 1M input tokens
     output: float  # $ per 1M output tokens
+    cached_input: float | None = None  # $ per 1M input tokens read from the prompt cache
+    cache_write: float | None = None  # $ per 1M input tokens written to the prompt cache
 
 
 # Pricing as of 2024 ($ per 1M tokens)
 # Update these as pricing changes
 MODEL_PRICING: dict[str, ModelPricing] = {
     # OpenAI
-    "gpt-4o": ModelPricing(2.50, 10.00),
-    "gpt-4o-mini": ModelPricing(0.15, 0.60),
+    "gpt-4o": ModelPricing(2.50, 10.00, cached_input=1.25),
+    "gpt-4o-mini": ModelPricing(0.15, 0.60, cached_input=0.075),
     "gpt-4-turbo": ModelPricing(10.00, 30.00),
     "gpt-4": ModelPricing(30.00, 60.00),
     "gpt-3.5-turbo": ModelPricing(0.50, 1.50),
     # Anthropic
-    "claude-3-opus": ModelPricing(15.00, 75.00),
+    "claude-3-opus": ModelPricing(15.00, 75.00, cached_input=1.50, cache_write=18.75),
     "claude-3-sonnet": ModelPricing(3.00, 15.00),
-    "claude-3-haiku": ModelPricing(0.25, 1.25),
-    "claude-3-5-sonnet": ModelPricing(3.00, 15.00),
+    "claude-3-haiku": ModelPricing(0.25, 1.25, cached_input=0.03, cache_write=0.30),
+    "claude-3-5-sonnet": ModelPricing(3.00, 15.00, cached_input=0.30, cache_write=3.75),
     # Google
     "gemini-pro": ModelPricing(0.50, 1.50),
     "gemini-1.5-pro": ModelPricing(3.50, 10.50),
@@ -71,19 +77,31 @@ def estimate_cost(
     model: str,
     prompt_tokens: int,
     completion_tokens: int,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> float:
     """Estimate the cost of an LLM call.
 
     Args:
         model: Model name
-        prompt_tokens: Number of input tokens
+        prompt_tokens: Number of input tokens, including cached and
+            cache-write tokens
         completion_tokens: Number of output tokens
+        cached_tokens: Input tokens read from the provider's prompt cache
+        cache_write_tokens: Input tokens written to the provider's prompt cache
 
     Returns:
         Estimated cost in USD
     """
     pricing = get_pricing(model)
-    input_cost = (prompt_tokens / 1_000_000) * pricing.input
+    cached_rate = pricing.input if pricing.cached_input is None else pricing.cached_input
+    write_rate = pricing.input if pricing.cache_write is None else pricing.cache_write
+    uncached_tokens = max(prompt_tokens - cached_tokens - cache_write_tokens, 0)
+    input_cost = (
+        uncached_tokens * pricing.input
+        + cached_tokens * cached_rate
+        + cache_write_tokens * write_rate
+    ) / 1_000_000
     output_cost = (completion_tokens / 1_000_000) * pricing.output
     return input_cost + output_cost
 
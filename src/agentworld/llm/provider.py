@@ -26,6 +26,101 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 DEFAULT_RETRY_MULTIPLIER = 2.0
 
+# Providers that only cache prompt prefixes marked with cache_control.
+# OpenAI, DeepSeek and Gemini cache repeated prefixes automatically, so
+# keeping the stable parts first is all they need.
+CACHE_CONTROL_PROVIDERS = ("anthropic", "bedrock", "vertex_ai")
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def supports_cache_control(model: str) -> bool:
+    """Check whether a model takes cache_control hints on message content.
+
+    Args:
+        model: Model name (format: provider/model)
+
+    Returns:
+        True for Claude models on Anthropic, Bedrock or Vertex AI
+    """
+    provider, _, name = model.partition("/")
+    if provider == "anthropic":
+        return True
+    return provider in CACHE_CONTROL_PROVIDERS and "claude" in name
+
+
+def build_messages(
+    prompt: str,
+    system_prompt: str | None = None,
+    prompt_prefix: str | None = None,
+    cache_control: bool = False,
+) -> list[dict[str, Any]]:
+    """Build chat messages with the stable prefix first.
+
+    The system prompt and the shared prompt prefix rarely change between
+    calls, so they lead the request where providers can cache them. With
+    ``cache_control`` each stable part becomes a content block marked as a
+    cache breakpoint; otherwise the prefix is joined to the prompt.
+
+    Args:
+        prompt: The varying user prompt
+        system_prompt: Optional system prompt
+        prompt_prefix: Optional stable context shared across calls
+        cache_control: Whether to add cache_control hints
+
+    Returns:
+        List of message dictionaries
+    """
+    messages: list[dict[str, Any]] = []
+    if cache_control:
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": [{"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}],
+            })
+        if prompt_prefix:
+            messages.append({
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt_prefix, "cache_control": CACHE_CONTROL},
+                    {"type": "text", "text": prompt},
+                ],
+            })
+            return messages
+    elif system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    if prompt_prefix:
+        prompt = f"{prompt_prefix}\n\n{prompt}"
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _usage_count(source: Any, name: str) -> int:
+    """Read an optional integer usage field, 0 if absent."""
+    value = getattr(source, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def cache_usage(usage: Any) -> tuple[int, int]:
+    """Extract prompt cache token counts from a litellm usage object.
+
+    litellm reports cache reads as ``prompt_tokens_details.cached_tokens``
+    for every provider, and Anthropic cache writes as
+    ``cache_creation_input_tokens``. Both are included in prompt_tokens.
+
+    Args:
+        usage: Response usage, or None
+
+    Returns:
+        Tuple of (cached_tokens, cache_write_tokens)
+    """
+    if usage is None:
+        return 0, 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    return (
+        _usage_count(details, "cached_tokens"),
+        _usage_count(usage, "cache_creation_input_tokens"),
+    )
+
 
 @dataclass
 class LLMCallRecord:
@@ -49,6 +144,8 @@ class LLMCallRecord:
     response_content: str = ""
     prompt_tokens: int = 0
     completion_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
     latency_ms: int = 0
 
     # Context
@@ -75,6 +172,8 @@ class LLMCallRecord:
             "response_content": self.response_content,
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
             "latency_ms": self.latency_ms,
             "agent_id": self.agent_id,
             "simulation_id": self.simulation_id,
@@ -97,6 +196,7 @@ class LLMProvider:
         retry_delay: float = DEFAULT_RETRY_DELAY,
         retry_multiplier: float = DEFAULT_RETRY_MULTIPLIER,
         simulation_id: str | None = None,
+        prompt_caching: bool = True,
     ):
         """Initialize the LLM provider.
 
@@ -108,6 +208,8 @@ class LLMProvider:
             retry_delay: Initial delay between retries in seconds
             retry_multiplier: Multiplier for exponential backoff
             simulation_id: Simulation ID for call logging
+            prompt_caching: Whether to mark stable prompt prefixes with
+                cache_control hints for providers that need them
         """
         self.default_model = default_model
         self.cache = cache or LLMCache()
@@ -116,6 +218,7 @@ class LLMProvider:
         self.retry_delay = retry_delay
         self.retry_multiplier = retry_multiplier
         self.simulation_id = simulation_id
+        self.prompt_caching = prompt_caching
         self._total_tokens = 0
         self._total_cost = 0.0
         self._call_history: list[LLMCallRecord] = []
@@ -131,6 +234,7 @@ class LLMProvider:
         seed: int | None = None,
         agent_id: str | None = None,
         step: int | None = None,
+        prompt_prefix: str | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
         """Generate a completion from the LLM.
@@ -145,6 +249,9 @@ class LLMProvider:
             seed: Seed for reproducibility (provider support varies)
             agent_id: Agent ID for call attribution/logging
             step: Simulation step for call logging
+            prompt_prefix: Stable context shared across calls (e.g. the
+                topic header), sent ahead of the prompt so providers can
+                cache it
             **kwargs: Additional parameters passed to the model
 
         Returns:
@@ -158,11 +265,13 @@ class LLMProvider:
         model = model or self.default_model
         provider = model.split("/")[0] if "/" in model else "unknown"
 
-        # Build messages
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        # Build messages, stable prefix first
+        messages = build_messages(
+            prompt,
+            system_prompt=system_prompt,
+            prompt_prefix=prompt_prefix,
+            cache_control=self.prompt_caching and supports_cache_control(model),
+        )
 
         # Check cache
         cache_key = self._cache_key(messages, model, temperature, seed)
@@ -179,6 +288,7 @@ class LLMProvider:
                     response_content=cached["content"],
                     prompt_tokens=cached["prompt_tokens"],
                     completion_tokens=cached["completion_tokens"],
+                    cached_tokens=cached.get("cached_tokens", 0),
                     agent_id=agent_id,
                     simulation_id=self.simulation_id,
                     step=step,
@@ -194,6 +304,7 @@ class LLMProvider:
                     cost=cached["cost"],
                     model=model,
                     cached=True,
+                    cached_tokens=cached.get("cached_tokens", 0),
                 )
 
         # Prepare call record
@@ -273,10 +384,18 @@ class LLMProvider:
         # Extract response data
         content = response.choices[0].message.content or ""
         usage = response.usage
-        prompt_tokens = usage.prompt_tokens if usage else count_tokens(prompt, model)
+        if usage:
+            prompt_tokens = usage.prompt_tokens
+        else:
+            prompt_tokens = count_tokens(
+                "\n\n".join(p for p in (system_prompt, prompt_prefix, prompt) if p), model
+            )
         completion_tokens = usage.completion_tokens if usage else count_tokens(content, model)
+        cached_tokens, cache_write_tokens = cache_usage(usage)
         tokens_used = prompt_tokens + completion_tokens
-        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        cost = estimate_cost(
+            model, prompt_tokens, completion_tokens, cached_tokens, cache_write_tokens
+        )
 
         # Update totals
         self._total_tokens += tokens_used
@@ -286,6 +405,8 @@ class LLMProvider:
         record.response_content = content
         record.prompt_tokens = prompt_tokens
         record.completion_tokens = completion_tokens
+        record.cached_tokens = cached_tokens
+        record.cache_write_tokens = cache_write_tokens
         record.latency_ms = latency_ms
         record.retries = retries
         self._call_history.append(record)
@@ -299,6 +420,7 @@ class LLMProvider:
             cost=cost,
             model=model,
             cached=False,
+            cached_tokens=cached_tokens,
         )
 
         # Cache response
@@ -309,7 +431,7 @@ class LLMProvider:
 
     def _cache_key(
         self,
-        messages: list[dict[str, str]],
+        messages: list[dict[str, Any]],
         model: str,
         temperature: float,
         seed: int | None = None,
@@ -0,0 +1,101 @@
+"""Offline stand-in for litellm completions.
+
+StubCompletion has the same call signature as ``litellm.acompletion`` and
+returns litellm ModelResponse objects, so it can replace the real call in
+tests and offline runs (e.g. by patching ``agentworld.llm.provider.acompletion``).
+
+Usage mimics provider prompt caching: each request's cacheable prefixes are
+remembered, and a later request that starts with one of them reports those
+tokens as cached. Requests with cache_control blocks cache up to each
+marked block and report cache writes, as Anthropic does; other requests
+cache each leading message automatically, as OpenAI does.
+"""
+
+from typing import Any, Callable
+
+from litellm import ModelResponse
+from litellm.types.utils import Usage
+
+from agentworld.llm.tokens import count_tokens
+
+
+def _blocks(message: dict[str, Any]) -> list[dict[str, Any]]:
+    """Content of a message as a list of text blocks."""
+    content = message.get("content") or ""
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}]
+    return list(content)
+
+
+class StubCompletion:
+    """Fake ``acompletion`` with canned replies and prompt cache accounting.
+
+    Attributes:
+        calls: Keyword arguments of every call, in order
+    """
+
+    def __init__(self, reply: str | Callable[[list[dict[str, Any]]], str] = "Stub response"):
+        """Initialize the stub.
+
+        Args:
+            reply: Reply text, or a function of the messages returning it
+        """
+        self.reply = reply
+        self.calls: list[dict[str, Any]] = []
+        self._cached_prefixes: set[str] = set()
+
+    async def __call__(self, model: str, messages: list[dict[str, Any]], **kwargs: Any) -> ModelResponse:
+        """Return a completion for the messages."""
+        self.calls.append({"model": model, "messages": messages, **kwargs})
+        content = self.reply(messages) if callable(self.reply) else self.reply
+
+        text, prefixes, marked = self._prefixes(messages)
+        cached = max((p for p in prefixes if p in self._cached_prefixes), key=len, default="")
+        written = max(prefixes, key=len, default="") if marked else ""
+        self._cached_prefixes.update(prefixes)
+
+        prompt_tokens = count_tokens(text, model)
+        cached_tokens = count_tokens(cached, model) if cached else 0
+        write_tokens = count_tokens(written, model) - cached_tokens if len(written) > len(cached) else 0
+        completion_tokens = count_tokens(content, model)
+        return ModelResponse(
+            model=model,
+            choices=[{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+            usage=Usage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+                prompt_tokens_details={"cached_tokens": cached_tokens},
+                cache_creation_input_tokens=write_tokens,
+            ),
+        )
+
+    @staticmethod
+    def _prefixes(messages: list[dict[str, Any]]) -> tuple[str, list[str], bool]:
+        """Split a request into its full text and cacheable prefixes.
+
+        Returns:
+            Tuple of (full text, cacheable prefixes, whether any block
+            carried cache_control)
+        """
+        text = ""
+        marked: list[str] = []
+        boundaries: list[str] = []
+        for message in messages:
+            for block in _blocks(message):
+                text += block.get("text", "")
+                if block.get("cache_control"):
+                    marked.append(text)
+            boundaries.append(text)
+        if marked:
+            return text, marked, True
+        return text, boundaries[:-1], False
+
+    def reset(self) -> None:
+        """Forget recorded calls and cached prefixes."""
+        self.calls.clear()
+        self._cached_prefixes.clear()
@@ -1,24 +1,92 @@
-"""Prompt template system using Jinja2."""
+"""Prompt template system using Jinja2.
 
+Templates are compiled once per process: string templates share one
+environment and a compiled-template cache keyed by source, and file
+templates are compiled through an environment with a filesystem bytecode
+cache, so other worker processes load compiled code instead of parsing.
+"""
+
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
+
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+
+logger = logging.getLogger(__name__)
+
+# Default directory for compiled file templates (None without a home directory)
+try:
+    DEFAULT_TEMPLATE_CACHE_DIR: Path | None = Path.home() / ".agentworld" / "template_cache"
+except RuntimeError:
+    DEFAULT_TEMPLATE_CACHE_DIR = None
+
+TEMPLATE_SUFFIX = ".jinja2"
 
-from jinja2 import Environment, FileSystemLoader, BaseLoader, Template
+_string_env = Environment(loader=BaseLoader())
+
+
+@lru_cache(maxsize=256)
+def _compile(source: str) -> Template:
+    """Compile a string template, once per distinct source."""
+    return _string_env.from_string(source)
+
+
+def _bytecode_cache(cache_dir: str | Path | None) -> FileSystemBytecodeCache | None:
+    """Bytecode cache in a directory, or None if it cannot be created.
+
+    Read-only or missing home directories (containers, sandboxed workers)
+    just mean templates are compiled without a shared cache.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get("AGENTWORLD_TEMPLATE_CACHE") or DEFAULT_TEMPLATE_CACHE_DIR
+        if cache_dir is None:
+            return None
+    cache_dir = Path(cache_dir)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning("Template bytecode cache disabled: %s", e)
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+
+def production_mode() -> bool:
+    """Whether AGENTWORLD_ENV selects production (no template reloading)."""
+    return os.environ.get("AGENTWORLD_ENV", "").lower() == "production"
 
 
 class PromptTemplate:
-    """A Jinja2-based prompt template."""
+    """A Jinja2-based prompt template.
+
+    String templates are compiled on first use, so a syntax error is raised
+    by the first render (or ``template`` access), not by the constructor,
+    unless ``precompile`` is set.
+    """
 
-    def __init__(self, template: str | Template):
+    def __init__(self, template: str | Template, precompile: bool = False):
         """Initialize with a template string or Jinja2 Template.
 
         Args:
             template: Template string or compiled Template
+            precompile: Compile now, raising TemplateSyntaxError on bad input
+
+        Raises:
+            TemplateSyntaxError: If precompiling a malformed template
         """
-        if isinstance(template, str):
-            self._template = Environment(loader=BaseLoader()).from_string(template)
-        else:
-            self._template = template
+        self._source = template if isinstance(template, str) else None
+        self._template = None if isinstance(template, str) else template
+        if precompile:
+            self.template
+
+    @property
+    def template(self) -> Template:
+        """The compiled Jinja2 template."""
+        if self._template is None:
+            self._template = _compile(self._source)
+        return self._template
 
     def render(self, **kwargs: Any) -> str:
         """Render the template with given variables.
@@ -29,7 +97,19 @@ class PromptTemplate:
         Returns:
             Rendered template string
         """
-        return self._template.render(**kwargs)
+        return self.template.render(**kwargs)
+
+    def render_many(self, variables: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Render the template once per set of variables.
+
+        Args:
+            variables: Template variables for each rendering
+
+        Returns:
+            Rendered strings, in order
+        """
+        render = self.template.render
+        return [render(values) for values in variables]
 
     @classmethod
     def from_file(cls, path: str | Path) -> "PromptTemplate":
@@ -49,14 +129,28 @@ class PromptTemplate:
 class TemplateRegistry:
     """Registry for managing prompt templates."""
 
-    def __init__(self, template_dir: str | Path | None = None):
+    def __init__(
+        self,
+        template_dir: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        auto_reload: bool | None = None,
+        precompile: bool = False,
+    ):
         """Initialize the registry.
 
         Args:
             template_dir: Directory containing template files
+            cache_dir: Directory for compiled template bytecode (defaults to
+                AGENTWORLD_TEMPLATE_CACHE or ~/.agentworld/template_cache);
+                created when needed, and skipped if that fails
+            auto_reload: Recompile file templates when they change on disk
+                (defaults to off in production mode)
+            precompile: Compile every template now, and templates registered
+                later as they are registered, instead of on first use
         """
         self._templates: dict[str, PromptTemplate] = {}
         self._env: Environment | None = None
+        self._precompile = precompile
 
         if template_dir:
             template_dir = Path(template_dir)
@@ -65,24 +159,48 @@ class TemplateRegistry:
                     loader=FileSystemLoader(str(template_dir)),
                     trim_blocks=True,
                     lstrip_blocks=True,
+                    auto_reload=not production_mode() if auto_reload is None else auto_reload,
+                    bytecode_cache=_bytecode_cache(cache_dir),
                 )
 
         # Register built-in templates
         self._register_builtins()
 
+        if precompile:
+            self.precompile()
+
     def _register_builtins(self) -> None:
         """Register built-in templates."""
         self.register("agent_system", PromptTemplate(AGENT_SYSTEM_TEMPLATE))
         self.register("agent_think", PromptTemplate(AGENT_THINK_TEMPLATE))
         self.register("agent_respond", PromptTemplate(AGENT_RESPOND_TEMPLATE))
 
+    def precompile(self) -> list[str]:
+        """Compile all registered and file templates.
+
+        Returns:
+            Names of the compiled templates
+        """
+        if self._env:
+            for filename in self._env.list_templates(filter_func=lambda n: n.endswith(TEMPLATE_SUFFIX)):
+                self.get(filename[:-len(TEMPLATE_SUFFIX)])
+        for template in self._templates.values():
+            template.template  # compiles string templates
+        return list(self._templates)
+
     def register(self, name: str, template: PromptTemplate) -> None:
         """Register a template.
 
         Args:
             name: Template name
             template: PromptTemplate instance
+
+        Raises:
+            TemplateSyntaxError: If the registry precompiles and the
+                template is malformed
         """
+        if self._precompile:
+            template.template
         self._templates[name] = template
 
     def get(self, name: str) -> PromptTemplate | None:
@@ -101,7 +219,7 @@ class TemplateRegistry:
         # Try loading from file system
         if self._env:
             try:
-                jinja_template = self._env.get_template(f"{name}.jinja2")
+                jinja_template = self._env.get_template(f"{name}{TEMPLATE_SUFFIX}")
                 template = PromptTemplate(jinja_template)
                 self._templates[name] = template
                 return template
@@ -123,10 +241,29 @@ class TemplateRegistry:
         Raises:
             KeyError: If template not found
         """
+        return self._require(name).render(**kwargs)
+
+    def render_many(self, name: str, variables: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Render a template by name once per set of variables.
+
+        Args:
+            name: Template name
+            variables: Template variables for each rendering
+
+        Returns:
+            Rendered strings, in order
+
+        Raises:
+            KeyError: If template not found
+        """
+        return self._require(name).render_many(variables)
+
+    def _require(self, name: str) -> PromptTemplate:
+        """Get a template by name, raising KeyError if missing."""
         template = self.get(name)
         if template is None:
             raise KeyError(f"Template not found: {name}")
-        return template.render(**kwargs)
+        return template
 
 
 # Built-in templates
@@ -201,3 +338,16 @@ def render_template(name: str, **kwargs: Any) -> str:
         Rendered template string
     """
     return get_registry().render(name, **kwargs)
+
+
+def render_many(name: str, variables: Iterable[Mapping[str, Any]]) -> list[str]:
+    """Render a template once per set of variables using the global registry.
+
+    Args:
+        name: Template name
+        variables: Template variables for each rendering
+
+    Returns:
+        Rendered strings, in order
+    """
+    return get_registry().render_many(name, variables)
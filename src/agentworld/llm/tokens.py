@@ -1,6 +1,20 @@
-"""Token counting utilities."""
+"""Token counting utilities.
 
+Exact counts come from tiktoken and are memoized in a process-wide LRU
+keyed by encoding and a hash of the text, so recounting the same prompt
+parts or conversation messages is a dictionary lookup. Large batches of
+uncounted texts are encoded in a thread pool (tiktoken releases the GIL
+while encoding).
+
+``approximate=True`` skips the tokenizer and estimates from the UTF-8
+length with a per-encoding linear fit, for hot paths such as rate-limit
+estimates that need speed more than exactness.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import Any, Sequence
 
 try:
     import tiktoken
@@ -19,75 +33,316 @@ MODEL_ENCODINGS = {
     "claude-3": "cl100k_base",  # Approximate
 }
 
+DEFAULT_ENCODING = "cl100k_base"
+
+# Approximate mode: tokens ~= slope * utf8_bytes + intercept. Fitted on
+# English prose and generated persona prompts with cl100k_base (median
+# error ~12%); other encodings use the same fit until calibrated.
+APPROXIMATION_COEFFICIENTS: dict[str, tuple[float, float]] = {
+    "cl100k_base": (0.197, 0.38),
+}
+
+# Uncached texts needed before a batch is spread over threads
+PARALLEL_BATCH_MIN = 256
 
-@lru_cache(maxsize=10)
-def get_encoding(model: str) -> "tiktoken.Encoding | None":
-    """Get the tiktoken encoding for a model.
+
+@lru_cache(maxsize=64)
+def get_encoding_name(model: str) -> str:
+    """Get the tiktoken encoding name for a model.
 
     Args:
         model: Model name (can include provider prefix)
 
     Returns:
-        tiktoken Encoding or None if not available
+        Encoding name
     """
-    if not TIKTOKEN_AVAILABLE:
-        return None
-
     # Strip provider prefix
     model_name = model.split("/")[-1] if "/" in model else model
 
     # Find matching encoding
-    encoding_name = "cl100k_base"  # Default
     for prefix, enc in MODEL_ENCODINGS.items():
         if model_name.startswith(prefix):
-            encoding_name = enc
-            break
+            return enc
+    return DEFAULT_ENCODING
 
+
+@lru_cache(maxsize=10)
+def _load_encoding(encoding_name: str) -> "tiktoken.Encoding | None":
+    """Load a tiktoken encoding by name, None if unavailable."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
     try:
         return tiktoken.get_encoding(encoding_name)
     except Exception:
         return None
 
 
-def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+def get_encoding(model: str) -> "tiktoken.Encoding | None":
+    """Get the tiktoken encoding for a model.
+
+    Args:
+        model: Model name (can include provider prefix)
+
+    Returns:
+        tiktoken Encoding or None if not available
+    """
+    return _load_encoding(get_encoding_name(model))
+
+
+class TokenCache:
+    """Bounded cache of token counts with approximate LRU eviction.
+
+    Keys are (encoding name, text length, text hash). Python caches a
+    string's hash on the string, so looking up the same message again
+    does not rehash it, and the cache does not keep texts alive.
+
+    Counts live in two generations: new and recently used counts go to
+    the young one, and when it fills up it replaces the old one, dropping
+    counts not used since. A hit is one or two dictionary lookups.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached counts
+        """
+        self.max_size = max_size
+        self._young: dict[tuple[str, int, int], int] = {}
+        self._old: dict[tuple[str, int, int], int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(encoding_name: str, text: str) -> tuple[str, int, int]:
+        """Cache key for a text under an encoding."""
+        return (encoding_name, len(text), hash(text))
+
+    def get(self, key: tuple[str, int, int]) -> int | None:
+        """Get a cached count, marking it recently used."""
+        count = self._young.get(key)
+        if count is None:
+            count = self._old.get(key)
+            if count is None:
+                self._misses += 1
+                return None
+            self.set(key, count)
+        self._hits += 1
+        return count
+
+    def get_many(self, keys: list[tuple[str, int, int]]) -> list[int | None]:
+        """Get cached counts for many keys at once (None for misses)."""
+        counts = list(map(self._young.get, keys))
+        misses = 0
+        for i, count in enumerate(counts):
+            if count is None:
+                count = self._old.get(keys[i])
+                if count is None:
+                    misses += 1
+                    continue
+                counts[i] = count
+                self.set(keys[i], count)
+        self._hits += len(keys) - misses
+        self._misses += misses
+        return counts
+
+    def set(self, key: tuple[str, int, int], count: int) -> None:
+        """Cache a count, retiring the young generation if full."""
+        self._young[key] = count
+        if len(self._young) >= max(self.max_size // 2, 1):
+            self._old = self._young
+            self._young = {}
+
+    def clear(self) -> None:
+        """Clear all cached counts."""
+        self._young.clear()
+        self._old.clear()
+
+    @property
+    def size(self) -> int:
+        """Current number of cached counts."""
+        return len(self._young) + len(self._old.keys() - self._young.keys())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+        }
+
+
+_token_cache = TokenCache()
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_token_cache() -> TokenCache:
+    """Get the process-wide token count cache."""
+    return _token_cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for batch encoding."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="agentworld-tokens",
+        )
+    return _executor
+
+
+def approximate_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """Estimate tokens from the text's UTF-8 length.
+
+    Args:
+        text: Text to estimate
+        model: Model name for coefficient selection
+
+    Returns:
+        Estimated token count (at least 1 for non-empty text)
+    """
+    if not text:
+        return 0
+    slope, intercept = _approximation(model)
+    size = len(text) if text.isascii() else len(text.encode("utf-8"))
+    return max(1, round(slope * size + intercept))
+
+
+def _approximation(model: str) -> tuple[float, float]:
+    """Approximate-mode coefficients for a model's encoding."""
+    return APPROXIMATION_COEFFICIENTS.get(
+        get_encoding_name(model), APPROXIMATION_COEFFICIENTS[DEFAULT_ENCODING]
+    )
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini", approximate: bool = False) -> int:
     """Count tokens in text for a given model.
 
     Args:
         text: Text to count tokens for
         model: Model name for encoding selection
+        approximate: Estimate from the text length instead of encoding
 
     Returns:
-        Approximate token count
+        Token count (approximate if requested or tiktoken is unavailable)
     """
-    encoding = get_encoding(model)
-    if encoding:
-        return len(encoding.encode(text))
+    if not text:
+        return 0
+    encoding = None if approximate else get_encoding(model)
+    if encoding is None:
+        return approximate_tokens(text, model)
+
+    key = TokenCache.key(encoding.name, text)
+    count = _token_cache.get(key)
+    if count is None:
+        count = len(encoding.encode_ordinary(text))
+        _token_cache.set(key, count)
+    return count
 
-    # Fallback: rough approximation (4 chars per token)
-    return len(text) // 4
+
+def count_tokens_batch(
+    texts: Sequence[str],
+    model: str = "gpt-4o-mini",
+    approximate: bool = False,
+) -> list[int]:
+    """Count tokens for many texts at once.
+
+    Cached texts are looked up; the rest are encoded once each, across a
+    thread pool when there are many.
+
+    Args:
+        texts: Texts to count tokens for
+        model: Model name for encoding selection
+        approximate: Estimate from the text lengths instead of encoding
+
+    Returns:
+        Token counts, in the order of ``texts``
+    """
+    encoding = None if approximate else get_encoding(model)
+    if encoding is None:
+        slope, intercept = _approximation(model)
+        return [
+            max(1, round(slope * (len(t) if t.isascii() else len(t.encode("utf-8"))) + intercept))
+            if t else 0
+            for t in texts
+        ]
+
+    name = encoding.name
+    keys = [(name, len(text), hash(text)) for text in texts]
+    counts = [0] * len(texts)
+    missing: dict[tuple[str, int, int], list[int]] = {}
+    pending: list[str] = []
+    for i, count in enumerate(_token_cache.get_many(keys)):
+        if count is not None:
+            counts[i] = count
+        elif not texts[i]:
+            continue
+        elif keys[i] in missing:
+            missing[keys[i]].append(i)
+        else:
+            missing[keys[i]] = [i]
+            pending.append(texts[i])
+
+    if pending:
+        for key, count in zip(missing, _encode_lengths(encoding, pending)):
+            _token_cache.set(key, count)
+            for i in missing[key]:
+                counts[i] = count
+    return counts
+
+
+def _encode_lengths(encoding: "tiktoken.Encoding", texts: list[str]) -> list[int]:
+    """Token lengths of texts, encoded in parallel chunks when many.
+
+    tiktoken's own ``encode_batch`` submits one task per text, which costs
+    more than encoding a typical message, so chunks are submitted instead.
+    """
+    workers = min(8, os.cpu_count() or 1)
+    if len(texts) < PARALLEL_BATCH_MIN or workers == 1:
+        return [len(tokens) for tokens in map(encoding.encode_ordinary, texts)]
+
+    size = -(-len(texts) // workers)
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+
+    def encode(chunk: list[str]) -> list[int]:
+        return [len(encoding.encode_ordinary(text)) for text in chunk]
+
+    return [count for counts in _get_executor().map(encode, chunks) for count in counts]
+
+
+def _content_text(content: Any) -> str:
+    """Text of a message content string or list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content or [])
 
 
 def count_message_tokens(
-    messages: list[dict[str, str]],
+    messages: list[dict[str, Any]],
     model: str = "gpt-4o-mini",
+    approximate: bool = False,
 ) -> int:
     """Count tokens in a list of messages.
 
     Args:
-        messages: List of message dicts with 'role' and 'content'
+        messages: List of message dicts with 'role' and 'content' (a string
+            or a list of text content blocks)
         model: Model name for encoding selection
+        approximate: Estimate from the text lengths instead of encoding
 
     Returns:
         Approximate token count including message overhead
     """
-    total = 0
+    texts = []
     for message in messages:
-        # Add tokens for message structure (role, content keys, etc.)
-        total += 4  # Approximate overhead per message
-        total += count_tokens(message.get("role", ""), model)
-        total += count_tokens(message.get("content", ""), model)
-
-    # Add tokens for reply priming
-    total += 2
+        texts.append(message.get("role", ""))
+        texts.append(_content_text(message.get("content", "")))
 
-    return total
+    # 4 tokens of structure (role, content keys, etc.) per message,
+    # plus 2 for reply priming
+    return sum(count_tokens_batch(texts, model, approximate)) + 4 * len(messages) + 2
@@ -10,6 +10,7 @@ from agentworld.memory.reflection import Reflection, ReflectionConfig
 from agentworld.memory.retrieval import MemoryRetrieval, RetrievalConfig
 from agentworld.memory.importance import ImportanceRater
 from agentworld.memory.embeddings import EmbeddingGenerator, EmbeddingConfig
+from agentworld.memory.store import MemoryStore
 
 __all__ = [
     "Memory",
@@ -22,4 +23,5 @@ __all__ = [
     "ImportanceRater",
     "EmbeddingGenerator",
     "EmbeddingConfig",
+    "MemoryStore",
 ]
@@ -5,14 +5,30 @@ Implements dual memory architecture with episodic observations and semantic refl
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import logging
+import re
 
 from agentworld.memory.observation import Observation
 from agentworld.memory.reflection import Reflection, ReflectionConfig
 from agentworld.memory.retrieval import MemoryRetrieval, RetrievalConfig
 from agentworld.memory.importance import ImportanceRater
+from agentworld.memory.retention import RetentionIndex
+from agentworld.memory.store import MemoryStore
+from agentworld.memory.clock import MemoryClock
 from agentworld.memory.embeddings import EmbeddingGenerator, EmbeddingConfig
-from agentworld.llm.provider import LLMProvider
+
+if TYPE_CHECKING:
+    from agentworld.llm.provider import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+def _log_reflection_failure(task: asyncio.Task) -> None:
+    """Done callback: log a failed background reflection run."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background reflection failed", exc_info=task.exception())
 
 
 @dataclass
@@ -23,15 +39,23 @@ class RetentionPolicy:
         max_observations: Maximum observations per agent
         max_reflections: Maximum reflections per agent
         prune_strategy: How to select memories for pruning
+        low_water_mark: Fraction of max_observations to prune down to, so
+            pruning runs once per batch of inserts rather than on every insert
     """
     max_observations: int = 1000
     max_reflections: int = 100
     prune_strategy: str = "importance_weighted"  # or "fifo", "recency"
+    low_water_mark: float = 0.9
 
     def should_prune(self, observation_count: int) -> bool:
         """Check if pruning is needed."""
         return observation_count > self.max_observations
 
+    def prune_target(self) -> int:
+        """Number of observations to keep after pruning."""
+        fraction = max(0.0, min(1.0, self.low_water_mark))
+        return int(self.max_observations * fraction)
+
 
 @dataclass
 class MemoryConfig:
@@ -67,6 +91,12 @@ Relevant memories:
 
 Provide a concise insight (1-2 sentences) that answers this question based on the memories."""
 
+BATCH_SYNTHESIS_PROMPT = """Based on the memories listed under each question, answer every question with an insightful reflection. Synthesize the information into a general insight or belief.
+
+{sections}
+
+For each question, provide a concise insight (1-2 sentences) on a single line, prefixed with its number (e.g. "1. ...")."""
+
 
 class Memory:
     """Dual memory system with episodic observations and semantic reflections.
@@ -76,21 +106,30 @@ class Memory:
     - Reflections: Synthesized insights from multiple observations
     - Retrieval: Combined scoring of recency, relevance, and importance
     - Reflection generation: Automatic synthesis when importance accumulates
+
+    When a MemoryStore is attached, new memories are written through it in
+    batches and previously stored memories are loaded on first use.
     """
 
     def __init__(
         self,
         config: MemoryConfig | None = None,
-        llm_provider: LLMProvider | None = None
+        llm_provider: "LLMProvider | None" = None,
+        store: MemoryStore | None = None,
+        clock: MemoryClock | None = None
     ):
         """Initialize memory system.
 
         Args:
             config: Memory system configuration
             llm_provider: LLM provider for importance rating and reflection
+            store: Optional persistent backend for memories
+            clock: Clock for memory timestamps and recency (wall time if None)
         """
         self.config = config or MemoryConfig()
         self.llm = llm_provider
+        self.store = store
+        self._loaded = store is None
 
         # Memory stores
         self._observations: List[Observation] = []
@@ -98,30 +137,69 @@ class Memory:
 
         # Importance accumulator for triggering reflections
         self._importance_accumulator: float = 0.0
+        self._reflection_task: asyncio.Task | None = None
 
         # Components
         self._embeddings = EmbeddingGenerator(self.config.embedding_config)
         self._retrieval = MemoryRetrieval(
             self.config.retrieval_config,
-            self._embeddings
+            self._embeddings,
+            clock
         )
+        self.clock = self._retrieval.clock
         self._importance = ImportanceRater(llm_provider)
+        self._retention = self._build_retention_index()
 
     @property
     def observations(self) -> List[Observation]:
         """Get all observations."""
+        self._ensure_loaded()
         return self._observations.copy()
 
     @property
     def reflections(self) -> List[Reflection]:
         """Get all reflections."""
+        self._ensure_loaded()
         return self._reflections.copy()
 
     @property
     def all_memories(self) -> List[Observation | Reflection]:
         """Get all memories (observations + reflections)."""
+        self._ensure_loaded()
         return self._observations + self._reflections
 
+    def _ensure_loaded(self) -> None:
+        """Load stored memories from the backend on first use.
+
+        Stored memories predate anything added in this session, so they are
+        placed ahead of in-memory ones.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        observations, reflections = self.store.load()
+        known = {m.id for m in self._observations}
+        known.update(m.id for m in self._reflections)
+        observations = [o for o in observations if o.id not in known]
+        reflections = [r for r in reflections if r.id not in known]
+
+        self._observations = observations + self._observations
+        self._reflections = reflections + self._reflections
+        if self._retention is not None:
+            for obs in observations:
+                self._retention.add(obs)
+
+    def flush(self) -> int:
+        """Write pending memories to the persistent backend.
+
+        Returns:
+            Number of memories written
+        """
+        if self.store is None:
+            return 0
+        return self.store.flush()
+
     async def add_observation(
         self,
         content: str,
@@ -152,6 +230,7 @@ class Memory:
 
         observation = Observation(
             content=content,
+            timestamp=self.clock.now(),
             source=source,
             location=location,
             importance=importance,
@@ -160,12 +239,19 @@ class Memory:
         )
 
         self._observations.append(observation)
+        if self._retention is not None:
+            self._retention.add(observation)
+        if self.store is not None:
+            self.store.add(observation)
         self._importance_accumulator += importance
 
         # Check if we should generate reflections
         if self.config.reflection_config.enabled:
             if self._importance_accumulator >= self.config.reflection_config.threshold:
-                await self.generate_reflections()
+                if self.config.reflection_config.background:
+                    self._schedule_reflections()
+                else:
+                    await self.generate_reflections()
 
         # Check if we need to prune
         self._maybe_prune()
@@ -188,6 +274,7 @@ class Memory:
         Returns:
             Top-k relevant memories
         """
+        self._ensure_loaded()
         memories = self._observations.copy()
         if include_reflections:
             memories.extend(self._reflections)
@@ -206,9 +293,14 @@ class Memory:
         if not self.config.reflection_config.enabled:
             return []
 
+        self._ensure_loaded()
         if not self._observations:
             return []
 
+        # Importance consumed by this run; observations added while it runs
+        # (in background mode) count towards the next one
+        consumed = self._importance_accumulator
+
         if self.llm is None:
             # Can't generate reflections without LLM
             self._importance_accumulator = 0.0
@@ -219,30 +311,48 @@ class Memory:
 
         # Generate questions about recent observations
         questions = await self._generate_questions(recent)
+        questions = questions[:self.config.reflection_config.questions_per_reflection]
 
-        # Generate reflections for each question
-        reflections = []
-        for question in questions[:self.config.reflection_config.questions_per_reflection]:
-            # Retrieve relevant memories for this question
-            relevant = await self._retrieval.retrieve(
+        # Retrieve relevant memories for all questions concurrently
+        memories = self.all_memories
+        retrieved = await asyncio.gather(*(
+            self._retrieval.retrieve(
                 question,
-                self.all_memories,
+                memories,
                 k=self.config.reflection_config.memories_per_question
             )
+            for question in questions
+        ))
+        answerable = [
+            (question, relevant)
+            for question, relevant in zip(questions, retrieved)
+            if relevant
+        ]
+
+        # Synthesize insights, in one batched call or one call per question
+        if self.config.reflection_config.batch_synthesis:
+            insights = await self._synthesize_batch(answerable)
+        else:
+            insights = await asyncio.gather(*(
+                self._synthesize(question, relevant)
+                for question, relevant in answerable
+            ))
+
+        answered = [
+            (question, relevant, insight)
+            for (question, relevant), insight in zip(answerable, insights)
+            if insight
+        ]
+        embeddings = await self._embeddings.embed_batch(
+            [insight for _, _, insight in answered]
+        )
 
-            if not relevant:
-                continue
-
-            # Synthesize insight
-            insight = await self._synthesize(question, relevant)
-
-            if not insight:
-                continue
-
-            # Create reflection
-            embedding = await self._embeddings.embed(insight)
+        # Create reflections
+        reflections = []
+        for (question, relevant, insight), embedding in zip(answered, embeddings):
             reflection = Reflection(
                 content=insight,
+                timestamp=self.clock.now(),
                 importance=self.config.reflection_config.min_reflection_importance,
                 embedding=embedding,
                 embedding_model=self.config.embedding_config.model,
@@ -251,12 +361,40 @@ class Memory:
             )
             reflections.append(reflection)
             self._reflections.append(reflection)
+            if self.store is not None:
+                self.store.add(reflection)
 
-        # Reset accumulator
-        self._importance_accumulator = 0.0
+        # Reset accumulator, keeping importance that arrived during the run
+        self._importance_accumulator = max(0.0, self._importance_accumulator - consumed)
 
         return reflections
 
+    def _schedule_reflections(self) -> None:
+        """Start reflection generation as a background task.
+
+        At most one run is in flight; observations arriving meanwhile keep
+        accumulating importance for the next run.
+        """
+        if self._reflection_task is not None and not self._reflection_task.done():
+            return
+        self._reflection_task = asyncio.create_task(self.generate_reflections())
+        self._reflection_task.add_done_callback(_log_reflection_failure)
+
+    async def wait_for_reflections(self) -> List[Reflection]:
+        """Wait for a pending background reflection run to finish.
+
+        Returns:
+            Reflections generated by the pending run, or an empty list
+
+        Raises:
+            Exception: Whatever the pending run raised
+        """
+        task = self._reflection_task
+        if task is None:
+            return []
+        self._reflection_task = None
+        return await task
+
     async def _generate_questions(self, observations: List[Observation]) -> List[str]:
         """Generate reflection questions from observations.
 
@@ -316,47 +454,116 @@ class Memory:
         except Exception:
             return None
 
+    def _build_retention_index(self) -> RetentionIndex | None:
+        """Create the eviction index for the configured prune strategy."""
+        strategy = self.config.retention_policy.prune_strategy
+        if strategy == "importance_weighted":
+            return RetentionIndex(self._retention_score)
+        if strategy == "recency":
+            return RetentionIndex(
+                self._retrieval._compute_recency, bucket_by_importance=False
+            )
+        return None
+
+    def _retention_score(self, obs: Observation, now: datetime) -> float:
+        """Score used by importance-weighted pruning (higher is kept)."""
+        recency = self._retrieval._compute_recency(obs, now)
+        importance_norm = (obs.importance - 1.0) / 9.0
+        return importance_norm * 0.7 + recency * 0.3
+
+    async def _synthesize_batch(
+        self,
+        items: List[tuple[str, List[Observation | Reflection]]]
+    ) -> List[Optional[str]]:
+        """Synthesize insights for several questions in a single LLM call.
+
+        Args:
+            items: (question, relevant memories) pairs
+
+        Returns:
+            Insight per question, None where the response had no answer
+        """
+        if not self.llm or not items:
+            return [None] * len(items)
+
+        sections = "\n\n".join(
+            f"Question {i}: {question}\nRelevant memories:\n"
+            + "\n".join(f"- {m.content}" for m in memories)
+            for i, (question, memories) in enumerate(items, 1)
+        )
+        prompt = BATCH_SYNTHESIS_PROMPT.format(sections=sections)
+
+        try:
+            response = await self.llm.complete(prompt)
+        except Exception:
+            return [None] * len(items)
+
+        insights: List[Optional[str]] = [None] * len(items)
+        for line in response.content.strip().split("\n"):
+            match = re.match(r"\s*(\d+)[.):]\s*(.+)", line)
+            if not match:
+                continue
+            index = int(match.group(1)) - 1
+            if 0 <= index < len(items) and insights[index] is None:
+                insights[index] = match.group(2).strip()
+        return insights
+
     def _maybe_prune(self) -> None:
-        """Prune memories if over retention limits."""
+        """Prune memories if over retention limits.
+
+        Prunes down to the policy's low-water mark, so the cost of a prune
+        is amortised over the inserts it takes to reach the limit again.
+        """
         policy = self.config.retention_policy
 
+        self._ensure_loaded()
         if not policy.should_prune(len(self._observations)):
             return
 
+        target = policy.prune_target()
+
         if policy.prune_strategy == "importance_weighted":
-            self._prune_importance_weighted()
+            self._prune_importance_weighted(target)
         elif policy.prune_strategy == "fifo":
-            self._prune_fifo()
+            self._prune_fifo(target)
         elif policy.prune_strategy == "recency":
-            self._prune_recency()
+            self._prune_recency(target)
 
-    def _prune_importance_weighted(self) -> None:
+    def _prune_importance_weighted(self, target: int) -> None:
         """Keep high-importance and recent memories."""
-        policy = self.config.retention_policy
-        now = datetime.now()
-
-        # Score each observation
-        scored = []
-        for obs in self._observations:
-            recency = self._retrieval._compute_recency(obs, now)
-            importance_norm = (obs.importance - 1.0) / 9.0
-            score = importance_norm * 0.7 + recency * 0.3
-            scored.append((obs, score))
-
-        # Sort by score and keep top max_observations
-        scored.sort(key=lambda x: x[1], reverse=True)
-        self._observations = [obs for obs, _ in scored[:policy.max_observations]]
+        self._evict_indexed(target)
 
-    def _prune_fifo(self) -> None:
+    def _prune_fifo(self, target: int) -> None:
         """Keep most recent observations (first-in-first-out)."""
-        policy = self.config.retention_policy
-        self._observations = self._observations[-policy.max_observations:]
+        cut = len(self._observations) - target
+        self._forget([obs.id for obs in self._observations[:cut]])
+        self._observations = self._observations[cut:]
 
-    def _prune_recency(self) -> None:
+    def _prune_recency(self, target: int) -> None:
         """Keep most recent observations by timestamp."""
-        policy = self.config.retention_policy
-        sorted_obs = sorted(self._observations, key=lambda o: o.timestamp, reverse=True)
-        self._observations = sorted_obs[:policy.max_observations]
+        self._evict_indexed(target)
+
+    def _evict_indexed(self, target: int) -> None:
+        """Evict lowest-scoring observations via the retention index.
+
+        Surviving observations keep their insertion order.
+        """
+        if self._retention is None:
+            return
+
+        evicted = self._retention.evict(
+            len(self._observations) - target, self.clock.now()
+        )
+        evicted_ids = {obs.id for obs in evicted}
+        self._observations = [
+            obs for obs in self._observations if obs.id not in evicted_ids
+        ]
+        self._forget(list(evicted_ids))
+
+    def _forget(self, memory_ids: List[str]) -> None:
+        """Delete pruned memories from the persistent backend."""
+        if self.store is not None and memory_ids:
+            self.store.delete(memory_ids)
 
     def get_context_for_prompt(
         self,
@@ -374,6 +581,7 @@ class Memory:
         Returns:
             Formatted memory context string
         """
+        self._ensure_loaded()
         recent = self._observations[-recent_k:]
         if not recent:
             return ""
@@ -383,6 +591,14 @@ class Memory:
 
     def clear(self) -> None:
         """Clear all memories."""
+        if self._reflection_task is not None:
+            self._reflection_task.cancel()
+            self._reflection_task = None
         self._observations.clear()
         self._reflections.clear()
         self._importance_accumulator = 0.0
+        if self._retention is not None:
+            self._retention.clear()
+        if self.store is not None:
+            self.store.clear()
+            self._loaded = True
@@ -0,0 +1,342 @@
+"""Memory system benchmarks.
+
+Runs the hot memory operations against synthetic observation corpora using
+deterministic embeddings and a stubbed LLM, so results only reflect local
+compute. Results can be saved as a baseline and later runs compared against
+it to catch performance regressions; the baseline committed under
+benchmarks/ is used by default.
+
+Memory is measured per case with tracemalloc (which also traces numpy
+buffers) in a separate, untimed run, so tracing overhead never skews the
+throughput numbers.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+
+from agentworld.core.models import LLMResponse
+from agentworld.memory.base import Memory, MemoryConfig, RetentionPolicy
+from agentworld.memory.embeddings import EmbeddingConfig
+from agentworld.memory.observation import Observation
+from agentworld.memory.reflection import ReflectionConfig
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Baseline committed with the repository (present in source checkouts)
+DEFAULT_BASELINE = Path(__file__).resolve().parents[3] / "benchmarks" / "memory.json"
+
+_SUBJECTS = ["Alice", "Bob", "Carol", "Dave", "Erin", "Frank", "Grace", "Heidi"]
+_VERBS = ["said", "thinks", "asked about", "is worried about", "agreed with", "disagreed with"]
+_TOPICS = [
+    "the new pricing plan", "the product launch", "remote work", "the budget",
+    "customer feedback", "the roadmap", "the onboarding flow", "a critical bug",
+]
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a single benchmark.
+
+    Attributes:
+        name: Operation benchmarked
+        size: Number of observations in the corpus
+        operations: Number of timed operations
+        seconds: Total wall time for the timed operations
+        peak_memory_mb: Peak memory traced while running this case alone
+    """
+    name: str
+    size: int
+    operations: int
+    seconds: float
+    peak_memory_mb: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Baseline lookup key."""
+        return f"{self.name}@{self.size}"
+
+    @property
+    def ops_per_sec(self) -> float:
+        """Operations per second."""
+        if self.seconds <= 0:
+            return float("inf")
+        return self.operations / self.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "size": self.size,
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "ops_per_sec": self.ops_per_sec,
+            "peak_memory_mb": self.peak_memory_mb,
+        }
+
+
+@dataclass
+class Regression:
+    """A benchmark slower than its baseline beyond the tolerance."""
+    key: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def slowdown(self) -> float:
+        """Fractional drop in throughput relative to baseline."""
+        return 1.0 - self.ops_per_sec / self.baseline_ops_per_sec
+
+
+class StubLLM:
+    """LLM stand-in returning canned reflection questions and insights."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def complete(self, prompt: str, **kwargs: Any) -> LLMResponse:
+        self.calls += 1
+        if prompt.startswith("Given the following observations"):
+            content = "\n".join(f"What matters about {topic}?" for topic in _TOPICS[:3])
+        else:
+            content = "People care most about outcomes that affect them directly."
+        return LLMResponse(
+            content=content,
+            tokens_used=0,
+            prompt_tokens=0,
+            completion_tokens=0,
+            cost=0.0,
+            model="stub",
+        )
+
+
+def synthetic_corpus(size: int, seed: int = 0) -> List[str]:
+    """Generate synthetic observation texts.
+
+    Args:
+        size: Number of observations
+        seed: Random seed
+
+    Returns:
+        List of observation strings
+    """
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_TOPICS)} (#{i})"
+        + ("!" if rng.random() < 0.1 else "")
+        for i in range(size)
+    ]
+
+
+def measure_peak_memory_mb(benchmark: Callable[[int, int], Any], size: int, dimensions: int) -> float:
+    """Peak memory allocated while running one benchmark case.
+
+    Unlike the process-wide peak RSS, which only ever grows, this counts
+    only what the case itself allocates.
+
+    Args:
+        benchmark: Benchmark coroutine function
+        size: Corpus size
+        dimensions: Embedding dimensions
+
+    Returns:
+        Peak traced memory in MB
+    """
+    tracemalloc.start()
+    try:
+        asyncio.run(benchmark(size, dimensions))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024.0 * 1024.0)
+
+
+def _make_memory(
+    dimensions: int,
+    max_observations: int,
+    llm: Optional[StubLLM] = None,
+    reflections: bool = False,
+) -> Memory:
+    """Create a memory wired for benchmarking."""
+    config = MemoryConfig(
+        embedding_config=EmbeddingConfig(
+            model="deterministic", dimensions=dimensions, provider="deterministic"
+        ),
+        reflection_config=ReflectionConfig(enabled=reflections, threshold=float("inf")),
+        retention_policy=RetentionPolicy(max_observations=max_observations),
+    )
+    return Memory(config=config, llm_provider=llm)
+
+
+async def _fill(memory: Memory, corpus: List[str]) -> None:
+    """Load a corpus into memory without going through add_observation."""
+    embeddings = await memory._embeddings.embed_batch(corpus)
+    start = datetime.now() - timedelta(hours=len(corpus) / 60.0)
+    for i, (text, embedding) in enumerate(zip(corpus, embeddings)):
+        obs = Observation(
+            content=text,
+            timestamp=start + timedelta(minutes=i),
+            importance=memory._importance._rate_heuristic(text),
+            embedding=embedding,
+            embedding_model="deterministic",
+        )
+        memory._observations.append(obs)
+        if memory._retention is not None:
+            memory._retention.add(obs)
+
+
+async def bench_add_observation(size: int, dimensions: int) -> BenchmarkResult:
+    """Time add_observation over a full corpus."""
+    corpus = synthetic_corpus(size)
+    memory = _make_memory(dimensions, max_observations=size)
+
+    start = time.perf_counter()
+    for text in corpus:
+        await memory.add_observation(text, source="bench")
+    elapsed = time.perf_counter() - start
+
+    return BenchmarkResult("add_observation", size, size, elapsed)
+
+
+async def bench_retrieve(size: int, dimensions: int, queries: int = 10) -> BenchmarkResult:
+    """Time retrieve against a filled memory."""
+    memory = _make_memory(dimensions, max_observations=size)
+    await _fill(memory, synthetic_corpus(size))
+    query_texts = [f"What does everyone think about {topic}?" for topic in _TOPICS]
+    await memory._embeddings.embed_batch(query_texts)
+
+    start = time.perf_counter()
+    for i in range(queries):
+        await memory.retrieve(query_texts[i % len(query_texts)], k=10)
+    elapsed = time.perf_counter() - start
+
+    return BenchmarkResult("retrieve", size, queries, elapsed)
+
+
+async def bench_prune(size: int, dimensions: int, inserts: int = 1000) -> BenchmarkResult:
+    """Time _maybe_prune for inserts arriving at the memory cap."""
+    memory = _make_memory(dimensions, max_observations=size)
+    await _fill(memory, synthetic_corpus(size))
+    extra = synthetic_corpus(inserts, seed=1)
+
+    elapsed = 0.0
+    now = datetime.now()
+    for text in extra:
+        obs = Observation(content=text, timestamp=now, importance=5.0)
+        memory._observations.append(obs)
+        if memory._retention is not None:
+            memory._retention.add(obs)
+        start = time.perf_counter()
+        memory._maybe_prune()
+        elapsed += time.perf_counter() - start
+
+    return BenchmarkResult("maybe_prune", size, inserts, elapsed)
+
+
+async def bench_generate_reflections(
+    size: int, dimensions: int, runs: int = 3
+) -> BenchmarkResult:
+    """Time generate_reflections with a stubbed LLM."""
+    memory = _make_memory(dimensions, max_observations=size, llm=StubLLM(), reflections=True)
+    await _fill(memory, synthetic_corpus(size))
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        await memory.generate_reflections()
+    elapsed = time.perf_counter() - start
+
+    return BenchmarkResult("generate_reflections", size, runs, elapsed)
+
+
+BENCHMARKS: Dict[str, Callable[[int, int], Any]] = {
+    "add_observation": bench_add_observation,
+    "retrieve": bench_retrieve,
+    "maybe_prune": bench_prune,
+    "generate_reflections": bench_generate_reflections,
+}
+
+
+def run_memory_benchmarks(
+    sizes: tuple[int, ...] | List[int] = DEFAULT_SIZES,
+    dimensions: int = 256,
+    names: Optional[List[str]] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+    measure_memory: bool = False,
+) -> List[BenchmarkResult]:
+    """Run memory benchmarks for each corpus size.
+
+    Args:
+        sizes: Corpus sizes to benchmark
+        dimensions: Embedding dimensions
+        names: Benchmarks to run (all if None)
+        on_result: Called with each result as it completes
+        measure_memory: Also run each case under tracemalloc to record
+            its peak memory (doubles the run time)
+
+    Returns:
+        Benchmark results
+    """
+    selected = names or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    results = []
+    for size in sizes:
+        for name in selected:
+            result = asyncio.run(BENCHMARKS[name](size, dimensions))
+            if measure_memory:
+                result.peak_memory_mb = measure_peak_memory_mb(BENCHMARKS[name], size, dimensions)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def load_baseline(path: str | Path) -> Dict[str, float]:
+    """Load baseline ops/sec keyed by benchmark key."""
+    data = json.loads(Path(path).read_text())
+    return {key: entry["ops_per_sec"] for key, entry in data.get("results", {}).items()}
+
+
+def save_baseline(results: List[BenchmarkResult], path: str | Path) -> None:
+    """Save results as a baseline file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "created_at": datetime.now().isoformat(),
+        "results": {result.key: result.to_dict() for result in results},
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def compare_to_baseline(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, float],
+    tolerance: float = 0.2,
+) -> List[Regression]:
+    """Find benchmarks whose throughput dropped below baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline ops/sec keyed by benchmark key
+        tolerance: Allowed fractional slowdown before flagging
+
+    Returns:
+        Regressions, one per slowed benchmark
+    """
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.key)
+        if expected is None or expected <= 0:
+            continue
+        if result.ops_per_sec < expected * (1.0 - tolerance):
+            regressions.append(Regression(result.key, expected, result.ops_per_sec))
+    return regressions
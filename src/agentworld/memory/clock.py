@@ -0,0 +1,103 @@
+"""Clocks used for memory timestamps and recency scoring.
+
+Recency only changes when the clock moves, so retrieval caches recency
+factors per clock bucket. A wall clock buckets real time into fixed windows;
+a step clock advances simulated time once per simulation step.
+"""
+
+from datetime import datetime, timedelta
+from typing import Hashable, Protocol, Tuple
+import math
+
+
+class MemoryClock(Protocol):
+    """Source of time for memory timestamps and recency scoring."""
+
+    def now(self) -> datetime:
+        """Current time on this clock."""
+        ...
+
+    def bucket(self, current_time: datetime) -> Tuple[Hashable, datetime]:
+        """Map a time to its cache key and the reference time for recency.
+
+        All times sharing a key must use the same reference time.
+        """
+        ...
+
+
+class WallClock:
+    """Real time, bucketed into fixed windows for recency caching.
+
+    Attributes:
+        bucket_seconds: Window size; 0 disables bucketing
+    """
+
+    def __init__(self, bucket_seconds: float = 60.0):
+        """Initialize wall clock.
+
+        Args:
+            bucket_seconds: Window size; 0 disables bucketing
+        """
+        self.bucket_seconds = bucket_seconds
+
+    def now(self) -> datetime:
+        """Current wall time."""
+        return datetime.now()
+
+    def bucket(self, current_time: datetime) -> Tuple[Hashable, datetime]:
+        """Bucket a time, referencing recency to the end of its window.
+
+        Using the window end keeps every memory created within the window
+        at a non-negative age.
+        """
+        if self.bucket_seconds <= 0:
+            return current_time, current_time
+        index = math.floor(current_time.timestamp() / self.bucket_seconds)
+        reference = datetime.fromtimestamp((index + 1) * self.bucket_seconds)
+        return index, reference
+
+
+class StepClock:
+    """Simulated time that advances in whole simulation steps.
+
+    Time is ``start + step * step_duration``, so it is constant within a step
+    and every query in a step shares cached recency factors.
+
+    Attributes:
+        start: Simulated time at step 0
+        step_duration: Simulated time per step
+        step: Current step
+    """
+
+    def __init__(
+        self,
+        start: datetime | None = None,
+        step_duration_hours: float = 1.0,
+        step: int = 0,
+    ):
+        """Initialize step clock.
+
+        Args:
+            start: Simulated time at step 0 (defaults to now)
+            step_duration_hours: Simulated hours per step
+            step: Initial step
+        """
+        self.start = start or datetime.now()
+        self.step_duration = timedelta(hours=step_duration_hours)
+        self.step = step
+
+    def now(self) -> datetime:
+        """Simulated time at the current step."""
+        return self.start + self.step * self.step_duration
+
+    def advance(self, steps: int = 1) -> None:
+        """Advance the clock by a number of steps."""
+        self.step += steps
+
+    def set_step(self, step: int) -> None:
+        """Move the clock to a specific step."""
+        self.step = step
+
+    def bucket(self, current_time: datetime) -> Tuple[Hashable, datetime]:
+        """Simulated time is already discrete; each time is its own bucket."""
+        return current_time, current_time
@@ -1,14 +1,13 @@
 """Embedding generation for memory retrieval."""
 
 from dataclasses import dataclass
+from importlib.util import find_spec
 from typing import List, Optional
+import hashlib
 import numpy as np
 
-try:
-    import litellm
-    HAS_LITELLM = True
-except ImportError:
-    HAS_LITELLM = False
+# litellm is slow to import; it is imported when an embedding is requested
+HAS_LITELLM = find_spec("litellm") is not None
 
 
 @dataclass
@@ -18,7 +17,9 @@ class EmbeddingConfig:
     Attributes:
         model: Embedding model identifier (e.g., "text-embedding-3-small")
         dimensions: Output vector dimensions
-        provider: Provider for embeddings (openai, etc.)
+        provider: Provider for embeddings (openai, etc.). "deterministic"
+            derives embeddings from a hash of the text without any API calls,
+            for tests and benchmarks.
     """
     model: str = "text-embedding-3-small"
     dimensions: int = 1536
@@ -60,6 +61,11 @@ class EmbeddingGenerator:
         if text in self._cache:
             return self._cache[text]
 
+        if self.config.provider == "deterministic":
+            embedding = self._deterministic_embedding(text)
+            self._cache[text] = embedding
+            return embedding
+
         if not HAS_LITELLM:
             # Fallback to random embedding for testing
             embedding = np.random.randn(self.config.dimensions).astype(np.float32)
@@ -68,6 +74,8 @@ class EmbeddingGenerator:
             return embedding
 
         try:
+            import litellm
+
             response = await litellm.aembedding(
                 model=self.config.model,
                 input=[text],
@@ -110,7 +118,12 @@ class EmbeddingGenerator:
 
         # Embed remaining texts
         if texts_to_embed:
-            if not HAS_LITELLM:
+            if self.config.provider == "deterministic":
+                for idx, text in zip(indices_to_embed, texts_to_embed):
+                    embedding = self._deterministic_embedding(text)
+                    self._cache[text] = embedding
+                    results.append((idx, embedding))
+            elif not HAS_LITELLM:
                 for idx, text in zip(indices_to_embed, texts_to_embed):
                     embedding = np.random.randn(self.config.dimensions).astype(np.float32)
                     embedding = embedding / np.linalg.norm(embedding)
@@ -118,6 +131,8 @@ class EmbeddingGenerator:
                     results.append((idx, embedding))
             else:
                 try:
+                    import litellm
+
                     response = await litellm.aembedding(
                         model=self.config.model,
                         input=texts_to_embed,
@@ -140,6 +155,13 @@ class EmbeddingGenerator:
         results.sort(key=lambda x: x[0])
         return [emb for _, emb in results]
 
+    def _deterministic_embedding(self, text: str) -> np.ndarray:
+        """Generate a unit embedding seeded from a hash of the text."""
+        seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+        rng = np.random.default_rng(seed)
+        embedding = rng.standard_normal(self.config.dimensions).astype(np.float32)
+        return embedding / np.linalg.norm(embedding)
+
     def clear_cache(self) -> None:
         """Clear the embedding cache."""
         self._cache.clear()
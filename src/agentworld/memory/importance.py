@@ -1,8 +1,9 @@
 """Importance scoring for memories."""
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from agentworld.llm.provider import LLMProvider
+if TYPE_CHECKING:
+    from agentworld.llm.provider import LLMProvider
 
 
 class ImportanceRater:
@@ -36,7 +37,7 @@ Return one number per line, nothing else.
 Observations:
 {observations}"""
 
-    def __init__(self, llm_provider: Optional[LLMProvider] = None):
+    def __init__(self, llm_provider: Optional["LLMProvider"] = None):
         """Initialize importance rater.
 
         Args:
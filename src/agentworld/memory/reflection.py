@@ -17,12 +17,18 @@ class ReflectionConfig:
         memories_per_question: Number of memories to retrieve per question
         min_reflection_importance: Minimum importance score for reflections (always high)
         enabled: Whether reflection generation is enabled
+        batch_synthesis: Answer all questions in one multi-question LLM call
+            instead of one concurrent call per question
+        background: Run reflection generation as a background task so the
+            triggering observation does not wait for it
     """
     threshold: float = 100.0
     questions_per_reflection: int = 3
     memories_per_question: int = 10
     min_reflection_importance: float = 8.0
     enabled: bool = True
+    batch_synthesis: bool = False
+    background: bool = False
 
 
 @dataclass
@@ -0,0 +1,96 @@
+"""Retention index for incremental memory pruning.
+
+Observations are bucketed by importance. Within a bucket the retention score
+only depends on the timestamp, so each bucket is a min-heap on timestamp and
+its head is always the bucket's weakest observation. At prune time the bucket
+heads are re-keyed with the current clock and evicted through a second heap,
+giving O(log n) per eviction instead of rescoring and sorting every memory.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+import heapq
+import itertools
+
+from agentworld.memory.observation import Observation
+
+
+ScoreFn = Callable[[Observation, datetime], float]
+
+
+class RetentionIndex:
+    """Eviction index over observations for retention-policy pruning.
+
+    The score function must be non-decreasing in the observation timestamp
+    for a fixed importance (newer memories never score lower), which holds
+    for every recency-decayed scoring used by the memory system.
+    """
+
+    def __init__(self, score_fn: ScoreFn, bucket_by_importance: bool = True):
+        """Initialize retention index.
+
+        Args:
+            score_fn: Retention score for an observation at a given time
+            bucket_by_importance: Whether importance contributes to the score.
+                If False, all observations share one bucket ordered by timestamp.
+        """
+        self.score_fn = score_fn
+        self.bucket_by_importance = bucket_by_importance
+        self._buckets: Dict[float, List[Tuple[datetime, int, Observation]]] = {}
+        self._counter = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _bucket_key(self, observation: Observation) -> float:
+        return observation.importance if self.bucket_by_importance else 0.0
+
+    def add(self, observation: Observation) -> None:
+        """Index an observation. O(log n)."""
+        bucket = self._buckets.setdefault(self._bucket_key(observation), [])
+        heapq.heappush(
+            bucket, (observation.timestamp, next(self._counter), observation)
+        )
+        self._size += 1
+
+    def evict(self, count: int, now: datetime | None = None) -> List[Observation]:
+        """Remove and return the ``count`` lowest-scoring observations.
+
+        Args:
+            count: Number of observations to evict
+            now: Reference time for scoring
+
+        Returns:
+            Evicted observations, lowest score first
+        """
+        if count <= 0 or not self._size:
+            return []
+
+        now = now or datetime.now()
+
+        # Re-key each bucket head against the current clock
+        heads = [
+            (self.score_fn(bucket[0][2], now), key)
+            for key, bucket in self._buckets.items()
+        ]
+        heapq.heapify(heads)
+
+        evicted = []
+        while heads and len(evicted) < count:
+            _, key = heapq.heappop(heads)
+            bucket = self._buckets[key]
+            _, _, observation = heapq.heappop(bucket)
+            evicted.append(observation)
+            if bucket:
+                heapq.heappush(heads, (self.score_fn(bucket[0][2], now), key))
+            else:
+                del self._buckets[key]
+
+        self._size -= len(evicted)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all observations from the index."""
+        self._buckets.clear()
+        self._size = 0
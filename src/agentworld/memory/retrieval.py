@@ -6,7 +6,7 @@ Implements the Generative Agents retrieval function:
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, Hashable, List, Union
 import math
 
 import numpy as np
@@ -14,6 +14,7 @@ import numpy as np
 from agentworld.memory.observation import Observation
 from agentworld.memory.reflection import Reflection
 from agentworld.memory.embeddings import EmbeddingGenerator
+from agentworld.memory.clock import MemoryClock, WallClock
 
 
 @dataclass
@@ -25,11 +26,14 @@ class RetrievalConfig:
         beta: Weight for recency (time decay)
         gamma: Weight for importance
         recency_decay_hours: Half-life for recency decay in hours
+        recency_bucket_seconds: Wall-clock window within which recency
+            factors are reused (0 recomputes for every distinct time)
     """
     alpha: float = 0.5  # Relevance weight
     beta: float = 0.3   # Recency weight
     gamma: float = 0.2  # Importance weight
     recency_decay_hours: float = 24.0  # Decay half-life
+    recency_bucket_seconds: float = 60.0
 
     def __post_init__(self):
         """Validate weights sum to approximately 1."""
@@ -49,21 +53,32 @@ class MemoryRetrieval:
 
     Implements the Generative Agents retrieval function for ranking memories
     when agents need to recall relevant context.
+
+    Recency factors are cached per memory and reused until the clock moves
+    into a new bucket, so repeated queries at the same time (or within the
+    same simulation step) skip recomputing them.
     """
 
     def __init__(
         self,
         config: RetrievalConfig | None = None,
-        embedding_generator: EmbeddingGenerator | None = None
+        embedding_generator: EmbeddingGenerator | None = None,
+        clock: MemoryClock | None = None
     ):
         """Initialize retrieval system.
 
         Args:
             config: Retrieval scoring configuration
             embedding_generator: Generator for query embeddings
+            clock: Clock for default query time and recency bucketing
         """
         self.config = config or RetrievalConfig()
         self.embeddings = embedding_generator or EmbeddingGenerator()
+        self.clock = clock or WallClock(self.config.recency_bucket_seconds)
+
+        # Recency cache, valid for a single (clock bucket, tau) key
+        self._recency_key: Hashable = None
+        self._recency_cache: Dict[str, float] = {}
 
     async def retrieve(
         self,
@@ -86,15 +101,20 @@ class MemoryRetrieval:
         if not memories:
             return []
 
-        current_time = current_time or datetime.now()
+        current_time = current_time or self.clock.now()
 
         # Generate query embedding
         query_embedding = await self.embeddings.embed(query)
 
         # Score all memories
+        recencies = self.recency_scores(memories, current_time)
         scored = []
-        for memory in memories:
-            score = self._compute_score(memory, query_embedding, current_time)
+        for memory, recency in zip(memories, recencies):
+            score = (
+                self.config.alpha * self._compute_relevance(memory, query_embedding) +
+                self.config.beta * recency +
+                self.config.gamma * self._compute_importance(memory)
+            )
             scored.append((memory, score))
 
         # Sort by score descending
@@ -164,10 +184,46 @@ class MemoryRetrieval:
         """
         delta = current_time - memory.timestamp
         hours = delta.total_seconds() / 3600.0
+        return math.exp(-hours / self._recency_tau())
+
+    def _recency_tau(self) -> float:
+        """Decay constant; tau is set so that at decay_hours, we have ~0.5 remaining."""
+        return self.config.recency_decay_hours / math.log(2)
+
+    def recency_scores(
+        self,
+        memories: List[MemoryItem],
+        current_time: datetime
+    ) -> List[float]:
+        """Get recency scores for memories, reusing cached factors.
+
+        The cache is keyed by the clock bucket of ``current_time`` and is
+        dropped as soon as a query falls into a different bucket.
+
+        Args:
+            memories: Memories to score
+            current_time: Query time
 
-        # tau is set so that at decay_hours, we have ~0.5 remaining
-        tau = self.config.recency_decay_hours / math.log(2)
-        return math.exp(-hours / tau)
+        Returns:
+            Recency score per memory, in order
+        """
+        bucket, reference = self.clock.bucket(current_time)
+        tau = self._recency_tau()
+        key = (bucket, tau)
+        if key != self._recency_key:
+            self._recency_key = key
+            self._recency_cache = {}
+
+        cache = self._recency_cache
+        scores = []
+        for memory in memories:
+            recency = cache.get(memory.id)
+            if recency is None:
+                hours = (reference - memory.timestamp).total_seconds() / 3600.0
+                recency = math.exp(-hours / tau)
+                cache[memory.id] = recency
+            scores.append(recency)
+        return scores
 
     def _compute_importance(self, memory: MemoryItem) -> float:
         """Normalize importance score to 0-1 range.
@@ -200,12 +256,9 @@ class MemoryRetrieval:
         if not memories:
             return []
 
-        current_time = current_time or datetime.now()
+        current_time = current_time or self.clock.now()
 
-        scored = [
-            (mem, self._compute_recency(mem, current_time))
-            for mem in memories
-        ]
+        scored = list(zip(memories, self.recency_scores(memories, current_time)))
         scored.sort(key=lambda x: x[1], reverse=True)
         return [mem for mem, _ in scored[:k]]
 
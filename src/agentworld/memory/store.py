@@ -0,0 +1,210 @@
+"""Persistent memory storage backed by the repository.
+
+Writes are buffered and flushed in batches; an agent's stored memories are
+read back in a single query with all embeddings decoded into one matrix.
+"""
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+import json
+
+import numpy as np
+
+from agentworld.memory.observation import Observation
+from agentworld.memory.reflection import Reflection
+
+if TYPE_CHECKING:
+    from agentworld.persistence.repository import Repository
+
+
+class MemoryStore:
+    """Persistence backend for a single agent's memories.
+
+    Attributes:
+        agent_id: Agent whose memories are stored
+        batch_size: Pending writes that trigger an automatic flush
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        repository: Optional["Repository"] = None,
+        batch_size: int = 100,
+    ):
+        """Initialize memory store.
+
+        Args:
+            agent_id: Agent whose memories are stored
+            repository: Repository to write through (created lazily if None)
+            batch_size: Pending writes that trigger an automatic flush
+        """
+        self.agent_id = agent_id
+        self.batch_size = batch_size
+        self._repository = repository
+        self._pending: List[dict[str, Any]] = []
+        self._embedding_matrix: Optional[np.ndarray] = None
+
+    @property
+    def repository(self) -> "Repository":
+        """Get the repository, creating if needed."""
+        if self._repository is None:
+            from agentworld.persistence.database import init_db
+            from agentworld.persistence.repository import Repository
+
+            init_db()
+            self._repository = Repository()
+        return self._repository
+
+    @property
+    def pending_count(self) -> int:
+        """Number of memories waiting to be flushed."""
+        return len(self._pending)
+
+    @property
+    def embedding_matrix(self) -> Optional[np.ndarray]:
+        """Embeddings decoded by the last load, one row per memory."""
+        return self._embedding_matrix
+
+    def add(self, memory: Observation | Reflection) -> None:
+        """Queue a memory for persistence, flushing when the batch is full."""
+        self._pending.append(self._to_record(memory))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending memories in one transaction.
+
+        Returns:
+            Number of memories written
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, []
+        return self.repository.save_memories(pending)
+
+    def load(self) -> Tuple[List[Observation], List[Reflection]]:
+        """Load all stored memories for the agent, oldest first.
+
+        Embeddings are decoded with a single ``np.frombuffer`` over the
+        concatenated blobs; each memory's embedding is a row view into the
+        cached matrix.
+
+        Returns:
+            Tuple of (observations, reflections)
+        """
+        rows = self.repository.get_memory_rows_for_agent(self.agent_id)
+        embeddings = self._decode_embeddings([row.embedding for row in rows])
+
+        observations: List[Observation] = []
+        reflections: List[Reflection] = []
+        for row, embedding in zip(rows, embeddings):
+            timestamp = self._to_local_time(row.created_at)
+
+            if row.memory_type == "reflection":
+                reflections.append(Reflection(
+                    id=row.id,
+                    content=row.content,
+                    timestamp=timestamp,
+                    importance=row.importance,
+                    embedding=embedding,
+                    embedding_model=row.embedding_model,
+                    source_memories=json.loads(row.source_memories or "[]"),
+                    questions_addressed=json.loads(row.questions_addressed or "[]"),
+                ))
+            else:
+                observations.append(Observation(
+                    id=row.id,
+                    content=row.content,
+                    timestamp=timestamp,
+                    importance=row.importance,
+                    embedding=embedding,
+                    embedding_model=row.embedding_model,
+                    source=row.source or "",
+                    location=row.location or "",
+                ))
+
+        return observations, reflections
+
+    def delete(self, memory_ids: List[str]) -> int:
+        """Delete memories, whether still pending or already stored.
+
+        Args:
+            memory_ids: IDs of the memories to delete
+
+        Returns:
+            Number of stored memories deleted
+        """
+        if not memory_ids:
+            return 0
+        ids = set(memory_ids)
+        unflushed = {record["id"] for record in self._pending if record["id"] in ids}
+        if unflushed:
+            self._pending = [record for record in self._pending if record["id"] not in unflushed]
+        stored = ids - unflushed
+        return self.repository.delete_memories(list(stored)) if stored else 0
+
+    def clear(self) -> int:
+        """Drop pending writes and delete the agent's stored memories.
+
+        Returns:
+            Number of stored memories deleted
+        """
+        self._pending.clear()
+        self._embedding_matrix = None
+        return self.repository.delete_memories_for_agent(self.agent_id)
+
+    def _decode_embeddings(self, blobs: List[Optional[bytes]]) -> List[Optional[np.ndarray]]:
+        """Decode embedding blobs, in bulk when they share a dimension."""
+        present = [blob for blob in blobs if blob is not None]
+        if not present:
+            self._embedding_matrix = None
+            return [None] * len(blobs)
+
+        width = len(present[0])
+        if all(len(blob) == width for blob in present):
+            dimensions = width // np.dtype(np.float32).itemsize
+            matrix = np.frombuffer(b"".join(present), dtype=np.float32)
+            self._embedding_matrix = matrix.reshape(len(present), dimensions)
+            rows = iter(self._embedding_matrix)
+            return [next(rows) if blob is not None else None for blob in blobs]
+
+        # Mixed embedding models: decode individually
+        self._embedding_matrix = None
+        return [
+            np.frombuffer(blob, dtype=np.float32) if blob is not None else None
+            for blob in blobs
+        ]
+
+    @staticmethod
+    def _to_local_time(value: Optional[datetime]) -> datetime:
+        """Convert a stored UTC timestamp to naive local time."""
+        if value is None:
+            return datetime.now()
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.astimezone().replace(tzinfo=None)
+
+    def _to_record(self, memory: Observation | Reflection) -> dict[str, Any]:
+        """Convert a memory into a repository record."""
+        embedding = None
+        if memory.embedding is not None:
+            embedding = np.asarray(memory.embedding, dtype=np.float32).tobytes()
+
+        record: dict[str, Any] = {
+            "id": memory.id,
+            "agent_id": self.agent_id,
+            "content": memory.content,
+            "importance": memory.importance,
+            "embedding": embedding,
+            "embedding_model": memory.embedding_model,
+            "created_at": memory.timestamp.astimezone(UTC),
+        }
+        if isinstance(memory, Reflection):
+            record["memory_type"] = "reflection"
+            record["source_memories"] = memory.source_memories
+            record["questions_addressed"] = memory.questions_addressed
+        else:
+            record["memory_type"] = "observation"
+            record["source"] = memory.source
+            record["location"] = memory.location
+        return record
@@ -5,11 +5,12 @@ from pathlib import Path
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
-from agentworld.persistence.models import Base
+from agentworld.persistence.models import Base, PERSONA_TRAIT_COLUMNS
+from agentworld.persistence.search import drop_persona_search, install_persona_search
 
 
 # Default database path
@@ -81,6 +82,42 @@ def create_db_engine(
     return engine
 
 
+# Columns added to tables after their first release, created on existing
+# databases by init_db: table -> [(column, DDL type, backfill expression)]
+ADDED_COLUMNS = {
+    "persona_library": [
+        *(
+            (trait, "FLOAT NOT NULL DEFAULT 0.5", f"COALESCE(json_extract(traits_json, '$.{trait}'), 0.5)")
+            for trait in PERSONA_TRAIT_COLUMNS
+        ),
+        ("prompt_key", "VARCHAR(64)", None),
+    ],
+}
+
+
+def add_missing_columns(engine) -> set[tuple[str, str]]:
+    """Add ADDED_COLUMNS missing from tables created by older versions.
+
+    Args:
+        engine: Database engine
+
+    Returns:
+        (table, column) pairs that were added and backfilled
+    """
+    added = set()
+    with engine.begin() as connection:
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row[1] for row in connection.execute(text(f"PRAGMA table_info({table})"))}
+            for column, ddl, backfill in columns:
+                if column in existing:
+                    continue
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+                if backfill is not None:
+                    connection.execute(text(f"UPDATE {table} SET {column} = {backfill}"))
+                added.add((table, column))
+    return added
+
+
 # Global engine and session factory
 _engine = None
 _session_factory = None
@@ -107,6 +144,11 @@ def init_db(
 
     # Create tables
     Base.metadata.create_all(_engine)
+    added = add_missing_columns(_engine)
+    install_persona_search(
+        _engine,
+        rebuild=any(("persona_library", trait) in added for trait in PERSONA_TRAIT_COLUMNS),
+    )
 
 
 def get_engine():
@@ -165,5 +207,7 @@ def reset_db() -> None:
     """
     global _engine
     if _engine is not None:
+        drop_persona_search(_engine)
         Base.metadata.drop_all(_engine)
         Base.metadata.create_all(_engine)
+        install_persona_search(_engine)
@@ -15,7 +15,7 @@ from sqlalchemy import (
     LargeBinary,
     Enum as SQLEnum,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, relationship, validates
 
 from agentworld.core.models import SimulationStatus
 
@@ -248,6 +248,10 @@ class MemoryModel(Base):
         source_memories = json.dumps(data.get("source_memories", []))
         questions_addressed = json.dumps(data.get("questions_addressed", []))
 
+        created_at = data.get("created_at")
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+
         return cls(
             id=data["id"],
             agent_id=data["agent_id"],
@@ -260,6 +264,7 @@ class MemoryModel(Base):
             location=data.get("location"),
             source_memories=source_memories,
             questions_addressed=questions_addressed,
+            created_at=created_at,
         )
 
 
@@ -468,6 +473,20 @@ class LLMCacheModel(Base):
         )
 
 
+# Big Five traits stored as columns for indexed range search
+PERSONA_TRAIT_COLUMNS = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+
+
+def persona_trait_values(traits: dict[str, Any] | None) -> dict[str, float]:
+    """Big Five column values for a persona's traits (0.5 when unset)."""
+    traits = traits or {}
+    values = {}
+    for name in PERSONA_TRAIT_COLUMNS:
+        value = traits.get(name)
+        values[name] = float(value) if isinstance(value, (int, float)) else 0.5
+    return values
+
+
 class PersonaLibraryModel(Base):
     """Database model for reusable persona templates.
 
@@ -481,19 +500,27 @@ class PersonaLibraryModel(Base):
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     traits_json = Column(Text, nullable=False)  # TraitVector as JSON
-    occupation = Column(String(255), nullable=True)
+    occupation = Column(String(255), nullable=True, index=True)
     age = Column(Integer, nullable=True)  # Specific age (ADR-008)
     age_range = Column(String(50), nullable=True)  # e.g., "25-35"
     background = Column(Text, nullable=True)
     goals_json = Column(Text, nullable=True)  # List of goals as JSON
     tags_json = Column(Text, nullable=True)  # List of tags for search
 
+    # Big Five copied out of traits_json for range search (see search.py)
+    openness = Column(Float, default=0.5, nullable=False)
+    conscientiousness = Column(Float, default=0.5, nullable=False)
+    extraversion = Column(Float, default=0.5, nullable=False)
+    agreeableness = Column(Float, default=0.5, nullable=False)
+    neuroticism = Column(Float, default=0.5, nullable=False)
+
     # ADR-008 required fields
     version = Column(Integer, default=1, nullable=False)  # Schema version
     usage_count = Column(Integer, default=0, nullable=False)  # Times used
     is_template = Column(Integer, default=0, nullable=False)  # Boolean as int
     created_by = Column(String(255), nullable=True)  # Creator identifier
     prompt_preview = Column(Text, nullable=True)  # Generated prompt preview
+    prompt_key = Column(String(64), nullable=True)  # Cache key prompt_preview was built for
 
     created_at = Column(DateTime, default=_utc_now)
     updated_at = Column(DateTime, default=_utc_now, onupdate=_utc_now)
@@ -520,6 +547,13 @@ class PersonaLibraryModel(Base):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
 
+    @validates("traits_json")
+    def _sync_trait_columns(self, key: str, traits_json: str) -> str:
+        """Keep the trait columns in step with traits_json."""
+        for name, value in persona_trait_values(json.loads(traits_json or "{}")).items():
+            setattr(self, name, value)
+        return traits_json
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PersonaLibraryModel":
         """Create from dictionary."""
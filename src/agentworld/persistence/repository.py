@@ -1,8 +1,13 @@
 """Repository pattern for data access."""
 
+import json
+import uuid
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Callable
 
+from sqlalchemy import Float, Integer, bindparam, delete, func, insert, literal_column, select, text, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from agentworld.core.models import SimulationStatus
@@ -24,12 +29,27 @@ from agentworld.persistence.models import (
     ExperimentModel,
     ExperimentVariantModel,
     ExperimentRunModel,
+    PERSONA_TRAIT_COLUMNS,
+    persona_trait_values,
 )
+from agentworld.persistence.search import (
+    FTS_COLUMNS,
+    FTS_TABLE,
+    RTREE_TABLE,
+    TraitRange,
+    TraitRangeSpec,
+    build_match_query,
+)
+from agentworld.personas.prompts import PromptCache, get_prompt_cache, prompt_cache_key
+from agentworld.personas.traits import TraitVector
 
 
 class Repository:
     """Data access repository for AgentWorld entities."""
 
+    # Bound parameters per IN (...) clause, kept under SQLite's limit
+    BULK_CHUNK_SIZE = 500
+
     def __init__(self, session: Session | None = None):
         """Initialize the repository.
 
@@ -289,6 +309,63 @@ class Repository:
         self.session.commit()
         return model.id
 
+    def save_memories(self, memories: list[dict[str, Any]]) -> int:
+        """Save a batch of new memories in one transaction.
+
+        Embeddings may be passed as raw float32 bytes to skip re-encoding.
+
+        Args:
+            memories: Memory data dictionaries
+
+        Returns:
+            Number of memories saved
+        """
+        if not memories:
+            return 0
+
+        rows = []
+        for data in memories:
+            embedding = data.get("embedding")
+            if embedding is not None and not isinstance(embedding, bytes):
+                embedding = MemoryModel.from_dict(data).embedding
+            rows.append({
+                "id": data["id"],
+                "agent_id": data["agent_id"],
+                "memory_type": data["memory_type"],
+                "content": data["content"],
+                "importance": data.get("importance", 5.0),
+                "embedding": embedding,
+                "embedding_model": data.get("embedding_model"),
+                "source": data.get("source"),
+                "location": data.get("location"),
+                "source_memories": json.dumps(data.get("source_memories", [])),
+                "questions_addressed": json.dumps(data.get("questions_addressed", [])),
+                "created_at": data.get("created_at") or datetime.now(UTC),
+            })
+
+        self.session.execute(insert(MemoryModel), rows)
+        self.session.commit()
+        return len(rows)
+
+    def get_memory_rows_for_agent(self, agent_id: str) -> list[Row]:
+        """Get all memories for an agent as raw rows, oldest first.
+
+        Unlike get_memories_for_agent, embeddings are left as raw bytes so
+        callers can decode them in bulk.
+
+        Args:
+            agent_id: Agent ID
+
+        Returns:
+            List of rows with MemoryModel columns
+        """
+        stmt = (
+            select(MemoryModel.__table__)
+            .where(MemoryModel.agent_id == agent_id)
+            .order_by(MemoryModel.created_at)
+        )
+        return list(self.session.execute(stmt).all())
+
     def get_memory(self, memory_id: str) -> dict[str, Any] | None:
         """Get a memory by ID.
 
@@ -342,6 +419,23 @@ class Repository:
         self.session.commit()
         return count
 
+    def delete_memories(self, memory_ids: list[str]) -> int:
+        """Delete memories by ID, in chunked bulk deletes.
+
+        Args:
+            memory_ids: Memory IDs
+
+        Returns:
+            Number of deleted memories
+        """
+        table = MemoryModel.__table__
+        count = 0
+        for start in range(0, len(memory_ids), self.BULK_CHUNK_SIZE):
+            chunk = memory_ids[start:start + self.BULK_CHUNK_SIZE]
+            count += self.session.execute(delete(table).where(table.c.id.in_(chunk))).rowcount
+        self.session.commit()
+        return count
+
     def count_memories(self, agent_id: str, memory_type: str | None = None) -> int:
         """Count memories for an agent.
 
@@ -409,7 +503,11 @@ class Repository:
         return model.id
 
     def save_topology_edges(self, simulation_id: str, edges: list[tuple]) -> int:
-        """Save multiple topology edges, replacing existing.
+        """Save topology edges, replacing the stored edge set.
+
+        Diffs against the stored edges and only writes the changes: new
+        edges are bulk-inserted, changed weights bulk-updated and removed
+        edges deleted, so re-saving an unchanged topology costs one read.
 
         Args:
             simulation_id: Simulation ID
@@ -418,25 +516,111 @@ class Repository:
         Returns:
             Number of edges saved
         """
-        # Delete existing edges
-        self.session.query(TopologyEdgeModel).filter_by(
-            simulation_id=simulation_id
-        ).delete()
-
-        # Add new edges
+        desired: dict[tuple[str, str], float] = {}
         for edge in edges:
-            source, target = edge[0], edge[1]
-            weight = edge[2] if len(edge) > 2 else 1.0
-            model = TopologyEdgeModel(
-                simulation_id=simulation_id,
-                source_id=source,
-                target_id=target,
-                weight=weight,
+            desired[(edge[0], edge[1])] = edge[2] if len(edge) > 2 else 1.0
+
+        table = TopologyEdgeModel.__table__
+        stored = self.session.execute(
+            select(table.c.id, table.c.source_id, table.c.target_id, table.c.weight)
+            .where(table.c.simulation_id == simulation_id)
+        ).all()
+
+        remaining = dict(desired)
+        stale_ids = []
+        updates = []
+        for row in stored:
+            key = (row.source_id, row.target_id)
+            if key not in remaining:
+                # Removed edge, or a duplicate of one already matched
+                stale_ids.append(row.id)
+                continue
+            weight = remaining.pop(key)
+            if row.weight != weight:
+                updates.append({"edge_id": row.id, "new_weight": weight})
+
+        for start in range(0, len(stale_ids), self.BULK_CHUNK_SIZE):
+            chunk = stale_ids[start:start + self.BULK_CHUNK_SIZE]
+            self.session.execute(delete(table).where(table.c.id.in_(chunk)))
+        if updates:
+            self.session.execute(
+                update(table)
+                .where(table.c.id == bindparam("edge_id"))
+                .values(weight=bindparam("new_weight")),
+                updates,
             )
-            self.session.add(model)
+        if remaining:
+            now = datetime.now(UTC)
+            self.session.execute(insert(table), [
+                {
+                    "simulation_id": simulation_id,
+                    "source_id": source,
+                    "target_id": target,
+                    "weight": weight,
+                    "created_at": now,
+                }
+                for (source, target), weight in remaining.items()
+            ])
 
         self.session.commit()
-        return len(edges)
+        return len(desired)
+
+    def update_topology_edges(
+        self,
+        simulation_id: str,
+        added: list[tuple],
+        removed: list[tuple],
+        directed: bool = False,
+    ) -> tuple[int, int]:
+        """Apply an edge delta to the stored topology.
+
+        Added edges replace any stored copy of the same edge, so re-adding
+        an edge updates its weight. For undirected topologies an edge
+        matches in either orientation.
+
+        Args:
+            simulation_id: Simulation ID
+            added: (source_id, target_id, weight) tuples to add
+            removed: (source_id, target_id) tuples to remove
+            directed: Whether edge orientation matters
+
+        Returns:
+            Tuple of (edges_added, edges_removed)
+        """
+        table = TopologyEdgeModel.__table__
+
+        def delete_pairs(pairs: list[tuple]) -> int:
+            if not directed:
+                pairs = pairs + [(target, source) for source, target in pairs]
+            if not pairs:
+                return 0
+            result = self.session.execute(
+                delete(table).where(
+                    table.c.simulation_id == simulation_id,
+                    table.c.source_id == bindparam("edge_source"),
+                    table.c.target_id == bindparam("edge_target"),
+                ),
+                [{"edge_source": source, "edge_target": target} for source, target in pairs],
+            )
+            return result.rowcount
+
+        edges_removed = delete_pairs([(edge[0], edge[1]) for edge in removed])
+        delete_pairs([(edge[0], edge[1]) for edge in added])
+        if added:
+            now = datetime.now(UTC)
+            self.session.execute(insert(table), [
+                {
+                    "simulation_id": simulation_id,
+                    "source_id": edge[0],
+                    "target_id": edge[1],
+                    "weight": edge[2] if len(edge) > 2 else 1.0,
+                    "created_at": now,
+                }
+                for edge in added
+            ])
+
+        self.session.commit()
+        return len(added), edges_removed
 
     def get_topology_edges(self, simulation_id: str) -> list[dict[str, Any]]:
         """Get all topology edges for a simulation.
@@ -447,10 +631,21 @@ class Repository:
         Returns:
             List of edge dictionaries
         """
-        models = self.session.query(TopologyEdgeModel).filter_by(
-            simulation_id=simulation_id
+        table = TopologyEdgeModel.__table__
+        rows = self.session.execute(
+            select(table).where(table.c.simulation_id == simulation_id)
         ).all()
-        return [model.to_dict() for model in models]
+        return [
+            {
+                "id": row.id,
+                "simulation_id": row.simulation_id,
+                "source_id": row.source_id,
+                "target_id": row.target_id,
+                "weight": row.weight,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+            }
+            for row in rows
+        ]
 
     def delete_topology(self, simulation_id: str) -> tuple[int, int]:
         """Delete topology config and edges for a simulation.
@@ -770,6 +965,147 @@ class Repository:
         self.session.commit()
         return model.id
 
+    def save_personas_bulk(
+        self,
+        personas: list[dict[str, Any]],
+        batch_size: int = 5000,
+        progress: Callable[[int, int], None] | None = None,
+        update_existing: bool = False,
+        on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+    ) -> tuple[int, int]:
+        """Write many personas to the library in batched transactions.
+
+        Each batch is committed on its own, so an interrupted import keeps
+        the batches already written. By default personas whose name is
+        already in the library (or earlier in the input) are skipped, which
+        makes re-running the same import resume where it stopped. With
+        ``update_existing``, personas are upserted by ID instead, like
+        save_persona.
+
+        A batch that violates a constraint (such as an ID already used
+        under another name) is retried one persona at a time, so only the
+        offending personas fail.
+
+        Args:
+            personas: Persona data dictionaries; missing IDs are generated
+            batch_size: Personas per transaction
+            progress: Optional callback(processed, total) after each batch
+            update_existing: Update personas whose ID exists instead of
+                skipping names already in the library
+            on_error: Optional callback(persona, error) for each persona
+                that cannot be written; without it the error is raised
+
+        Returns:
+            Tuple of (written, skipped); failed personas count as neither
+        """
+        table = PersonaLibraryModel.__table__
+        written = 0
+        skipped = 0
+        seen: set[str] = set()
+
+        for start in range(0, len(personas), batch_size):
+            batch = personas[start:start + batch_size]
+            if update_existing:
+                todo = batch
+            else:
+                names = list({data["name"] for data in batch} - seen)
+                for chunk_start in range(0, len(names), self.BULK_CHUNK_SIZE):
+                    chunk = names[chunk_start:chunk_start + self.BULK_CHUNK_SIZE]
+                    seen.update(self.session.execute(
+                        select(table.c.name).where(table.c.name.in_(chunk))
+                    ).scalars())
+                todo = []
+                for data in batch:
+                    if data["name"] in seen:
+                        skipped += 1
+                        continue
+                    seen.add(data["name"])
+                    todo.append(data)
+
+            now = datetime.now(UTC)
+            try:
+                self._write_personas(todo, now, update_existing)
+                self.session.commit()
+                written += len(todo)
+            except IntegrityError:
+                self.session.rollback()
+                for data in todo:
+                    try:
+                        self._write_personas([data], now, update_existing)
+                        self.session.commit()
+                        written += 1
+                    except IntegrityError as e:
+                        self.session.rollback()
+                        if on_error is None:
+                            raise
+                        on_error(data, e)
+            if progress is not None:
+                progress(start + len(batch), len(personas))
+
+        if written:
+            # Fresh statistics let the planner choose between the occupation
+            # index and the search tables
+            self.session.execute(text("ANALYZE persona_library"))
+            self.session.commit()
+        return written, skipped
+
+    def _write_personas(
+        self,
+        personas: list[dict[str, Any]],
+        now: datetime,
+        update_existing: bool,
+    ) -> None:
+        """Insert personas, updating those whose ID exists if requested."""
+        table = PersonaLibraryModel.__table__
+        rows = [
+            {
+                "id": data.get("id") or str(uuid.uuid4()),
+                "name": data["name"],
+                "description": data.get("description"),
+                "traits_json": json.dumps(data.get("traits", {})),
+                **persona_trait_values(data.get("traits")),
+                "occupation": data.get("occupation"),
+                "age": data.get("age"),
+                "age_range": data.get("age_range"),
+                "background": data.get("background"),
+                "goals_json": json.dumps(data.get("goals", [])),
+                "tags_json": json.dumps(data.get("tags", [])),
+                "version": data.get("version", 1),
+                "usage_count": data.get("usage_count", 0),
+                "is_template": int(data.get("is_template", False)),
+                "created_by": data.get("created_by"),
+                "prompt_preview": data.get("prompt_preview"),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for data in personas
+        ]
+
+        existing: set[str] = set()
+        if update_existing:
+            ids = [row["id"] for row in rows]
+            for chunk_start in range(0, len(ids), self.BULK_CHUNK_SIZE):
+                chunk = ids[chunk_start:chunk_start + self.BULK_CHUNK_SIZE]
+                existing.update(self.session.execute(
+                    select(table.c.id).where(table.c.id.in_(chunk))
+                ).scalars())
+
+        new_rows = [row for row in rows if row["id"] not in existing]
+        if new_rows:
+            self.session.execute(insert(table), new_rows)
+        if existing:
+            columns = [name for name in rows[0] if name not in ("id", "created_at")]
+            self.session.execute(
+                update(table)
+                .where(table.c.id == bindparam("persona_id"))
+                .values({name: bindparam(f"new_{name}") for name in columns}),
+                [
+                    {"persona_id": row["id"], **{f"new_{name}": row[name] for name in columns}}
+                    for row in rows
+                    if row["id"] in existing
+                ],
+            )
+
     def get_persona(self, persona_id: str) -> dict[str, Any] | None:
         """Get a persona by ID.
 
@@ -798,6 +1134,38 @@ class Repository:
             return None
         return model.to_dict()
 
+    def get_persona_prompt(self, persona_id: str, cache: PromptCache | None = None) -> str | None:
+        """Get a library persona's system prompt, generating it on first use.
+
+        The prompt is persisted in prompt_preview together with its cache
+        key; it is regenerated when the persona's traits, name or background
+        change, or when the prompt template version is bumped.
+
+        Args:
+            persona_id: Persona ID
+            cache: Prompt cache to read and fill (default: process-wide)
+
+        Returns:
+            System prompt, or None if the persona does not exist
+        """
+        model = self.session.query(PersonaLibraryModel).filter_by(id=persona_id).first()
+        if model is None:
+            return None
+        cache = cache or get_prompt_cache()
+        traits = TraitVector.from_dict(json.loads(model.traits_json or "{}"))
+        background = model.background or ""
+        key = prompt_cache_key(traits, model.name, background)
+
+        if model.prompt_key == key and model.prompt_preview:
+            cache.set(key, model.prompt_preview)
+            return model.prompt_preview
+
+        prompt = cache.get_or_generate(traits, model.name, background, key=key)
+        model.prompt_preview = prompt
+        model.prompt_key = key
+        self.session.commit()
+        return prompt
+
     def list_personas(
         self,
         tags: list[str] | None = None,
@@ -845,23 +1213,128 @@ class Repository:
         self.session.commit()
         return True
 
-    def search_personas(self, query_text: str, limit: int = 20) -> list[dict[str, Any]]:
-        """Search personas by name or description.
+    def _filter_personas(
+        self,
+        stmt,
+        query_text: str | None,
+        tags: list[str] | None,
+        occupation: str | None,
+        trait_ranges: dict[str, TraitRangeSpec] | None,
+    ):
+        """Apply persona search filters to a select on persona_library.
+
+        Text and tags go through the FTS5 index, Big Five ranges through
+        the R-tree, and occupation through its index. Custom trait ranges
+        fall back to json_extract. The R-tree box is inclusive; strict
+        bounds are applied by the recheck against the exact columns.
+
+        Returns:
+            Tuple of (filtered select, result ordering)
+        """
+        table = PersonaLibraryModel.__table__
+        rowid = literal_column("persona_library.rowid")
+        order = [rowid]
+
+        match = build_match_query(query_text, tags)
+        if match is not None:
+            weights = ", ".join(str(weight) for weight in FTS_COLUMNS.values())
+            fts = text(
+                f"SELECT rowid, bm25({FTS_TABLE}, {weights}) AS rank "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match"
+            ).bindparams(match=match).columns(rowid=Integer, rank=Float).subquery("fts")
+            stmt = stmt.join(fts, fts.c.rowid == rowid)
+            order = [fts.c.rank, rowid]
+        if tags:
+            # FTS matches words; confirm whole tags against the JSON list
+            tag_values = func.json_each(table.c.tags_json).table_valued("value")
+            stmt = stmt.where(
+                select(tag_values.c.value).where(tag_values.c.value.in_(tags)).exists()
+            )
+        if occupation is not None:
+            stmt = stmt.where(table.c.occupation == occupation)
+
+        box, params = [], {}
+        for trait, spec in (trait_ranges or {}).items():
+            low, high, low_strict, high_strict = TraitRange(*spec)
+            if trait in PERSONA_TRAIT_COLUMNS:
+                column = table.c[trait]
+                if low is not None:
+                    box.append(f"{trait}_max >= :{trait}_low")
+                    params[f"{trait}_low"] = low
+                if high is not None:
+                    box.append(f"{trait}_min <= :{trait}_high")
+                    params[f"{trait}_high"] = high
+            else:
+                column = func.json_extract(table.c.traits_json, f'$."{trait}"')
+            if low is not None:
+                stmt = stmt.where(column > low if low_strict else column >= low)
+            if high is not None:
+                stmt = stmt.where(column < high if high_strict else column <= high)
+        if box:
+            trait_box = text(
+                f"SELECT id FROM {RTREE_TABLE} WHERE {' AND '.join(box)}"
+            ).bindparams(**params).columns(id=Integer).subquery("trait_box")
+            stmt = stmt.join(trait_box, trait_box.c.id == rowid)
+
+        return stmt, order
+
+    def search_personas(
+        self,
+        query_text: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        tags: list[str] | None = None,
+        occupation: str | None = None,
+        trait_ranges: dict[str, TraitRangeSpec] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search personas with full-text, tag, occupation and trait filters.
+
+        Filters compose. Text matches word prefixes in the name, occupation,
+        tags, description and background, and results are ranked by bm25
+        relevance. Without text, results come back in library order.
 
         Args:
-            query_text: Search query
+            query_text: Free-text query
             limit: Maximum number of results
+            offset: Number of results to skip
+            tags: Tags, any of which must be present
+            occupation: Exact occupation
+            trait_ranges: Dict of trait name -> TraitRange, or an inclusive
+                (low, high) tuple with None for an open bound, e.g.
+                {"openness": (0.7, None)}
 
         Returns:
             List of matching persona dictionaries
         """
-        query = self.session.query(PersonaLibraryModel).filter(
-            (PersonaLibraryModel.name.ilike(f"%{query_text}%")) |
-            (PersonaLibraryModel.description.ilike(f"%{query_text}%")) |
-            (PersonaLibraryModel.occupation.ilike(f"%{query_text}%"))
+        stmt, order = self._filter_personas(
+            select(PersonaLibraryModel), query_text, tags, occupation, trait_ranges
         )
-        query = query.limit(limit)
-        return [model.to_dict() for model in query.all()]
+        stmt = stmt.order_by(*order).limit(limit).offset(offset)
+        return [model.to_dict() for model in self.session.scalars(stmt)]
+
+    def persona_occupation_facets(
+        self,
+        query_text: str | None = None,
+        tags: list[str] | None = None,
+        occupation: str | None = None,
+        trait_ranges: dict[str, TraitRangeSpec] | None = None,
+    ) -> dict[str | None, int]:
+        """Count the personas matching a search, by occupation.
+
+        Takes the same filters as search_personas; the counts sum to the
+        total number of matches.
+
+        Returns:
+            Dict of occupation (None when unset) -> count, largest first
+        """
+        table = PersonaLibraryModel.__table__
+        count = func.count()
+        stmt, _ = self._filter_personas(
+            select(table.c.occupation, count).select_from(table),
+            query_text, tags, occupation, trait_ranges,
+        )
+        stmt = stmt.group_by(table.c.occupation).order_by(count.desc(), table.c.occupation)
+        return {row[0]: row[1] for row in self.session.execute(stmt)}
 
     # Experiment methods (per ADR-008)
 
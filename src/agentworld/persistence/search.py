@@ -0,0 +1,204 @@
+"""Indexed search structures for the persona library.
+
+Two SQLite virtual tables shadow ``persona_library`` and are kept in sync by
+triggers, so every write path (ORM merges, bulk inserts, deletes) updates
+them without extra code:
+
+- ``persona_fts``: an external-content FTS5 index over name, occupation,
+  description, background and tags, for ranked full-text queries.
+- ``persona_traits``: an R-tree over the Big Five trait columns, for
+  multi-trait range queries. R-tree bounds are stored as 32-bit floats and
+  rounded outwards, so callers recheck the exact trait columns.
+
+Both are keyed by the library table's implicit rowid.
+"""
+
+import re
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from agentworld.persistence.models import PERSONA_TRAIT_COLUMNS
+
+
+FTS_TABLE = "persona_fts"
+RTREE_TABLE = "persona_traits"
+
+# Columns indexed for full-text search, with their bm25 weights
+FTS_COLUMNS = {
+    "name": 10.0,
+    "occupation": 5.0,
+    "tags_json": 3.0,
+    "description": 2.0,
+    "background": 1.0,
+}
+
+
+
+class TraitRange(NamedTuple):
+    """Bounds on one trait; None leaves that side open.
+
+    Plain ``(low, high)`` tuples are accepted wherever a range is and are
+    inclusive on both sides.
+    """
+
+    low: float | None = None
+    high: float | None = None
+    low_strict: bool = False
+    high_strict: bool = False
+
+
+TraitRangeSpec = TraitRange | tuple[float | None, float | None]
+
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_TRAIT_FILTER = re.compile(r"^\s*(\w+)\s*(>=|<=|>|<|=)\s*(-?\d+(?:\.\d*)?|-?\.\d+)\s*$")
+
+
+def _fts_values(prefix: str) -> str:
+    return ", ".join(f"{prefix}.{column}" for column in FTS_COLUMNS)
+
+
+def _rtree_values(prefix: str) -> str:
+    return ", ".join(f"{prefix}.{column}, {prefix}.{column}" for column in PERSONA_TRAIT_COLUMNS)
+
+
+def _ddl() -> list[str]:
+    """Statements creating the search tables and sync triggers."""
+    fts_columns = ", ".join(FTS_COLUMNS)
+    rtree_columns = ", ".join(f"{c}_min, {c}_max" for c in PERSONA_TRAIT_COLUMNS)
+    fts_insert = (
+        f"INSERT INTO {FTS_TABLE}(rowid, {fts_columns}) "
+        f"VALUES (new.rowid, {_fts_values('new')});"
+    )
+    fts_delete = (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {fts_columns}) "
+        f"VALUES ('delete', old.rowid, {_fts_values('old')});"
+    )
+    rtree_insert = f"INSERT INTO {RTREE_TABLE} VALUES (new.rowid, {_rtree_values('new')});"
+    rtree_delete = f"DELETE FROM {RTREE_TABLE} WHERE id = old.rowid;"
+    # Usage counters and timestamps change often and are not indexed
+    watched = ", ".join([*FTS_COLUMNS, *PERSONA_TRAIT_COLUMNS])
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{fts_columns}, content='persona_library', content_rowid='rowid', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {RTREE_TABLE} USING rtree(id, {rtree_columns})",
+        "CREATE TRIGGER IF NOT EXISTS persona_library_search_insert "
+        f"AFTER INSERT ON persona_library BEGIN {fts_insert} {rtree_insert} END",
+        "CREATE TRIGGER IF NOT EXISTS persona_library_search_delete "
+        f"AFTER DELETE ON persona_library BEGIN {fts_delete} {rtree_delete} END",
+        "CREATE TRIGGER IF NOT EXISTS persona_library_search_update "
+        f"AFTER UPDATE OF {watched} ON persona_library BEGIN "
+        f"{fts_delete} {fts_insert} {rtree_delete} {rtree_insert} END",
+    ]
+
+
+def install_persona_search(engine: Engine, rebuild: bool = False) -> None:
+    """Create the persona search tables and triggers if needed.
+
+    Safe to call on every start. When the search tables are new they are
+    filled from the existing rows.
+
+    Args:
+        engine: Database engine
+        rebuild: Refill the tables even if they exist (e.g. after the trait
+            columns were backfilled)
+    """
+    with engine.begin() as connection:
+        had_tables = connection.execute(
+            text("SELECT count(*) FROM sqlite_master WHERE name IN (:fts, :rtree)"),
+            {"fts": FTS_TABLE, "rtree": RTREE_TABLE},
+        ).scalar() == 2
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_persona_library_occupation "
+            "ON persona_library (occupation)"
+        ))
+        for statement in _ddl():
+            connection.execute(text(statement))
+        if not had_tables or rebuild:
+            rebuild_persona_search(connection)
+
+
+def rebuild_persona_search(connection: Connection) -> None:
+    """Refill both search tables from persona_library."""
+    connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    connection.execute(text(f"DELETE FROM {RTREE_TABLE}"))
+    connection.execute(text(
+        f"INSERT INTO {RTREE_TABLE} SELECT p.rowid, {_rtree_values('p')} FROM persona_library AS p"
+    ))
+
+
+def drop_persona_search(engine: Engine) -> None:
+    """Drop the search tables and triggers (before dropping the library)."""
+    with engine.begin() as connection:
+        for suffix in ("insert", "delete", "update"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS persona_library_search_{suffix}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {RTREE_TABLE}"))
+
+
+def build_match_query(query_text: str | None = None, tags: list[str] | None = None) -> str | None:
+    """Build an FTS5 MATCH expression from free text and tags.
+
+    Every word of the text must match, as a prefix, in any indexed column;
+    any one of the tags must match the tags column as a phrase. User input
+    is tokenized and quoted, so FTS5 syntax characters cannot break the
+    query.
+
+    Args:
+        query_text: Free-text query
+        tags: Tags, any of which may match
+
+    Returns:
+        MATCH expression, or None if there is nothing to match
+    """
+    parts = [f'"{token}"*' for token in _TOKEN.findall(query_text or "")]
+    phrases = []
+    for tag in tags or []:
+        tokens = _TOKEN.findall(tag)
+        if tokens:
+            phrases.append('"' + " ".join(tokens) + '"')
+    if phrases:
+        parts.append("tags_json : (" + " OR ".join(phrases) + ")")
+    return " AND ".join(parts) or None
+
+
+def parse_trait_ranges(spec: str | None) -> dict[str, TraitRange]:
+    """Parse trait filters such as "openness>0.7,neuroticism<0.3".
+
+    ">" and "<" are strict, ">=" and "<=" inclusive; "=" fixes both bounds.
+    Several filters on one trait narrow its range.
+
+    Args:
+        spec: Comma-separated filters
+
+    Returns:
+        Dict of trait name -> TraitRange
+
+    Raises:
+        ValueError: If a filter cannot be parsed
+    """
+    ranges: dict[str, TraitRange] = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        found = _TRAIT_FILTER.match(item)
+        if found is None:
+            raise ValueError(f"Invalid trait filter '{item.strip()}', expected e.g. 'openness>0.7'")
+        trait, op, number = found.group(1), found.group(2), float(found.group(3))
+        low, high, low_strict, high_strict = ranges.get(trait, TraitRange())
+        strict = op in (">", "<")
+        if op in (">", ">=", "="):
+            if low is None or number > low:
+                low, low_strict = number, strict
+            elif number == low:
+                low_strict = low_strict or strict
+        if op in ("<", "<=", "="):
+            if high is None or number < high:
+                high, high_strict = number, strict
+            elif number == high:
+                high_strict = high_strict or strict
+        ranges[trait] = TraitRange(low, high, low_strict, high_strict)
+    return ranges
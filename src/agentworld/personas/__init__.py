@@ -9,13 +9,23 @@ from agentworld.personas.traits import (
     generate_diverse_population,
     generate_population_with_profiles,
 )
+from agentworld.personas.matrix import TraitMatrix
+from agentworld.personas.population import (
+    PopulationSampler,
+    TraitDistribution,
+    generate_personas,
+)
 
 __all__ = [
     "ARCHETYPES",
     "CustomTrait",
     "PersonaProfile",
+    "PopulationSampler",
+    "TraitDistribution",
     "TraitVector",
+    "TraitMatrix",
     "create_trait_vector",
     "generate_diverse_population",
+    "generate_personas",
     "generate_population_with_profiles",
 ]
@@ -0,0 +1,241 @@
+"""Vectorized trait similarity over whole populations.
+
+A TraitMatrix packs many TraitVectors into NumPy arrays so all-pairs
+similarity, nearest-persona queries and diversity measures run as array
+operations instead of one ``TraitVector.similarity`` call per pair.
+
+``TraitVector.similarity`` only compares custom traits both personas have,
+weighted by the mean of the two weights, so each pair's cosine has its own
+norms. Expanding ``((w_i + w_j) / 2) ** 2`` splits the shared-trait terms
+into three matrix products, so results match the pairwise method up to
+floating-point rounding.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from agentworld.personas.population import BIG_FIVE
+from agentworld.personas.traits import CustomTrait, TraitVector
+
+# Upper bound on similarity entries computed at once
+_BLOCK_ENTRIES = 1 << 22
+
+
+class TraitMatrix:
+    """A population of trait vectors packed into arrays.
+
+    Attributes:
+        big_five: (n, 5) Big Five values
+        custom_names: Custom trait names, in column order
+        values: (n, c) custom trait values (0 where absent)
+        weights: (n, c) custom trait weights (0 where absent)
+        present: (n, c) mask of which personas have each custom trait
+        include_custom: Whether custom traits count towards similarity
+    """
+
+    def __init__(self, vectors: Sequence[TraitVector], include_custom: bool = True):
+        """Pack trait vectors.
+
+        Args:
+            vectors: Trait vectors to pack
+            include_custom: Whether custom traits count towards similarity,
+                as in ``TraitVector.similarity``
+        """
+        self.include_custom = include_custom
+        n = len(vectors)
+        self.big_five = np.array(
+            [[getattr(v, trait) for trait in BIG_FIVE] for v in vectors],
+            dtype=float,
+        ).reshape(n, len(BIG_FIVE))
+
+        names = sorted({name for v in vectors for name in v.custom_traits}) if include_custom else []
+        column = {name: c for c, name in enumerate(names)}
+        self.custom_names = names
+        self.values = np.zeros((n, len(names)))
+        self.weights = np.zeros((n, len(names)))
+        for i, vector in enumerate(vectors):
+            if not include_custom:
+                break
+            for name, trait in vector.custom_traits.items():
+                if isinstance(trait, CustomTrait):
+                    value, weight = trait.value, trait.weight
+                else:
+                    value, weight = trait, 1.0
+                self.values[i, column[name]] = value
+                self.weights[i, column[name]] = weight
+        self.present = np.zeros((n, len(names)))
+        if names:
+            for i, vector in enumerate(vectors):
+                for name in vector.custom_traits:
+                    self.present[i, column[name]] = 1.0
+
+        # Per-persona factors for the expanded shared-trait products
+        v, w, m = self.values, self.weights, self.present
+        self._dot_terms = (v * w * w, v * w, v)
+        self._norm_terms = (v * v * w * w, v * v * w, v * v * m)
+        self._mask_terms = (m, w, w * w)
+        self._big_five_norms = np.einsum("ij,ij->i", self.big_five, self.big_five)
+        norms = np.sqrt(self._big_five_norms)[:, None]
+        self._unit = np.divide(
+            self.big_five, norms, out=np.zeros_like(self.big_five), where=norms > 0
+        )
+
+    def __len__(self) -> int:
+        return len(self.big_five)
+
+    def _block(self, rows: np.ndarray, cols: np.ndarray | None = None) -> np.ndarray:
+        """Similarities between the given rows and columns (default all)."""
+        col = slice(None) if cols is None else cols
+        if not self.custom_names:
+            # Plain cosine similarity of the Big Five
+            return self._unit[rows] @ self._unit[col].T
+
+        b = self.big_five
+        dot = b[rows] @ b[col].T
+
+        dvw2, dvw, dv = self._dot_terms
+        dot += (
+            dvw2[rows] @ dv[col].T
+            + 2 * dvw[rows] @ dvw[col].T
+            + dv[rows] @ dvw2[col].T
+        ) / 4
+        nv2w2, nv2w, nv2 = self._norm_terms
+        m, w, w2 = self._mask_terms
+        norm_rows = self._big_five_norms[rows][:, None] + (
+            nv2w2[rows] @ m[col].T
+            + 2 * nv2w[rows] @ w[col].T
+            + nv2[rows] @ w2[col].T
+        ) / 4
+        norm_cols = self._big_five_norms[col][None, :] + (
+            m[rows] @ nv2w2[col].T
+            + 2 * w[rows] @ nv2w[col].T
+            + w2[rows] @ nv2[col].T
+        ) / 4
+
+        denominator = np.sqrt(norm_rows) * np.sqrt(norm_cols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = np.where(denominator > 0, dot / denominator, 0.0)
+        return result
+
+    def _row_blocks(self):
+        """Yield row index ranges sized to bound memory."""
+        n = len(self)
+        step = max(1, _BLOCK_ENTRIES // max(n, 1))
+        for start in range(0, n, step):
+            yield np.arange(start, min(start + step, n))
+
+    def similarity(self, i: int, j: int) -> float:
+        """Similarity between two personas, as ``TraitVector.similarity``."""
+        return float(self._block(np.array([i]), np.array([j]))[0, 0])
+
+    def similarities(self, rows: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Similarities between some personas and the whole population.
+
+        Args:
+            rows: Persona indices
+
+        Returns:
+            (len(rows), n) similarity array
+        """
+        return self._block(np.asarray(rows, dtype=np.int64))
+
+    def similarity_matrix(self) -> np.ndarray:
+        """All-pairs similarity matrix (n, n)."""
+        return self._block(np.arange(len(self)))
+
+    def nearest(self, index: int, k: int = 5) -> list[tuple[int, float]]:
+        """Find the personas most similar to one persona.
+
+        Args:
+            index: Persona index
+            k: Number of neighbors
+
+        Returns:
+            (index, similarity) pairs, most similar first, excluding the
+            persona itself
+        """
+        scores = self._block(np.array([index]))[0]
+        scores[index] = -np.inf
+        k = min(k, len(self) - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def diversity_scores(self) -> np.ndarray:
+        """Mean dissimilarity (1 - similarity) of each persona to the rest.
+
+        Returns:
+            (n,) array; higher means more distinctive
+        """
+        n = len(self)
+        if n < 2:
+            return np.zeros(n)
+        if not self.custom_names:
+            # Plain cosine: the row sums are dot products with the sum of
+            # unit vectors, so no pairwise matrix is needed
+            unit = self._unit
+            totals = unit @ unit.sum(axis=0) - np.einsum("ij,ij->i", unit, unit)
+        else:
+            totals = np.empty(n)
+            for rows in self._row_blocks():
+                block = self._block(rows)
+                totals[rows] = block.sum(axis=1) - block[np.arange(len(rows)), rows]
+        return 1.0 - totals / (n - 1)
+
+    def population_diversity(self) -> float:
+        """Mean pairwise dissimilarity of the whole population."""
+        if len(self) < 2:
+            return 0.0
+        return float(self.diversity_scores().mean())
+
+    def select_diverse(self, k: int, start: int | None = None) -> list[int]:
+        """Greedily select a maximally diverse panel.
+
+        Starts from the most distinctive persona (or ``start``) and then
+        repeatedly adds the persona whose highest similarity to the panel so
+        far is lowest (farthest-point selection). Each pick costs one row of
+        similarities.
+
+        Args:
+            k: Panel size
+            start: Optional first persona
+
+        Returns:
+            Selected persona indices, in selection order
+        """
+        n = len(self)
+        k = min(k, n)
+        if k <= 0:
+            return []
+        first = int(np.argmax(self.diversity_scores())) if start is None else start
+        selected = [first]
+        closest = self._block(np.array([first]))[0]
+        closest[first] = np.inf
+        while len(selected) < k:
+            pick = int(np.argmin(closest))
+            selected.append(pick)
+            closest = np.maximum(closest, self._block(np.array([pick]))[0])
+            closest[selected] = np.inf
+        return selected
+
+    def near_duplicates(self, threshold: float = 0.999) -> list[tuple[int, int]]:
+        """Find pairs of personas at or above a similarity threshold.
+
+        Args:
+            threshold: Minimum similarity to count as a duplicate
+
+        Returns:
+            (i, j) pairs with i < j
+        """
+        pairs: list[tuple[int, int]] = []
+        for rows in self._row_blocks():
+            # Only columns after the block's first row can form new pairs
+            cols = np.arange(rows[0], len(self))
+            i, j = np.nonzero(self._block(rows, cols) >= threshold)
+            i, j = rows[i], cols[j]
+            keep = i < j
+            pairs.extend(zip(i[keep].tolist(), j[keep].tolist()))
+        return pairs
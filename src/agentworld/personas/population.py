@@ -0,0 +1,292 @@
+"""Vectorized population sampling.
+
+Samples whole populations of trait values as one NumPy array from a seeded
+Generator. Traits can be correlated through a covariance or correlation
+matrix, and values are kept in range by truncating the distribution:
+out-of-range rows are redrawn from the same joint distribution rather than
+piled up at the bounds.
+
+Population templates (see PopulationTemplateModel) are turned into persona
+library records with ``generate_personas``, ready for
+``Repository.save_personas_bulk``.
+"""
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+from agentworld.core.exceptions import ValidationError
+
+
+BIG_FIVE = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+
+TRUNCATION_MODES = ("resample", "clip")
+
+# Reserved trait_distributions key holding [trait_a, trait_b, r] triples
+CORRELATIONS_KEY = "correlations"
+
+
+@dataclass
+class TraitDistribution:
+    """Normal distribution of one trait, truncated to [low, high].
+
+    Attributes:
+        mean: Mean of the untruncated distribution
+        std: Standard deviation of the untruncated distribution
+        low: Lower bound
+        high: Upper bound
+    """
+
+    mean: float = 0.5
+    std: float = 0.2
+    low: float = 0.0
+    high: float = 1.0
+
+    @classmethod
+    def from_value(cls, value: Any) -> "TraitDistribution":
+        """Create from a (mean, std) tuple or a template dictionary.
+
+        Template dictionaries use the keys mean, std, min and max.
+        """
+        if isinstance(value, TraitDistribution):
+            return value
+        if isinstance(value, Mapping):
+            return cls(
+                mean=value.get("mean", 0.5),
+                std=value.get("std", 0.2),
+                low=value.get("min", 0.0),
+                high=value.get("max", 1.0),
+            )
+        mean, std = value
+        return cls(mean=mean, std=std)
+
+
+def _nearest_factor(covariance: np.ndarray) -> np.ndarray:
+    """Factor L with L @ L.T == covariance, repairing indefinite matrices.
+
+    Hand-written correlation matrices are often slightly indefinite; negative
+    eigenvalues are clipped to zero, giving the nearest valid covariance.
+    """
+    try:
+        return np.linalg.cholesky(covariance)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+class PopulationSampler:
+    """Samples correlated, truncated trait values for whole populations.
+
+    Attributes:
+        traits: Trait names, in column order (Big Five first)
+        means: (d,) means
+        low: (d,) lower bounds
+        high: (d,) upper bounds
+        covariance: (d, d) covariance of the untruncated distribution
+        truncation: "resample" to redraw out-of-range rows, "clip" to clamp
+    """
+
+    def __init__(
+        self,
+        distributions: Mapping[str, Any] | None = None,
+        correlation: np.ndarray | Sequence[Sequence[float]] | Mapping[tuple[str, str], float] | None = None,
+        covariance: np.ndarray | Sequence[Sequence[float]] | None = None,
+        truncation: str = "resample",
+        max_rounds: int = 20,
+    ):
+        """Initialize the sampler.
+
+        Args:
+            distributions: Dict of trait_name -> TraitDistribution, (mean, std)
+                or template dict. Big Five traits default to (0.5, 0.2);
+                other names add custom traits after the Big Five.
+            correlation: Correlation matrix in trait order, or a dict of
+                (trait_a, trait_b) -> correlation
+            covariance: Covariance matrix in trait order; overrides the
+                distributions' standard deviations and ``correlation``
+            truncation: "resample" or "clip"
+            max_rounds: Redraw rounds before remaining out-of-range values
+                are clipped
+        """
+        if truncation not in TRUNCATION_MODES:
+            raise ValidationError(
+                f"truncation must be one of {', '.join(TRUNCATION_MODES)}, got '{truncation}'"
+            )
+        distributions = dict(distributions or {})
+        extra = sorted(name for name in distributions if name not in BIG_FIVE)
+        self.traits = list(BIG_FIVE) + extra
+        parsed = [
+            TraitDistribution.from_value(distributions.get(name, TraitDistribution()))
+            for name in self.traits
+        ]
+        self.means = np.array([d.mean for d in parsed], dtype=float)
+        self.low = np.array([d.low for d in parsed], dtype=float)
+        self.high = np.array([d.high for d in parsed], dtype=float)
+        self.truncation = truncation
+        self.max_rounds = max_rounds
+
+        d = len(self.traits)
+        if covariance is not None:
+            self.covariance = np.asarray(covariance, dtype=float)
+        else:
+            stds = np.array([dist.std for dist in parsed], dtype=float)
+            self.covariance = self._correlation_matrix(correlation) * np.outer(stds, stds)
+        if self.covariance.shape != (d, d):
+            raise ValidationError(
+                f"Covariance must be {d}x{d} for traits {self.traits}, "
+                f"got shape {self.covariance.shape}"
+            )
+        self._factor = _nearest_factor(self.covariance)
+
+    def _correlation_matrix(self, correlation: Any) -> np.ndarray:
+        """Build a full correlation matrix from an array or pair dict."""
+        d = len(self.traits)
+        if correlation is None:
+            return np.eye(d)
+        if isinstance(correlation, Mapping):
+            column = {name: i for i, name in enumerate(self.traits)}
+            matrix = np.eye(d)
+            for (a, b), r in correlation.items():
+                if a not in column or b not in column:
+                    raise ValidationError(f"Unknown trait in correlation: {a}, {b}")
+                matrix[column[a], column[b]] = matrix[column[b], column[a]] = r
+            return matrix
+        return np.asarray(correlation, dtype=float)
+
+    @classmethod
+    def from_template(cls, trait_distributions: Mapping[str, Any], **kwargs: Any) -> "PopulationSampler":
+        """Create from a population template's trait_distributions.
+
+        Correlations are read from the reserved "correlations" key as a
+        list of [trait_a, trait_b, r] triples.
+
+        Args:
+            trait_distributions: Template trait distributions
+            **kwargs: Passed to the constructor
+
+        Returns:
+            PopulationSampler
+        """
+        distributions = dict(trait_distributions)
+        pairs = distributions.pop(CORRELATIONS_KEY, None) or []
+        correlation = {(a, b): r for a, b, r in pairs} if pairs else None
+        return cls(distributions, correlation=correlation, **kwargs)
+
+    def sample(self, n: int, seed: int | np.random.Generator | None = None) -> np.ndarray:
+        """Sample trait values for a population.
+
+        Args:
+            n: Population size
+            seed: Random seed or Generator for reproducibility
+
+        Returns:
+            (n, d) array of trait values, columns in ``traits`` order
+        """
+        rng = np.random.default_rng(seed)
+        values = self._draw(rng, n)
+        if self.truncation == "resample":
+            for _ in range(self.max_rounds):
+                bad = np.flatnonzero(((values < self.low) | (values > self.high)).any(axis=1))
+                if len(bad) == 0:
+                    break
+                values[bad] = self._draw(rng, len(bad))
+        return np.clip(values, self.low, self.high)
+
+    def _draw(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Draw n rows from the untruncated distribution."""
+        return self.means + rng.standard_normal((n, len(self.traits))) @ self._factor.T
+
+
+def sample_ages(
+    n: int,
+    config: Mapping[str, Any],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Sample integer ages from a template's age config.
+
+    Args:
+        n: Population size
+        config: Dict with min, max and distribution ("uniform" or "normal")
+        rng: Random generator
+
+    Returns:
+        (n,) integer array within [min, max]
+    """
+    low, high = int(config.get("min", 18)), int(config.get("max", 65))
+    if config.get("distribution", "uniform") == "normal":
+        mean = config.get("mean", (low + high) / 2)
+        std = config.get("std", (high - low) / 4)
+        ages = np.rint(rng.normal(mean, std, n))
+        return np.clip(ages, low, high).astype(np.int64)
+    return rng.integers(low, high, n, endpoint=True)
+
+
+def _choose(options: Sequence[str] | Mapping[str, float], n: int, rng: np.random.Generator) -> list[str]:
+    """Pick n options uniformly, or by weight when given a dict."""
+    if isinstance(options, Mapping):
+        names = list(options)
+        weights = np.array([options[name] for name in names], dtype=float)
+        picks = rng.choice(len(names), n, p=weights / weights.sum())
+    else:
+        names = list(options)
+        picks = rng.integers(0, len(names), n)
+    return [names[i] for i in picks.tolist()]
+
+
+def generate_personas(
+    template: Mapping[str, Any],
+    count: int | None = None,
+    seed: int | None = None,
+    name_prefix: str | None = None,
+    truncation: str = "resample",
+) -> list[dict[str, Any]]:
+    """Generate persona library records from a population template.
+
+    Traits, ages and occupations are sampled as whole arrays, so large
+    populations only pay per-persona cost for building the dictionaries.
+    The same template and seed always give the same names and values, so
+    an interrupted bulk import can be re-run and resumed.
+
+    Args:
+        template: Population template dictionary
+            (see PopulationTemplateModel.to_dict)
+        count: Number of personas (defaults to the template's default_count)
+        seed: Random seed (defaults to the template's seed)
+        name_prefix: Name prefix (defaults to the template name)
+        truncation: Trait truncation mode, "resample" or "clip"
+
+    Returns:
+        Persona dictionaries for Repository.save_personas_bulk
+    """
+    n = template.get("default_count", 10) if count is None else count
+    seed = template.get("seed") if seed is None else seed
+    prefix = template["name"] if name_prefix is None else name_prefix
+    rng = np.random.default_rng(seed)
+
+    sampler = PopulationSampler.from_template(
+        template.get("trait_distributions") or {}, truncation=truncation
+    )
+    values = sampler.sample(n, rng).tolist()
+
+    demographics = template.get("demographic_config") or {}
+    ages = sample_ages(n, demographics["age"], rng).tolist() if "age" in demographics else [None] * n
+    occupations = demographics.get("occupations")
+    jobs = _choose(occupations, n, rng) if occupations else [None] * n
+
+    tags = list(template.get("tags") or [])
+    created_by = template.get("created_by")
+    traits = sampler.traits
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"{prefix}_{i + 1}",
+            "traits": dict(zip(traits, row)),
+            "age": ages[i],
+            "occupation": jobs[i],
+            "tags": tags,
+            "created_by": created_by,
+        }
+        for i, row in enumerate(values)
+    ]
@@ -1,8 +1,18 @@
 """Trait-aware prompt generation."""
 
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
 from agentworld.personas.traits import TraitVector, TRAIT_DESCRIPTORS
 
 
+# Bump whenever the generated wording changes, so cached and persisted
+# prompts built by older templates are regenerated
+PROMPT_TEMPLATE_VERSION = 1
+
+
 def generate_personality_prompt(traits: TraitVector, name: str = "Agent") -> str:
     """Generate a personality description for use in system prompts.
 
@@ -128,3 +138,134 @@ def generate_system_prompt(
     )
 
     return "\n".join(sections)
+
+
+def prompt_cache_key(
+    traits: TraitVector,
+    name: str,
+    background: str = "",
+    additional_instructions: str = "",
+) -> str:
+    """Content-addressed key for a generated system prompt.
+
+    Args:
+        traits: TraitVector defining the personality
+        name: Name of the agent
+        background: Optional background/context for the agent
+        additional_instructions: Optional additional instructions
+
+    Returns:
+        SHA-256 hex digest of the prompt inputs and template version
+    """
+    payload = json.dumps(
+        [PROMPT_TEMPLATE_VERSION, traits.to_dict(), name, background or "", additional_instructions or ""],
+        sort_keys=True,
+        default=lambda value: value.to_dict(),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PromptCache:
+    """Bounded LRU cache of generated system prompts.
+
+    Keys come from prompt_cache_key, so agents sharing a persona share one
+    prompt string.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached prompts
+        """
+        self.max_size = max_size
+        self._prompts: OrderedDict[str, str] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Get a cached prompt, marking it recently used."""
+        prompt = self._prompts.get(key)
+        if prompt is None:
+            self._misses += 1
+            return None
+        self._prompts.move_to_end(key)
+        self._hits += 1
+        return prompt
+
+    def set(self, key: str, prompt: str) -> None:
+        """Cache a prompt, evicting the least recently used if full."""
+        self._prompts[key] = prompt
+        self._prompts.move_to_end(key)
+        while len(self._prompts) > self.max_size:
+            self._prompts.popitem(last=False)
+
+    def get_or_generate(
+        self,
+        traits: TraitVector,
+        name: str,
+        background: str = "",
+        additional_instructions: str = "",
+        key: str | None = None,
+    ) -> str:
+        """Get a system prompt, generating and caching it on a miss.
+
+        Args:
+            traits: TraitVector defining the personality
+            name: Name of the agent
+            background: Optional background/context for the agent
+            additional_instructions: Optional additional instructions
+            key: Precomputed prompt_cache_key, if the caller has one
+
+        Returns:
+            Complete system prompt
+        """
+        if key is None:
+            key = prompt_cache_key(traits, name, background, additional_instructions)
+        prompt = self.get(key)
+        if prompt is None:
+            prompt = generate_system_prompt(traits, name, background, additional_instructions)
+            self.set(key, prompt)
+        return prompt
+
+    def clear(self) -> None:
+        """Clear all cached prompts."""
+        self._prompts.clear()
+
+    @property
+    def size(self) -> int:
+        """Current number of cached prompts."""
+        return len(self._prompts)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+        }
+
+
+_prompt_cache = PromptCache()
+
+
+def get_prompt_cache() -> PromptCache:
+    """Get the process-wide system prompt cache."""
+    return _prompt_cache
+
+
+def cached_system_prompt(
+    traits: TraitVector,
+    name: str,
+    background: str = "",
+    additional_instructions: str = "",
+) -> str:
+    """Generate a system prompt through the process-wide cache.
+
+    Same arguments and result as generate_system_prompt.
+    """
+    return _prompt_cache.get_or_generate(traits, name, background, additional_instructions)
@@ -1,10 +1,10 @@
 """Trait vector system based on Big Five personality model."""
 
-import random
 from dataclasses import dataclass, field
 from typing import Any
 
 from agentworld.core.exceptions import ValidationError
+from agentworld.personas.population import PopulationSampler
 
 
 # Big Five trait descriptors (low to high)
@@ -523,6 +523,9 @@ def generate_diverse_population(
     Per ADR-004, this enables systematic generation of diverse
     agent populations for research and simulation.
 
+    Values are sampled as one array (see PopulationSampler) and clamped to
+    [0, 1]. Names other than the Big Five become custom traits.
+
     Args:
         n: Number of agents to generate
         trait_distributions: Dict of trait_name -> (mean, std)
@@ -532,28 +535,9 @@ def generate_diverse_population(
     Returns:
         List of TraitVectors sampled from distributions
     """
-    rng = random.Random(seed)
-
-    defaults = {
-        "openness": (0.5, 0.2),
-        "conscientiousness": (0.5, 0.2),
-        "extraversion": (0.5, 0.2),
-        "agreeableness": (0.5, 0.2),
-        "neuroticism": (0.5, 0.2),
-    }
-    distributions = {**defaults, **(trait_distributions or {})}
-
-    population = []
-    for _ in range(n):
-        traits = {}
-        for trait, (mean, std) in distributions.items():
-            # Sample and clamp to [0, 1]
-            value = rng.gauss(mean, std)
-            value = max(0.0, min(1.0, value))
-            traits[trait] = value
-        population.append(TraitVector(**traits))
-
-    return population
+    sampler = PopulationSampler(trait_distributions, truncation="clip")
+    values = sampler.sample(n, seed).tolist()
+    return [TraitVector.from_dict(dict(zip(sampler.traits, row))) for row in values]
 
 
 def generate_population_with_profiles(
@@ -30,6 +30,12 @@ from agentworld.simulation.control import (
     with_timeout,
     retry_with_backoff,
 )
+from agentworld.simulation.sharding import (
+    ShardStrategy,
+    Shard,
+    partition_agents,
+    topology_groups,
+)
 from agentworld.simulation.checkpoint import (
     CheckpointMetadata,
     SimulationState,
@@ -78,6 +84,11 @@ __all__ = [
     "SimulationController",
     "with_timeout",
     "retry_with_backoff",
+    # Sharding
+    "ShardStrategy",
+    "Shard",
+    "partition_agents",
+    "topology_groups",
     # Checkpoint
     "CheckpointMetadata",
     "SimulationState",
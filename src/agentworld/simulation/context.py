@@ -0,0 +1,144 @@
+"""Token-budgeted conversation context.
+
+A ContextWindow keeps the recent conversation as one pre-rendered string
+plus running character and token offsets. Each message is formatted and
+token-counted once, when it is appended. Rendering the newest lines that
+fit a token budget is then a binary search and a single string slice,
+whatever the length of the conversation.
+
+Token counts are per line, so a rendered context never exceeds its
+budget by more than the tokenizer merging across line boundaries.
+"""
+
+from bisect import bisect_left
+from typing import Iterator
+
+from agentworld.core.models import Message
+from agentworld.llm.tokens import count_tokens
+
+
+# ADR-002 target: < 2K tokens per agent per step
+DEFAULT_CONTEXT_TOKENS = 2000
+
+CONTEXT_HEADER = "Recent conversation:"
+
+
+class ContextWindow:
+    """Rolling window of recent conversation lines with cached token counts.
+
+    The window holds at most ``max_tokens`` tokens of lines (the largest
+    budget any agent can ask for); older lines are evicted as new ones
+    arrive.
+
+    Attributes:
+        model: Model whose tokenizer counts tokens
+        max_tokens: Most tokens of lines kept
+        header_tokens: Tokens used by the context header
+    """
+
+    def __init__(self, model: str = "openai/gpt-4o-mini", max_tokens: int = DEFAULT_CONTEXT_TOKENS):
+        """Initialize an empty window.
+
+        Args:
+            model: Model whose tokenizer counts tokens
+            max_tokens: Most tokens of lines kept
+        """
+        self.model = model
+        self.max_tokens = max_tokens
+        self.header_tokens = count_tokens(CONTEXT_HEADER, model)
+        self._text = ""
+        # Per line: sender, and the character and token offsets where it starts
+        self._senders: list[str] = []
+        self._char_starts: list[int] = []
+        self._token_starts: list[int] = []
+        self._char_base = 0
+        self._tokens = 0
+        self._first = 0
+
+    def __len__(self) -> int:
+        return len(self._senders) - self._first
+
+    @property
+    def tokens(self) -> int:
+        """Tokens of all lines in the window (without the header)."""
+        return self._tokens - self._token_starts[self._first] if len(self) else 0
+
+    def append(self, message: Message, sender_name: str | None = None) -> None:
+        """Add a message to the end of the window.
+
+        Args:
+            message: Message to add
+            sender_name: Display name of the sender (defaults to its ID)
+        """
+        line = f"\n  {sender_name or message.sender_id}: {message.content}"
+        self.append_line(message.sender_id, line, count_tokens(line, self.model))
+
+    def append_line(self, sender_id: str, line: str, tokens: int) -> None:
+        """Add a formatted, already counted line to the end of the window.
+
+        Args:
+            sender_id: Sender of the line
+            line: Line text, starting with a newline
+            tokens: Token count of the line
+        """
+        self._senders.append(sender_id)
+        self._char_starts.append(self._char_base + len(self._text))
+        self._token_starts.append(self._tokens)
+        self._text += line
+        self._tokens += tokens
+        while len(self) > 1 and self.tokens > self.max_tokens:
+            self._first += 1
+        if self._first > len(self):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop evicted lines from the buffers (amortized over appends)."""
+        first = self._first
+        cut = self._char_starts[first] - self._char_base
+        self._text = self._text[cut:]
+        self._char_base = self._char_starts[first]
+        del self._senders[:first]
+        del self._char_starts[:first]
+        del self._token_starts[:first]
+        self._first = 0
+
+    def lines(self) -> Iterator[tuple[str, str, int]]:
+        """Iterate over the window's lines, oldest first.
+
+        Yields:
+            Tuples of (sender_id, line, tokens)
+        """
+        if not len(self):
+            return
+        ends = self._char_starts[self._first + 1:] + [self._char_base + len(self._text)]
+        token_ends = self._token_starts[self._first + 1:] + [self._tokens]
+        for i, (end, token_end) in enumerate(zip(ends, token_ends), start=self._first):
+            start = self._char_starts[i] - self._char_base
+            yield (
+                self._senders[i],
+                self._text[start:end - self._char_base],
+                token_end - self._token_starts[i],
+            )
+
+    def render(self, budget: int | None = None, max_messages: int | None = None) -> str:
+        """Render the newest lines that fit a token budget.
+
+        Args:
+            budget: Token budget including the header (defaults to
+                ``max_tokens`` plus the header)
+            max_messages: Optional cap on the number of lines
+
+        Returns:
+            Context string, or "" if no line fits
+        """
+        if budget is None:
+            budget = self.max_tokens + self.header_tokens
+        budget -= self.header_tokens
+        if not len(self) or budget < 0:
+            return ""
+        first = bisect_left(self._token_starts, self._tokens - budget, lo=self._first)
+        if max_messages is not None:
+            first = max(first, len(self._senders) - max_messages)
+        if first >= len(self._senders):
+            return ""
+        return CONTEXT_HEADER + self._text[self._char_starts[first] - self._char_base:]
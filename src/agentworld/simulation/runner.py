@@ -10,11 +10,23 @@ from typing import Any, Callable, Awaitable, Optional, TYPE_CHECKING
 from agentworld.core.models import Message, SimulationConfig, SimulationStatus
 from agentworld.core.exceptions import SimulationError
 from agentworld.agents.agent import Agent
+from agentworld.memory.store import MemoryStore
+from agentworld.memory.clock import StepClock
 from agentworld.persistence.repository import Repository
 from agentworld.persistence.database import init_db
 from agentworld.topology.base import Topology, RoutingMode
 from agentworld.topology.types import MeshTopology, create_topology
 from agentworld.topology.graph import TopologyGraph
+from agentworld.topology.routing import RoutingTable
+from agentworld.topology.dynamic import RewiringPolicy
+from agentworld.llm.tokens import count_tokens_batch
+from agentworld.simulation.context import DEFAULT_CONTEXT_TOKENS, ContextWindow
+from agentworld.simulation.sharding import (
+    Shard,
+    ShardStrategy,
+    partition_agents,
+    topology_groups,
+)
 from agentworld.simulation.control import (
     ExecutionPhase,
     ThreePhaseExecutor,
@@ -22,7 +34,7 @@ from agentworld.simulation.control import (
     PhaseResult,
 )
 from agentworld.plugins.hooks import PluginHooks
-from agentworld.api.events import SimulationEventEmitter
+from agentworld.core.events import EventBus, SimulationEventEmitter
 
 if TYPE_CHECKING:
     from agentworld.agents.external import InjectedAgentManager
@@ -33,6 +45,10 @@ logger = logging.getLogger(__name__)
 # Type alias for step callbacks
 StepCallback = Callable[[int, list[Message]], Awaitable[None] | None]
 
+CONTINUE_INSTRUCTION = (
+    "Continue the conversation naturally. Respond to what others have said or add your own perspective."
+)
+
 
 @dataclass
 class Simulation:
@@ -54,9 +70,17 @@ class Simulation:
     topology_type: str = "mesh"  # Default to full mesh
     topology_config: dict = field(default_factory=dict)
     routing_mode: RoutingMode = RoutingMode.DIRECT_ONLY
+    persist_memory: bool = False
+    memory_clock: StepClock | None = None
+    rewiring_policy: RewiringPolicy | None = None
+    shard_by: ShardStrategy | None = None
+    max_concurrent_shards: int | None = None
+    context_tokens: int = DEFAULT_CONTEXT_TOKENS
+    event_bus: EventBus | None = field(default=None, repr=False)
 
     # Runtime state
     _messages: list[Message] = field(default_factory=list, repr=False)
+    _context: ContextWindow | None = field(default=None, repr=False)
     _repository: Repository | None = field(default=None, repr=False)
     _step_callbacks: list[StepCallback] = field(default_factory=list, repr=False)
     _total_tokens: int = field(default=0, repr=False)
@@ -65,6 +89,14 @@ class Simulation:
     _topology_graph: TopologyGraph | None = field(default=None, repr=False)
     _emitter: SimulationEventEmitter | None = field(default=None, repr=False)
     _injection_manager: "InjectedAgentManager | None" = field(default=None, repr=False)
+    _agents_by_id: dict[str, Agent] = field(default_factory=dict, repr=False)
+    _agents_key: tuple | None = field(default=None, repr=False)
+    _fanout: dict[str, list[Agent]] = field(default_factory=dict, repr=False)
+    _fanout_table: RoutingTable | None = field(default=None, repr=False)
+    _fanout_revision: int = field(default=0, repr=False)
+    _saved_topology_key: tuple | None = field(default=None, repr=False)
+    _shards: list[Shard] = field(default_factory=list, repr=False)
+    _shards_key: tuple | None = field(default=None, repr=False)
 
     @classmethod
     def from_config(cls, config: SimulationConfig) -> "Simulation":
@@ -124,6 +156,7 @@ class Simulation:
         """Set the topology."""
         self._topology = value
         self._topology_graph = TopologyGraph(value, self.routing_mode)
+        self._invalidate_delivery_index()
 
     @property
     def topology_graph(self) -> TopologyGraph:
@@ -134,9 +167,9 @@ class Simulation:
 
     @property
     def emitter(self) -> SimulationEventEmitter:
-        """Get the event emitter for real-time updates."""
+        """Get the emitter publishing to the event bus (default: process-wide)."""
         if self._emitter is None:
-            self._emitter = SimulationEventEmitter(self.id)
+            self._emitter = SimulationEventEmitter(self.id, self.event_bus)
         return self._emitter
 
     @property
@@ -182,6 +215,66 @@ class Simulation:
         """
         return self.topology_graph.get_valid_recipients(sender_id)
 
+    def _agent_index(self) -> dict[str, Agent]:
+        """Get the agent ID index, rebuilding it if the agent list changed."""
+        # Keyed on the agent objects themselves (kept alive by the index), so
+        # agents replaced in place are noticed, not only appends
+        key = tuple(map(id, self.agents))
+        if key != self._agents_key:
+            index: dict[str, Agent] = {}
+            for agent in self.agents:
+                index.setdefault(agent.id, agent)
+            self._agents_by_id = index
+            self._agents_key = key
+            self._fanout_table = None
+        return self._agents_by_id
+
+    def _invalidate_delivery_index(self) -> None:
+        """Drop the agent index and per-sender receiver lists."""
+        self._agents_key = None
+        self._fanout_table = None
+
+    def get_receivers(self, sender_id: str) -> list[Agent]:
+        """Get the agents that receive messages from a sender.
+
+        Receiver lists are computed once per sender from the routing table
+        and reused until agents are added, the routing mode changes, or the
+        topology changes in a way that affects that sender.
+
+        Args:
+            sender_id: Sending agent ID
+
+        Returns:
+            Receiving agents, in simulation order
+        """
+        index = self._agent_index()
+        table = self.topology_graph.routing_table
+        if table is not self._fanout_table:
+            self._fanout = {}
+            self._fanout_table = table
+            self._fanout_revision = table.revision
+        elif table.revision != self._fanout_revision:
+            touched = table.touched_since(self._fanout_revision)
+            if touched is None:
+                self._fanout = {}
+            else:
+                for sender in touched:
+                    self._fanout.pop(sender, None)
+            self._fanout_revision = table.revision
+
+        receivers = self._fanout.get(sender_id)
+        if receivers is None:
+            if table.routing_mode == RoutingMode.BROADCAST:
+                receivers = [a for a in self.agents if a.id != sender_id]
+            else:
+                recipient_ids = set(table.recipients(sender_id))
+                receivers = [
+                    a for a in index.values()
+                    if a.id in recipient_ids
+                ]
+            self._fanout[sender_id] = receivers
+        return receivers
+
     @property
     def messages(self) -> list[Message]:
         """Get all messages."""
@@ -205,6 +298,7 @@ class Simulation:
         """
         agent.simulation_id = self.id
         self.agents.append(agent)
+        self._invalidate_delivery_index()
 
     def get_agent(self, agent_id: str) -> Agent | None:
         """Get an agent by ID.
@@ -215,10 +309,7 @@ class Simulation:
         Returns:
             Agent or None if not found
         """
-        for agent in self.agents:
-            if agent.id == agent_id:
-                return agent
-        return None
+        return self._agent_index().get(agent_id)
 
     def get_agent_by_name(self, name: str) -> Agent | None:
         """Get an agent by name.
@@ -287,16 +378,84 @@ class Simulation:
             self.repository.save_topology_config({
                 "simulation_id": self.id,
                 "topology_type": self.topology_type,
-                "directed": isinstance(self._topology.graph, type(self._topology.graph)),
+                "directed": self._topology.directed,
                 "config": self.topology_config,
             })
 
-            # Save topology edges
+            self._save_topology_edges()
+
+    def _save_topology_edges(self) -> None:
+        """Save topology edges (only the diff is written)."""
+        key = (id(self._topology), self._topology.fingerprint())
+        if key != self._saved_topology_key:
             edges = [
-                (source, target, data.get("weight", 1.0))
-                for source, target, data in self._topology.graph.edges(data=True)
+                (edge["source"], edge["target"], edge["weight"])
+                for edge in self._topology.to_dict()["edges"]
             ]
             self.repository.save_topology_edges(self.id, edges)
+            self._saved_topology_key = key
+
+    def _apply_rewiring(self, step_messages: list[Message]) -> None:
+        """Apply the rewiring policy's changes for a committed step.
+
+        Routing tables and the delivery index pick the changes up
+        incrementally. If the stored edges matched the topology before the
+        change, only the delta is written; otherwise the edge set is diffed.
+        """
+        if self.rewiring_policy is None:
+            return
+        topology = self.topology
+        before = topology.fingerprint()
+        delta = self.rewiring_policy.rewire(topology, step_messages, self.current_step)
+        if not delta:
+            return
+        delta.apply(topology)
+
+        if self._saved_topology_key == (id(topology), before):
+            self.repository.update_topology_edges(
+                self.id, delta.added, delta.removed, directed=topology.directed
+            )
+            self._saved_topology_key = (id(topology), topology.fingerprint())
+        else:
+            self._save_topology_edges()
+
+    def _attach_memory_backends(self) -> None:
+        """Give agents the simulation's memory clock and persistent stores.
+
+        Only agents whose memory has not been built yet are wired up.
+        """
+        if self.memory_clock is not None:
+            self.memory_clock.set_step(self.current_step)
+
+        for agent in self.agents:
+            if agent._memory is not None:
+                continue
+            if self.memory_clock is not None and agent.memory_clock is None:
+                agent.memory_clock = self.memory_clock
+            if self.persist_memory and agent.memory_store is None:
+                agent.memory_store = MemoryStore(agent.id, self.repository)
+
+    async def _await_reflections(self) -> None:
+        """Wait for agents' background reflection runs to finish.
+
+        Failures are logged by the memory (see Memory._schedule_reflections)
+        and do not fail the step.
+        """
+        pending = [
+            agent._memory.wait_for_reflections()
+            for agent in self.agents
+            if agent._memory is not None and agent._memory._reflection_task is not None
+        ]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _flush_memories(self) -> None:
+        """Write buffered agent memories to the repository."""
+        if not self.persist_memory:
+            return
+        for agent in self.agents:
+            if agent._memory is not None:
+                agent._memory.flush()
 
     def _save_message(self, message: Message) -> None:
         """Save a message to repository.
@@ -321,6 +480,7 @@ class Simulation:
         prompt: str,
         receiver_id: str | None,
         step: int,
+        prefix: str | None = None,
     ) -> Message:
         """Generate a message, using external agent if injected.
 
@@ -329,6 +489,8 @@ class Simulation:
             prompt: The prompt/context for generation
             receiver_id: Target receiver ID
             step: Current simulation step
+            prefix: Stable context shared by every agent's prompt, sent to
+                simulated agents separately so providers can cache it
 
         Returns:
             Generated message
@@ -352,7 +514,7 @@ class Simulation:
                     # Call external agent
                     response_text, metrics = await provider.generate_response(
                         agent=agent,
-                        stimulus=prompt,
+                        stimulus=f"{prefix}\n\n{prompt}" if prefix else prompt,
                         conversation_history=conversation_history,
                         run_id=self.id,
                         turn_id=str(uuid.uuid4()),
@@ -390,33 +552,84 @@ class Simulation:
             prompt=prompt,
             receiver_id=receiver_id,
             step=step,
+            prefix=prefix,
         )
 
-    def _build_context(self, for_agent: Agent, recent_count: int = 5) -> str:
-        """Build context string for an agent.
+    def _context_prefix(self) -> str | None:
+        """Stable header shared by every agent's context (the topic)."""
+        if self.initial_prompt:
+            return f"Topic: {self.initial_prompt}"
+        return None
+
+    def _turn_prompt(self, index: int, context: str) -> tuple[str, str | None]:
+        """Build an agent's prompt for the current step.
 
         Args:
-            for_agent: Agent to build context for
-            recent_count: Number of recent messages to include
+            index: Agent's position in the simulation
+            context: Context from ``_build_context``
 
         Returns:
-            Context string
+            Tuple of (prompt, stable prefix or None)
         """
-        recent = self._messages[-recent_count:] if self._messages else []
-        if not recent:
-            return self.initial_prompt
+        if self.current_step == 1 and index == 0:
+            return f"Start a conversation about: {self.initial_prompt}\n\nBegin by sharing your initial thoughts.", None
+        prompt = f"{context}\n\n{CONTINUE_INSTRUCTION}" if context else CONTINUE_INSTRUCTION
+        return prompt, self._context_prefix()
 
-        lines = []
-        if self.initial_prompt:
-            lines.append(f"Topic: {self.initial_prompt}\n")
+    @property
+    def context_window(self) -> ContextWindow:
+        """Rolling window of recent messages, creating if needed."""
+        if self._context is None:
+            self._context = ContextWindow(self.model, max_tokens=self.context_tokens)
+            for message in self._messages:
+                self._append_context(self._context, message)
+        return self._context
+
+    def _append_context(self, window: ContextWindow, message: Message) -> None:
+        """Add a message to a context window under its sender's name."""
+        sender = self.get_agent(message.sender_id)
+        window.append(message, sender.name if sender else None)
+
+    def _record_message(self, message: Message) -> None:
+        """Add a message to the conversation history."""
+        self._messages.append(message)
+        self._append_context(self.context_window, message)
+
+    def _context_budget(self, agent: Agent) -> int:
+        """Tokens left for conversation context in an agent's prompt.
+
+        ``context_tokens`` caps each agent's whole prompt, so the system
+        prompt, topic prefix and turn instruction are taken out first.
+        """
+        fixed = count_tokens_batch(
+            [agent.system_prompt or "", self._context_prefix() or "", CONTINUE_INSTRUCTION],
+            self.model,
+        )
+        return self.context_tokens - sum(fixed)
 
-        lines.append("Recent conversation:")
-        for msg in recent:
-            sender = self.get_agent(msg.sender_id)
-            sender_name = sender.name if sender else msg.sender_id
-            lines.append(f"  {sender_name}: {msg.content}")
+    def _build_context(
+        self,
+        for_agent: Agent,
+        recent_count: int | None = None,
+        history: ContextWindow | None = None,
+    ) -> str:
+        """Build context string for an agent.
 
-        return "\n".join(lines)
+        Fills the agent's token budget (see ``_context_budget``) with the
+        most recent messages. The topic header is not included; it is sent
+        separately as the stable prompt prefix (see ``_context_prefix``).
+
+        Args:
+            for_agent: Agent to build context for
+            recent_count: Optional cap on the number of recent messages
+            history: Window to draw from (defaults to all messages)
+
+        Returns:
+            Context string
+        """
+        if history is None:
+            history = self.context_window
+        return history.render(self._context_budget(for_agent), max_messages=recent_count)
 
     async def step(self, use_three_phase: bool = False) -> list[Message]:
         """Execute one simulation step.
@@ -430,6 +643,7 @@ class Simulation:
 
         Raises:
             SimulationError: If simulation cannot step
+            ValueError: If shard_by is set without DIRECT_ONLY routing
         """
         if self.status == SimulationStatus.COMPLETED:
             raise SimulationError("Simulation already completed")
@@ -440,6 +654,13 @@ class Simulation:
         if not self.agents:
             raise SimulationError("No agents in simulation")
 
+        if self.shard_by is not None and self.topology_graph.routing_mode != RoutingMode.DIRECT_ONLY:
+            # Shards are only independent when messages reach neighbors alone
+            raise ValueError(
+                f"shard_by requires {RoutingMode.DIRECT_ONLY.value!r} routing, "
+                f"got {self.topology_graph.routing_mode.value!r}"
+            )
+
         # Update status
         if self.status == SimulationStatus.PENDING:
             self.status = SimulationStatus.RUNNING
@@ -449,6 +670,7 @@ class Simulation:
 
         self.current_step += 1
         step_messages: list[Message] = []
+        self._attach_memory_backends()
 
         # Initialize topology if needed
         if self._topology is None and self.agents:
@@ -460,13 +682,19 @@ class Simulation:
         # Plugin hook: step start (per ADR-014)
         PluginHooks.on_step_start(self.current_step, self)
 
-        if use_three_phase:
+        if self.shard_by is not None:
+            # Shards step concurrently and merge at COMMIT
+            step_messages = await self._step_sharded()
+        elif use_three_phase:
             # Three-phase execution per ADR-011
             step_messages = await self._step_three_phase()
         else:
             # Standard sequential execution
             step_messages = await self._step_sequential()
 
+        # Rewire the topology once the step's messages are committed
+        self._apply_rewiring(step_messages)
+
         # Plugin hook: step complete (per ADR-014)
         PluginHooks.on_step_complete(self.current_step, self)
 
@@ -480,6 +708,10 @@ class Simulation:
         # Notify callbacks
         await self._notify_step(self.current_step, step_messages)
 
+        # Persist memories (and reflections) recorded during this step
+        await self._await_reflections()
+        self._flush_memories()
+
         # Check if completed
         if self.current_step >= self.total_steps:
             self.status = SimulationStatus.COMPLETED
@@ -526,10 +758,7 @@ class Simulation:
             self.emitter.agent_thinking(agent.id, agent.name)
 
             # Generate message
-            if self.current_step == 1 and i == 0:
-                prompt = f"Start a conversation about: {self.initial_prompt}\n\nBegin by sharing your initial thoughts."
-            else:
-                prompt = f"{context}\n\nContinue the conversation naturally. Respond to what others have said or add your own perspective."
+            prompt, prefix = self._turn_prompt(i, context)
 
             # Use injection-aware message generation
             message = await self._generate_message_with_injection(
@@ -537,13 +766,14 @@ class Simulation:
                 prompt=prompt,
                 receiver_id=receiver_id,
                 step=self.current_step,
+                prefix=prefix,
             )
 
             # Emit agent responded event
             self.emitter.agent_responded(agent.id, agent.name, message.content)
 
             # Track message
-            self._messages.append(message)
+            self._record_message(message)
             step_messages.append(message)
             self._save_message(message)
 
@@ -562,10 +792,149 @@ class Simulation:
             PluginHooks.on_message_sent(message, self)
 
             # Notify other agents based on topology
-            for other_agent in self.agents:
-                if other_agent.id != agent.id:
-                    if self.can_communicate(agent.id, other_agent.id):
+            for other_agent in self.get_receivers(agent.id):
+                other_agent.receive_message(message)
+
+        return step_messages
+
+    def get_shards(self) -> list[Shard]:
+        """Partition agents into shards for sharded step execution.
+
+        The partition is cached until the topology or agent list changes.
+
+        Returns:
+            Shards in deterministic order
+        """
+        strategy = ShardStrategy(self.shard_by)
+        topology = self.topology
+        key = (
+            strategy,
+            id(topology),
+            topology.fingerprint(),
+            tuple(map(id, self.agents)),
+        )
+        if key != self._shards_key:
+            self._shards = partition_agents(
+                [agent.id for agent in self.agents],
+                topology_groups(topology, strategy),
+            )
+            self._shards_key = key
+        return self._shards
+
+    def _shard_histories(self, shards: list[Shard]) -> list[ContextWindow]:
+        """Context windows each shard steps against.
+
+        Every shard starts from the messages committed in earlier steps,
+        as agents see them in the unsharded loop, copied from the
+        simulation's context window without recounting tokens. During the
+        step a shard only adds its own members' messages; other shards'
+        messages from this step become visible once committed.
+        """
+        lines = list(self.context_window.lines())
+        histories = []
+        for _ in shards:
+            history = ContextWindow(self.model, max_tokens=self.context_tokens)
+            for sender_id, line, tokens in lines:
+                history.append_line(sender_id, line, tokens)
+            histories.append(history)
+        return histories
+
+    async def _step_sharded(self) -> list[Message]:
+        """Execute step with shards running as concurrent tasks.
+
+        Each shard processes its agents sequentially against its own message
+        buffer, delivering messages to receivers inside the shard at once.
+        At COMMIT, messages from all shards are recorded in simulation
+        order and cross-shard deliveries are made in that same order, so
+        results do not depend on which shard finishes first.
+
+        Returns:
+            List of messages generated, in simulation order
+        """
+        shards = self.get_shards()
+        histories = self._shard_histories(shards)
+        position = {agent.id: i for i, agent in enumerate(self.agents)}
+        index = self._agent_index()
+        semaphore = (
+            asyncio.Semaphore(self.max_concurrent_shards)
+            if self.max_concurrent_shards else None
+        )
+
+        async def run_shard(
+            shard: Shard, history: ContextWindow
+        ) -> list[tuple[int, Message, list[Agent]]]:
+            """Step one shard's agents; cross-shard receivers are deferred."""
+            results = []
+            for agent_id in shard.agent_ids:
+                agent = index[agent_id]
+                i = position[agent_id]
+                context = self._build_context(agent, history=history)
+
+                valid_recipients = self.get_valid_recipients(agent.id)
+                if valid_recipients:
+                    receiver_id = valid_recipients[i % len(valid_recipients)]
+                else:
+                    receiver_id = None
+
+                self.emitter.agent_thinking(agent.id, agent.name)
+
+                prompt, prefix = self._turn_prompt(i, context)
+
+                message = await self._generate_message_with_injection(
+                    agent=agent,
+                    prompt=prompt,
+                    receiver_id=receiver_id,
+                    step=self.current_step,
+                    prefix=prefix,
+                )
+                self.emitter.agent_responded(agent.id, agent.name, message.content)
+                self._append_context(history, message)
+
+                deferred = []
+                for other_agent in self.get_receivers(agent.id):
+                    if other_agent.id in shard.members:
                         other_agent.receive_message(message)
+                    else:
+                        deferred.append(other_agent)
+                results.append((i, message, deferred))
+            return results
+
+        async def run_guarded(shard: Shard, history: ContextWindow):
+            if semaphore is None:
+                return await run_shard(shard, history)
+            async with semaphore:
+                return await run_shard(shard, history)
+
+        outputs = await asyncio.gather(*(
+            run_guarded(shard, history) for shard, history in zip(shards, histories)
+        ))
+
+        # ===== COMMIT: merge shards in simulation order =====
+        committed = sorted(
+            (item for output in outputs for item in output),
+            key=lambda item: item[0],
+        )
+        step_messages: list[Message] = []
+        for _, message, _ in committed:
+            self._record_message(message)
+            step_messages.append(message)
+            self._save_message(message)
+
+            receiver = self.get_agent(message.receiver_id) if message.receiver_id else None
+            self.emitter.message_created(
+                message_id=message.id,
+                sender_id=message.sender_id,
+                sender_name=index[message.sender_id].name,
+                receiver_id=message.receiver_id,
+                receiver_name=receiver.name if receiver else None,
+                content_preview=message.content,
+                step=self.current_step,
+            )
+            PluginHooks.on_message_sent(message, self)
+
+        for _, message, deferred in committed:
+            for other_agent in deferred:
+                other_agent.receive_message(message)
 
         return step_messages
 
@@ -622,10 +991,7 @@ class Simulation:
                 receiver_id = None
 
             context = perception.get("context", "")
-            if self.current_step == 1 and idx == 0:
-                prompt = f"Start a conversation about: {self.initial_prompt}\n\nBegin by sharing your initial thoughts."
-            else:
-                prompt = f"{context}\n\nContinue the conversation naturally. Respond to what others have said or add your own perspective."
+            prompt, prefix = self._turn_prompt(idx, context)
 
             # Use injection-aware message generation
             return await self._generate_message_with_injection(
@@ -633,6 +999,7 @@ class Simulation:
                 prompt=prompt,
                 receiver_id=receiver_id,
                 step=self.current_step,
+                prefix=prefix,
             )
 
         for agent in self.agents:
@@ -654,7 +1021,7 @@ class Simulation:
         # Apply all actions atomically
         async def commit_message(agent_id: str, message: Message) -> Message:
             """Commit a message to the simulation state."""
-            self._messages.append(message)
+            self._record_message(message)
             self._save_message(message)
             return message
 
@@ -687,10 +1054,8 @@ class Simulation:
 
         # Notify agents of all committed messages
         for message in step_messages:
-            for agent in self.agents:
-                if agent.id != message.sender_id:
-                    if self.can_communicate(message.sender_id, agent.id):
-                        agent.receive_message(message)
+            for agent in self.get_receivers(message.sender_id):
+                agent.receive_message(message)
 
         return step_messages
 
@@ -0,0 +1,94 @@
+"""Community-aware sharding for step execution.
+
+Under DIRECT_ONLY routing an agent's message only reaches its neighbors, so
+agents in different connected components cannot affect each other within a
+step and can be stepped independently. Communities are a finer partition:
+edges between them exist, so messages that cross shards are held back and
+delivered at COMMIT, in simulation order.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable
+
+import networkx as nx
+
+from agentworld.topology.base import Topology
+
+
+class ShardStrategy(str, Enum):
+    """How agents are partitioned into shards."""
+
+    COMPONENT = "component"  # Connected components (no cross-shard edges)
+    COMMUNITY = "community"  # Modularity communities (cross-shard edges at COMMIT)
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A group of agents stepped together as one task.
+
+    Attributes:
+        index: Shard number (shards are ordered by their first agent)
+        agent_ids: Member agent IDs in simulation order
+        members: Member agent IDs for fast lookup
+    """
+
+    index: int
+    agent_ids: tuple[str, ...]
+    members: frozenset[str]
+
+
+def topology_groups(topology: Topology, strategy: ShardStrategy) -> list[set[str]]:
+    """Group topology nodes for a sharding strategy.
+
+    Args:
+        topology: Topology to partition
+        strategy: Partitioning strategy
+
+    Returns:
+        Disjoint sets of agent IDs
+    """
+    graph = topology.graph
+    if strategy == ShardStrategy.COMPONENT:
+        if graph.is_directed():
+            return [set(c) for c in nx.weakly_connected_components(graph)]
+        return [set(c) for c in nx.connected_components(graph)]
+
+    if graph.number_of_nodes() == 0:
+        return []
+    if graph.is_directed():
+        graph = graph.to_undirected(as_view=True)
+    return [set(c) for c in nx.community.louvain_communities(graph, seed=0)]
+
+
+def partition_agents(agent_ids: list[str], groups: Iterable[set[str]]) -> list[Shard]:
+    """Build deterministic shards from agent groups.
+
+    Agents not covered by any group get a shard of their own. Members keep
+    simulation order and shards are ordered by their first member, so the
+    partition does not depend on set iteration order.
+
+    Args:
+        agent_ids: Agent IDs in simulation order
+        groups: Disjoint sets of agent IDs
+
+    Returns:
+        Shards covering every agent exactly once
+    """
+    position = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+    shard_of: dict[str, int] = {}
+    for g, group in enumerate(groups):
+        for agent_id in group:
+            if agent_id in position:
+                shard_of.setdefault(agent_id, g)
+
+    members: dict[object, list[str]] = {}
+    for agent_id in agent_ids:
+        key = shard_of.get(agent_id, ("single", agent_id))
+        members.setdefault(key, []).append(agent_id)
+
+    ordered = sorted(members.values(), key=lambda ids: position[ids[0]])
+    return [
+        Shard(index=i, agent_ids=tuple(ids), members=frozenset(ids))
+        for i, ids in enumerate(ordered)
+    ]
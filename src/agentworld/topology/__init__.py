@@ -14,6 +14,13 @@ from agentworld.topology.types import (
     CustomTopology,
 )
 from agentworld.topology.graph import TopologyGraph
+from agentworld.topology.sparse import SparseTopology
+from agentworld.topology.dynamic import (
+    TopologyDelta,
+    RewiringPolicy,
+    InteractionRewiringPolicy,
+)
+from agentworld.topology.layout import LayoutConfig, GraphLayout, LayoutEngine
 
 __all__ = [
     "Topology",
@@ -26,4 +33,11 @@ __all__ = [
     "SmallWorldTopology",
     "ScaleFreeTopology",
     "CustomTopology",
+    "SparseTopology",
+    "TopologyDelta",
+    "RewiringPolicy",
+    "InteractionRewiringPolicy",
+    "LayoutConfig",
+    "GraphLayout",
+    "LayoutEngine",
 ]
@@ -1,9 +1,11 @@
 """Base topology class and types."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import astuple, dataclass, field
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Deque, List, Optional, Tuple, Union
+import random
 
 import networkx as nx
 
@@ -20,6 +22,52 @@ class RoutingMode(Enum):
     BROADCAST = "broadcast"
 
 
+# Mutations remembered for incremental cache updates
+CHANGE_LOG_LIMIT = 4096
+
+# Key placed in a graph's __networkx_cache__ by fingerprint(). NetworkX
+# (3.3+) clears that cache on every structural mutation, so a missing key
+# means the graph was edited since the last fingerprint.
+_EDIT_MARKER = "agentworld.topology.fingerprint"
+
+
+@dataclass(frozen=True)
+class EdgeChange:
+    """A single mutation made through the Topology API.
+
+    Attributes:
+        kind: "add_edge", "remove_edge", "add_node" or "remove_node"
+        source: Edge source, or the node for node changes
+        target: Edge target (None for node changes)
+        weight: Edge weight for edge additions
+    """
+    kind: str
+    source: str
+    target: Optional[str] = None
+    weight: float = 1.0
+
+
+@dataclass
+class MetricsConfig:
+    """Accuracy settings for topology metrics.
+
+    Graphs with more than ``exact_max_nodes`` nodes use sampled estimates:
+    average path length from BFS over ``path_samples`` sources, a diameter
+    lower bound from those sources plus a double sweep, and betweenness
+    and closeness centrality from ``centrality_samples`` pivots.
+
+    Attributes:
+        exact_max_nodes: Largest graph for which metrics are exact
+        path_samples: BFS sources for path-length estimates
+        centrality_samples: Pivot nodes for centrality estimates
+        seed: Random seed for sampling
+    """
+    exact_max_nodes: int = 1000
+    path_samples: int = 256
+    centrality_samples: int = 256
+    seed: int = 0
+
+
 @dataclass
 class TopologyMetrics:
     """Network analysis metrics.
@@ -33,6 +81,7 @@ class TopologyMetrics:
         avg_path_length: Average shortest path length
         diameter: Maximum shortest path length
         degree_distribution: Dict of node -> degree
+        approximate: Whether path metrics were estimated by sampling
     """
     node_count: int = 0
     edge_count: int = 0
@@ -42,6 +91,7 @@ class TopologyMetrics:
     avg_path_length: Optional[float] = None
     diameter: Optional[int] = None
     degree_distribution: dict = field(default_factory=dict)
+    approximate: bool = False
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -54,6 +104,7 @@ class TopologyMetrics:
             "avg_path_length": self.avg_path_length,
             "diameter": self.diameter,
             "degree_distribution": self.degree_distribution,
+            "approximate": self.approximate,
         }
 
 
@@ -70,17 +121,105 @@ class Topology(ABC):
         Args:
             directed: If True, use DiGraph for asymmetric communication
         """
+        self._version = 0
+        self._graph_edits = 0
         self.graph: Union[nx.Graph, nx.DiGraph] = (
             nx.DiGraph() if directed else nx.Graph()
         )
         self._directed = directed
         self._topology_type: str = "base"
+        self.metrics_config = MetricsConfig()
+        self._metrics: Optional[TopologyMetrics] = None
+        self._metrics_key: Optional[tuple] = None
+        self._node_clustering: Optional[dict] = None
+        # (fingerprint before, fingerprint after, change), contiguous
+        self._change_log: Deque[Tuple[tuple, tuple, EdgeChange]] = deque(
+            maxlen=CHANGE_LOG_LIMIT
+        )
 
     @property
     def topology_type(self) -> str:
         """Get the topology type name."""
         return self._topology_type
 
+    @property
+    def directed(self) -> bool:
+        """Whether edges are one-way."""
+        return self._directed
+
+    @property
+    def graph(self) -> Union[nx.Graph, nx.DiGraph]:
+        """The underlying NetworkX graph."""
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: Union[nx.Graph, nx.DiGraph]) -> None:
+        """Replace the underlying graph."""
+        self._graph = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped by every mutation made through this class."""
+        return self._version
+
+    def fingerprint(self) -> tuple:
+        """Cheap change detector for caches derived from the graph.
+
+        Combines the mutation counter with the graph identity, node count
+        and an edit stamp, so node and edge edits made directly on
+        ``graph`` are noticed too. O(1) on NetworkX 3.3+; older versions
+        count edges, which is O(n).
+        """
+        return (self._version, id(self._graph), len(self._graph), self._edit_stamp(self._graph))
+
+    def _edit_stamp(self, graph: Union[nx.Graph, nx.DiGraph]) -> int:
+        """Value that changes whenever graph's structure is edited."""
+        cache = getattr(graph, "__networkx_cache__", None)
+        if cache is None:
+            return graph.number_of_edges()
+        if _EDIT_MARKER not in cache:
+            self._graph_edits += 1
+            cache[_EDIT_MARKER] = True
+        return self._graph_edits
+
+    def mark_changed(self) -> None:
+        """Invalidate derived caches after edits fingerprint cannot see.
+
+        Needed only for changes to edge or node attributes (e.g. weights)
+        made directly on ``graph``.
+        """
+        self._version += 1
+
+    def _record(self, before: tuple, change: EdgeChange) -> None:
+        """Append a mutation to the change log."""
+        if self._change_log and self._change_log[-1][1] != before:
+            # Something changed outside the API; older entries are unusable
+            self._change_log.clear()
+        self._change_log.append((before, self.fingerprint(), change))
+
+    def changes_since(self, fingerprint: tuple) -> Optional[List[EdgeChange]]:
+        """Get the mutations made since the topology had a fingerprint.
+
+        Args:
+            fingerprint: Fingerprint recorded by a cache
+
+        Returns:
+            Changes in order, or None if they are not known (the log was
+            trimmed, or the graph was replaced or edited directly), in
+            which case caches must be rebuilt from scratch
+        """
+        current = self.fingerprint()
+        if fingerprint == current:
+            return []
+        log = self._change_log
+        if not log or log[-1][1] != current:
+            return None
+        for i in range(len(log) - 1, -1, -1):
+            if log[i][0] == fingerprint:
+                return [change for _, _, change in list(log)[i:]]
+        return None
+
     @abstractmethod
     def build(self, agent_ids: List[str], **kwargs) -> None:
         """Build topology with given agents.
@@ -100,7 +239,10 @@ class Topology(ABC):
             agent_id: Agent identifier
             **attrs: Optional node attributes
         """
+        before = self.fingerprint()
         self.graph.add_node(agent_id, **attrs)
+        self._version += 1
+        self._record(before, EdgeChange("add_node", agent_id))
 
     def remove_node(self, agent_id: str) -> None:
         """Remove a node and all its edges.
@@ -109,7 +251,10 @@ class Topology(ABC):
             agent_id: Agent to remove
         """
         if agent_id in self.graph:
+            before = self.fingerprint()
             self.graph.remove_node(agent_id)
+            self._version += 1
+            self._record(before, EdgeChange("remove_node", agent_id))
 
     def add_edge(
         self,
@@ -126,7 +271,10 @@ class Topology(ABC):
             weight: Edge weight (default 1.0)
             **attrs: Optional edge attributes
         """
+        before = self.fingerprint()
         self.graph.add_edge(agent1, agent2, weight=weight, **attrs)
+        self._version += 1
+        self._record(before, EdgeChange("add_edge", agent1, agent2, weight))
 
     def remove_edge(self, agent1: str, agent2: str) -> None:
         """Remove edge between agents.
@@ -136,7 +284,10 @@ class Topology(ABC):
             agent2: Second agent
         """
         if self.graph.has_edge(agent1, agent2):
+            before = self.fingerprint()
             self.graph.remove_edge(agent1, agent2)
+            self._version += 1
+            self._record(before, EdgeChange("remove_edge", agent1, agent2))
 
     def get_neighbors(self, agent_id: str) -> List[str]:
         """Get agents this agent can directly communicate with.
@@ -212,7 +363,33 @@ class Topology(ABC):
         """
         return list(self.graph.edges())
 
-    def get_metrics(self) -> TopologyMetrics:
+    def get_metrics(self, refresh: bool = False) -> TopologyMetrics:
+        """Get network analysis metrics.
+
+        Metrics are cached until the topology or ``metrics_config`` changes.
+        After edge edits made through the API, degree and clustering are
+        updated locally rather than recomputed for the whole graph.
+
+        Args:
+            refresh: If True, recompute even if cached
+
+        Returns:
+            TopologyMetrics with computed values
+        """
+        key = (self.fingerprint(), astuple(self.metrics_config))
+        if refresh or self._metrics is None:
+            self._metrics = self._compute_metrics()
+        elif key != self._metrics_key:
+            updated = None
+            if key[1] == self._metrics_key[1]:
+                changes = self.changes_since(self._metrics_key[0])
+                if changes is not None:
+                    updated = self._update_metrics(self._metrics, changes)
+            self._metrics = updated or self._compute_metrics()
+        self._metrics_key = key
+        return self._metrics
+
+    def _compute_metrics(self) -> TopologyMetrics:
         """Compute network analysis metrics.
 
         Returns:
@@ -220,6 +397,7 @@ class Topology(ABC):
         """
         n = self.graph.number_of_nodes()
         m = self.graph.number_of_edges()
+        self._node_clustering = None
 
         # Check connectivity
         if n > 0:
@@ -240,20 +418,117 @@ class Topology(ABC):
 
         # Only compute these for connected graphs with multiple nodes
         if is_connected and n > 1:
-            try:
-                if self._directed:
-                    # Use underlying undirected graph for clustering
-                    undirected = self.graph.to_undirected()
-                    metrics.clustering_coefficient = nx.average_clustering(undirected)
-                else:
-                    metrics.clustering_coefficient = nx.average_clustering(self.graph)
+            if self._directed:
+                # Use underlying undirected graph for clustering
+                undirected = self.graph.to_undirected()
+                metrics.clustering_coefficient = nx.average_clustering(undirected)
+            else:
+                # Keep per-node values so edge edits can update them locally
+                self._node_clustering = nx.clustering(self.graph)
+                metrics.clustering_coefficient = sum(self._node_clustering.values()) / n
+            self._fill_path_metrics(metrics)
+
+        return metrics
+
+    def _update_metrics(
+        self, metrics: TopologyMetrics, changes: List[EdgeChange]
+    ) -> Optional[TopologyMetrics]:
+        """Update cached metrics for a batch of edge changes.
+
+        Degrees and per-node clustering are only recomputed for the changed
+        edges' endpoints and their common neighbors; connectivity and path
+        metrics are recomputed.
+
+        Args:
+            metrics: Metrics before the changes
+            changes: Changes since those metrics were computed
 
+        Returns:
+            Updated metrics, or None if a full recomputation is needed
+        """
+        if self._directed or self._node_clustering is None:
+            return None
+
+        graph = self.graph
+        touched = set()
+        for change in changes:
+            if change.kind not in ("add_edge", "remove_edge"):
+                return None
+            if change.source not in metrics.degree_distribution or (
+                change.target not in metrics.degree_distribution
+            ):
+                return None  # Edge introduced a new node
+            touched.add(change.source)
+            touched.add(change.target)
+            touched.update(nx.common_neighbors(graph, change.source, change.target))
+
+        n = graph.number_of_nodes()
+        node_clustering = dict(self._node_clustering)
+        node_clustering.update(nx.clustering(graph, touched))
+        degrees = dict(metrics.degree_distribution)
+        degrees.update(graph.degree(touched))
+
+        updated = TopologyMetrics(
+            node_count=n,
+            edge_count=graph.number_of_edges(),
+            density=nx.density(graph),
+            is_connected=nx.is_connected(graph),
+            degree_distribution=degrees,
+        )
+        if updated.is_connected and n > 1:
+            updated.clustering_coefficient = sum(node_clustering.values()) / n
+            self._fill_path_metrics(updated)
+
+        self._node_clustering = node_clustering
+        return updated
+
+    def _fill_path_metrics(self, metrics: TopologyMetrics) -> None:
+        """Set average path length and diameter, sampling on large graphs."""
+        try:
+            if metrics.node_count > self.metrics_config.exact_max_nodes:
+                estimate = self._sampled_path_metrics()
+                if estimate is not None:
+                    metrics.avg_path_length, metrics.diameter = estimate
+                    metrics.approximate = True
+            else:
                 metrics.avg_path_length = nx.average_shortest_path_length(self.graph)
                 metrics.diameter = nx.diameter(self.graph)
-            except nx.NetworkXError:
-                pass  # Leave as None for disconnected components
+        except nx.NetworkXError:
+            pass  # Leave as None for disconnected components
 
-        return metrics
+    def _sampled_path_metrics(self) -> Optional[Tuple[float, int]]:
+        """Estimate average path length and bound the diameter by sampling.
+
+        Returns:
+            (avg_path_length, diameter lower bound), or None for directed
+            graphs that are not strongly connected
+        """
+        graph = self.graph
+        if self._directed and not nx.is_strongly_connected(graph):
+            return None
+
+        config = self.metrics_config
+        nodes = list(graph.nodes())
+        n = len(nodes)
+        rng = random.Random(config.seed)
+        sources = rng.sample(nodes, min(config.path_samples, n))
+
+        total = 0
+        diameter = 0
+        farthest = sources[0]
+        for source in sources:
+            lengths = nx.single_source_shortest_path_length(graph, source)
+            total += sum(lengths.values())
+            node, eccentricity = max(lengths.items(), key=lambda item: item[1])
+            if eccentricity > diameter:
+                diameter, farthest = eccentricity, node
+
+        # Double sweep: the eccentricity of the farthest node found is
+        # usually close to the true diameter
+        lengths = nx.single_source_shortest_path_length(graph, farthest)
+        diameter = max(diameter, max(lengths.values()))
+
+        return total / (len(sources) * (n - 1)), diameter
 
     def to_dict(self) -> dict:
         """Serialize topology to dictionary.
@@ -0,0 +1,148 @@
+"""Dynamic topologies that rewire during a simulation.
+
+A rewiring policy runs at the end of each step's COMMIT phase. It sees the
+step's committed messages and returns a TopologyDelta; the simulation applies
+it through the Topology API, so routing tables, delivery lists and cached
+metrics are updated incrementally and only the changed edges are persisted.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Protocol, Sequence, Tuple
+
+from agentworld.core.models import Message
+from agentworld.topology.base import Topology
+
+
+@dataclass
+class TopologyDelta:
+    """Edge changes to apply to a topology.
+
+    Attributes:
+        added: (source, target, weight) edges to add
+        removed: (source, target) edges to remove
+    """
+    added: List[Tuple[str, str, float]] = field(default_factory=list)
+    removed: List[Tuple[str, str]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+    def apply(self, topology: Topology) -> None:
+        """Apply removals, then additions, through the Topology API."""
+        for source, target in self.removed:
+            topology.remove_edge(source, target)
+        for source, target, weight in self.added:
+            topology.add_edge(source, target, weight=weight)
+
+
+class RewiringPolicy(Protocol):
+    """Decides how the topology changes after each step."""
+
+    def rewire(
+        self, topology: Topology, messages: Sequence[Message], step: int
+    ) -> TopologyDelta:
+        """Compute edge changes for a committed step.
+
+        Args:
+            topology: Current topology (must not be mutated directly)
+            messages: Messages committed this step
+            step: Step number
+
+        Returns:
+            Edges to add and remove
+        """
+        ...
+
+
+class InteractionRewiringPolicy:
+    """Form ties between agents who talk, drop ties that go quiet.
+
+    Each addressed message counts as an interaction between its sender and
+    receiver. A pair without an edge gains one after ``form_threshold``
+    interactions; an edge with no interactions for ``drop_after`` steps is
+    removed, unless that would leave an endpoint without any edges.
+
+    Attributes:
+        form_threshold: Interactions needed to form a tie
+        drop_after: Idle steps before a tie is dropped (None = never)
+        max_changes_per_step: Cap on additions and removals per step
+    """
+
+    def __init__(
+        self,
+        form_threshold: int = 2,
+        drop_after: Optional[int] = None,
+        max_changes_per_step: Optional[int] = None,
+    ):
+        """Initialize policy.
+
+        Args:
+            form_threshold: Interactions needed to form a tie
+            drop_after: Idle steps before a tie is dropped (None = never)
+            max_changes_per_step: Cap on additions and removals per step
+        """
+        self.form_threshold = form_threshold
+        self.drop_after = drop_after
+        self.max_changes_per_step = max_changes_per_step
+        self._interactions: Dict[FrozenSet[str], int] = {}
+        self._last_active: Dict[FrozenSet[str], int] = {}
+
+    def rewire(
+        self, topology: Topology, messages: Sequence[Message], step: int
+    ) -> TopologyDelta:
+        """Compute edge changes from this step's messages.
+
+        Args:
+            topology: Current topology
+            messages: Messages committed this step
+            step: Step number
+
+        Returns:
+            Edges to add and remove
+        """
+        graph = topology.graph
+        delta = TopologyDelta()
+        limit = self.max_changes_per_step
+
+        for message in messages:
+            receiver = message.receiver_id
+            if receiver is None or receiver == message.sender_id:
+                continue
+            pair = frozenset((message.sender_id, receiver))
+            self._last_active[pair] = step
+            if graph.has_edge(message.sender_id, receiver):
+                continue
+            count = self._interactions.get(pair, 0) + 1
+            self._interactions[pair] = count
+            if count >= self.form_threshold and (limit is None or len(delta.added) < limit):
+                delta.added.append((message.sender_id, receiver, 1.0))
+                del self._interactions[pair]
+
+        if self.drop_after is not None:
+            delta.removed = self._idle_edges(topology, step, limit)
+        return delta
+
+    def _idle_edges(
+        self, topology: Topology, step: int, limit: Optional[int]
+    ) -> List[Tuple[str, str]]:
+        """Edges idle for longer than drop_after, keeping everyone connected."""
+        graph = topology.graph
+        degree_left: Dict[str, int] = {}
+        removed = []
+        for source, target in graph.edges():
+            pair = frozenset((source, target))
+            # Edges never used count as active from the step they were seen
+            last = self._last_active.setdefault(pair, step)
+            if step - last < self.drop_after:
+                continue
+            for node in (source, target):
+                degree_left.setdefault(node, graph.degree(node))
+            if degree_left[source] <= 1 or degree_left[target] <= 1:
+                continue
+            degree_left[source] -= 1
+            degree_left[target] -= 1
+            removed.append((source, target))
+            self._last_active.pop(pair, None)
+            if limit is not None and len(removed) >= limit:
+                break
+        return removed
@@ -5,13 +5,17 @@ from typing import List, Optional, Set
 import networkx as nx
 
 from agentworld.topology.base import Topology, RoutingMode
+from agentworld.topology.routing import RoutingTable
 
 
 class TopologyGraph:
     """Wrapper providing convenient topology operations for simulations.
 
     Provides message routing, neighborhood queries, and path-finding
-    operations on top of a Topology instance.
+    operations on top of a Topology instance. Routing queries are answered
+    from a RoutingTable compiled on first use, updated in place for edge
+    changes made through the Topology API, and recompiled when the
+    topology is replaced or the routing mode changes.
     """
 
     def __init__(self, topology: Topology, routing_mode: RoutingMode = RoutingMode.DIRECT_ONLY):
@@ -23,6 +27,22 @@ class TopologyGraph:
         """
         self.topology = topology
         self.routing_mode = routing_mode
+        self._routing: Optional[RoutingTable] = None
+        self._routing_key: Optional[tuple] = None
+
+    @property
+    def routing_table(self) -> RoutingTable:
+        """Get the compiled routing table, recompiling if stale."""
+        key = (id(self.topology), self.topology.fingerprint(), self.routing_mode)
+        if self._routing is not None and key != self._routing_key:
+            if key[0] == self._routing_key[0] and key[2] == self._routing_key[2]:
+                changes = self.topology.changes_since(self._routing_key[1])
+                if changes is not None and self._routing.apply(self.topology, changes):
+                    self._routing_key = key
+        if self._routing is None or key != self._routing_key:
+            self._routing = RoutingTable(self.topology, self.routing_mode)
+            self._routing_key = key
+        return self._routing
 
     def can_send_message(self, sender: str, receiver: str) -> bool:
         """Check if sender can send a message to receiver.
@@ -36,15 +56,7 @@ class TopologyGraph:
         Returns:
             True if message can be sent
         """
-        if self.routing_mode == RoutingMode.BROADCAST:
-            # Broadcast mode ignores topology
-            return True
-        elif self.routing_mode == RoutingMode.MULTI_HOP:
-            # Multi-hop allows any reachable destination
-            return self.topology.can_reach(sender, receiver)
-        else:
-            # Direct only - must have direct edge
-            return self.topology.can_communicate(sender, receiver)
+        return self.routing_table.can_send(sender, receiver)
 
     def get_valid_recipients(self, sender: str) -> List[str]:
         """Get all agents that sender can message.
@@ -55,17 +67,9 @@ class TopologyGraph:
             sender: Sending agent ID
 
         Returns:
-            List of valid recipient agent IDs
+            Sorted list of valid recipient agent IDs
         """
-        all_nodes = set(self.topology.get_all_nodes())
-        all_nodes.discard(sender)
-
-        if self.routing_mode == RoutingMode.BROADCAST:
-            return list(all_nodes)
-        elif self.routing_mode == RoutingMode.MULTI_HOP:
-            return [n for n in all_nodes if self.topology.can_reach(sender, n)]
-        else:
-            return self.topology.get_neighbors(sender)
+        return list(self.routing_table.recipients(sender))
 
     def get_message_path(self, sender: str, receiver: str) -> Optional[List[str]]:
         """Get the path a message would take.
@@ -94,9 +98,8 @@ class TopologyGraph:
         Returns:
             List of all other agent IDs
         """
-        all_nodes = set(self.topology.get_all_nodes())
-        all_nodes.discard(sender)
-        return list(all_nodes)
+        table = self.routing_table
+        return [n for n in table.nodes if n != sender]
 
     def get_neighborhood(self, agent_id: str, hops: int = 1) -> Set[str]:
         """Get all agents within N hops of an agent.
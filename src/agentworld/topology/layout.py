@@ -0,0 +1,495 @@
+"""Server-side graph layouts for visualization.
+
+Layouts are computed with vectorized NumPy over edge arrays, so clients only
+draw precomputed positions instead of running a force simulation in the
+browser. A LayoutEngine caches the layout per topology fingerprint and, after
+edits made through the Topology API, only re-settles the nodes whose edges
+changed. Community-collapsed views give a level-of-detail overview of large
+topologies.
+"""
+
+from collections import deque
+from dataclasses import astuple, dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from agentworld.topology.base import Topology
+
+
+# Layout versions remembered for changed_since()
+LAYOUT_HISTORY_LIMIT = 64
+
+# Upper bound on pairwise repulsion terms evaluated at once
+_PAIR_CHUNK = 1 << 20
+
+
+@dataclass
+class LayoutConfig:
+    """Settings for layout computation.
+
+    Attributes:
+        algorithm: "force" (spectral start, force-directed refinement) or
+            "spectral"
+        iterations: Force-directed iterations for a full layout
+        refine_iterations: Iterations used to settle nodes after edits
+        exact_max_nodes: Above this many nodes, repulsion is estimated from
+            a random sample of nodes each iteration
+        repulsion_samples: Sample size for estimated repulsion
+        max_incremental_fraction: Share of nodes that may move in an
+            incremental update before the layout is recomputed
+        seed: Random seed for reproducible layouts
+    """
+    algorithm: str = "force"
+    iterations: int = 50
+    refine_iterations: int = 15
+    exact_max_nodes: int = 1000
+    repulsion_samples: int = 256
+    max_incremental_fraction: float = 0.25
+    seed: int = 0
+
+
+@dataclass
+class GraphLayout:
+    """Node positions for one version of a topology.
+
+    Attributes:
+        nodes: Agent IDs, in row order of ``positions``
+        positions: (n, 2) array of x, y coordinates
+        version: Incremented every time the layout changes
+        approximate: True if repulsion was estimated by sampling
+    """
+    nodes: List[str]
+    positions: np.ndarray
+    version: int = 0
+    approximate: bool = False
+    index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+
+    def position_of(self, node: str) -> Optional[Tuple[float, float]]:
+        """Get a node's position, or None if it is not in the layout."""
+        i = self.index.get(node)
+        if i is None:
+            return None
+        x, y = self.positions[i]
+        return float(x), float(y)
+
+    def to_dict(self, nodes: Optional[Set[str]] = None) -> dict:
+        """Convert to a dictionary of rounded positions.
+
+        Args:
+            nodes: Only include these nodes (default all)
+
+        Returns:
+            Dictionary with version, approximate flag and positions
+        """
+        rounded = np.round(self.positions, 4).tolist()
+        return {
+            "version": self.version,
+            "approximate": self.approximate,
+            "positions": {
+                node: rounded[i]
+                for i, node in enumerate(self.nodes)
+                if nodes is None or node in nodes
+            },
+        }
+
+
+@dataclass
+class CommunityView:
+    """Level-of-detail view with each community collapsed to one node.
+
+    Attributes:
+        communities: Member agent IDs per community, largest first
+        positions: (c, 2) array of community centroids
+        edges: (community_a, community_b, edge_count) between communities
+        version: Layout version the view was built from
+    """
+    communities: List[List[str]]
+    positions: np.ndarray
+    edges: List[Tuple[int, int, int]]
+    version: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        rounded = np.round(self.positions, 4).tolist()
+        return {
+            "version": self.version,
+            "communities": [
+                {
+                    "id": i,
+                    "size": len(members),
+                    "position": rounded[i],
+                    "members": members,
+                }
+                for i, members in enumerate(self.communities)
+            ],
+            "edges": [
+                {"source": a, "target": b, "weight": count}
+                for a, b, count in self.edges
+            ],
+        }
+
+
+def _edge_arrays(
+    nodes: List[str], index: Dict[str, int], edges: List[Tuple[str, str]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert edges to source and target index arrays, dropping self-loops."""
+    if not edges:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    src = np.fromiter((index[u] for u, _ in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((index[v] for _, v in edges), dtype=np.int64, count=len(edges))
+    keep = src != dst
+    return src[keep], dst[keep]
+
+
+def spectral_positions(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    seed: int = 0,
+    iterations: int = 200,
+) -> np.ndarray:
+    """Spectral layout from the normalized Laplacian.
+
+    Uses subspace iteration on ``(I + D^-1/2 A D^-1/2) / 2`` with the
+    trivial eigenvector deflated, so only sparse products over the edge
+    arrays are needed. Edges are treated as undirected.
+
+    Args:
+        n: Number of nodes
+        src: Edge source indices
+        dst: Edge target indices
+        seed: Random seed for the starting subspace
+        iterations: Subspace iterations
+
+    Returns:
+        (n, 2) array of positions scaled to [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    if n <= 2:
+        return rng.uniform(-1.0, 1.0, (n, 2))
+
+    degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+    inv_sqrt = 1.0 / np.sqrt(np.maximum(degree, 1))
+    trivial = np.sqrt(degree.astype(float))
+    norm = np.linalg.norm(trivial)
+    trivial = trivial / norm if norm > 0 else trivial
+
+    basis = rng.standard_normal((n, 2))
+    for _ in range(iterations):
+        scaled = basis * inv_sqrt[:, None]
+        product = np.empty_like(basis)
+        for j in range(2):
+            column = scaled[:, j]
+            product[:, j] = (
+                np.bincount(src, weights=column[dst], minlength=n)
+                + np.bincount(dst, weights=column[src], minlength=n)
+            )
+        basis = 0.5 * (basis + product * inv_sqrt[:, None])
+        basis -= np.outer(trivial, trivial @ basis)
+        basis, _ = np.linalg.qr(basis)
+
+    positions = basis * inv_sqrt[:, None]
+    return _normalize(positions)
+
+
+def _normalize(positions: np.ndarray) -> np.ndarray:
+    """Center positions and scale them to [-1, 1]."""
+    if len(positions) == 0:
+        return positions
+    centered = positions - positions.mean(axis=0)
+    scale = np.abs(centered).max()
+    return centered / scale if scale > 0 else centered
+
+
+def force_positions(
+    positions: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+    iterations: int,
+    temperature: float,
+    movable: Optional[np.ndarray] = None,
+    samples: Optional[int] = None,
+    seed: int = 0,
+) -> np.ndarray:
+    """Refine positions with Fruchterman-Reingold forces.
+
+    Args:
+        positions: (n, 2) starting positions (not modified)
+        src: Edge source indices
+        dst: Edge target indices
+        iterations: Number of iterations
+        temperature: Maximum step in the first iteration, cooled linearly
+        movable: Indices of nodes allowed to move (default all)
+        samples: Estimate repulsion from this many random nodes per
+            iteration instead of all pairs
+        seed: Random seed for sampling
+
+    Returns:
+        Refined (n, 2) positions
+    """
+    positions = positions.astype(float, copy=True)
+    n = len(positions)
+    if n < 2 or iterations <= 0:
+        return positions
+
+    rng = np.random.default_rng(seed)
+    rows = np.arange(n) if movable is None else np.asarray(movable, dtype=np.int64)
+    k = 1.0 / np.sqrt(n)
+    k2 = k * k
+    sample_size = min(samples, n) if samples else n
+    scale = (n - 1) / sample_size if sample_size < n else 1.0
+    chunk = max(1, _PAIR_CHUNK // sample_size)
+
+    for step in range(iterations):
+        others = (
+            positions if sample_size == n
+            else positions[rng.choice(n, sample_size, replace=False)]
+        )
+        displacement = np.zeros((n, 2))
+
+        # Repulsion k^2 / d between all (or sampled) pairs
+        for start in range(0, len(rows), chunk):
+            block = rows[start:start + chunk]
+            delta = positions[block, None, :] - others[None, :, :]
+            dist2 = np.maximum(np.einsum("ijk,ijk->ij", delta, delta), 1e-9)
+            displacement[block] += scale * np.einsum("ijk,ij->ik", delta, k2 / dist2)
+
+        # Attraction d^2 / k along edges
+        if len(src):
+            delta = positions[dst] - positions[src]
+            pull = delta * (np.linalg.norm(delta, axis=1) / k)[:, None]
+            for axis in range(2):
+                displacement[:, axis] += np.bincount(src, weights=pull[:, axis], minlength=n)
+                displacement[:, axis] -= np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+        limit = temperature * (1.0 - step / iterations)
+        moved = displacement[rows]
+        length = np.maximum(np.linalg.norm(moved, axis=1), 1e-9)
+        positions[rows] += moved * (np.minimum(length, limit) / length)[:, None]
+
+    return positions
+
+
+class LayoutEngine:
+    """Computes and caches layouts for a topology.
+
+    Attributes:
+        topology: Topology being laid out
+        config: Layout settings
+    """
+
+    def __init__(self, topology: Topology, config: Optional[LayoutConfig] = None):
+        """Initialize engine.
+
+        Args:
+            topology: Topology to lay out
+            config: Layout settings (defaults to LayoutConfig())
+        """
+        self.topology = topology
+        self.config = config or LayoutConfig()
+        self._layout: Optional[GraphLayout] = None
+        self._key: Optional[tuple] = None
+        # (version, nodes moved or removed, or None for a full recompute)
+        self._history: Deque[Tuple[int, Optional[Set[str]]]] = deque(
+            maxlen=LAYOUT_HISTORY_LIMIT
+        )
+        self._communities: Optional[CommunityView] = None
+        self._communities_key: Optional[tuple] = None
+
+    def get_layout(self, refresh: bool = False) -> GraphLayout:
+        """Get the layout for the topology's current state.
+
+        After edits made through the Topology API, only the changed edges'
+        endpoints (and new nodes) are re-settled; everything else keeps its
+        position. Large batches of edits trigger a full recomputation.
+
+        Args:
+            refresh: If True, recompute from scratch
+
+        Returns:
+            Current layout
+        """
+        key = (self.topology.fingerprint(), astuple(self.config))
+        if not refresh and self._layout is not None and key == self._key:
+            return self._layout
+
+        version = self._layout.version + 1 if self._layout is not None else 0
+        updated = None
+        if not refresh and self._layout is not None and key[1] == self._key[1]:
+            updated = self._update(self._layout, version)
+
+        if updated is None:
+            self._layout = self._compute(version)
+            self._history.append((version, None))
+        else:
+            self._layout, changed = updated
+            self._history.append((version, changed))
+        self._key = key
+        return self._layout
+
+    def changed_since(self, version: int) -> Optional[Set[str]]:
+        """Nodes whose positions changed (or were removed) since a version.
+
+        Args:
+            version: Layout version a client already has
+
+        Returns:
+            Set of node IDs, or None if the client needs the full layout
+        """
+        layout = self.get_layout()
+        if version == layout.version:
+            return set()
+        if version > layout.version or not self._history or self._history[0][0] > version + 1:
+            return None
+        changed: Set[str] = set()
+        for applied, nodes in self._history:
+            if applied <= version:
+                continue
+            if nodes is None:
+                return None
+            changed |= nodes
+        return changed
+
+    def community_view(self) -> CommunityView:
+        """Get the community-collapsed view of the current layout.
+
+        Communities are detected with Louvain modularity on the undirected
+        graph and cached until the layout changes.
+        """
+        layout = self.get_layout()
+        key = (layout.version, self.config.seed)
+        if self._communities is not None and key == self._communities_key:
+            return self._communities
+
+        graph = self.topology.graph
+        if graph.is_directed():
+            graph = graph.to_undirected(as_view=True)
+        found = nx.community.louvain_communities(graph, seed=self.config.seed)
+        communities = sorted(
+            (sorted(members, key=str) for members in found),
+            key=lambda members: (-len(members), str(members[0])),
+        )
+
+        membership = np.empty(len(layout.nodes), dtype=np.int64)
+        for cid, members in enumerate(communities):
+            membership[[layout.index[node] for node in members]] = cid
+        count = len(communities)
+        sizes = np.bincount(membership, minlength=count)
+        centroids = np.column_stack([
+            np.bincount(membership, weights=layout.positions[:, axis], minlength=count)
+            for axis in range(2)
+        ]) / np.maximum(sizes, 1)[:, None]
+
+        src, dst = _edge_arrays(layout.nodes, layout.index, self.topology.get_all_edges())
+        a, b = membership[src], membership[dst]
+        between = a != b
+        pairs = np.column_stack([np.minimum(a, b), np.maximum(a, b)])[between]
+        edges: List[Tuple[int, int, int]] = []
+        if len(pairs):
+            unique, counts = np.unique(pairs, axis=0, return_counts=True)
+            edges = [(int(u), int(v), int(c)) for (u, v), c in zip(unique, counts)]
+
+        self._communities = CommunityView(
+            communities=communities,
+            positions=centroids,
+            edges=edges,
+            version=layout.version,
+        )
+        self._communities_key = key
+        return self._communities
+
+    def _compute(self, version: int) -> GraphLayout:
+        """Lay out the whole topology."""
+        config = self.config
+        if config.algorithm not in ("force", "spectral"):
+            raise ValueError(f"Unknown layout algorithm: {config.algorithm}")
+
+        nodes = list(self.topology.get_all_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        src, dst = _edge_arrays(nodes, index, self.topology.get_all_edges())
+        n = len(nodes)
+
+        positions = spectral_positions(n, src, dst, seed=config.seed)
+        approximate = False
+        if config.algorithm == "force" and n > 2:
+            # Small jitter separates nodes the spectral start places together
+            rng = np.random.default_rng(config.seed)
+            positions = positions + rng.normal(0.0, 0.05, positions.shape)
+            approximate = n > config.exact_max_nodes
+            positions = _normalize(force_positions(
+                positions,
+                src,
+                dst,
+                iterations=config.iterations,
+                temperature=0.1,
+                samples=config.repulsion_samples if approximate else None,
+                seed=config.seed,
+            ))
+        return GraphLayout(nodes, positions, version=version, approximate=approximate)
+
+    def _update(
+        self, layout: GraphLayout, version: int
+    ) -> Optional[Tuple[GraphLayout, Set[str]]]:
+        """Re-settle the nodes touched by recent changes.
+
+        Returns:
+            New layout and the nodes that moved or were removed, or None if
+            a full recomputation is needed
+        """
+        changes = self.topology.changes_since(self._key[0])
+        if changes is None:
+            return None
+
+        nodes = list(self.topology.get_all_nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        touched = set()
+        for change in changes:
+            touched.add(change.source)
+            if change.target is not None:
+                touched.add(change.target)
+        removed = {node for node in touched if node not in index}
+        movable = [index[node] for node in touched if node in index]
+        if len(movable) > self.config.max_incremental_fraction * max(len(nodes), 1):
+            return None
+
+        # Carry positions over; new nodes start at their neighbors' centroid
+        positions = np.zeros((len(nodes), 2))
+        rng = np.random.default_rng(self.config.seed + version)
+        for node, i in index.items():
+            old = layout.index.get(node)
+            if old is not None:
+                positions[i] = layout.positions[old]
+                continue
+            placed = [
+                layout.positions[layout.index[neighbor]]
+                for neighbor in self.topology.get_neighbors(node)
+                if neighbor in layout.index
+            ]
+            center = np.mean(placed, axis=0) if placed else np.zeros(2)
+            positions[i] = center + rng.normal(0.0, 0.05, 2)
+
+        src, dst = _edge_arrays(nodes, index, self.topology.get_all_edges())
+        approximate = len(nodes) > self.config.exact_max_nodes
+        positions = force_positions(
+            positions,
+            src,
+            dst,
+            iterations=self.config.refine_iterations,
+            temperature=0.05,
+            movable=np.array(movable, dtype=np.int64),
+            samples=self.config.repulsion_samples if approximate else None,
+            seed=self.config.seed + version,
+        )
+        updated = GraphLayout(
+            nodes,
+            positions,
+            version=version,
+            approximate=approximate or layout.approximate,
+        )
+        return updated, {nodes[i] for i in movable} | removed
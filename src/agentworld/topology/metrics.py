@@ -1,7 +1,14 @@
 """Network metrics and analysis for topologies."""
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Optional, Tuple
+import atexit
+import math
+import pickle
+import random
 
 import networkx as nx
 
@@ -17,15 +24,22 @@ class CentralityMetrics:
         betweenness: How often node lies on shortest paths between others
         closeness: Average distance to all other nodes (inverse)
         eigenvector: Importance based on connections to important nodes
+        approximate: Whether betweenness and closeness were estimated
     """
     degree: Dict[str, float]
     betweenness: Dict[str, float]
     closeness: Dict[str, float]
     eigenvector: Optional[Dict[str, float]] = None
+    approximate: bool = False
 
 
 class TopologyAnalyzer:
-    """Analyzes topology structure and computes network metrics."""
+    """Analyzes topology structure and computes network metrics.
+
+    Results are cached until the topology changes (see
+    ``Topology.fingerprint``). Graphs larger than the topology's
+    ``metrics_config.exact_max_nodes`` get sampled centrality estimates.
+    """
 
     def __init__(self, topology: Topology):
         """Initialize analyzer.
@@ -34,8 +48,16 @@ class TopologyAnalyzer:
             topology: Topology to analyze
         """
         self.topology = topology
-        self._metrics_cache: Optional[TopologyMetrics] = None
         self._centrality_cache: Optional[CentralityMetrics] = None
+        self._centrality_key: Optional[tuple] = None
+
+    def _cache_key(self) -> tuple:
+        """Key identifying the topology state and accuracy settings."""
+        return (
+            id(self.topology),
+            self.topology.fingerprint(),
+            astuple(self.topology.metrics_config),
+        )
 
     def get_metrics(self, refresh: bool = False) -> TopologyMetrics:
         """Get basic topology metrics.
@@ -46,9 +68,7 @@ class TopologyAnalyzer:
         Returns:
             TopologyMetrics instance
         """
-        if self._metrics_cache is None or refresh:
-            self._metrics_cache = self.topology.get_metrics()
-        return self._metrics_cache
+        return self.topology.get_metrics(refresh=refresh)
 
     def get_centrality(self, refresh: bool = False) -> CentralityMetrics:
         """Compute centrality measures for all nodes.
@@ -59,11 +79,13 @@ class TopologyAnalyzer:
         Returns:
             CentralityMetrics instance
         """
-        if self._centrality_cache is not None and not refresh:
+        key = self._cache_key()
+        if self._centrality_cache is not None and not refresh and key == self._centrality_key:
             return self._centrality_cache
 
         graph = self.topology.graph
         n = graph.number_of_nodes()
+        self._centrality_key = key
 
         if n == 0:
             self._centrality_cache = CentralityMetrics(
@@ -72,9 +94,16 @@ class TopologyAnalyzer:
             return self._centrality_cache
 
         # Compute various centrality measures
+        config = self.topology.metrics_config
+        approximate = n > config.exact_max_nodes
         degree = nx.degree_centrality(graph)
-        betweenness = nx.betweenness_centrality(graph)
-        closeness = nx.closeness_centrality(graph)
+        if approximate:
+            pivots = min(config.centrality_samples, n)
+            betweenness = nx.betweenness_centrality(graph, k=pivots, seed=config.seed)
+            closeness = self._sampled_closeness(graph, pivots, config.seed)
+        else:
+            betweenness = nx.betweenness_centrality(graph)
+            closeness = nx.closeness_centrality(graph)
 
         # Eigenvector centrality can fail for some graphs
         eigenvector = None
@@ -88,9 +117,48 @@ class TopologyAnalyzer:
             betweenness=betweenness,
             closeness=closeness,
             eigenvector=eigenvector,
+            approximate=approximate,
         )
         return self._centrality_cache
 
+    @staticmethod
+    def _sampled_closeness(graph: nx.Graph, pivots: int, seed: int) -> Dict[str, float]:
+        """Estimate closeness centrality from BFS runs out of pivot nodes.
+
+        Each node's average distance to the rest of the graph is estimated
+        from its distances to the pivots. Follows NetworkX's convention of
+        using incoming distances and scaling by the reachable fraction.
+
+        Args:
+            graph: Graph to analyze
+            pivots: Number of pivot nodes
+            seed: Random seed for pivot selection
+
+        Returns:
+            Dict of node -> estimated closeness
+        """
+        nodes = list(graph.nodes())
+        sample = random.Random(seed).sample(nodes, pivots)
+        totals = dict.fromkeys(nodes, 0)
+        counts = dict.fromkeys(nodes, 0)
+
+        for pivot in sample:
+            for node, distance in nx.single_source_shortest_path_length(graph, pivot).items():
+                if node != pivot:
+                    totals[node] += distance
+                    counts[node] += 1
+
+        sampled = set(sample)
+        closeness = {}
+        for node in nodes:
+            others = pivots - (1 if node in sampled else 0)
+            if counts[node] == 0 or others == 0:
+                closeness[node] = 0.0
+            else:
+                average = totals[node] / counts[node]
+                closeness[node] = (1.0 / average) * (counts[node] / others)
+        return closeness
+
     def get_most_central(self, measure: str = "degree", k: int = 1) -> List[str]:
         """Get the k most central nodes by specified measure.
 
@@ -149,11 +217,22 @@ class TopologyAnalyzer:
             return nx.clustering(self.topology.graph.to_undirected())
         return dict(nx.clustering(self.topology.graph))
 
-    def compare_to_random(self, num_samples: int = 10) -> dict:
+    def compare_to_random(
+        self,
+        num_samples: int = 10,
+        method: str = "sample",
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+    ) -> dict:
         """Compare topology metrics to random graphs with same n, m.
 
         Args:
             num_samples: Number of random graphs to generate
+            method: "sample" to generate Erdos-Renyi graphs, or "analytical"
+                for closed-form estimates
+            seed: Base seed for the random graphs
+            max_workers: Worker processes for sampling (None = CPU count,
+                1 = run in this process)
 
         Returns:
             Dict with comparison statistics
@@ -165,44 +244,39 @@ class TopologyAnalyzer:
         if n < 2 or m < 1:
             return {"error": "Graph too small for comparison"}
 
-        # Calculate probability for Erdos-Renyi model
-        max_edges = n * (n - 1) // 2
-        if max_edges == 0:
+        baseline = random_baseline(
+            n,
+            m,
+            directed=self.topology.directed,
+            num_samples=num_samples,
+            method=method,
+            seed=seed,
+            max_workers=max_workers,
+        )
+        if baseline is None:
             return {"error": "Cannot create random graph"}
-        p = m / max_edges
-
-        random_clusterings = []
-        random_path_lengths = []
-
-        for _ in range(num_samples):
-            try:
-                random_graph = nx.erdos_renyi_graph(n, p)
-                if nx.is_connected(random_graph):
-                    random_clusterings.append(nx.average_clustering(random_graph))
-                    random_path_lengths.append(
-                        nx.average_shortest_path_length(random_graph)
-                    )
-            except Exception:
-                continue
 
         result = {
             "actual_clustering": metrics.clustering_coefficient,
             "actual_path_length": metrics.avg_path_length,
+            "random_method": method,
         }
+        if method == "sample":
+            result["random_samples"] = baseline.samples
 
-        if random_clusterings:
-            result["random_clustering_mean"] = sum(random_clusterings) / len(random_clusterings)
+        if baseline.clustering is not None and metrics.clustering_coefficient is not None:
+            result["random_clustering_mean"] = baseline.clustering
             result["clustering_ratio"] = (
-                metrics.clustering_coefficient / result["random_clustering_mean"]
-                if result["random_clustering_mean"] > 0
+                metrics.clustering_coefficient / baseline.clustering
+                if baseline.clustering > 0
                 else None
             )
 
-        if random_path_lengths:
-            result["random_path_length_mean"] = sum(random_path_lengths) / len(random_path_lengths)
+        if baseline.path_length is not None and metrics.avg_path_length is not None:
+            result["random_path_length_mean"] = baseline.path_length
             result["path_length_ratio"] = (
-                metrics.avg_path_length / result["random_path_length_mean"]
-                if result["random_path_length_mean"] > 0
+                metrics.avg_path_length / baseline.path_length
+                if baseline.path_length > 0
                 else None
             )
 
@@ -246,3 +320,208 @@ class TopologyAnalyzer:
             lines.append(f"Most Central (degree): {', '.join(most_central)}")
 
         return "\n".join(lines)
+
+
+# Below this many nodes, sampling runs in-process; pool startup would
+# dominate the work
+PARALLEL_BASELINE_MIN_NODES = 200
+
+# Most baselines kept in the cache, least recently used evicted first
+BASELINE_CACHE_SIZE = 128
+
+_baseline_cache: "OrderedDict[tuple, Optional[RandomBaseline]]" = OrderedDict()
+
+# Worker pool shared by sampled baselines, created on first use
+_baseline_pool: Optional[ProcessPoolExecutor] = None
+_baseline_pool_workers: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class RandomBaseline:
+    """Expected metrics of Erdos-Renyi graphs with a given size.
+
+    Attributes:
+        clustering: Mean average clustering coefficient
+        path_length: Mean average shortest path length
+        samples: Number of connected samples the means are based on
+            (0 for analytical estimates)
+    """
+    clustering: Optional[float]
+    path_length: Optional[float]
+    samples: int = 0
+
+
+def _baseline_sample(
+    n: int, p: float, directed: bool, seed: int, path_sources: Optional[int]
+) -> Optional[Tuple[float, float]]:
+    """Clustering and path length of one seeded random graph.
+
+    Returns:
+        (clustering, path_length), or None if the graph is not connected
+    """
+    if p < 0.2:
+        graph = nx.fast_gnp_random_graph(n, p, seed=seed, directed=directed)
+    else:
+        graph = nx.gnp_random_graph(n, p, seed=seed, directed=directed)
+
+    connected = nx.is_strongly_connected(graph) if directed else nx.is_connected(graph)
+    if not connected:
+        return None
+    undirected = graph.to_undirected() if directed else graph
+    clustering = nx.average_clustering(undirected)
+
+    if path_sources is None or path_sources >= n:
+        return clustering, nx.average_shortest_path_length(graph)
+
+    sources = random.Random(seed).sample(range(n), path_sources)
+    total = sum(
+        sum(nx.single_source_shortest_path_length(graph, source).values())
+        for source in sources
+    )
+    return clustering, total / (path_sources * (n - 1))
+
+
+def _analytical_baseline(n: int, p: float, directed: bool) -> RandomBaseline:
+    """Closed-form Erdos-Renyi estimates.
+
+    Clustering of G(n, p) is p (roughly 2p - p^2 once a directed graph is
+    made undirected). Path length uses the Fronczak et al. approximation
+    (ln n - gamma) / ln k + 1/2 with mean out-degree k.
+    """
+    clustering = 1 - (1 - p) ** 2 if directed else p
+    k = p * (n - 1)
+    path_length = None
+    if k >= n - 1:
+        path_length = 1.0
+    elif k > 1:
+        path_length = (math.log(n) - 0.5772156649) / math.log(k) + 0.5
+        path_length = max(1.0, path_length)
+    return RandomBaseline(clustering=clustering, path_length=path_length)
+
+
+def random_baseline(
+    n: int,
+    m: int,
+    directed: bool = False,
+    num_samples: int = 10,
+    method: str = "sample",
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    path_sources: Optional[int] = 32,
+) -> Optional[RandomBaseline]:
+    """Expected clustering and path length of random graphs with n nodes, m edges.
+
+    Sampled baselines generate each graph from its own seed derived from
+    ``seed``, so results are reproducible regardless of how samples are
+    spread over worker processes. Each graph's path length is estimated
+    from ``path_sources`` BFS sources; averaged over many graphs this is
+    far cheaper than all pairs and just as stable. Results are cached per
+    (n, m, directed, num_samples, method, seed, path_sources).
+
+    Args:
+        n: Number of nodes
+        m: Number of edges
+        directed: Whether edges are one-way
+        num_samples: Number of random graphs to generate
+        method: "sample" or "analytical"
+        seed: Base seed for the random graphs
+        max_workers: Worker processes for sampling (None = CPU count,
+            1 = run in this process)
+        path_sources: BFS sources per graph for path length (None = all pairs)
+
+    Returns:
+        RandomBaseline, or None if no random graph of that size exists
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method not in ("sample", "analytical"):
+        raise ValueError(f"Unknown baseline method: {method}")
+
+    if method == "analytical":
+        key = (n, m, directed, 0, method, 0, None)
+    else:
+        key = (n, m, directed, num_samples, method, seed, path_sources)
+    if key in _baseline_cache:
+        _baseline_cache.move_to_end(key)
+        return _baseline_cache[key]
+
+    max_edges = n * (n - 1) if directed else n * (n - 1) // 2
+    if max_edges == 0:
+        baseline = None
+    else:
+        p = min(1.0, m / max_edges)
+        if method == "analytical":
+            baseline = _analytical_baseline(n, p, directed)
+        else:
+            baseline = _sampled_baseline(
+                n, p, directed, num_samples, seed, max_workers, path_sources
+            )
+
+    _baseline_cache[key] = baseline
+    while len(_baseline_cache) > BASELINE_CACHE_SIZE:
+        _baseline_cache.popitem(last=False)
+    return baseline
+
+
+def _get_baseline_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """Get the shared baseline worker pool, creating it on first use."""
+    global _baseline_pool, _baseline_pool_workers
+    if _baseline_pool is not None and _baseline_pool_workers != max_workers:
+        shutdown_baseline_pool()
+    if _baseline_pool is None:
+        if _baseline_pool_workers is None:
+            atexit.register(shutdown_baseline_pool)
+        _baseline_pool = ProcessPoolExecutor(max_workers=max_workers)
+        _baseline_pool_workers = max_workers
+    return _baseline_pool
+
+
+def shutdown_baseline_pool() -> None:
+    """Shut down the worker pool used for sampled baselines, if running."""
+    global _baseline_pool
+    pool, _baseline_pool = _baseline_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _sampled_baseline(
+    n: int,
+    p: float,
+    directed: bool,
+    num_samples: int,
+    seed: int,
+    max_workers: Optional[int],
+    path_sources: Optional[int],
+) -> RandomBaseline:
+    """Average metrics over seeded random graphs, in parallel if worthwhile."""
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(32) for _ in range(num_samples)]
+    args = (
+        [n] * num_samples,
+        [p] * num_samples,
+        [directed] * num_samples,
+        seeds,
+        [path_sources] * num_samples,
+    )
+
+    samples = None
+    if max_workers != 1 and num_samples > 1 and n >= PARALLEL_BASELINE_MIN_NODES:
+        try:
+            samples = list(_get_baseline_pool(max_workers).map(_baseline_sample, *args))
+        except (BrokenProcessPool, OSError, NotImplementedError, pickle.PicklingError):
+            # Workers died or processes are unavailable here; drop the pool
+            # and fall back to serial
+            shutdown_baseline_pool()
+            samples = None
+    if samples is None:
+        samples = list(map(_baseline_sample, *args))
+
+    connected = [sample for sample in samples if sample is not None]
+    if not connected:
+        return RandomBaseline(clustering=None, path_length=None)
+    return RandomBaseline(
+        clustering=sum(c for c, _ in connected) / len(connected),
+        path_length=sum(length for _, length in connected) / len(connected),
+        samples=len(connected),
+    )
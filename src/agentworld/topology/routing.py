@@ -0,0 +1,300 @@
+"""Precompiled routing tables for message delivery.
+
+A RoutingTable is compiled from a topology once so that per-message routing
+checks are O(1) lookups instead of NetworkX queries. Edge changes made
+through the Topology API are applied to the table incrementally.
+"""
+
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from agentworld.topology.base import EdgeChange, RoutingMode, Topology
+
+
+# Applied change batches remembered for touched_since()
+REVISION_LOG_LIMIT = 256
+
+
+def _sorted_nodes(nodes) -> Tuple[str, ...]:
+    """Sort node IDs, falling back to their repr for mixed types."""
+    try:
+        return tuple(sorted(nodes))
+    except TypeError:
+        return tuple(sorted(nodes, key=repr))
+
+
+class RoutingTable:
+    """Immutable routing snapshot of a topology for one routing mode.
+
+    Holds per-sender neighbor sets for direct routing, component IDs (or,
+    for directed graphs, reachability bitsets over strongly connected
+    components) for multi-hop routing, and sorted recipient tuples that are
+    materialised lazily per sender.
+
+    Attributes:
+        routing_mode: Routing mode the table was compiled for
+        nodes: All agent IDs in sorted order
+        revision: Number of change batches applied since compilation
+    """
+
+    def __init__(self, topology: Topology, routing_mode: RoutingMode):
+        """Compile a routing table.
+
+        Args:
+            topology: Topology to compile
+            routing_mode: Routing mode to compile for
+        """
+        self.routing_mode = routing_mode
+        self.nodes: Tuple[str, ...] = _sorted_nodes(topology.get_all_nodes())
+        self.index: Dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+        self._neighbors: Dict[str, FrozenSet[str]] = {
+            node: frozenset(topology.get_neighbors(node)) for node in self.nodes
+        }
+        self._recipients: Dict[str, Tuple[str, ...]] = {}
+        self._adjacency: Optional[np.ndarray] = None
+
+        self.revision = 0
+        self._touched: Deque[Tuple[int, Optional[Set[str]]]] = deque(
+            maxlen=REVISION_LOG_LIMIT
+        )
+
+        # Multi-hop reachability
+        self._component: Dict[str, int] = {}
+        self._members: Dict[int, Set[str]] = {}
+        self._reach_bits: List[int] = []
+        self._directed = topology.directed
+        if routing_mode == RoutingMode.MULTI_HOP:
+            self._compile_reachability(topology.graph)
+
+    def _compile_reachability(self, graph: nx.Graph) -> None:
+        """Compute component IDs, plus SCC reachability bitsets if directed."""
+        self._component = {}
+        self._members = {}
+        if not self._directed:
+            for cid, members in enumerate(nx.connected_components(graph)):
+                self._members[cid] = set(members)
+                for node in members:
+                    self._component[node] = cid
+            return
+
+        condensation = nx.condensation(graph)
+        mapping = condensation.graph["mapping"]
+        self._component = dict(mapping)
+
+        # Each SCC reaches itself plus everything its successors reach
+        reach = [0] * condensation.number_of_nodes()
+        for scc in reversed(list(nx.topological_sort(condensation))):
+            bits = 1 << scc
+            for succ in condensation.successors(scc):
+                bits |= reach[succ]
+            reach[scc] = bits
+        self._reach_bits = reach
+
+    def can_send(self, sender: str, receiver: str) -> bool:
+        """Check whether sender may message receiver. O(1)."""
+        if self.routing_mode == RoutingMode.BROADCAST:
+            return True
+        if self.routing_mode == RoutingMode.MULTI_HOP:
+            return self.can_reach(sender, receiver)
+        neighbors = self._neighbors.get(sender)
+        return neighbors is not None and receiver in neighbors
+
+    def can_reach(self, sender: str, receiver: str) -> bool:
+        """Check whether a path exists from sender to receiver. O(1)."""
+        source = self._component.get(sender)
+        target = self._component.get(receiver)
+        if source is None or target is None:
+            return False
+        if not self._directed:
+            return source == target
+        return bool((self._reach_bits[source] >> target) & 1)
+
+    def recipients(self, sender: str) -> Tuple[str, ...]:
+        """Sorted tuple of agents the sender may message.
+
+        Computed on first request per sender and cached.
+        """
+        cached = self._recipients.get(sender)
+        if cached is not None:
+            return cached
+
+        if self.routing_mode == RoutingMode.BROADCAST:
+            result = tuple(n for n in self.nodes if n != sender)
+        elif self.routing_mode == RoutingMode.MULTI_HOP:
+            if sender not in self._component:
+                result = ()
+            else:
+                result = tuple(
+                    n for n in self.nodes
+                    if n != sender and self.can_reach(sender, n)
+                )
+        else:
+            result = _sorted_nodes(self._neighbors.get(sender, ()))
+
+        self._recipients[sender] = result
+        return result
+
+    @property
+    def adjacency_matrix(self) -> np.ndarray:
+        """Boolean adjacency matrix indexed by ``index`` (built on first use)."""
+        if self._adjacency is None:
+            n = len(self.nodes)
+            matrix = np.zeros((n, n), dtype=bool)
+            for node, neighbors in self._neighbors.items():
+                i = self.index[node]
+                for neighbor in neighbors:
+                    matrix[i, self.index[neighbor]] = True
+            matrix.setflags(write=False)
+            self._adjacency = matrix
+        return self._adjacency
+
+    def apply(self, topology: Topology, changes: List[EdgeChange]) -> bool:
+        """Update the table in place for changes made to its topology.
+
+        Neighbor sets are refreshed for changed edges' endpoints only.
+        Undirected multi-hop components are merged on edge additions and
+        then split on removals, by a BFS from each endpoint that stops once
+        the other endpoint is reached; directed reachability is recompiled.
+
+        Args:
+            topology: The topology, already mutated
+            changes: Changes since the table was compiled or last updated
+
+        Returns:
+            False if the changes cannot be applied incrementally (node
+            removal), in which case the table should be recompiled
+        """
+        if any(change.kind == "remove_node" for change in changes):
+            return False
+
+        new_nodes: Set[str] = set()
+        refreshed: Set[str] = set()
+        for change in changes:
+            endpoints = [change.source] if change.target is None else [change.source, change.target]
+            new_nodes.update(node for node in endpoints if node not in self.index)
+            if change.kind != "add_node":
+                refreshed.add(change.source)
+                if not self._directed:
+                    refreshed.add(change.target)
+
+        if new_nodes:
+            self.nodes = _sorted_nodes(self.nodes + tuple(new_nodes))
+            self.index = {node: i for i, node in enumerate(self.nodes)}
+            refreshed |= new_nodes
+        for node in refreshed:
+            self._neighbors[node] = frozenset(topology.get_neighbors(node))
+        self._adjacency = None
+
+        touched: Optional[Set[str]]
+        if self.routing_mode == RoutingMode.BROADCAST:
+            touched = None if new_nodes else set()
+        elif self.routing_mode == RoutingMode.DIRECT_ONLY:
+            touched = refreshed
+        elif self._directed:
+            self._compile_reachability(topology.graph)
+            touched = None
+        else:
+            touched = self._update_components(changes, new_nodes)
+
+        if touched is None:
+            self._recipients.clear()
+        else:
+            for sender in touched:
+                self._recipients.pop(sender, None)
+        self.revision += 1
+        self._touched.append((self.revision, touched))
+        return True
+
+    def _update_components(self, changes: List[EdgeChange], new_nodes: Set[str]) -> Set[str]:
+        """Maintain undirected components through edge changes.
+
+        Returns:
+            Nodes whose component membership changed
+        """
+        next_cid = max(self._members, default=-1) + 1
+        for node in new_nodes:
+            self._component[node] = next_cid
+            self._members[next_cid] = {node}
+            next_cid += 1
+
+        # Merge first: neighbor sets already reflect the final graph, so
+        # splits are only exact once every added edge has been merged
+        touched: Set[str] = set()
+        for change in changes:
+            if change.kind != "add_edge":
+                continue
+            a = self._component[change.source]
+            b = self._component[change.target]
+            if a == b:
+                continue
+            if len(self._members[a]) < len(self._members[b]):
+                a, b = b, a
+            moved = self._members.pop(b)
+            for node in moved:
+                self._component[node] = a
+            self._members[a] |= moved
+            touched |= self._members[a]
+
+        for change in changes:
+            if change.kind != "remove_edge" or change.source == change.target:
+                continue
+            for node, other in ((change.source, change.target), (change.target, change.source)):
+                reached = self._search(node, other)
+                if reached is None:
+                    break
+                old = self._component[node]
+                if reached == self._members[old]:
+                    continue
+                touched |= self._members[old]
+                self._members[old] -= reached
+                self._members[next_cid] = reached
+                for member in reached:
+                    self._component[member] = next_cid
+                next_cid += 1
+        return touched
+
+    def _search(self, source: str, target: str) -> Optional[Set[str]]:
+        """BFS over current neighbor sets.
+
+        Returns:
+            None if target is reachable from source, otherwise every node
+            reachable from source
+        """
+        seen = {source}
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for neighbor in self._neighbors.get(node, ()):
+                    if neighbor == target:
+                        return None
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return seen
+
+    def touched_since(self, revision: int) -> Optional[Set[str]]:
+        """Senders whose recipients may have changed since a revision.
+
+        Args:
+            revision: Revision a cache was built at
+
+        Returns:
+            Set of sender IDs, or None if every sender may be affected
+        """
+        if revision == self.revision:
+            return set()
+        if not self._touched or self._touched[0][0] > revision + 1:
+            return None
+        senders: Set[str] = set()
+        for applied, touched in self._touched:
+            if applied <= revision:
+                continue
+            if touched is None:
+                return None
+            senders |= touched
+        return senders
@@ -0,0 +1,799 @@
+"""Array-backed topology for large agent populations.
+
+SparseTopology stores adjacency as CSR arrays (``indptr``/``indices``/
+``weights``) over integer agent indices instead of a NetworkX dict-of-dicts.
+The standard topology types are generated directly into that format, and
+neighbor, reachability, shortest-path and metric queries run as vectorized
+breadth-first searches over the arrays.
+
+The NetworkX ``graph`` is only materialised when something asks for it
+(e.g. an algorithm this class does not implement). Mutations made through
+the Topology API or directly on a materialised graph are picked up by
+rebuilding the arrays from the graph on the next array query.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+import random
+
+import networkx as nx
+import numpy as np
+
+from agentworld.topology.base import Topology, TopologyMetrics
+
+
+# Most wedges (candidate triangles) held in memory at once when counting
+TRIANGLE_CHUNK = 1 << 22
+
+class SparseTopology(Topology):
+    """Topology stored as CSR adjacency arrays.
+
+    Undirected edges are stored in both directions. Row neighbors are kept
+    sorted so edge lookups are binary searches.
+
+    Attributes:
+        indptr: Row offsets into ``indices`` (length n + 1)
+        indices: Neighbor (successor) indices, sorted within each row
+        weights: Edge weights aligned with ``indices``
+    """
+
+    def __init__(self, directed: bool = False, topology_type: str = "custom"):
+        """Initialize an empty sparse topology.
+
+        Args:
+            directed: If True, edges are one-way
+            topology_type: Topology type name reported by ``topology_type``
+        """
+        super().__init__(directed)
+        self._graph = None
+        self._topology_type = topology_type
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.weights = np.zeros(0, dtype=np.float64)
+        self._edge_count = 0
+        self._reverse: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        # Fingerprint of the graph the arrays were built from, if any
+        self._synced_key: Optional[tuple] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+
+    @classmethod
+    def create(
+        cls,
+        topology_type: str,
+        agent_ids: List[str],
+        directed: bool = False,
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> "SparseTopology":
+        """Generate a standard topology type directly into CSR form.
+
+        Accepts the same parameters as the corresponding NetworkX-backed
+        topology's ``build``.
+
+        Args:
+            topology_type: One of "mesh", "hub_spoke", "hierarchical",
+                "small_world", "scale_free", "custom"
+            agent_ids: List of agent IDs
+            directed: Whether edges are one-way
+            seed: Random seed for randomized topologies
+            **kwargs: Topology-specific parameters
+
+        Returns:
+            Built SparseTopology
+
+        Raises:
+            ValueError: If topology_type is unknown
+        """
+        builders = {
+            "mesh": _mesh_edges,
+            "hub_spoke": _hub_spoke_edges,
+            "hierarchical": _hierarchical_edges,
+            "small_world": _small_world_edges,
+            "scale_free": _scale_free_edges,
+        }
+        topology = cls(directed=directed, topology_type=topology_type)
+
+        if topology_type == "custom":
+            topology.build(agent_ids, **kwargs)
+            return topology
+        if topology_type not in builders:
+            raise ValueError(
+                f"Unknown topology type: {topology_type}. "
+                f"Valid types: {list(builders.keys()) + ['custom']}"
+            )
+
+        ids, src, dst = builders[topology_type](
+            list(agent_ids), np.random.default_rng(seed), **kwargs
+        )
+        # Generated structures are undirected; directed variants get both
+        # directions, matching Graph.to_directed()
+        topology._load(ids, src, dst, symmetric=True)
+        return topology
+
+    def build(
+        self,
+        agent_ids: List[str],
+        edges: Optional[List[tuple]] = None,
+        graph: Optional[nx.Graph] = None,
+        **kwargs,
+    ) -> None:
+        """Build from explicit edges or an existing NetworkX graph.
+
+        Args:
+            agent_ids: List of agent IDs (all will be added as nodes)
+            edges: Optional list of (source, target) or (source, target, weight) tuples
+            graph: Optional NetworkX graph to convert (takes precedence over edges)
+        """
+        if graph is not None:
+            self._graph = None
+            self._load_graph(graph)
+            self._version += 1
+            return
+
+        ids = list(dict.fromkeys(agent_ids))
+        index = {aid: i for i, aid in enumerate(ids)}
+        src, dst, weight = [], [], []
+        for edge in edges or []:
+            for node in edge[:2]:
+                if node not in index:
+                    index[node] = len(ids)
+                    ids.append(node)
+            src.append(index[edge[0]])
+            dst.append(index[edge[1]])
+            weight.append(edge[2] if len(edge) >= 3 else 1.0)
+
+        self._graph = None
+        self._load(
+            ids,
+            np.asarray(src, dtype=np.int64),
+            np.asarray(dst, dtype=np.int64),
+            np.asarray(weight, dtype=np.float64),
+            symmetric=not self._directed,
+        )
+
+    def _load(
+        self,
+        ids: List[str],
+        src: np.ndarray,
+        dst: np.ndarray,
+        weight: Optional[np.ndarray] = None,
+        symmetric: bool = False,
+    ) -> None:
+        """Replace the arrays with a CSR built from edge arrays.
+
+        Args:
+            ids: Agent IDs, position = node index
+            src: Edge source indices
+            dst: Edge target indices
+            weight: Edge weights (defaults to 1.0)
+            symmetric: Store every edge in both directions
+        """
+        n = len(ids)
+        if weight is None:
+            weight = np.ones(len(src), dtype=np.float64)
+        if symmetric:
+            loops = src == dst
+            src, dst = (
+                np.concatenate([src, dst[~loops]]),
+                np.concatenate([dst, src[~loops]]),
+            )
+            weight = np.concatenate([weight, weight[~loops]])
+
+        # Sort by (row, column); keep the last weight for duplicate edges
+        order = np.lexsort((dst, src))
+        src, dst, weight = src[order], dst[order], weight[order]
+        if len(src):
+            keep = np.ones(len(src), dtype=bool)
+            keep[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst, weight = src[keep], dst[keep], weight[keep]
+
+        self._ids = list(ids)
+        self._index = {aid: i for i, aid in enumerate(self._ids)}
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.indices = dst.astype(np.int64, copy=False)
+        self.weights = weight.astype(np.float64, copy=False)
+        self._reverse = None
+
+        if self._directed:
+            self._edge_count = len(dst)
+        else:
+            self._edge_count = (len(dst) + int(np.count_nonzero(src == dst))) // 2
+        self._version += 1
+        self._synced_key = None
+
+    def _load_graph(self, graph: Union[nx.Graph, nx.DiGraph]) -> None:
+        """Rebuild the arrays from a NetworkX graph."""
+        ids = list(graph.nodes())
+        index = {aid: i for i, aid in enumerate(ids)}
+        edges = list(graph.edges(data="weight", default=1.0))
+        src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+        weight = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+        version = self._version
+        # Match CustomTopology: an undirected source becomes both directions
+        # of a directed topology, and a directed one is folded into an
+        # undirected topology
+        symmetric = not self._directed or not graph.is_directed()
+        self._load(ids, src, dst, weight, symmetric=symmetric)
+        # Loading from the graph is not a mutation of the topology
+        self._version = version
+
+    # ------------------------------------------------------------------
+    # NetworkX interop
+
+    @property
+    def graph(self) -> Union[nx.Graph, nx.DiGraph]:
+        """NetworkX view of the topology, materialised on first access."""
+        if self._graph is None:
+            self._graph = self.to_networkx()
+            self._synced_key = self._graph_key()
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: Union[nx.Graph, nx.DiGraph]) -> None:
+        """Replace the topology with a NetworkX graph."""
+        self._graph = value
+        self._version += 1
+
+    def _graph_key(self) -> tuple:
+        """Fingerprint of the materialised graph."""
+        return (self._version, id(self._graph), len(self._graph), self._edit_stamp(self._graph))
+
+    def _sync(self) -> None:
+        """Rebuild the arrays if the materialised graph has changed."""
+        if self._graph is not None and self._graph_key() != self._synced_key:
+            self._load_graph(self._graph)
+            self._synced_key = self._graph_key()
+
+    def fingerprint(self) -> tuple:
+        """Cheap change detector for caches derived from the topology."""
+        if self._graph is not None:
+            return self._graph_key()
+        return (self._version, None, len(self._ids), None)
+
+    def to_networkx(self) -> Union[nx.Graph, nx.DiGraph]:
+        """Convert the arrays to a new NetworkX graph.
+
+        Returns:
+            Graph or DiGraph with the same nodes, edges and weights
+        """
+        self._sync()
+        graph = nx.DiGraph() if self._directed else nx.Graph()
+        graph.add_nodes_from(self._ids)
+        rows = np.repeat(np.arange(len(self._ids)), np.diff(self.indptr))
+        ids = self._ids
+        graph.add_weighted_edges_from(
+            (ids[u], ids[v], w)
+            for u, v, w in zip(rows.tolist(), self.indices.tolist(), self.weights.tolist())
+        )
+        return graph
+
+    # ------------------------------------------------------------------
+    # Array helpers
+
+    @property
+    def node_ids(self) -> List[str]:
+        """Agent IDs in index order."""
+        self._sync()
+        return self._ids
+
+    def index_of(self, agent_id: str) -> Optional[int]:
+        """Get the array index of an agent, or None if absent."""
+        self._sync()
+        return self._index.get(agent_id)
+
+    def degrees(self) -> np.ndarray:
+        """Degree per node (in + out for directed graphs)."""
+        self._sync()
+        out_degree = np.diff(self.indptr)
+        if not self._directed:
+            loops = self._self_loop_mask()
+            return out_degree + np.bincount(
+                self._rows()[loops], minlength=len(self._ids)
+            )
+        return out_degree + np.bincount(self.indices, minlength=len(self._ids))
+
+    def _rows(self) -> np.ndarray:
+        """Row index of each stored edge."""
+        return np.repeat(np.arange(len(self._ids)), np.diff(self.indptr))
+
+    def _self_loop_mask(self) -> np.ndarray:
+        """Mask of stored edges that are self-loops."""
+        return self._rows() == self.indices
+
+    def _reverse_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """CSR of the transposed graph (predecessors), built on first use."""
+        if self._reverse is None:
+            rows = self._rows()
+            order = np.lexsort((rows, self.indices))
+            indptr = np.zeros(len(self._ids) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=len(self._ids)), out=indptr[1:])
+            self._reverse = (indptr, rows[order])
+        return self._reverse
+
+    def _expand(
+        self,
+        frontier: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Gather all neighbors of a frontier.
+
+        Returns:
+            (neighbors, parents) where parents[i] is the frontier node
+            neighbors[i] was reached from
+        """
+        starts = indptr[frontier]
+        lengths = indptr[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(total)
+        return indices[positions], np.repeat(frontier, lengths)
+
+    def _bfs(
+        self,
+        source: int,
+        target: Optional[int] = None,
+        undirected: bool = False,
+        track_parents: bool = False,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Level-synchronous BFS over the arrays.
+
+        Args:
+            source: Start node index
+            target: Stop once this node is reached
+            undirected: Follow edges in both directions
+            track_parents: Record a BFS parent per node
+
+        Returns:
+            (distances, parents); unreachable nodes have distance -1
+        """
+        n = len(self._ids)
+        dist = np.full(n, -1, dtype=np.int64)
+        parents = np.full(n, -1, dtype=np.int64) if track_parents else None
+        dist[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        adjacency = [(self.indptr, self.indices)]
+        if undirected and self._directed:
+            adjacency.append(self._reverse_csr())
+
+        level = 0
+        while frontier.size and (target is None or dist[target] < 0):
+            level += 1
+            found, via = [], []
+            for indptr, indices in adjacency:
+                neighbors, origin = self._expand(frontier, indptr, indices)
+                found.append(neighbors)
+                via.append(origin)
+            neighbors = np.concatenate(found)
+            origin = np.concatenate(via)
+            fresh = dist[neighbors] < 0
+            neighbors = neighbors[fresh]
+            dist[neighbors] = level
+            if parents is not None:
+                parents[neighbors] = origin[fresh]
+            # Scanning dist deduplicates the frontier faster than np.unique
+            frontier = np.flatnonzero(dist == level)
+        return dist, parents
+
+    # ------------------------------------------------------------------
+    # Topology API
+
+    def get_neighbors(self, agent_id: str) -> List[str]:
+        """Get agents this agent can directly communicate with.
+
+        Args:
+            agent_id: Agent to get neighbors for
+
+        Returns:
+            List of neighbor agent IDs
+        """
+        i = self.index_of(agent_id)
+        if i is None:
+            return []
+        ids = self._ids
+        return [ids[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]].tolist()]
+
+    def can_communicate(self, sender: str, receiver: str) -> bool:
+        """Check if a direct edge exists.
+
+        Args:
+            sender: Sending agent
+            receiver: Receiving agent
+
+        Returns:
+            True if direct edge exists
+        """
+        i, j = self.index_of(sender), self.index_of(receiver)
+        if i is None or j is None:
+            return False
+        row = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        k = np.searchsorted(row, j)
+        return bool(k < len(row) and row[k] == j)
+
+    def can_reach(self, sender: str, receiver: str) -> bool:
+        """Check if multi-hop communication is possible.
+
+        Args:
+            sender: Sending agent
+            receiver: Receiving agent
+
+        Returns:
+            True if any path exists
+        """
+        i, j = self.index_of(sender), self.index_of(receiver)
+        if i is None or j is None:
+            return False
+        dist, _ = self._bfs(i, target=j)
+        return bool(dist[j] >= 0)
+
+    def get_shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Get an unweighted shortest path between agents.
+
+        Args:
+            source: Starting agent
+            target: Destination agent
+
+        Returns:
+            List of agent IDs in path, or None if unreachable
+        """
+        i, j = self.index_of(source), self.index_of(target)
+        if i is None or j is None:
+            return None
+        dist, parents = self._bfs(i, target=j, track_parents=True)
+        if dist[j] < 0:
+            return None
+
+        path = [j]
+        while path[-1] != i:
+            path.append(int(parents[path[-1]]))
+        return [self._ids[k] for k in reversed(path)]
+
+    def get_all_nodes(self) -> List[str]:
+        """Get all node IDs in the topology.
+
+        Returns:
+            List of all agent IDs
+        """
+        return list(self.node_ids)
+
+    def get_all_edges(self) -> List[tuple]:
+        """Get all edges in the topology.
+
+        Returns:
+            List of (source, target) tuples; undirected edges appear once
+        """
+        self._sync()
+        rows, cols = self._rows(), self.indices
+        if not self._directed:
+            keep = rows <= cols
+            rows, cols = rows[keep], cols[keep]
+        ids = self._ids
+        return [(ids[u], ids[v]) for u, v in zip(rows.tolist(), cols.tolist())]
+
+    def _compute_metrics(self) -> TopologyMetrics:
+        """Compute network analysis metrics on the arrays.
+
+        For graphs larger than ``metrics_config.exact_max_nodes``, the
+        average path length is estimated and the diameter lower-bounded
+        from BFS runs over a sample of sources.
+
+        Returns:
+            TopologyMetrics with computed values
+        """
+        self._sync()
+        n = len(self._ids)
+        m = self._edge_count
+        degrees = self.degrees()
+
+        if n > 1:
+            possible = n * (n - 1) if self._directed else n * (n - 1) / 2
+            density = m / possible
+        else:
+            density = 0.0
+
+        is_connected = True
+        if n > 0:
+            dist, _ = self._bfs(0, undirected=True)
+            is_connected = bool((dist >= 0).all())
+
+        metrics = TopologyMetrics(
+            node_count=n,
+            edge_count=m,
+            density=density,
+            is_connected=is_connected,
+            degree_distribution=dict(zip(self._ids, degrees.tolist())) if n > 0 else {},
+        )
+
+        if is_connected and n > 1:
+            metrics.clustering_coefficient = self._average_clustering()
+            path_metrics = self._path_metrics()
+            if path_metrics is not None:
+                metrics.avg_path_length, metrics.diameter = path_metrics
+                metrics.approximate = n > self.metrics_config.exact_max_nodes
+
+        return metrics
+
+    def _average_clustering(self) -> float:
+        """Average clustering coefficient of the undirected graph.
+
+        Triangles are counted on the CSR arrays: each edge is oriented from
+        its lower- to its higher-degree endpoint, every pair of a node's
+        outgoing edges is a wedge, and a wedge closes into a triangle when
+        its far endpoints are adjacent (looked up in the sorted edge keys).
+        Wedges are processed in chunks of TRIANGLE_CHUNK.
+        """
+        indptr, indices = self.indptr, self.indices
+        if self._directed:
+            indptr, indices = self._undirected_csr()
+
+        n = len(self._ids)
+        if n == 0:
+            return 0.0
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        no_loops = rows != indices
+        src, dst = rows[no_loops], indices[no_loops]
+        degree = np.bincount(src, minlength=n).astype(np.float64)
+        # Rows are sorted by (src, dst), so these keys are sorted too
+        keys = src * n + dst
+
+        # Orient each edge towards the endpoint later in (degree, index)
+        rank = np.empty(n, dtype=np.int64)
+        rank[np.lexsort((np.arange(n), degree))] = np.arange(n)
+        forward = rank[src] < rank[dst]
+        fsrc, fdst = src[forward], dst[forward]
+        order = np.lexsort((fdst, fsrc))
+        fsrc, fdst = fsrc[order], fdst[order]
+        fptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(fsrc, minlength=n), out=fptr[1:])
+
+        # Edge i pairs with the later edges of its row: fptr[row + 1] - i - 1 wedges
+        later = fptr[fsrc + 1] - np.arange(len(fsrc)) - 1
+        wedges = np.cumsum(later)
+        triangles = np.zeros(n, dtype=np.int64)
+        start = 0
+        while start < len(fsrc):
+            done = wedges[start - 1] if start else 0
+            stop = max(start + 1, int(np.searchsorted(wedges, done + TRIANGLE_CHUNK, side="right")))
+            counts = later[start:stop]
+            total = int(counts.sum())
+            if total:
+                first = np.repeat(np.arange(start, stop), counts)
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                second = first + 1 + offsets
+                v, w = fdst[first], fdst[second]
+                wanted = v * n + w
+                closed = np.zeros(total, dtype=bool)
+                position = np.searchsorted(keys, wanted)
+                in_range = position < len(keys)
+                closed[in_range] = keys[position[in_range]] == wanted[in_range]
+                for corner in (fsrc[first[closed]], v[closed], w[closed]):
+                    triangles += np.bincount(corner, minlength=n)
+            start = stop
+
+        possible = degree * (degree - 1) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            local = np.where(possible > 0, triangles / possible, 0.0)
+        return float(local.mean())
+
+    def _undirected_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Symmetrized CSR of a directed graph."""
+        rows = self._rows()
+        src = np.concatenate([rows, self.indices])
+        dst = np.concatenate([self.indices, rows])
+        order = np.lexsort((dst, src))
+        src, dst = src[order], dst[order]
+        keep = np.ones(len(src), dtype=bool)
+        keep[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        src, dst = src[keep], dst[keep]
+        indptr = np.zeros(len(self._ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(self._ids)), out=indptr[1:])
+        return indptr, dst
+
+    def _path_metrics(self) -> Optional[Tuple[float, int]]:
+        """Average shortest path length and diameter.
+
+        Returns:
+            (avg_path_length, diameter), or None for directed graphs that
+            are not strongly connected
+        """
+        config = self.metrics_config
+        n = len(self._ids)
+        sampled = n > config.exact_max_nodes
+        if sampled:
+            rng = np.random.default_rng(config.seed)
+            sources = rng.choice(n, size=min(config.path_samples, n), replace=False)
+        else:
+            sources = np.arange(n)
+
+        total = 0
+        diameter = 0
+        farthest = 0
+        for source in sources.tolist():
+            dist, _ = self._bfs(source)
+            if (dist < 0).any():
+                return None
+            total += int(dist.sum())
+            if int(dist.max()) > diameter:
+                diameter, farthest = int(dist.max()), int(dist.argmax())
+
+        if sampled:
+            # Double sweep from the farthest node found tightens the bound
+            dist, _ = self._bfs(farthest)
+            diameter = max(diameter, int(dist.max()))
+        return total / (len(sources) * (n - 1)), diameter
+
+    def to_dict(self) -> dict:
+        """Serialize topology to dictionary.
+
+        Returns:
+            Dictionary representation for persistence
+        """
+        self._sync()
+        rows, cols, weights = self._rows(), self.indices, self.weights
+        if not self._directed:
+            keep = rows <= cols
+            rows, cols, weights = rows[keep], cols[keep], weights[keep]
+        ids = self._ids
+        return {
+            "type": self._topology_type,
+            "directed": self._directed,
+            "nodes": list(ids),
+            "edges": [
+                {"source": ids[u], "target": ids[v], "weight": w}
+                for u, v, w in zip(rows.tolist(), cols.tolist(), weights.tolist())
+            ],
+        }
+
+
+# ----------------------------------------------------------------------
+# Array-native generators. Each returns (ids, src, dst) for an undirected
+# edge list, following the parameter handling of the NetworkX-backed types.
+
+
+def _mesh_edges(
+    agent_ids: List[str], rng: np.random.Generator, **kwargs
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Complete graph."""
+    n = len(agent_ids)
+    src, dst = np.triu_indices(n, k=1)
+    return agent_ids, src.astype(np.int64), dst.astype(np.int64)
+
+
+def _hub_spoke_edges(
+    agent_ids: List[str],
+    rng: np.random.Generator,
+    hub_id: Optional[str] = None,
+    **kwargs,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Star with the hub at index 0."""
+    if not agent_ids:
+        return [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if hub_id is None:
+        hub_id = agent_ids[0]
+    elif hub_id not in agent_ids:
+        raise ValueError(f"hub_id '{hub_id}' not in agent_ids")
+
+    ids = [hub_id] + [a for a in agent_ids if a != hub_id]
+    spokes = np.arange(1, len(ids), dtype=np.int64)
+    return ids, np.zeros(len(spokes), dtype=np.int64), spokes
+
+
+def _hierarchical_edges(
+    agent_ids: List[str],
+    rng: np.random.Generator,
+    branching_factor: int = 2,
+    root_id: Optional[str] = None,
+    **kwargs,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Balanced tree filled in breadth-first order."""
+    if not agent_ids:
+        return [], np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if root_id is None:
+        root_id = agent_ids[0]
+    elif root_id not in agent_ids:
+        raise ValueError(f"root_id '{root_id}' not in agent_ids")
+    if branching_factor < 1:
+        raise ValueError(f"branching_factor must be >= 1, got {branching_factor}")
+
+    ids = [root_id] + [a for a in agent_ids if a != root_id]
+    children = np.arange(1, len(ids), dtype=np.int64)
+    return ids, (children - 1) // branching_factor, children
+
+
+def _small_world_edges(
+    agent_ids: List[str],
+    rng: np.random.Generator,
+    k: int = 4,
+    p: float = 0.3,
+    **kwargs,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Watts-Strogatz ring lattice with vectorized rewiring."""
+    n = len(agent_ids)
+    if n < 3:
+        return _mesh_edges(agent_ids, rng)
+
+    if k % 2 != 0:
+        k = k + 1
+    if k >= n:
+        k = n - 1 if (n - 1) % 2 == 0 else n - 2
+    if k < 2:
+        k = 2
+    if not 0.0 <= p <= 1.0:
+        raise ValueError(f"p must be in [0, 1], got {p}")
+
+    half = k // 2
+    src = np.repeat(np.arange(n, dtype=np.int64), half)
+    lattice = (src + np.tile(np.arange(1, half + 1, dtype=np.int64), n)) % n
+    dst = lattice.copy()
+
+    rewired = rng.random(len(src)) < p
+    dst[rewired] = rng.integers(0, n, size=int(rewired.sum()))
+
+    # Resample rewired edges that became self-loops or duplicates; lattice
+    # edges win ties so they are never displaced
+    order = np.argsort(rewired, kind="stable")
+    for _ in range(100):
+        bad = _invalid_edges(src, dst, n, order) & rewired
+        if not bad.any():
+            break
+        dst[bad] = rng.integers(0, n, size=int(bad.sum()))
+    else:
+        bad = _invalid_edges(src, dst, n, order) & rewired
+        dst[bad] = lattice[bad]
+        keep = ~_invalid_edges(src, dst, n, order)
+        src, dst = src[keep], dst[keep]
+
+    return agent_ids, src, dst
+
+
+def _invalid_edges(src: np.ndarray, dst: np.ndarray, n: int, order: np.ndarray) -> np.ndarray:
+    """Mask self-loops and all but the first (in ``order``) of duplicate edges."""
+    keys = np.minimum(src, dst) * n + np.maximum(src, dst)
+    _, first = np.unique(keys[order], return_index=True)
+    duplicate = np.ones(len(src), dtype=bool)
+    duplicate[order[first]] = False
+    return duplicate | (src == dst)
+
+
+def _scale_free_edges(
+    agent_ids: List[str],
+    rng: np.random.Generator,
+    m: int = 2,
+    **kwargs,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Barabasi-Albert preferential attachment from an initial star."""
+    n = len(agent_ids)
+    if n < 2:
+        return agent_ids, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if m >= n:
+        m = n - 1
+    if m < 1:
+        m = 1
+
+    # Each node appears once per incident edge, so uniform picks from this
+    # list are degree-proportional. Sampling stays in Python: per-node
+    # NumPy calls would cost more than the picks themselves.
+    picker = random.Random(int(rng.integers(2**63)))
+    repeated = [0] * m + list(range(1, m + 1))
+    src = [0] * m
+    dst = list(range(1, m + 1))
+
+    for new in range(m + 1, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(repeated[int(picker.random() * len(repeated))])
+        for target in targets:
+            src.append(new)
+            dst.append(target)
+            repeated.append(target)
+        repeated.extend([new] * m)
+
+    return agent_ids, np.asarray(src, dtype=np.int64), np.asarray(dst, dtype=np.int64)
@@ -342,6 +342,7 @@ def create_topology(
     topology_type: str,
     agent_ids: List[str],
     directed: bool = False,
+    backend: str = "networkx",
     **kwargs
 ) -> Topology:
     """Factory function to create topologies by type name.
@@ -350,14 +351,22 @@ def create_topology(
         topology_type: One of "mesh", "hub_spoke", "hierarchical", "small_world", "scale_free", "custom"
         agent_ids: List of agent IDs
         directed: Whether to use directed graph
+        backend: "networkx" for graph-backed topologies, or "sparse" for
+            array-backed SparseTopology (suited to thousands of agents)
         **kwargs: Topology-specific parameters
 
     Returns:
         Configured Topology instance
 
     Raises:
-        ValueError: If topology_type is unknown
+        ValueError: If topology_type or backend is unknown
     """
+    if backend == "sparse":
+        from agentworld.topology.sparse import SparseTopology
+        return SparseTopology.create(topology_type, agent_ids, directed=directed, **kwargs)
+    if backend != "networkx":
+        raise ValueError(f"Unknown topology backend: {backend}. Valid backends: ['networkx', 'sparse']")
+
     topology_classes = {
         "mesh": MeshTopology,
         "hub_spoke": HubSpokeTopology,
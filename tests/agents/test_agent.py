@@ -46,6 +46,24 @@ class TestAgentCreation:
         assert agent.system_prompt is not None
         assert len(agent.system_prompt) > 0
 
+    def test_system_prompt_generated_lazily(self):
+        """Test the prompt is built on first read and shared across agents."""
+        traits = TraitVector(extraversion=0.9)
+        first = Agent(name="Twin", traits=traits, background="Same persona")
+        second = Agent(name="Twin", traits=traits, background="Same persona")
+
+        assert first.__dict__["_system_prompt"] is None
+        assert first.system_prompt is second.system_prompt
+        assert "Same persona" in first.system_prompt
+
+    def test_system_prompt_reset_regenerates(self):
+        """Test setting None rebuilds the prompt from current fields."""
+        agent = Agent(name="Dana", traits=TraitVector(), system_prompt="Custom")
+        agent.background = "Moved to Paris"
+        agent.system_prompt = None
+
+        assert "Moved to Paris" in agent.system_prompt
+
     def test_from_config(self):
         """Test creating agent from AgentConfig."""
         config = AgentConfig(
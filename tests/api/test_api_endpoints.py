@@ -230,6 +230,104 @@ class TestSimulationEndpoints:
         assert response.status_code == 404
 
 
+class TestTopologyEndpoints:
+    """Tests for topology layout endpoints."""
+
+    def _create(self, client) -> str:
+        payload = {
+            "name": "Layout Test",
+            "initial_prompt": "Hello",
+            "agents": [{"name": f"Agent{i}"} for i in range(12)],
+        }
+        return client.post("/api/v1/simulations", json=payload).json()["id"]
+
+    def test_layout_full_then_incremental(self, client):
+        """Test the full layout, then only changes after stored edges change."""
+        from agentworld.persistence.repository import Repository
+
+        sim_id = self._create(client)
+        response = client.get(f"/api/v1/simulations/{sim_id}/topology/layout")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["full"] is True
+        assert data["node_count"] == 12
+        assert len(data["positions"]) == 12
+        assert len(data["edges"]) == 66  # default mesh
+
+        # Drop one stored edge; only its endpoints should be resent
+        repo = Repository()
+        edges = [(e["source"], e["target"]) for e in data["edges"]]
+        repo.save_topology_edges(sim_id, [(u, v, 1.0) for u, v in edges[1:]])
+
+        response = client.get(
+            f"/api/v1/simulations/{sim_id}/topology/layout",
+            params={"since": data["version"]},
+        )
+        update = response.json()
+        assert update["full"] is False
+        assert update["version"] == data["version"] + 1
+        assert set(update["positions"]) == set(edges[0])
+        assert update["edges"] is None
+
+    def test_layout_skips_rebuild_when_edges_unchanged(self, client):
+        """Test the topology is only rebuilt when stored edges change."""
+        from unittest.mock import patch
+
+        from agentworld.api.routes import topology as topology_routes
+        from agentworld.persistence.repository import Repository
+
+        sim_id = self._create(client)
+        build = topology_routes._build_topology
+        with patch.object(topology_routes, "_build_topology", side_effect=build) as rebuild:
+            data = client.get(f"/api/v1/simulations/{sim_id}/topology/layout").json()
+            client.get(f"/api/v1/simulations/{sim_id}/topology/layout")
+            client.get(f"/api/v1/simulations/{sim_id}/topology/communities")
+            assert rebuild.call_count == 1
+
+            edges = [(e["source"], e["target"], 1.0) for e in data["edges"]]
+            Repository().save_topology_edges(sim_id, edges[1:])
+            client.get(f"/api/v1/simulations/{sim_id}/topology/layout")
+            assert rebuild.call_count == 2
+
+    def test_layout_engines_bounded_and_dropped(self, client, monkeypatch):
+        """Test cached engines are LRU-bounded and dropped with their simulation."""
+        from agentworld.api.routes import topology as topology_routes
+
+        monkeypatch.setattr(topology_routes, "MAX_LAYOUT_ENGINES", 2)
+        topology_routes._layout_engines.clear()
+        first, second, third = (self._create(client) for _ in range(3))
+
+        for sim_id in (first, second, third):
+            client.get(f"/api/v1/simulations/{sim_id}/topology/layout")
+        assert list(topology_routes._layout_engines) == [(second, "force"), (third, "force")]
+
+        client.delete(f"/api/v1/simulations/{third}")
+        assert list(topology_routes._layout_engines) == [(second, "force")]
+
+    def test_communities(self, client):
+        """Test the community-collapsed view covers every agent."""
+        sim_id = self._create(client)
+
+        response = client.get(f"/api/v1/simulations/{sim_id}/topology/communities")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert sum(c["size"] for c in data["communities"]) == 12
+
+    def test_layout_errors(self, client):
+        """Test unknown simulations and algorithms are rejected."""
+        response = client.get("/api/v1/simulations/missing/topology/layout")
+        assert response.status_code == 404
+
+        sim_id = self._create(client)
+        response = client.get(
+            f"/api/v1/simulations/{sim_id}/topology/layout",
+            params={"algorithm": "circle"},
+        )
+        assert response.status_code == 400
+
+
 class TestPersonaEndpoints:
     """Tests for persona API endpoints."""
 
@@ -312,6 +410,22 @@ class TestPersonaEndpoints:
         assert "personas" in data
         assert len(data["personas"]) >= 1
 
+    def test_search_personas_with_filters(self, client):
+        """Test searching personas by trait range with facets."""
+        response = client.get("/api/v1/personas/search?traits=openness>0.75&tags=api")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "Test Persona" in [p["name"] for p in data["personas"]]
+        assert data["total"] == sum(data["facets"].values())
+        assert data["facets"]["Software Tester"] >= 1
+
+    def test_search_personas_invalid_traits(self, client):
+        """Test malformed trait filters are rejected."""
+        response = client.get("/api/v1/personas/search?traits=openness~1")
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_TRAIT_FILTER"
+
     def test_update_persona(self, client):
         """Test updating a persona."""
         persona_id = getattr(TestPersonaEndpoints, "persona_id", None)
@@ -0,0 +1,201 @@
+"""Tests for batched per-client WebSocket delivery."""
+
+import asyncio
+import json
+
+from agentworld.api import websocket as websocket_module
+from agentworld.api.broadcast import MAX_BATCH_EVENTS, ClientChannel, batch_frame
+from agentworld.api.websocket import ConnectionManager
+from agentworld.core.events import EventType
+
+
+class FakeWebSocket:
+    """WebSocket stand-in recording frames, optionally stalled or broken."""
+
+    def __init__(self, stalled: bool = False, broken: bool = False):
+        self.frames = []
+        self.stalled = stalled
+        self.broken = broken
+        self.release = asyncio.Event()
+
+    async def send_text(self, text):
+        if self.broken:
+            raise RuntimeError("connection reset")
+        if self.stalled:
+            await self.release.wait()
+        self.frames.append(json.loads(text))
+
+    @property
+    def events(self):
+        events = []
+        for frame in self.frames:
+            events.extend(frame["events"] if frame["type"] == EventType.BATCH else [frame])
+        return events
+
+
+def _text(event_type: str, i: int = 0) -> str:
+    return json.dumps({"type": event_type, "i": i})
+
+
+async def _drain(*channels: ClientChannel) -> None:
+    while any(channel.pending for channel in channels):
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestBatchFrame:
+    """Tests for frame construction."""
+
+    def test_single_event_sent_as_is(self):
+        """Test a lone event is not wrapped."""
+        assert batch_frame([_text("step.started")]) == _text("step.started")
+
+    def test_batch_envelope(self):
+        """Test several events are spliced into a valid batch envelope."""
+        frame = json.loads(batch_frame([_text("a", 1), _text("b", 2)]))
+
+        assert frame == {"type": "batch", "events": [{"type": "a", "i": 1}, {"type": "b", "i": 2}]}
+
+
+class TestClientChannel:
+    """Tests for ClientChannel."""
+
+    async def test_coalesces_events_into_frames(self):
+        """Test events queued during the flush interval share one frame."""
+        websocket = FakeWebSocket()
+        channel = ClientChannel(websocket, flush_interval=0.01)
+
+        for i in range(5):
+            channel.send(EventType.MESSAGE_CREATED, _text(EventType.MESSAGE_CREATED, i))
+        await asyncio.sleep(0.05)
+
+        assert len(websocket.frames) == 1
+        assert [event["i"] for event in websocket.events] == [0, 1, 2, 3, 4]
+        channel.close()
+
+    async def test_frames_capped(self):
+        """Test a frame carries at most MAX_BATCH_EVENTS events."""
+        websocket = FakeWebSocket()
+        channel = ClientChannel(websocket, flush_interval=0)
+
+        for i in range(MAX_BATCH_EVENTS + 10):
+            channel.send(EventType.MESSAGE_CREATED, _text(EventType.MESSAGE_CREATED, i))
+        await _drain(channel)
+
+        assert [len(frame["events"]) for frame in websocket.frames] == [MAX_BATCH_EVENTS, 10]
+        channel.close()
+
+    async def test_lagging_client_sheds_low_priority_first(self):
+        """Test a full queue drops low-priority events and reports them."""
+        websocket = FakeWebSocket(stalled=True)
+        channel = ClientChannel(websocket, max_pending=10, flush_interval=0)
+        channel.send(EventType.STEP_STARTED, _text(EventType.STEP_STARTED))
+        await asyncio.sleep(0)  # writer takes the first event and stalls
+
+        for i in range(8):
+            channel.send(EventType.AGENT_THINKING, _text(EventType.AGENT_THINKING, i))
+        for i in range(5):
+            channel.send(EventType.MESSAGE_CREATED, _text(EventType.MESSAGE_CREATED, i))
+        channel.send(EventType.AGENT_THINKING, _text(EventType.AGENT_THINKING, 99))
+
+        assert channel.pending <= 10
+        assert channel.dropped == {EventType.AGENT_THINKING: 8}
+
+        websocket.stalled = False
+        websocket.release.set()
+        await _drain(channel)
+
+        events = websocket.events
+        assert events[0]["type"] == EventType.STEP_STARTED
+        assert events[1] == {"type": EventType.EVENTS_DROPPED, "dropped": {EventType.AGENT_THINKING: 8}}
+        assert [e["i"] for e in events if e["type"] == EventType.MESSAGE_CREATED] == [0, 1, 2, 3, 4]
+        assert [e["i"] for e in events if e["type"] == EventType.AGENT_THINKING] == [99]
+        channel.close()
+
+    async def test_drops_oldest_when_only_high_priority(self):
+        """Test the oldest events go when nothing low-priority is queued."""
+        websocket = FakeWebSocket(stalled=True)
+        channel = ClientChannel(websocket, max_pending=3, flush_interval=0)
+        channel.send(EventType.STEP_STARTED, _text(EventType.STEP_STARTED))
+        await asyncio.sleep(0)
+
+        for i in range(5):
+            channel.send(EventType.MESSAGE_CREATED, _text(EventType.MESSAGE_CREATED, i))
+
+        assert channel.pending == 3
+        assert channel.dropped == {EventType.MESSAGE_CREATED: 2}
+        channel.close()
+
+    async def test_send_failure_closes_channel(self):
+        """Test a failed send closes the channel and reports the socket."""
+        websocket = FakeWebSocket(broken=True)
+        failed = []
+        channel = ClientChannel(websocket, on_error=failed.append, flush_interval=0)
+
+        channel.send(EventType.STEP_STARTED, _text(EventType.STEP_STARTED))
+        await asyncio.sleep(0)
+
+        assert channel.closed
+        assert failed == [websocket]
+        channel.send(EventType.STEP_STARTED, _text(EventType.STEP_STARTED))
+        assert channel.pending == 0
+
+
+class TestConnectionManagerDelivery:
+    """Tests for broadcasting through client channels."""
+
+    async def test_slow_client_does_not_block_others(self):
+        """Test a stalled viewer neither blocks broadcasts nor other viewers."""
+        manager = ConnectionManager(max_pending=50, flush_interval=0)
+        slow, fast = FakeWebSocket(stalled=True), FakeWebSocket()
+        manager._add_connection(slow, "sim-1")
+        manager._add_connection(fast, "sim-1")
+
+        for i in range(500):
+            await manager.broadcast_to_simulation("sim-1", {"type": EventType.MESSAGE_CREATED, "i": i})
+            if i % 10 == 0:
+                await asyncio.sleep(0)
+        await _drain(manager._channels[fast])
+
+        assert [event["i"] for event in fast.events] == list(range(500))
+        assert manager._channels[slow].pending <= 50
+        manager.disconnect(slow)
+        manager.disconnect(fast)
+
+    async def test_event_serialized_once(self, monkeypatch):
+        """Test an event is encoded once however many clients receive it."""
+        calls = []
+        dumps = json.dumps
+
+        def counting(obj, *args, **kwargs):
+            calls.append(obj)
+            return dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr(websocket_module.json, "dumps", counting)
+        manager = ConnectionManager(flush_interval=0)
+        viewers = [FakeWebSocket() for _ in range(10)]
+        for viewer in viewers[:5]:
+            manager._add_connection(viewer, "sim-1")
+        for viewer in viewers[5:]:
+            manager._add_connection(viewer)
+
+        await manager.broadcast_to_simulation("sim-1", {"type": EventType.STEP_STARTED})
+        assert len(calls) == 1
+        monkeypatch.undo()
+        await _drain(*manager._channels.values())
+
+        assert all(viewer.events == [{"type": EventType.STEP_STARTED}] for viewer in viewers)
+        for viewer in viewers:
+            manager.disconnect(viewer)
+
+    async def test_failed_client_removed(self):
+        """Test a client whose send fails is removed from every pool."""
+        manager = ConnectionManager(flush_interval=0)
+        broken = FakeWebSocket(broken=True)
+        manager._add_connection(broken, "sim-1")
+
+        await manager.broadcast_to_simulation("sim-1", {"type": EventType.STEP_STARTED})
+        await asyncio.sleep(0)
+
+        assert "sim-1" not in manager.simulation_connections
+        assert broken not in manager._channels
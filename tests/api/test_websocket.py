@@ -1,5 +1,6 @@
 """Tests for WebSocket functionality."""
 
+import asyncio
 import os
 import pytest
 import json
@@ -98,6 +99,55 @@ class TestConnectionManager:
         from agentworld.api.websocket import manager, ConnectionManager
         assert isinstance(manager, ConnectionManager)
 
+    async def test_forwards_bus_events_in_order(self):
+        """Test bus events reach clients in order without a task per event."""
+        from agentworld.api.websocket import ConnectionManager
+        from agentworld.core.events import EventBus, SimulationEventEmitter
+
+        class FakeWebSocket:
+            def __init__(self):
+                self.events = []
+
+            async def send_text(self, text):
+                frame = json.loads(text)
+                self.events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+
+        bus = EventBus()
+        manager = ConnectionManager(flush_interval=0)
+        watcher, observer = FakeWebSocket(), FakeWebSocket()
+        manager._add_connection(watcher, "sim-1")
+        manager._add_connection(observer)
+        manager.attach(bus)
+        tasks = len(asyncio.all_tasks())
+
+        emitter = SimulationEventEmitter("sim-1", bus)
+        emitter.step_started(1, 3)
+        for i in range(20):
+            emitter.agent_thinking(f"a{i}", "Alice")
+        assert len(asyncio.all_tasks()) == tasks + 2  # one writer per client
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert [event["type"] for event in watcher.events] == ["step.started"] + ["agent.thinking"] * 20
+        assert watcher.events[1]["agent_id"] == "a0"
+        assert watcher.events[0]["simulation_id"] == "sim-1"
+        assert observer.events == watcher.events
+
+        manager.detach()
+        assert not bus.has_subscribers
+
+    def test_server_forwards_published_events(self, client):
+        """Test events published while the server runs reach subscribers."""
+        from agentworld.api.events import get_emitter
+
+        with client.websocket_connect("/ws/simulations/bus-sim") as websocket:
+            websocket.receive_json()
+
+            get_emitter("bus-sim").step_started(2, 5)
+
+            data = websocket.receive_json()
+            assert data == {"type": "step.started", "step": 2, "total_steps": 5, "simulation_id": "bus-sim"}
+
     def test_event_types_exist(self):
         """Test that event types are defined."""
         from agentworld.api.websocket import EventType
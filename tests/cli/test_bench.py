@@ -0,0 +1,42 @@
+"""Tests for benchmark CLI commands."""
+
+import pytest
+from typer.testing import CliRunner
+
+from agentworld.cli.commands.bench import bench_app
+from agentworld.memory import benchmark
+from agentworld.memory.benchmark import BenchmarkResult, save_baseline
+
+
+@pytest.fixture
+def slow_results(monkeypatch):
+    """Make every benchmark report a tiny throughput."""
+    def run(sizes, **kwargs):
+        return [BenchmarkResult("retrieve", size, operations=1, seconds=100.0) for size in sizes]
+
+    monkeypatch.setattr(benchmark, "run_memory_benchmarks", run)
+
+
+def _bench(*args):
+    return CliRunner().invoke(bench_app, ["--sizes", "1000", *args], terminal_width=200)
+
+
+class TestBenchMemory:
+    """Tests for bench memory."""
+
+    def test_no_comparison_by_default(self, slow_results):
+        """Test slow results pass when no baseline is requested."""
+        result = _bench()
+
+        assert result.exit_code == 0
+        assert "regressed" not in result.output
+
+    def test_baseline_regression_fails(self, slow_results, tmp_path):
+        """Test a requested baseline fails on regressions."""
+        path = tmp_path / "baseline.json"
+        save_baseline([BenchmarkResult("retrieve", 1000, operations=1000, seconds=1.0)], path)
+
+        result = _bench("--baseline", str(path))
+
+        assert result.exit_code == 1
+        assert "retrieve@1000 regressed" in result.output
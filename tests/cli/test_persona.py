@@ -0,0 +1,69 @@
+"""Tests for persona CLI commands."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from agentworld.cli.commands import persona as persona_commands
+from agentworld.persistence.database import init_db
+from agentworld.persistence.repository import Repository
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    """In-memory library shared with the commands."""
+    init_db(in_memory=True)
+    monkeypatch.setattr(persona_commands, "init_db", lambda: None)
+    return Repository()
+
+
+def _import(tmp_path, personas, *args):
+    path = tmp_path / "personas.json"
+    path.write_text(json.dumps(personas))
+    return CliRunner().invoke(
+        persona_commands.persona_app, ["import", str(path), *args], terminal_width=200
+    )
+
+
+class TestPersonaImport:
+    """Tests for persona import."""
+
+    def test_reimport_updates_by_default(self, repo, tmp_path):
+        """Test re-importing an edited export updates the personas."""
+        _import(tmp_path, [{"id": "p1", "name": "Ada", "occupation": "engineer"}])
+
+        result = _import(tmp_path, [{"id": "p1", "name": "Ada", "occupation": "mathematician"}])
+
+        assert result.exit_code == 0
+        assert "Imported 1 persona(s)" in result.output
+        assert repo.get_persona("p1")["occupation"] == "mathematician"
+
+    def test_skip_existing(self, repo, tmp_path):
+        """Test --skip-existing leaves known names untouched."""
+        _import(tmp_path, [{"id": "p1", "name": "Ada", "occupation": "engineer"}])
+
+        result = _import(
+            tmp_path,
+            [{"id": "p1", "name": "Ada", "occupation": "mathematician"}, {"name": "Grace"}],
+            "--skip-existing",
+        )
+
+        assert result.exit_code == 0
+        assert "Skipped 1 persona(s)" in result.output
+        assert repo.get_persona("p1")["occupation"] == "engineer"
+        assert repo.get_persona_by_name("Grace") is not None
+
+    def test_failures_reported_per_persona(self, repo, tmp_path):
+        """Test one conflicting persona fails without stopping the import."""
+        _import(tmp_path, [{"id": "p1", "name": "Ada"}])
+
+        result = _import(tmp_path, [
+            {"id": "p2", "name": "Ada"},
+            {"id": "p3", "name": "Grace"},
+        ])
+
+        assert result.exit_code == 0
+        assert "Failed to import 'Ada'" in result.output
+        assert "Imported 1 persona(s)" in result.output
+        assert repo.get_persona("p3")["name"] == "Grace"
@@ -0,0 +1,93 @@
+"""Tests for CLI startup cost and lazy command loading."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from agentworld.cli.app import LAZY_COMMANDS, app, load_command
+
+
+# Total import time allowed for `agentworld --help` (typically ~0.15s;
+# importing the command modules eagerly took over 3s)
+HELP_IMPORT_BUDGET_S = 1.0
+
+# Wall-clock checks flake on loaded machines; run them on request only
+TIMING_TESTS = os.environ.get("AGENTWORLD_TIMING_TESTS") == "1"
+
+# Modules that only commands doing real work should import
+HEAVY_MODULES = ("litellm", "fastapi", "sqlalchemy", "numpy", "agentworld.cli.commands")
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Top-level cumulative import times (us) of running the CLI with args."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "agentworld.cli.app", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+    """Tests for the cost of starting the CLI."""
+
+    @pytest.mark.skipif(not TIMING_TESTS, reason="set AGENTWORLD_TIMING_TESTS=1 to run timing checks")
+    def test_help_import_budget(self):
+        """Test --help stays within its import-time budget."""
+        times = _import_times("--help")
+
+        total = sum(times.values()) / 1_000_000
+        slowest = sorted(times.items(), key=lambda item: -item[1])[:5]
+        assert total < HELP_IMPORT_BUDGET_S, f"{total:.2f}s importing, slowest: {slowest}"
+
+    def test_help_skips_heavy_modules(self):
+        """Test --help imports no command modules, LLM or API stacks."""
+        times = _import_times("--help")
+
+        loaded = [name for name in times if name.startswith(HEAVY_MODULES)]
+        assert loaded == []
+
+
+class TestLazyCommands:
+    """Tests for commands registered by name."""
+
+    @pytest.mark.parametrize("name", list(LAZY_COMMANDS))
+    def test_short_help_matches_command(self, name):
+        """Test the help listed without importing matches the real command."""
+        command = load_command(name)
+
+        assert command.name == name
+        assert command.get_short_help_str(limit=200) == LAZY_COMMANDS[name][2]
+
+    def test_help_lists_all_commands(self):
+        """Test --help lists every command with its short help."""
+        result = CliRunner().invoke(app, ["--help"], terminal_width=200)
+
+        assert result.exit_code == 0
+        for name, (_, _, short_help) in LAZY_COMMANDS.items():
+            assert name in result.output
+            assert short_help in result.output
+
+    def test_invokes_loaded_command(self):
+        """Test commands and command groups run once resolved."""
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["list", "--help"])
+        assert result.exit_code == 0
+        assert "--limit" in result.output
+
+        result = runner.invoke(app, ["cfg", "path"])
+        assert result.exit_code == 0
+        assert "config" in result.output.lower()
@@ -0,0 +1,133 @@
+"""Tests for the in-core event bus."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from agentworld.agents.agent import Agent
+from agentworld.core.events import EventBus, EventType, SimulationEventEmitter, get_event_bus
+from agentworld.core.models import Message
+from agentworld.persistence.database import init_db
+from agentworld.personas.traits import TraitVector
+from agentworld.simulation.runner import Simulation
+
+
+@pytest.fixture
+def mock_db():
+    """Initialize in-memory database for tests."""
+    init_db(in_memory=True)
+
+
+class TestEventBus:
+    """Tests for EventBus."""
+
+    def test_publish_reaches_subscribers_in_order(self):
+        """Test subscribers receive each event in subscription order."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(lambda *event: received.append(("a", *event)))
+        bus.subscribe(lambda *event: received.append(("b", *event)))
+
+        bus.publish(EventType.STEP_STARTED, "sim-1", {"step": 1})
+
+        assert received == [
+            ("a", "step.started", "sim-1", {"step": 1}),
+            ("b", "step.started", "sim-1", {"step": 1}),
+        ]
+
+    def test_unsubscribe(self):
+        """Test the function returned by subscribe removes the subscriber."""
+        bus = EventBus()
+        received = []
+        unsubscribe = bus.subscribe(lambda *event: received.append(event))
+        assert bus.has_subscribers
+
+        unsubscribe()
+        bus.publish(EventType.STEP_STARTED)
+
+        assert received == []
+        assert not bus.has_subscribers
+
+    def test_failing_subscriber_isolated(self):
+        """Test a raising subscriber does not stop delivery to others."""
+        bus = EventBus()
+        received = []
+
+        def broken(*event):
+            raise ValueError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(lambda *event: received.append(event))
+
+        bus.publish(EventType.SIMULATION_ERROR, "sim-1", {"error": "x"})
+
+        assert len(received) == 1
+
+    def test_default_bus(self):
+        """Test emitters publish to the process-wide bus by default."""
+        assert SimulationEventEmitter("sim-1").bus is get_event_bus()
+
+
+class TestSimulationEventEmitter:
+    """Tests for SimulationEventEmitter."""
+
+    def test_no_payload_without_subscribers(self):
+        """Test nothing is built or published when nobody listens."""
+        emitter = SimulationEventEmitter("sim-1", EventBus())
+
+        with patch.object(emitter, "_emit") as emit:
+            emitter.step_started(1, 10)
+            emitter.agent_responded("a1", "Alice", "Hello")
+            emitter.message_created("m1", "a1", "Alice", content_preview="Hello")
+
+        emit.assert_not_called()
+
+    def test_previews_truncated(self):
+        """Test content previews are cut to 100 characters."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(lambda *event: received.append(event))
+        emitter = SimulationEventEmitter("sim-1", bus)
+
+        emitter.message_created("m1", "a1", "Alice", content_preview="x" * 500)
+
+        event_type, simulation_id, data = received[0]
+        assert (event_type, simulation_id) == (EventType.MESSAGE_CREATED, "sim-1")
+        assert data["content_preview"] == "x" * 100
+
+
+class TestSimulationEvents:
+    """Tests for events published by simulations."""
+
+    async def test_step_publishes_to_event_bus(self, mock_db):
+        """Test a step publishes its events to the simulation's bus."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(lambda *event: received.append(event))
+        agents = [Agent(name="Alice", traits=TraitVector()), Agent(name="Bob", traits=TraitVector())]
+        sim = Simulation(name="Test", agents=agents, initial_prompt="Remote work", event_bus=bus)
+
+        async def generate(agent, prompt, receiver_id=None, step=0, prefix=None):
+            return Message(sender_id=agent.id, receiver_id=receiver_id, content="Hello", step=step)
+
+        with patch.object(Agent, "generate_message", generate):
+            await sim.step()
+
+        types = [event_type for event_type, _, _ in received]
+        assert types[:2] == [EventType.SIMULATION_STARTED, EventType.STEP_STARTED]
+        assert types[-1] == EventType.STEP_COMPLETED
+        assert types.count(EventType.MESSAGE_CREATED) == 2
+        assert {simulation_id for _, simulation_id, _ in received} == {sim.id}
+
+    def test_headless_import_skips_web_stack(self):
+        """Test importing the simulation runner does not import FastAPI."""
+        code = (
+            "import sys, agentworld.simulation.runner; "
+            "print(sorted(m for m in ('fastapi', 'starlette') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
@@ -49,6 +49,32 @@ class TestEstimateCost:
         )
         assert cost > 0  # Should use default pricing
 
+    def test_cached_tokens_discounted(self):
+        """Test cached prompt tokens are billed at the cached rate."""
+        full = estimate_cost("gpt-4o", prompt_tokens=1_000_000, completion_tokens=0)
+        cached = estimate_cost(
+            "gpt-4o", prompt_tokens=1_000_000, completion_tokens=0, cached_tokens=1_000_000
+        )
+        assert full == pytest.approx(2.50)
+        assert cached == pytest.approx(1.25)
+
+    def test_cache_write_tokens(self):
+        """Test cache writes use the cache-write rate."""
+        cost = estimate_cost(
+            "anthropic/claude-3-5-sonnet",
+            prompt_tokens=2_000_000,
+            completion_tokens=0,
+            cached_tokens=500_000,
+            cache_write_tokens=500_000,
+        )
+        assert cost == pytest.approx(3.00 + 0.15 + 1.875)
+
+    def test_cached_tokens_without_cache_pricing(self):
+        """Test models without cache rates bill cached tokens as input."""
+        plain = estimate_cost("gpt-4", prompt_tokens=1000, completion_tokens=10)
+        cached = estimate_cost("gpt-4", prompt_tokens=1000, completion_tokens=10, cached_tokens=800)
+        assert cached == pytest.approx(plain)
+
 
 class TestGetPricing:
     """Tests for get_pricing function."""
@@ -3,7 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from agentworld.llm.provider import LLMProvider, get_provider
+from agentworld.llm.provider import LLMProvider, build_messages, get_provider
+from agentworld.llm.stub import StubCompletion
 from agentworld.core.models import LLMResponse
 
 
@@ -108,6 +109,107 @@ class TestLLMProvider:
             assert response.tokens_used == 50
 
 
+class TestPromptCaching:
+    """Tests for prompt prefix caching support."""
+
+    SYSTEM = "You are Alice, a thoughtful engineer. " * 20
+    TOPIC = "Topic: The future of remote work"
+
+    def test_build_messages_plain(self):
+        """Test the prefix leads the user message without hints."""
+        messages = build_messages("Say hi", system_prompt="System", prompt_prefix="Topic: X")
+
+        assert messages == [
+            {"role": "system", "content": "System"},
+            {"role": "user", "content": "Topic: X\n\nSay hi"},
+        ]
+
+    def test_build_messages_cache_control(self):
+        """Test stable parts become marked content blocks."""
+        messages = build_messages(
+            "Say hi", system_prompt="System", prompt_prefix="Topic: X", cache_control=True
+        )
+
+        assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        blocks = messages[1]["content"]
+        assert [b["text"] for b in blocks] == ["Topic: X", "Say hi"]
+        assert "cache_control" in blocks[0]
+        assert "cache_control" not in blocks[1]
+
+    @pytest.mark.asyncio
+    async def test_anthropic_requests_carry_hints(self):
+        """Test Claude models get cache_control hints and others do not."""
+        stub = StubCompletion()
+        with patch("agentworld.llm.provider.acompletion", new=stub):
+            provider = LLMProvider()
+            await provider.complete(
+                "Hi", model="anthropic/claude-3-haiku", system_prompt=self.SYSTEM,
+                prompt_prefix=self.TOPIC, use_cache=False,
+            )
+            await provider.complete(
+                "Hi", model="openai/gpt-4o-mini", system_prompt=self.SYSTEM,
+                prompt_prefix=self.TOPIC, use_cache=False,
+            )
+            await LLMProvider(prompt_caching=False).complete(
+                "Hi", model="anthropic/claude-3-haiku", system_prompt=self.SYSTEM, use_cache=False,
+            )
+
+        anthropic, openai, disabled = (call["messages"] for call in stub.calls)
+        assert isinstance(anthropic[0]["content"], list)
+        assert anthropic[1]["content"][0]["text"] == self.TOPIC
+        assert openai[1]["content"] == f"{self.TOPIC}\n\nHi"
+        assert disabled[0]["content"] == self.SYSTEM
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_recorded_and_priced(self):
+        """Test cached tokens from usage reach the record and the cost."""
+        stub = StubCompletion()
+        provider = LLMProvider(default_model="anthropic/claude-3-5-sonnet")
+        with patch("agentworld.llm.provider.acompletion", new=stub):
+            first = await provider.complete(
+                "Turn 1", system_prompt=self.SYSTEM, prompt_prefix=self.TOPIC, use_cache=False
+            )
+            second = await provider.complete(
+                "Turn 2", system_prompt=self.SYSTEM, prompt_prefix=self.TOPIC, use_cache=False
+            )
+
+        first_record, second_record = provider.call_history
+        assert first_record.cached_tokens == 0
+        assert first_record.cache_write_tokens > 0
+        assert second_record.cached_tokens == first_record.cache_write_tokens
+        assert second_record.cache_write_tokens == 0
+        assert second_record.to_dict()["cached_tokens"] == second.cached_tokens
+        assert second.cached_tokens > 0
+        assert second.cost < first.cost
+
+    @pytest.mark.asyncio
+    async def test_automatic_caching_counts_system_prompt(self):
+        """Test providers without hints report the shared system prompt as cached."""
+        stub = StubCompletion()
+        provider = LLMProvider()
+        with patch("agentworld.llm.provider.acompletion", new=stub):
+            await provider.complete("Turn 1", system_prompt=self.SYSTEM, use_cache=False)
+            response = await provider.complete("Turn 2", system_prompt=self.SYSTEM, use_cache=False)
+
+        record = provider.call_history[-1]
+        assert response.cached_tokens == record.cached_tokens > 0
+        assert record.cache_write_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_response_cache_keeps_cached_tokens(self):
+        """Test L1 cache hits return the recorded cached token count."""
+        stub = StubCompletion()
+        provider = LLMProvider()
+        with patch("agentworld.llm.provider.acompletion", new=stub):
+            await provider.complete("Warm", system_prompt=self.SYSTEM)
+            first = await provider.complete("Again", system_prompt=self.SYSTEM)
+            repeat = await provider.complete("Again", system_prompt=self.SYSTEM)
+
+        assert repeat.cached
+        assert repeat.cached_tokens == first.cached_tokens
+        assert len(stub.calls) == 2
+
+
 class TestGetProvider:
     """Tests for get_provider function."""
 
@@ -4,6 +4,7 @@ import pytest
 from agentworld.llm.templates import (
     PromptTemplate,
     TemplateRegistry,
+    render_many,
     render_template,
     get_registry,
 )
@@ -100,6 +101,83 @@ class TestTemplateRegistry:
         assert registry.get("agent_respond") is not None
 
 
+class TestCompiledTemplates:
+    """Tests for template precompilation and batch rendering."""
+
+    @pytest.fixture
+    def template_dir(self, tmp_path):
+        """Directory with two file templates."""
+        directory = tmp_path / "templates"
+        directory.mkdir()
+        (directory / "greet.jinja2").write_text("Hello, {{ name }}!")
+        (directory / "bye.jinja2").write_text("Bye, {{ name }}.")
+        return directory
+
+    def test_string_templates_compiled_once(self):
+        """Test templates with the same source share one compiled template."""
+        first = PromptTemplate("Shared {{ x }}")
+        second = PromptTemplate("Shared {{ x }}")
+
+        assert first.template is second.template
+
+    def test_render_many(self):
+        """Test batch rendering over lists of variables."""
+        template = PromptTemplate("{{ a }}-{{ b }}")
+
+        assert template.render_many([{"a": 1, "b": 2}, {"a": 3, "b": 4}]) == ["1-2", "3-4"]
+        assert render_many("agent_respond", [{"sender": "Bob", "message": "Hi", "name": "Al"}])[0].startswith(
+            "You received a message from Bob"
+        )
+
+    def test_render_many_missing_raises(self):
+        """Test batch rendering an unknown template raises KeyError."""
+        with pytest.raises(KeyError):
+            TemplateRegistry().render_many("definitely_not_a_template", [{}])
+
+    def test_precompile_writes_bytecode_cache(self, template_dir, tmp_path):
+        """Test precompiling loads file templates and caches their bytecode."""
+        cache_dir = tmp_path / "cache"
+        registry = TemplateRegistry(template_dir, cache_dir=cache_dir, precompile=True)
+
+        assert {"greet", "bye", "agent_system"} <= set(registry.precompile())
+        assert len(list(cache_dir.iterdir())) == 2
+
+        # A second registry (e.g. another worker) loads the cached bytecode
+        other = TemplateRegistry(template_dir, cache_dir=cache_dir)
+        assert other.render_many("greet", [{"name": "A"}, {"name": "B"}]) == ["Hello, A!", "Hello, B!"]
+
+    def test_auto_reload_off_in_production(self, template_dir, tmp_path, monkeypatch):
+        """Test production mode turns off template reloading."""
+        monkeypatch.setenv("AGENTWORLD_ENV", "production")
+        assert TemplateRegistry(template_dir, cache_dir=tmp_path)._env.auto_reload is False
+
+        monkeypatch.delenv("AGENTWORLD_ENV")
+        assert TemplateRegistry(template_dir, cache_dir=tmp_path)._env.auto_reload is True
+        assert TemplateRegistry(template_dir, cache_dir=tmp_path, auto_reload=False)._env.auto_reload is False
+
+    def test_unwritable_cache_dir_disables_bytecode_cache(self, template_dir, tmp_path):
+        """Test a cache directory that cannot be created is skipped."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        registry = TemplateRegistry(template_dir, cache_dir=blocker / "cache")
+
+        assert registry._env.bytecode_cache is None
+        assert registry.get("greet").render(name="A") == "Hello, A!"
+
+    def test_syntax_errors(self):
+        """Test malformed templates fail on first use, or at once when precompiling."""
+        from jinja2 import TemplateSyntaxError
+
+        template = PromptTemplate("{{ bad")
+        with pytest.raises(TemplateSyntaxError):
+            template.render()
+        with pytest.raises(TemplateSyntaxError):
+            PromptTemplate("{{ bad", precompile=True)
+        with pytest.raises(TemplateSyntaxError):
+            TemplateRegistry(precompile=True).register("bad", PromptTemplate("{{ bad"))
+
+
 class TestRenderTemplate:
     """Tests for render_template function."""
 
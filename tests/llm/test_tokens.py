@@ -1,7 +1,15 @@
 """Tests for token counting."""
 
 import pytest
-from agentworld.llm.tokens import count_tokens, count_message_tokens
+from agentworld.llm import tokens
+from agentworld.llm.tokens import (
+    TokenCache,
+    approximate_tokens,
+    count_message_tokens,
+    count_tokens,
+    count_tokens_batch,
+    get_token_cache,
+)
 
 
 class TestCountTokens:
@@ -81,3 +89,84 @@ class TestCountMessageTokens:
 
         # Message count should include overhead
         assert message_count > raw_count
+
+    def test_content_blocks(self):
+        """Test list-of-blocks content counts like the joined text."""
+        plain = count_message_tokens([{"role": "user", "content": "Topic: X\n\nSay hi"}])
+        blocks = count_message_tokens([{
+            "role": "user",
+            "content": [{"type": "text", "text": "Topic: X\n\n"}, {"type": "text", "text": "Say hi"}],
+        }])
+        assert blocks == plain
+
+
+class TestTokenCache:
+    """Tests for cached and batch token counting."""
+
+    TEXTS = [f"Message {i}: the team discussed remote work policies." for i in range(40)]
+
+    def test_repeat_counts_hit_cache(self):
+        """Test counting the same text twice encodes it once."""
+        cache = get_token_cache()
+        text = "A sentence that is only counted in this test."
+        count_tokens(text)
+        hits = cache.stats["hits"]
+
+        assert count_tokens(text) == count_tokens(text)
+        assert cache.stats["hits"] == hits + 2
+
+    def test_batch_matches_single(self):
+        """Test batch counts equal per-text counts, duplicates included."""
+        texts = self.TEXTS + ["", self.TEXTS[0]]
+        expected = [count_tokens(text) for text in texts]
+        get_token_cache().clear()
+
+        assert count_tokens_batch(texts) == expected
+        assert count_tokens_batch(texts) == expected
+
+    def test_parallel_batch(self, monkeypatch):
+        """Test large batches split across threads give the same counts."""
+        expected = [count_tokens(text) for text in self.TEXTS]
+        get_token_cache().clear()
+        monkeypatch.setattr(tokens, "PARALLEL_BATCH_MIN", 4)
+        monkeypatch.setattr(tokens.os, "cpu_count", lambda: 4)
+
+        assert count_tokens_batch(self.TEXTS) == expected
+
+    def test_generational_eviction(self):
+        """Test recently used counts survive eviction and stale ones do not."""
+        cache = TokenCache(max_size=4)
+        cache.set(("e", 1, 1), 1)
+        cache.set(("e", 1, 2), 2)  # young generation full, becomes old
+        cache.get(("e", 1, 1))  # promoted back to young
+        cache.set(("e", 1, 3), 3)  # young full again; key 2 dropped
+
+        assert cache.get(("e", 1, 1)) == 1
+        assert cache.get(("e", 1, 2)) is None
+        assert cache.size <= 4
+
+
+class TestApproximateTokens:
+    """Tests for approximate token counting."""
+
+    def test_close_to_exact(self):
+        """Test the estimate is near the exact count for prose."""
+        text = (
+            "Remote work changed how teams communicate. Some people enjoy the "
+            "flexibility, while others miss the energy of a shared office. "
+        ) * 10
+        exact = count_tokens(text)
+
+        assert approximate_tokens(text) == pytest.approx(exact, rel=0.25)
+        assert count_tokens(text, approximate=True) == approximate_tokens(text)
+
+    def test_edge_cases(self):
+        """Test empty and non-ASCII text."""
+        assert approximate_tokens("") == 0
+        assert approximate_tokens("a") == 1
+        assert approximate_tokens("日本語のテキスト") > approximate_tokens("abcdefgh")
+
+    def test_batch(self):
+        """Test approximate batch counts match single estimates."""
+        texts = ["", "Hi", "Ünïcödé text"]
+        assert count_tokens_batch(texts, approximate=True) == [approximate_tokens(t) for t in texts]
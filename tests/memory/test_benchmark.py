@@ -0,0 +1,117 @@
+"""Tests for memory benchmarks."""
+
+import numpy as np
+import pytest
+
+from agentworld.memory.benchmark import (
+    DEFAULT_BASELINE,
+    BenchmarkResult,
+    compare_to_baseline,
+    load_baseline,
+    measure_peak_memory_mb,
+    run_memory_benchmarks,
+    save_baseline,
+    synthetic_corpus,
+)
+from agentworld.memory.embeddings import EmbeddingConfig, EmbeddingGenerator
+
+
+class TestDeterministicEmbeddings:
+    """Tests for the deterministic embedding provider."""
+
+    @pytest.mark.asyncio
+    async def test_same_text_same_embedding(self):
+        """Test embeddings are reproducible across generators."""
+        config = EmbeddingConfig(provider="deterministic", dimensions=16)
+        a = await EmbeddingGenerator(config).embed("hello")
+        b = await EmbeddingGenerator(config).embed("hello")
+        c = await EmbeddingGenerator(config).embed("world")
+
+        np.testing.assert_array_equal(a, b)
+        assert not np.array_equal(a, c)
+        assert a.shape == (16,)
+        assert abs(np.linalg.norm(a) - 1.0) < 1e-5
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single(self):
+        """Test embed_batch agrees with embed."""
+        config = EmbeddingConfig(provider="deterministic", dimensions=8)
+        batch = await EmbeddingGenerator(config).embed_batch(["x", "y"])
+        single = await EmbeddingGenerator(config).embed("y")
+        np.testing.assert_array_equal(batch[1], single)
+
+
+class TestBenchmarks:
+    """Tests for benchmark running and baseline comparison."""
+
+    def test_synthetic_corpus_is_seeded(self):
+        """Test corpus generation is deterministic."""
+        assert synthetic_corpus(20, seed=3) == synthetic_corpus(20, seed=3)
+        assert len(synthetic_corpus(20)) == 20
+
+    def test_run_all_benchmarks(self):
+        """Test every benchmark runs on a small corpus."""
+        results = run_memory_benchmarks([50], dimensions=8)
+
+        assert {r.name for r in results} == {
+            "add_observation", "retrieve", "maybe_prune", "generate_reflections"
+        }
+        assert all(r.ops_per_sec > 0 for r in results)
+
+    def test_memory_measured_per_case(self):
+        """Test peak memory reflects each case, not the process high-water mark."""
+        large, small = run_memory_benchmarks(
+            [2000, 50], dimensions=64, names=["retrieve"], measure_memory=True
+        )
+
+        assert large.peak_memory_mb > small.peak_memory_mb > 0
+
+    def test_memory_not_measured_by_default(self):
+        """Test memory is only traced on request."""
+        results = run_memory_benchmarks([20], dimensions=8, names=["retrieve"])
+
+        assert results[0].peak_memory_mb is None
+
+    def test_measure_peak_memory_stops_tracing(self):
+        """Test tracemalloc is switched off after measuring."""
+        import tracemalloc
+
+        from agentworld.memory.benchmark import bench_retrieve
+
+        assert measure_peak_memory_mb(bench_retrieve, 20, 8) > 0
+        assert not tracemalloc.is_tracing()
+
+    def test_committed_baseline(self):
+        """Test the committed baseline covers every benchmark and default size."""
+        baseline = load_baseline(DEFAULT_BASELINE)
+
+        for name in ("add_observation", "retrieve", "maybe_prune", "generate_reflections"):
+            for size in (1000, 10000, 100000):
+                assert baseline[f"{name}@{size}"] > 0
+
+    def test_unknown_benchmark(self):
+        """Test unknown benchmark names are rejected."""
+        with pytest.raises(ValueError):
+            run_memory_benchmarks([10], names=["nope"])
+
+    def test_baseline_round_trip(self, tmp_path):
+        """Test saving and loading baselines."""
+        results = [BenchmarkResult("retrieve", 100, 10, 0.5)]
+        path = tmp_path / "baseline.json"
+        save_baseline(results, path)
+
+        assert load_baseline(path) == {"retrieve@100": 20.0}
+
+    def test_compare_to_baseline(self):
+        """Test regressions are flagged beyond the tolerance only."""
+        results = [
+            BenchmarkResult("retrieve", 100, 10, 1.0),
+            BenchmarkResult("maybe_prune", 100, 10, 1.0),
+            BenchmarkResult("add_observation", 100, 10, 1.0),
+        ]
+        baseline = {"retrieve@100": 11.0, "maybe_prune@100": 20.0}
+
+        regressions = compare_to_baseline(results, baseline, tolerance=0.2)
+
+        assert [r.key for r in regressions] == ["maybe_prune@100"]
+        assert regressions[0].slowdown == pytest.approx(0.5)
@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
+import numpy as np
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 from agentworld.memory.base import Memory, MemoryConfig
 from agentworld.memory.observation import Observation
@@ -136,6 +138,123 @@ class TestMemory:
         assert len(memory.reflections) == 0
 
 
+class TestReflectionGeneration:
+    """Tests for Memory.generate_reflections."""
+
+    def _memory(self, responses, **reflection_options):
+        """Create a memory with a stubbed LLM returning responses in order."""
+        llm = MagicMock()
+        llm.complete = AsyncMock(
+            side_effect=[MagicMock(content=r) for r in responses]
+        )
+        config = MemoryConfig(
+            reflection_config=ReflectionConfig(
+                threshold=1000.0, questions_per_reflection=2, **reflection_options
+            ),
+        )
+        memory = Memory(config=config, llm_provider=llm)
+        memory._embeddings.embed = AsyncMock(return_value=np.array([0.1, 0.2, 0.3]))
+        memory._embeddings.embed_batch = AsyncMock(
+            side_effect=lambda texts: [np.array([0.1, 0.2, 0.3]) for _ in texts]
+        )
+        return memory, llm
+
+    @pytest.mark.asyncio
+    async def test_concurrent_synthesis(self):
+        """Test one synthesis call per question, in question order."""
+        memory, llm = self._memory(
+            ["What does Alice like?\nWhat does Bob like?", "Alice likes coffee", "Bob likes tea"]
+        )
+        await memory.add_observation("Alice drinks coffee", importance=5.0)
+
+        reflections = await memory.generate_reflections()
+
+        assert [r.content for r in reflections] == ["Alice likes coffee", "Bob likes tea"]
+        assert reflections[0].questions_addressed == ["What does Alice like?"]
+        assert llm.complete.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_synthesis(self):
+        """Test all questions answered in one synthesis call."""
+        memory, llm = self._memory(
+            ["What does Alice like?\nWhat does Bob like?", "1. Alice likes coffee\n2. Bob likes tea"],
+            batch_synthesis=True,
+        )
+        await memory.add_observation("Alice drinks coffee", importance=5.0)
+
+        reflections = await memory.generate_reflections()
+
+        assert [r.content for r in reflections] == ["Alice likes coffee", "Bob likes tea"]
+        assert reflections[1].questions_addressed == ["What does Bob like?"]
+        assert llm.complete.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_synthesis_skips_missing_answers(self):
+        """Test unanswered questions produce no reflection."""
+        memory, _ = self._memory(
+            ["Q1?\nQ2?", "2. Only the second"],
+            batch_synthesis=True,
+        )
+        await memory.add_observation("Something happened", importance=5.0)
+
+        reflections = await memory.generate_reflections()
+
+        assert [r.questions_addressed for r in reflections] == [["Q2?"]]
+
+    @pytest.mark.asyncio
+    async def test_background_reflection(self):
+        """Test background reflection does not block the observation."""
+        memory, _ = self._memory(
+            ["Q1?\nQ2?", "Insight one", "Insight two"],
+            background=True,
+        )
+        memory.config.reflection_config.threshold = 5.0
+
+        await memory.add_observation("Something important", importance=6.0)
+        assert memory._reflection_task is not None
+
+        reflections = await memory.wait_for_reflections()
+        assert len(reflections) == 2
+        assert len(memory.reflections) == 2
+        assert await memory.wait_for_reflections() == []
+
+    @pytest.mark.asyncio
+    async def test_background_reflection_keeps_new_importance(self):
+        """Test importance added while a background run is in flight survives it."""
+        memory, llm = self._memory(["Q1?", "Insight one"], background=True)
+        memory.config.reflection_config.threshold = 5.0
+        gate = asyncio.Event()
+        responses = iter(["Q1?", "Insight one"])
+
+        async def complete(*args, **kwargs):
+            await gate.wait()
+            return MagicMock(content=next(responses))
+
+        llm.complete = AsyncMock(side_effect=complete)
+
+        await memory.add_observation("Something important", importance=6.0)
+        await asyncio.sleep(0)  # the run starts and waits on the LLM
+        await memory.add_observation("Something else", importance=3.0)
+        gate.set()
+        await memory.wait_for_reflections()
+
+        assert memory._importance_accumulator == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_background_reflection_failure_logged(self, caplog):
+        """Test a failing background run is logged, not left unretrieved."""
+        memory, _ = self._memory([], background=True)
+        memory.config.reflection_config.threshold = 5.0
+        memory._generate_questions = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with caplog.at_level("ERROR", logger="agentworld.memory.base"):
+            await memory.add_observation("Something important", importance=6.0)
+            with pytest.raises(RuntimeError):
+                await memory.wait_for_reflections()
+
+        assert "Background reflection failed" in caplog.text
+
+
 class TestRetrievalConfig:
     """Tests for RetrievalConfig class."""
 
@@ -0,0 +1,141 @@
+"""Tests for retention index and memory pruning."""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from agentworld.memory.base import Memory, MemoryConfig, RetentionPolicy
+from agentworld.memory.observation import Observation
+from agentworld.memory.retention import RetentionIndex
+
+
+def _score(obs: Observation, now: datetime) -> float:
+    hours = (now - obs.timestamp).total_seconds() / 3600.0
+    return (obs.importance - 1.0) / 9.0 * 0.7 + np.exp(-hours / 24.0) * 0.3
+
+
+class TestRetentionIndex:
+    """Tests for RetentionIndex."""
+
+    def test_evicts_lowest_scores(self):
+        """Test eviction order matches a full sort by score."""
+        now = datetime.now()
+        rng = np.random.default_rng(7)
+        observations = [
+            Observation(
+                content=f"obs {i}",
+                importance=float(rng.integers(1, 11)),
+                timestamp=now - timedelta(hours=float(rng.uniform(0, 200))),
+            )
+            for i in range(200)
+        ]
+        index = RetentionIndex(_score)
+        for obs in observations:
+            index.add(obs)
+
+        evicted = index.evict(50, now)
+
+        expected = sorted(observations, key=lambda o: _score(o, now))[:50]
+        assert {o.id for o in evicted} == {o.id for o in expected}
+        assert len(index) == 150
+
+    def test_single_bucket_evicts_oldest(self):
+        """Test recency-only index evicts by timestamp."""
+        now = datetime.now()
+        observations = [
+            Observation(content=f"obs {i}", timestamp=now - timedelta(hours=i))
+            for i in range(10)
+        ]
+        index = RetentionIndex(lambda o, t: o.timestamp.timestamp(), bucket_by_importance=False)
+        for obs in observations:
+            index.add(obs)
+
+        evicted = index.evict(3, now)
+        assert [o.content for o in evicted] == ["obs 9", "obs 8", "obs 7"]
+
+    def test_evict_more_than_size(self):
+        """Test evicting more than indexed empties the index."""
+        index = RetentionIndex(_score)
+        index.add(Observation(content="only"))
+        assert len(index.evict(5)) == 1
+        assert len(index) == 0
+        assert index.evict(1) == []
+
+    def test_clear(self):
+        """Test clearing the index."""
+        index = RetentionIndex(_score)
+        index.add(Observation(content="a"))
+        index.clear()
+        assert len(index) == 0
+
+
+class TestRetentionPolicy:
+    """Tests for RetentionPolicy hysteresis."""
+
+    def test_prune_target(self):
+        """Test low-water mark target."""
+        policy = RetentionPolicy(max_observations=100, low_water_mark=0.8)
+        assert policy.prune_target() == 80
+
+    def test_prune_target_clamped(self):
+        """Test low-water mark is clamped to [0, 1]."""
+        policy = RetentionPolicy(max_observations=100, low_water_mark=1.5)
+        assert policy.prune_target() == 100
+
+
+class TestMemoryPruning:
+    """Tests for Memory pruning with the retention index."""
+
+    def _memory(self, strategy: str) -> Memory:
+        config = MemoryConfig(
+            retention_policy=RetentionPolicy(
+                max_observations=20,
+                low_water_mark=0.5,
+                prune_strategy=strategy,
+            ),
+        )
+        config.reflection_config.enabled = False
+        memory = Memory(config=config)
+        memory._embeddings.embed = AsyncMock(return_value=np.array([0.1, 0.2, 0.3]))
+        return memory
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["importance_weighted", "fifo", "recency"])
+    async def test_prunes_to_low_water_mark(self, strategy):
+        """Test pruning drops to the low-water mark and then waits."""
+        memory = self._memory(strategy)
+
+        for i in range(20):
+            await memory.add_observation(f"obs {i}", importance=5.0)
+        assert len(memory.observations) == 20
+
+        await memory.add_observation("obs 20", importance=5.0)
+        assert len(memory.observations) == 10
+
+        for i in range(21, 31):
+            await memory.add_observation(f"obs {i}", importance=5.0)
+        assert len(memory.observations) == 20
+
+    @pytest.mark.asyncio
+    async def test_importance_weighted_keeps_important(self):
+        """Test important memories survive and order is preserved."""
+        memory = self._memory("importance_weighted")
+
+        for i in range(21):
+            importance = 10.0 if i % 3 == 0 else 1.0
+            await memory.add_observation(f"obs {i}", importance=importance)
+
+        kept = memory.observations
+        assert len(kept) == 10
+        assert all(o.importance == 10.0 for o in kept if o.content in {"obs 0", "obs 3"})
+        assert sum(1 for o in kept if o.importance == 10.0) == 7
+        assert [o.timestamp for o in kept] == sorted(o.timestamp for o in kept)
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_index(self):
+        """Test clear empties the retention index."""
+        memory = self._memory("importance_weighted")
+        await memory.add_observation("obs", importance=5.0)
+        memory.clear()
+        assert len(memory._retention) == 0
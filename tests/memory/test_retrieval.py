@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 from agentworld.memory.retrieval import MemoryRetrieval, RetrievalConfig
 from agentworld.memory.observation import Observation
 from agentworld.memory.reflection import Reflection
+from agentworld.memory.clock import StepClock, WallClock
 
 
 class TestRetrievalConfig:
@@ -224,3 +225,95 @@ class TestRetrievalWithReflections:
         # Should contain both types
         types = {type(m).__name__ for m in result}
         assert "Observation" in types or "Reflection" in types
+
+
+class TestRecencyCache:
+    """Tests for bucketed recency caching."""
+
+    @pytest.fixture
+    def memories(self):
+        """Create memories at different ages."""
+        now = datetime.now()
+        return [
+            Observation(content=f"obs {h}", timestamp=now - timedelta(hours=h))
+            for h in (1, 5, 24)
+        ]
+
+    def test_matches_exact_recency_without_bucketing(self, memories):
+        """Test cached scores equal _compute_recency when bucketing is off."""
+        retrieval = MemoryRetrieval(
+            RetrievalConfig(recency_bucket_seconds=0), embedding_generator=MagicMock()
+        )
+        now = datetime.now()
+
+        scores = retrieval.recency_scores(memories, now)
+
+        assert scores == [retrieval._compute_recency(m, now) for m in memories]
+
+    def test_reused_within_bucket(self, memories):
+        """Test repeated queries in a bucket skip recomputation."""
+        retrieval = MemoryRetrieval(
+            RetrievalConfig(recency_bucket_seconds=3600), embedding_generator=MagicMock()
+        )
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        for m, h in zip(memories, (1, 5, 24)):
+            m.timestamp = now - timedelta(hours=h)
+
+        first = retrieval.recency_scores(memories, now)
+        retrieval._recency_cache[memories[0].id] = -1.0
+        second = retrieval.recency_scores(memories, now + timedelta(minutes=10))
+
+        assert second[0] == -1.0
+        assert second[1:] == first[1:]
+
+    def test_invalidated_when_clock_advances(self, memories):
+        """Test moving to a new bucket recomputes recency."""
+        retrieval = MemoryRetrieval(
+            RetrievalConfig(recency_bucket_seconds=60), embedding_generator=MagicMock()
+        )
+        now = datetime.now()
+
+        first = retrieval.recency_scores(memories, now)
+        later = retrieval.recency_scores(memories, now + timedelta(hours=2))
+
+        assert all(b < a for a, b in zip(first, later))
+
+    def test_invalidated_when_decay_changes(self, memories):
+        """Test changing the half-life drops cached factors."""
+        retrieval = MemoryRetrieval(embedding_generator=MagicMock())
+        now = datetime.now()
+
+        first = retrieval.recency_scores(memories, now)
+        retrieval.config.recency_decay_hours = 1.0
+        second = retrieval.recency_scores(memories, now)
+
+        assert second[2] < first[2]
+
+    def test_wall_clock_bucket_reference(self):
+        """Test wall clock references the end of the window."""
+        clock = WallClock(bucket_seconds=60)
+        t = datetime(2024, 1, 1, 12, 0, 30)
+
+        key, reference = clock.bucket(t)
+
+        assert clock.bucket(t + timedelta(seconds=20))[0] == key
+        assert reference == datetime(2024, 1, 1, 12, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_step_clock(self):
+        """Test step clock drives default query time and recency."""
+        start = datetime(2024, 1, 1)
+        clock = StepClock(start=start, step_duration_hours=24.0)
+        mock_embeddings = MagicMock()
+        mock_embeddings.embed = AsyncMock(return_value=np.array([0.1, 0.2, 0.3]))
+        retrieval = MemoryRetrieval(embedding_generator=mock_embeddings, clock=clock)
+        memory = Observation(content="step 0", timestamp=clock.now())
+
+        assert retrieval.recency_scores([memory], clock.now()) == [1.0]
+
+        clock.advance()
+        assert clock.now() == start + timedelta(days=1)
+        assert retrieval.recency_scores([memory], clock.now())[0] == pytest.approx(0.5)
+
+        result = await retrieval.retrieve("query", [memory], k=1)
+        assert result == [memory]
@@ -0,0 +1,176 @@
+"""Tests for persistent memory storage."""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from agentworld.memory.base import Memory, MemoryConfig, RetentionPolicy
+from agentworld.memory.observation import Observation
+from agentworld.memory.reflection import Reflection
+from agentworld.memory.store import MemoryStore
+
+
+@pytest.fixture
+def agent_repo(repository):
+    """Repository with a simulation and agent to own memories."""
+    repository.save_simulation({"id": "sim", "name": "Test", "status": "pending"})
+    repository.save_agent({"id": "a1", "simulation_id": "sim", "name": "A"})
+    return repository
+
+
+def _memory(store: MemoryStore) -> Memory:
+    config = MemoryConfig()
+    config.reflection_config.enabled = False
+    memory = Memory(config=config, store=store)
+    memory._embeddings.embed = AsyncMock(
+        side_effect=lambda text: np.full(4, len(text), dtype=np.float32)
+    )
+    return memory
+
+
+class TestMemoryStore:
+    """Tests for MemoryStore."""
+
+    def test_batched_flush(self, agent_repo):
+        """Test writes are buffered until the batch fills."""
+        store = MemoryStore("a1", agent_repo, batch_size=3)
+        store.add(Observation(content="one"))
+        store.add(Observation(content="two"))
+        assert store.pending_count == 2
+        assert agent_repo.count_memories("a1") == 0
+
+        store.add(Observation(content="three"))
+        assert store.pending_count == 0
+        assert agent_repo.count_memories("a1") == 3
+
+    def test_round_trip(self, agent_repo):
+        """Test observations and reflections survive a save and load."""
+        store = MemoryStore("a1", agent_repo)
+        timestamp = datetime.now() - timedelta(hours=2)
+        obs = Observation(
+            content="Saw Bob",
+            timestamp=timestamp,
+            importance=6.0,
+            embedding=np.array([1.0, 2.0, 3.0], dtype=np.float32),
+            embedding_model="test-model",
+            source="bob",
+            location="cafe",
+        )
+        ref = Reflection(
+            content="Bob is friendly",
+            embedding=np.array([4.0, 5.0, 6.0], dtype=np.float32),
+            source_memories=[obs.id],
+            questions_addressed=["Who is Bob?"],
+        )
+        store.add(obs)
+        store.add(ref)
+        assert store.flush() == 2
+
+        observations, reflections = MemoryStore("a1", agent_repo).load()
+
+        assert len(observations) == 1
+        loaded = observations[0]
+        assert loaded.id == obs.id
+        assert loaded.source == "bob"
+        assert loaded.location == "cafe"
+        assert loaded.importance == 6.0
+        assert abs((loaded.timestamp - timestamp).total_seconds()) < 1
+        np.testing.assert_array_equal(loaded.embedding, obs.embedding)
+        assert reflections[0].source_memories == [obs.id]
+        assert reflections[0].questions_addressed == ["Who is Bob?"]
+
+    def test_load_decodes_single_matrix(self, agent_repo):
+        """Test embeddings are views into one decoded matrix."""
+        store = MemoryStore("a1", agent_repo)
+        for i in range(5):
+            store.add(Observation(
+                content=f"obs {i}",
+                embedding=np.full(8, i, dtype=np.float32),
+            ))
+        store.flush()
+
+        observations, _ = store.load()
+
+        assert store.embedding_matrix.shape == (5, 8)
+        for i, obs in enumerate(observations):
+            assert obs.embedding.base is not None
+            assert obs.embedding[0] == i
+
+    def test_clear(self, agent_repo):
+        """Test clear deletes stored and pending memories."""
+        store = MemoryStore("a1", agent_repo)
+        store.add(Observation(content="stored"))
+        store.flush()
+        store.add(Observation(content="pending"))
+
+        assert store.clear() == 1
+        assert store.pending_count == 0
+        assert store.load() == ([], [])
+
+    def test_delete(self, agent_repo):
+        """Test delete removes stored and pending memories by ID."""
+        store = MemoryStore("a1", agent_repo)
+        stored = [Observation(content=f"stored {i}") for i in range(3)]
+        for obs in stored:
+            store.add(obs)
+        store.flush()
+        pending = Observation(content="pending")
+        store.add(pending)
+
+        assert store.delete([stored[0].id, stored[2].id, pending.id]) == 2
+        assert store.pending_count == 0
+        assert [o.content for o in store.load()[0]] == ["stored 1"]
+
+
+class TestPersistentMemory:
+    """Tests for Memory with a persistent backend."""
+
+    @pytest.mark.asyncio
+    async def test_memories_survive_rebuild(self, agent_repo):
+        """Test a rebuilt Memory sees previously flushed memories."""
+        memory = _memory(MemoryStore("a1", agent_repo))
+        await memory.add_observation("Alice likes coffee", importance=5.0)
+        await memory.add_observation("Bob prefers tea", importance=5.0)
+        memory.flush()
+
+        rebuilt = _memory(MemoryStore("a1", agent_repo))
+        assert [o.content for o in rebuilt.observations] == [
+            "Alice likes coffee", "Bob prefers tea"
+        ]
+
+        results = await rebuilt.retrieve("coffee", k=1)
+        assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_lazy_load_keeps_order(self, agent_repo):
+        """Test stored memories come before ones added before loading."""
+        memory = _memory(MemoryStore("a1", agent_repo))
+        await memory.add_observation("first", importance=5.0)
+        memory.flush()
+
+        rebuilt = _memory(MemoryStore("a1", agent_repo))
+        assert not rebuilt._loaded
+        await rebuilt.add_observation("second", importance=5.0)
+
+        assert [o.content for o in rebuilt.observations] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["importance_weighted", "fifo"])
+    async def test_pruned_memories_deleted(self, agent_repo, strategy):
+        """Test pruned observations do not come back after a reload."""
+        store = MemoryStore("a1", agent_repo, batch_size=5)
+        memory = _memory(store)
+        memory.config.retention_policy = RetentionPolicy(
+            max_observations=20, low_water_mark=0.5, prune_strategy=strategy
+        )
+        for i in range(21):
+            await memory.add_observation(f"obs {i}", importance=5.0)
+        memory.flush()
+        kept = {o.id for o in memory.observations}
+        assert len(kept) == 10
+
+        rebuilt = _memory(MemoryStore("a1", agent_repo))
+
+        assert {o.id for o in rebuilt.observations} == kept
+        assert agent_repo.count_memories("a1") == 10
@@ -1,9 +1,11 @@
 """Tests for Persona Library functionality (Phase 4)."""
 
 import pytest
+import sqlite3
 import uuid
 from agentworld.persistence.database import init_db
 from agentworld.persistence.repository import Repository
+from agentworld.persistence.search import TraitRange, parse_trait_ranges
 
 
 @pytest.fixture
@@ -111,6 +113,25 @@ class TestPersonaMethods:
         assert len(results) >= 1
         assert any("Alice" in p["name"] for p in results)
 
+    def test_get_persona_prompt(self, repo):
+        """Test the prompt is persisted on first use and rebuilt after edits."""
+        persona_id = str(uuid.uuid4())
+        repo.save_persona({
+            "id": persona_id,
+            "name": "Prompted",
+            "background": "Sails boats",
+            "traits": {"openness": 0.9},
+        })
+
+        prompt = repo.get_persona_prompt(persona_id)
+        stored = repo.get_persona(persona_id)
+        assert "Sails boats" in prompt
+        assert stored["prompt_preview"] == prompt
+
+        repo.save_persona({**stored, "background": "Flies kites"})
+        assert "Flies kites" in repo.get_persona_prompt(persona_id)
+        assert repo.get_persona_prompt("missing") is None
+
     def test_increment_persona_usage(self, repo):
         """Test incrementing persona usage count."""
         persona_id = str(uuid.uuid4())
@@ -356,3 +377,251 @@ class TestPopulationTemplateMethods:
 
         result = repo.get_population_template(template_id)
         assert result["usage_count"] == 2
+
+
+class TestBulkPersonaImport:
+    """Tests for batched persona imports."""
+
+    def test_save_personas_bulk(self, repo):
+        """Test personas are inserted across several batches."""
+        personas = [{"name": f"Bulk {i}", "traits": {"openness": 0.5}, "age": 30} for i in range(25)]
+
+        inserted, skipped = repo.save_personas_bulk(personas, batch_size=10)
+
+        assert (inserted, skipped) == (25, 0)
+        result = repo.get_persona_by_name("Bulk 7")
+        assert result["traits"] == {"openness": 0.5}
+        assert result["age"] == 30
+
+    def test_resume_skips_existing_names(self, repo):
+        """Test re-running an interrupted import only writes the rest."""
+        personas = [{"name": f"Resume {i}", "traits": {}} for i in range(20)]
+        repo.save_personas_bulk(personas[:8], batch_size=5)
+
+        batches = []
+        inserted, skipped = repo.save_personas_bulk(
+            personas, batch_size=5, progress=lambda done, total: batches.append(done)
+        )
+
+        assert (inserted, skipped) == (12, 8)
+        assert batches == [5, 10, 15, 20]
+        assert len(repo.list_personas(limit=100)) == 20
+
+    def test_duplicate_names_in_input(self, repo):
+        """Test duplicate names within one import keep the first."""
+        inserted, skipped = repo.save_personas_bulk([
+            {"name": "Twin", "occupation": "first"},
+            {"name": "Twin", "occupation": "second"},
+        ])
+
+        assert (inserted, skipped) == (1, 1)
+        assert repo.get_persona_by_name("Twin")["occupation"] == "first"
+
+
+    def test_update_existing_upserts_by_id(self, repo):
+        """Test update mode rewrites personas whose ID exists and adds the rest."""
+        repo.save_personas_bulk([{"id": "p1", "name": "Edited", "occupation": "old"}])
+
+        written, skipped = repo.save_personas_bulk(
+            [
+                {"id": "p1", "name": "Edited", "occupation": "new", "traits": {"openness": 0.9}},
+                {"id": "p2", "name": "Added"},
+            ],
+            update_existing=True,
+        )
+
+        assert (written, skipped) == (2, 0)
+        persona = repo.get_persona("p1")
+        assert persona["occupation"] == "new"
+        assert persona["traits"] == {"openness": 0.9}
+        assert repo.get_persona("p2")["name"] == "Added"
+
+    @pytest.mark.parametrize("update_existing, clash", [
+        (False, {"id": "taken", "name": "Clash"}),  # ID used under another name
+        (True, {"id": "new", "name": "Original"}),  # Name used under another ID
+    ])
+    def test_conflicting_rows_fail_alone(self, repo, update_existing, clash):
+        """Test a constraint violation only fails the offending persona."""
+        repo.save_personas_bulk([{"id": "taken", "name": "Original"}])
+        failures = []
+
+        written, skipped = repo.save_personas_bulk(
+            [{"id": "a", "name": "Before"}, clash, {"id": "c", "name": "After"}],
+            batch_size=10,
+            update_existing=update_existing,
+            on_error=lambda persona, error: failures.append(persona["name"]),
+        )
+
+        assert (written, skipped) == (2, 0)
+        assert failures == [clash["name"]]
+        assert repo.get_persona_by_name("Before") is not None
+        assert repo.get_persona_by_name("After") is not None
+        assert repo.get_persona("taken")["name"] == "Original"
+
+    def test_conflict_raised_without_handler(self, repo):
+        """Test failures are raised when no error callback is given."""
+        from sqlalchemy.exc import IntegrityError
+
+        repo.save_personas_bulk([{"id": "taken", "name": "Original"}])
+
+        with pytest.raises(IntegrityError):
+            repo.save_personas_bulk([{"id": "taken", "name": "Clash"}])
+
+
+class TestPersonaSearch:
+    """Tests for indexed persona search."""
+
+    @pytest.fixture
+    def library(self, repo):
+        """Repository with a small, varied persona library."""
+        repo.save_personas_bulk([
+            {"name": "Ada Lovelace", "occupation": "engineer", "description": "Writes analytical engines",
+             "tags": ["tech", "history"], "traits": {"openness": 0.9, "neuroticism": 0.2}},
+            {"name": "Grace Hopper", "occupation": "engineer", "description": "Compiler pioneer",
+             "tags": ["tech lead"], "traits": {"openness": 0.8, "neuroticism": 0.5}},
+            {"name": "Florence Nightingale", "occupation": "nurse", "description": "Statistics in care",
+             "tags": ["health"], "traits": {"openness": 0.6, "neuroticism": 0.1, "empathy": 0.95}},
+            {"name": "Marie Engineer", "occupation": "physicist", "description": "Radioactivity",
+             "tags": ["science"], "traits": {"openness": 0.75, "neuroticism": 0.25}},
+        ])
+        return repo
+
+    def test_ranked_full_text(self, library):
+        """Test name matches outrank description and occupation matches."""
+        results = library.search_personas("engineer")
+
+        assert results[0]["name"] == "Marie Engineer"
+        assert {p["name"] for p in results} == {"Marie Engineer", "Ada Lovelace", "Grace Hopper"}
+
+    def test_prefix_and_syntax_safe(self, library):
+        """Test word prefixes match and FTS operators are treated as text."""
+        assert [p["name"] for p in library.search_personas("compil")] == ["Grace Hopper"]
+        assert library.search_personas('NOT "(engines*') == []
+
+    def test_trait_ranges(self, library):
+        """Test Big Five and custom trait ranges compose."""
+        results = library.search_personas(trait_ranges={"openness": (0.7, None), "neuroticism": (None, 0.3)})
+        assert {p["name"] for p in results} == {"Ada Lovelace", "Marie Engineer"}
+
+        results = library.search_personas(trait_ranges={"empathy": (0.9, None)})
+        assert [p["name"] for p in results] == ["Florence Nightingale"]
+
+    def test_exact_bounds(self, library):
+        """Test inclusive bounds are exact despite R-tree rounding."""
+        results = library.search_personas(trait_ranges={"openness": (0.75, 0.75)})
+        assert [p["name"] for p in results] == ["Marie Engineer"]
+
+        assert library.search_personas(trait_ranges={"openness": (0.7500001, None), "neuroticism": (0.25, 0.25)}) == []
+
+    def test_strict_bounds(self, library):
+        """Test ">" and "<" exclude personas exactly on the bound."""
+        names = [p["name"] for p in library.search_personas(trait_ranges=parse_trait_ranges("openness>0.75"))]
+        assert names == ["Ada Lovelace", "Grace Hopper"]
+
+        names = [p["name"] for p in library.search_personas(trait_ranges=parse_trait_ranges("openness>=0.75"))]
+        assert names == ["Ada Lovelace", "Grace Hopper", "Marie Engineer"]
+
+        assert library.search_personas(trait_ranges=parse_trait_ranges("empathy>0.95")) == []
+        assert library.search_personas(trait_ranges=parse_trait_ranges("neuroticism<0.1")) == []
+
+    def test_trait_range_pagination(self, library):
+        """Test trait-only results page in a stable library order."""
+        pages = [
+            library.search_personas(trait_ranges={"openness": (0.5, None)}, limit=1, offset=offset)
+            for offset in range(4)
+        ]
+
+        assert [page[0]["name"] for page in pages] == [
+            "Ada Lovelace", "Grace Hopper", "Florence Nightingale", "Marie Engineer",
+        ]
+
+    def test_tags_match_whole_tags(self, library):
+        """Test tag filters match whole tags, not words inside them."""
+        results = library.search_personas(tags=["tech"])
+        assert [p["name"] for p in results] == ["Ada Lovelace"]
+
+        results = library.search_personas(tags=["tech lead", "health"])
+        assert {p["name"] for p in results} == {"Grace Hopper", "Florence Nightingale"}
+
+    def test_filters_and_pagination(self, library):
+        """Test occupation, text and paging combine."""
+        results = library.search_personas(occupation="engineer", limit=1)
+        page_two = library.search_personas(occupation="engineer", limit=1, offset=1)
+
+        assert len(results) == len(page_two) == 1
+        assert results[0]["name"] != page_two[0]["name"]
+        assert library.search_personas("radio", occupation="engineer") == []
+
+    def test_occupation_facets(self, library):
+        """Test facet counts cover every match."""
+        facets = library.persona_occupation_facets(trait_ranges={"openness": (0.7, None)})
+
+        assert facets == {"engineer": 2, "physicist": 1}
+
+    def test_index_follows_updates_and_deletes(self, library):
+        """Test the search tables stay in sync with library writes."""
+        persona = library.get_persona_by_name("Grace Hopper")
+        library.save_persona({**persona, "description": "Admiral", "traits": {"openness": 0.1}})
+
+        assert library.search_personas("compiler") == []
+        assert [p["name"] for p in library.search_personas("admiral")] == ["Grace Hopper"]
+        assert library.search_personas(trait_ranges={"openness": (None, 0.2)})[0]["name"] == "Grace Hopper"
+
+        library.delete_persona(persona["id"])
+        assert library.search_personas("admiral") == []
+        assert library.search_personas(trait_ranges={"openness": (None, 0.2)}) == []
+
+
+class TestPersonaSearchInstall:
+    """Tests for installing search on existing databases."""
+
+    def test_upgrades_old_library(self, tmp_path):
+        """Test a library without trait columns is migrated and indexed."""
+        path = tmp_path / "old.db"
+        init_db(path=path)
+        connection = sqlite3.connect(path)
+        connection.executescript("""
+            DROP TABLE persona_fts;
+            DROP TABLE persona_traits;
+            DROP TABLE persona_collection_members;
+            DROP TABLE persona_library;
+            CREATE TABLE persona_library (
+                id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL UNIQUE,
+                description TEXT, traits_json TEXT NOT NULL, occupation VARCHAR(255),
+                age INTEGER, age_range VARCHAR(50), background TEXT, goals_json TEXT,
+                tags_json TEXT, version INTEGER NOT NULL, usage_count INTEGER NOT NULL,
+                is_template INTEGER NOT NULL, created_by VARCHAR(255), prompt_preview TEXT,
+                created_at DATETIME, updated_at DATETIME
+            );
+            INSERT INTO persona_library (id, name, traits_json, version, usage_count, is_template)
+            VALUES ('p1', 'Old Timer', '{"openness": 0.9}', 1, 0, 0);
+        """)
+        connection.commit()
+        connection.close()
+
+        init_db(path=path)
+        repo = Repository()
+
+        assert [p["name"] for p in repo.search_personas("old")] == ["Old Timer"]
+        assert [p["name"] for p in repo.search_personas(trait_ranges={"openness": (0.85, None)})] == ["Old Timer"]
+
+
+class TestParseTraitRanges:
+    """Tests for trait filter parsing."""
+
+    def test_parse(self):
+        """Test operators and repeated traits combine into ranges."""
+        assert parse_trait_ranges("openness>0.7, neuroticism<=.3,openness<0.9,agreeableness=0.5") == {
+            "openness": TraitRange(0.7, 0.9, low_strict=True, high_strict=True),
+            "neuroticism": TraitRange(None, 0.3),
+            "agreeableness": TraitRange(0.5, 0.5),
+        }
+        assert parse_trait_ranges("openness>=0.7,openness>0.7,openness>0.5") == {
+            "openness": TraitRange(0.7, None, low_strict=True),
+        }
+        assert parse_trait_ranges(None) == {}
+
+    def test_invalid(self):
+        """Test malformed filters are rejected."""
+        with pytest.raises(ValueError):
+            parse_trait_ranges("openness ~ 0.7")
@@ -248,6 +248,54 @@ class TestTopologyMethods:
         edges = repo.get_topology_edges("sim")
         assert len(edges) == 2
 
+    def test_save_topology_edges_diffs(self, repo):
+        """Test re-saving only changes the edges that differ."""
+        repo.save_simulation({"id": "sim", "name": "Test", "status": "pending"})
+        repo.save_topology_edges("sim", [("a", "b", 1.0), ("b", "c", 1.0), ("c", "d", 1.0)])
+        before = {(e["source_id"], e["target_id"]): e for e in repo.get_topology_edges("sim")}
+
+        count = repo.save_topology_edges(
+            "sim", [("a", "b", 1.0), ("b", "c", 0.5), ("d", "e", 2.0)]
+        )
+        after = {(e["source_id"], e["target_id"]): e for e in repo.get_topology_edges("sim")}
+
+        assert count == 3
+        assert set(after) == {("a", "b"), ("b", "c"), ("d", "e")}
+        assert after[("a", "b")]["id"] == before[("a", "b")]["id"]
+        assert after[("b", "c")]["id"] == before[("b", "c")]["id"]
+        assert after[("b", "c")]["weight"] == 0.5
+        assert after[("d", "e")]["weight"] == 2.0
+
+    def test_save_topology_edges_large(self, repo):
+        """Test large edge sets round-trip and can be cleared."""
+        repo.save_simulation({"id": "sim", "name": "Test", "status": "pending"})
+        edges = [(f"n{i}", f"n{i + 1}", 1.0) for i in range(2000)]
+
+        assert repo.save_topology_edges("sim", edges) == 2000
+        assert len(repo.get_topology_edges("sim")) == 2000
+
+        repo.save_topology_edges("sim", [])
+        assert repo.get_topology_edges("sim") == []
+
+    def test_update_topology_edges(self, repo):
+        """Test applying an edge delta without rewriting the edge set."""
+        repo.save_simulation({"id": "sim", "name": "Test", "status": "pending"})
+        repo.save_topology_edges("sim", [("a", "b", 1.0), ("b", "c", 1.0)])
+        kept = {(e["source_id"], e["target_id"]): e["id"] for e in repo.get_topology_edges("sim")}
+
+        added, removed = repo.update_topology_edges(
+            "sim", added=[("c", "d", 2.0)], removed=[("c", "b")]
+        )
+        after = {(e["source_id"], e["target_id"]): e for e in repo.get_topology_edges("sim")}
+
+        assert (added, removed) == (1, 1)
+        assert set(after) == {("a", "b"), ("c", "d")}
+        assert after[("a", "b")]["id"] == kept[("a", "b")]
+        assert after[("c", "d")]["weight"] == 2.0
+
+        # Directed removal only matches the stored orientation
+        assert repo.update_topology_edges("sim", [], [("b", "a")], directed=True) == (0, 0)
+
     def test_delete_topology(self, repo):
         """Test deleting topology data."""
         repo.save_simulation({"id": "sim", "name": "Test", "status": "pending"})
@@ -0,0 +1,100 @@
+"""Tests for vectorized trait similarity."""
+
+import random
+
+import numpy as np
+import pytest
+
+from agentworld.personas.matrix import TraitMatrix
+from agentworld.personas.traits import CustomTrait, TraitVector, generate_diverse_population
+
+
+def _population(n: int = 40, seed: int = 3) -> list[TraitVector]:
+    """Trait vectors with a random subset of custom traits each."""
+    rng = random.Random(seed)
+    vectors = []
+    for _ in range(n):
+        custom = {name: rng.random() for name in ("tech", "risk", "zeal") if rng.random() < 0.5}
+        vectors.append(TraitVector(*[rng.random() for _ in range(5)], custom_traits=custom))
+    # Typed custom traits with their own weights
+    vectors[0].custom_traits["tech"] = CustomTrait(0.3, "tech use", "tech-savvy", "tech-averse", weight=2.5)
+    vectors[1].custom_traits["tech"] = CustomTrait(0.8, "tech use", "tech-savvy", "tech-averse", weight=0.5)
+    vectors.append(TraitVector(0.0, 0.0, 0.0, 0.0, 0.0))
+    return vectors
+
+
+class TestTraitMatrixSimilarity:
+    """Tests for agreement with TraitVector.similarity."""
+
+    @pytest.mark.parametrize("include_custom", [True, False])
+    def test_matches_pairwise_similarity(self, include_custom):
+        """Test all-pairs similarity equals the pairwise method."""
+        vectors = _population()
+        matrix = TraitMatrix(vectors, include_custom=include_custom)
+
+        expected = np.array([
+            [a.similarity(b, include_custom=include_custom) for b in vectors]
+            for a in vectors
+        ])
+
+        np.testing.assert_allclose(matrix.similarity_matrix(), expected, rtol=0, atol=1e-12)
+        assert matrix.similarity(0, 1) == pytest.approx(
+            vectors[0].similarity(vectors[1], include_custom=include_custom), abs=1e-12
+        )
+
+    def test_nearest(self):
+        """Test nearest neighbors are sorted and exclude the query."""
+        vectors = _population()
+        matrix = TraitMatrix(vectors)
+
+        result = matrix.nearest(2, k=3)
+        expected = sorted(
+            ((i, vectors[2].similarity(v)) for i, v in enumerate(vectors) if i != 2),
+            key=lambda item: -item[1],
+        )[:3]
+
+        assert [i for i, _ in result] == [i for i, _ in expected]
+
+
+class TestTraitMatrixDiversity:
+    """Tests for diversity measures."""
+
+    @pytest.mark.parametrize("include_custom", [True, False])
+    def test_diversity_scores(self, include_custom):
+        """Test scores are the mean dissimilarity to everyone else."""
+        vectors = _population(20)
+        matrix = TraitMatrix(vectors, include_custom=include_custom)
+        similarity = matrix.similarity_matrix()
+        n = len(vectors)
+
+        expected = 1 - (similarity.sum(axis=1) - np.diag(similarity)) / (n - 1)
+
+        np.testing.assert_allclose(matrix.diversity_scores(), expected, atol=1e-12)
+        assert matrix.population_diversity() == pytest.approx(expected.mean())
+
+    def test_select_diverse_prefers_spread(self):
+        """Test the panel is more diverse than the population average."""
+        matrix = TraitMatrix(generate_diverse_population(500, seed=1))
+
+        panel = matrix.select_diverse(10)
+        sub = TraitMatrix([generate_diverse_population(500, seed=1)[i] for i in panel])
+
+        assert len(set(panel)) == 10
+        assert sub.population_diversity() > matrix.population_diversity()
+
+    def test_near_duplicates(self):
+        """Test duplicated personas are found once each."""
+        base = generate_diverse_population(30, seed=2)
+        vectors = base + [TraitVector(**base[4].big_five), TraitVector(**base[9].big_five)]
+
+        pairs = TraitMatrix(vectors).near_duplicates(threshold=1 - 1e-9)
+
+        assert (4, 30) in pairs and (9, 31) in pairs
+        assert all(i < j for i, j in pairs)
+
+    def test_empty_and_single(self):
+        """Test degenerate populations."""
+        assert TraitMatrix([]).select_diverse(3) == []
+        single = TraitMatrix([TraitVector()])
+        assert single.population_diversity() == 0.0
+        assert single.nearest(0) == []
@@ -0,0 +1,149 @@
+"""Tests for vectorized population sampling."""
+
+import numpy as np
+import pytest
+
+from agentworld.core.exceptions import ValidationError
+from agentworld.personas.population import (
+    BIG_FIVE,
+    PopulationSampler,
+    generate_personas,
+    sample_ages,
+)
+from agentworld.personas.traits import TraitVector, generate_diverse_population
+
+
+class TestPopulationSampler:
+    """Tests for PopulationSampler."""
+
+    def test_shape_and_bounds(self):
+        """Test samples fill one array within the truncation bounds."""
+        values = PopulationSampler().sample(100_000, seed=1)
+
+        assert values.shape == (100_000, 5)
+        assert values.min() >= 0.0 and values.max() <= 1.0
+
+    def test_reproducible(self):
+        """Test the same seed gives the same population."""
+        sampler = PopulationSampler({"openness": (0.7, 0.1)})
+
+        np.testing.assert_array_equal(sampler.sample(50, seed=3), sampler.sample(50, seed=3))
+        assert not np.array_equal(sampler.sample(50, seed=3), sampler.sample(50, seed=4))
+
+    def test_correlated_traits(self):
+        """Test pairwise correlations are reproduced."""
+        sampler = PopulationSampler(
+            {name: (0.5, 0.1) for name in BIG_FIVE},
+            correlation={("openness", "extraversion"): 0.6, ("agreeableness", "neuroticism"): -0.4},
+        )
+        corr = np.corrcoef(sampler.sample(50_000, seed=0), rowvar=False)
+
+        assert corr[0, 2] == pytest.approx(0.6, abs=0.03)
+        assert corr[3, 4] == pytest.approx(-0.4, abs=0.03)
+        assert abs(corr[0, 1]) < 0.03
+
+    def test_covariance_matrix(self):
+        """Test a full covariance matrix sets spreads and correlations."""
+        covariance = np.diag([0.01, 0.0025, 0.01, 0.01, 0.01])
+        covariance[0, 1] = covariance[1, 0] = 0.004
+        values = PopulationSampler(covariance=covariance).sample(50_000, seed=0)
+
+        np.testing.assert_allclose(values.std(axis=0)[:2], [0.1, 0.05], atol=0.005)
+        assert np.corrcoef(values[:, 0], values[:, 1])[0, 1] == pytest.approx(0.8, abs=0.03)
+
+    def test_indefinite_correlation_is_repaired(self):
+        """Test inconsistent correlations still produce finite samples."""
+        correlation = {
+            ("openness", "conscientiousness"): 0.9,
+            ("conscientiousness", "extraversion"): 0.9,
+            ("openness", "extraversion"): -0.9,
+        }
+        values = PopulationSampler(correlation=correlation).sample(1000, seed=0)
+
+        assert np.isfinite(values).all()
+
+    def test_resample_truncation_avoids_pileup(self):
+        """Test resampling keeps mass off the bounds, unlike clipping."""
+        distributions = {"openness": (0.95, 0.2)}
+        resampled = PopulationSampler(distributions).sample(10_000, seed=0)[:, 0]
+        clipped = PopulationSampler(distributions, truncation="clip").sample(10_000, seed=0)[:, 0]
+
+        assert (clipped == 1.0).mean() > 0.3
+        assert (resampled == 1.0).mean() < 0.01
+
+    def test_custom_traits_and_bounds(self):
+        """Test extra traits are appended and template bounds respected."""
+        sampler = PopulationSampler({"humor": {"mean": 0.5, "std": 0.3, "min": 0.2, "max": 0.8}})
+        values = sampler.sample(1000, seed=0)
+
+        assert sampler.traits == list(BIG_FIVE) + ["humor"]
+        assert values[:, 5].min() >= 0.2 and values[:, 5].max() <= 0.8
+
+    def test_invalid_arguments(self):
+        """Test bad truncation modes and covariance shapes are rejected."""
+        with pytest.raises(ValidationError):
+            PopulationSampler(truncation="reflect")
+        with pytest.raises(ValidationError):
+            PopulationSampler(covariance=np.eye(3))
+
+
+class TestGeneratePersonas:
+    """Tests for population template generation."""
+
+    TEMPLATE = {
+        "name": "Survey",
+        "demographic_config": {
+            "age": {"min": 20, "max": 60, "distribution": "normal"},
+            "occupations": {"engineer": 3, "teacher": 1},
+        },
+        "trait_distributions": {
+            "openness": {"mean": 0.7, "std": 0.1},
+            "correlations": [["openness", "extraversion", 0.5]],
+        },
+        "default_count": 20,
+        "seed": 7,
+        "tags": ["survey"],
+    }
+
+    def test_records(self):
+        """Test records carry sampled traits and demographics."""
+        personas = generate_personas(self.TEMPLATE, count=2000)
+
+        assert len(personas) == 2000
+        assert personas[0]["name"] == "Survey_1"
+        assert personas[-1]["name"] == "Survey_2000"
+        assert set(personas[0]["traits"]) == set(BIG_FIVE)
+        assert all(20 <= p["age"] <= 60 for p in personas)
+        engineers = sum(p["occupation"] == "engineer" for p in personas)
+        assert 0.7 < engineers / 2000 < 0.8
+        assert np.mean([p["traits"]["openness"] for p in personas]) == pytest.approx(0.7, abs=0.01)
+
+    def test_uses_template_defaults(self):
+        """Test count and seed default to the template's values."""
+        first = generate_personas(self.TEMPLATE)
+        second = generate_personas(self.TEMPLATE)
+
+        assert len(first) == 20
+        assert [p["traits"] for p in first] == [p["traits"] for p in second]
+
+    def test_uniform_ages(self):
+        """Test uniform ages cover the whole range."""
+        ages = sample_ages(5000, {"min": 18, "max": 20}, np.random.default_rng(0))
+
+        assert set(ages.tolist()) == {18, 19, 20}
+
+
+class TestGenerateDiversePopulation:
+    """Tests for generate_diverse_population on the vectorized sampler."""
+
+    def test_trait_vectors(self):
+        """Test trait vectors are built with clamped values."""
+        population = generate_diverse_population(
+            500, {"extraversion": (0.9, 0.3), "humor": (0.5, 0.1)}, seed=2
+        )
+
+        assert len(population) == 500
+        assert all(isinstance(v, TraitVector) for v in population)
+        assert all(0.0 <= v.extraversion <= 1.0 for v in population)
+        assert "humor" in population[0].custom_traits
+        assert np.mean([v.extraversion for v in population]) > 0.75
@@ -2,7 +2,9 @@
 
 import pytest
 from agentworld.personas.prompts import (
+    PromptCache,
     generate_system_prompt,
+    prompt_cache_key,
     generate_personality_prompt,
     generate_response_guidance,
 )
@@ -132,3 +134,41 @@ class TestGenerateResponseGuidance:
 
         # Should still return something
         assert len(guidance) > 0
+
+
+class TestPromptCache:
+    """Tests for the system prompt cache."""
+
+    def test_key_is_content_addressed(self):
+        """Test equal inputs share a key and any change alters it."""
+        key = prompt_cache_key(TraitVector(openness=0.9), "Ada", "Engineer")
+
+        assert key == prompt_cache_key(TraitVector(openness=0.9), "Ada", "Engineer")
+        assert key != prompt_cache_key(TraitVector(openness=0.8), "Ada", "Engineer")
+        assert key != prompt_cache_key(TraitVector(openness=0.9), "Ada", "Poet")
+        assert key != prompt_cache_key(TraitVector(openness=0.9), "Ada", "Engineer", "Be brief")
+
+    def test_get_or_generate_matches_generator(self):
+        """Test cached prompts equal freshly generated ones."""
+        cache = PromptCache()
+        traits = TraitVector(agreeableness=0.1, custom_traits={"humor": 0.9})
+
+        first = cache.get_or_generate(traits, "Max", "A comedian")
+        second = cache.get_or_generate(traits, "Max", "A comedian")
+
+        assert first == generate_system_prompt(traits, "Max", "A comedian")
+        assert second is first
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_bounded_lru(self):
+        """Test the least recently used prompt is evicted."""
+        cache = PromptCache(max_size=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert cache.size == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
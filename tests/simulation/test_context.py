@@ -0,0 +1,132 @@
+"""Tests for token-budgeted conversation context."""
+
+import pytest
+
+from agentworld.agents.agent import Agent
+from agentworld.core.models import Message
+from agentworld.llm.tokens import count_tokens
+from agentworld.persistence.database import init_db
+from agentworld.personas.traits import TraitVector
+from agentworld.simulation import context as context_module
+from agentworld.simulation.context import CONTEXT_HEADER, ContextWindow
+from agentworld.simulation.runner import Simulation
+
+
+@pytest.fixture
+def mock_db():
+    """Initialize in-memory database for tests."""
+    init_db(in_memory=True)
+
+
+def _message(i: int, sender: str = "a", words: int = 5) -> Message:
+    return Message(sender_id=sender, receiver_id=None, content=" ".join([f"m{i}"] * words), step=i)
+
+
+def _fill(window: ContextWindow, count: int, **kwargs) -> None:
+    for i in range(count):
+        window.append(_message(i, **kwargs))
+
+
+class TestContextWindow:
+    """Tests for ContextWindow."""
+
+    def test_render_matches_conversation_format(self):
+        """Test rendering lists messages under the header, oldest first."""
+        window = ContextWindow()
+        window.append(_message(1, words=1), "Alice")
+        window.append(_message(2, sender="b", words=1))
+
+        assert window.render() == f"{CONTEXT_HEADER}\n  Alice: m1\n  b: m2"
+
+    def test_render_respects_budget(self):
+        """Test the newest lines that fit the budget are rendered."""
+        window = ContextWindow()
+        _fill(window, 50)
+
+        for budget in (0, 10, 37, 100, 400):
+            text = window.render(budget)
+            assert count_tokens(text) <= budget
+            if text:
+                assert text.endswith("m49 m49 m49 m49 m49")
+        assert "m0 " in window.render(10_000)
+        assert "m0 " not in window.render(100)
+
+    def test_max_messages(self):
+        """Test the optional cap on the number of lines."""
+        window = ContextWindow()
+        _fill(window, 10)
+
+        text = window.render(max_messages=3)
+
+        assert text.count("\n") == 3
+        assert "m7" in text and "m6" not in text
+
+    def test_evicts_beyond_max_tokens(self):
+        """Test the window keeps at most max_tokens of lines."""
+        window = ContextWindow(max_tokens=60)
+        _fill(window, 500)
+
+        assert 0 < window.tokens <= 60
+        assert len(window) < 20
+        assert len(window._senders) <= 2 * len(window) + 1
+        assert window.render().endswith("m499 m499 m499 m499 m499")
+
+    def test_tokens_counted_once(self, monkeypatch):
+        """Test rendering does not recount tokens."""
+        calls = []
+
+        def counting(text, model="gpt-4o-mini"):
+            calls.append(text)
+            return count_tokens(text, model)
+
+        monkeypatch.setattr(context_module, "count_tokens", counting)
+        window = ContextWindow()
+        _fill(window, 20)
+        for budget in range(10, 200):
+            window.render(budget)
+
+        assert len(calls) == 21  # header + one per message
+
+    def test_lines_round_trip(self):
+        """Test lines can be copied into another window without recounting."""
+        window = ContextWindow(max_tokens=80)
+        _fill(window, 40)
+        copy = ContextWindow(max_tokens=80)
+        for sender_id, line, tokens in window.lines():
+            copy.append_line(sender_id, line, tokens)
+
+        assert copy.render() == window.render()
+        assert copy.tokens == window.tokens
+        assert list(ContextWindow().lines()) == []
+
+
+class TestSimulationContext:
+    """Tests for the simulation's per-agent context budget."""
+
+    def test_context_fits_agent_budget(self, mock_db):
+        """Test each agent's whole prompt stays within context_tokens."""
+        agents = [
+            Agent(name="Alice", traits=TraitVector()),
+            Agent(name="Bob", traits=TraitVector(), system_prompt="Short prompt."),
+        ]
+        sim = Simulation(name="Test", agents=agents, initial_prompt="Remote work", context_tokens=600)
+        for i in range(200):
+            sim._record_message(_message(i, sender=agents[i % 2].id, words=8))
+
+        for agent in agents:
+            context = sim._build_context(agent)
+            prompt, prefix = sim._turn_prompt(1, context)
+            total = sum(count_tokens(part) for part in (agent.system_prompt, prefix, prompt))
+            assert total <= 600
+            assert "Alice:" in context and "Bob:" in context
+
+        # The agent with the shorter system prompt gets more history
+        assert len(sim._build_context(agents[1])) > len(sim._build_context(agents[0]))
+
+    def test_window_rebuilt_from_messages(self, mock_db):
+        """Test a lazily created window picks up existing messages."""
+        agent = Agent(name="Alice", traits=TraitVector())
+        sim = Simulation(name="Test", agents=[agent])
+        sim._messages.append(_message(1, sender=agent.id, words=1))
+
+        assert sim._build_context(agent) == f"{CONTEXT_HEADER}\n  Alice: m1"
@@ -1,10 +1,13 @@
 """Tests for Simulation runner."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from agentworld.simulation.runner import Simulation
 from agentworld.agents.agent import Agent
+from agentworld.memory.base import Memory
 from agentworld.core.models import Message, SimulationConfig, AgentConfig, SimulationStatus, LLMResponse
 from agentworld.personas.traits import TraitVector
 from agentworld.persistence.database import init_db
@@ -165,6 +168,119 @@ class TestSimulationTopology:
         recipients = sim.get_valid_recipients(agent1.id)
         assert len(recipients) >= 1
 
+    def test_get_receivers_hub_spoke(self, mock_db):
+        """Test receivers follow topology edges."""
+        hub = Agent(name="Hub", traits=TraitVector())
+        spoke1 = Agent(name="S1", traits=TraitVector())
+        spoke2 = Agent(name="S2", traits=TraitVector())
+        sim = Simulation(
+            name="Test",
+            agents=[hub, spoke1, spoke2],
+            topology_type="hub_spoke",
+            topology_config={"hub_id": hub.id},
+        )
+
+        assert sim.get_receivers(hub.id) == [spoke1, spoke2]
+        assert sim.get_receivers(spoke1.id) == [hub]
+        assert sim.get_receivers(spoke1.id) is sim.get_receivers(spoke1.id)
+
+    def test_get_receivers_invalidated_by_topology_change(self, mock_db):
+        """Test cached receivers are rebuilt after topology edits."""
+        hub = Agent(name="Hub", traits=TraitVector())
+        spoke1 = Agent(name="S1", traits=TraitVector())
+        spoke2 = Agent(name="S2", traits=TraitVector())
+        sim = Simulation(
+            name="Test",
+            agents=[hub, spoke1, spoke2],
+            topology_type="hub_spoke",
+            topology_config={"hub_id": hub.id},
+        )
+
+        assert sim.get_receivers(spoke1.id) == [hub]
+        sim.topology.add_edge(spoke1.id, spoke2.id)
+        assert sim.get_receivers(spoke1.id) == [hub, spoke2]
+
+    def test_get_receivers_invalidated_by_add_agent(self, mock_db):
+        """Test adding an agent refreshes the agent index."""
+        from agentworld.topology.base import RoutingMode
+
+        agent1 = Agent(name="A", traits=TraitVector())
+        agent2 = Agent(name="B", traits=TraitVector())
+        sim = Simulation(
+            name="Test", agents=[agent1, agent2], routing_mode=RoutingMode.BROADCAST
+        )
+        assert sim.get_receivers(agent1.id) == [agent2]
+
+        agent3 = Agent(name="C", traits=TraitVector())
+        sim.add_agent(agent3)
+
+        assert sim.get_agent(agent3.id) is agent3
+        assert sim.get_receivers(agent1.id) == [agent2, agent3]
+
+    def test_get_receivers_invalidated_by_replaced_agent(self, mock_db):
+        """Test replacing an agent in place refreshes the agent index."""
+        from agentworld.topology.base import RoutingMode
+
+        agent1 = Agent(name="A", traits=TraitVector())
+        agent2 = Agent(name="B", traits=TraitVector())
+        sim = Simulation(
+            name="Test", agents=[agent1, agent2], routing_mode=RoutingMode.BROADCAST
+        )
+        assert sim.get_receivers(agent1.id) == [agent2]
+
+        replacement = Agent(name="C", traits=TraitVector())
+        sim.agents[1] = replacement
+
+        assert sim.get_agent(agent2.id) is None
+        assert sim.get_agent(replacement.id) is replacement
+        assert sim.get_receivers(agent1.id) == [replacement]
+
+    async def test_shards_rebuilt_after_replaced_agent(self, mock_db):
+        """Test replacing an agent in place refreshes the cached shards."""
+        agents = [Agent(name=name, traits=TraitVector()) for name in "ABCD"]
+        sim = Simulation(name="Test", agents=agents, initial_prompt="Topic", shard_by="component")
+
+        async def generate(agent, prompt, receiver_id=None, step=0, prefix=None):
+            return Message(sender_id=agent.id, receiver_id=receiver_id, content="Hi", step=step)
+
+        sim.get_shards()
+        sim.agents[0] = Agent(name="E", traits=TraitVector())
+        # The old agent is still in the topology; keep its messages out of the DB
+        with patch.object(Agent, "generate_message", generate), patch.object(sim, "_save_message"):
+            messages = await sim.step()
+
+        shard_members = {agent_id for shard in sim.get_shards() for agent_id in shard.agent_ids}
+        assert shard_members == {agent.id for agent in sim.agents}
+        assert [m.sender_id for m in messages] == [agent.id for agent in sim.agents]
+
+    def test_apply_rewiring_updates_receivers_and_edges(self, mock_db):
+        """Test rewiring after a step updates delivery and stored edges."""
+        from agentworld.topology.dynamic import InteractionRewiringPolicy
+
+        hub = Agent(name="Hub", traits=TraitVector())
+        spoke1 = Agent(name="S1", traits=TraitVector())
+        spoke2 = Agent(name="S2", traits=TraitVector())
+        sim = Simulation(
+            name="Test",
+            agents=[hub, spoke1, spoke2],
+            topology_type="hub_spoke",
+            topology_config={"hub_id": hub.id},
+            rewiring_policy=InteractionRewiringPolicy(form_threshold=1),
+        )
+        sim._save_state()
+        assert sim.get_receivers(spoke1.id) == [hub]
+
+        sim._apply_rewiring([
+            Message(sender_id=spoke1.id, receiver_id=spoke2.id, content="hi")
+        ])
+
+        assert sim.get_receivers(spoke1.id) == [hub, spoke2]
+        stored = sim.repository.get_topology_edges(sim.id)
+        assert len(stored) == 3
+        assert {spoke1.id, spoke2.id} in [
+            {e["source_id"], e["target_id"]} for e in stored
+        ]
+
 
 class TestSimulationCallbacks:
     """Tests for step callbacks."""
@@ -179,6 +295,57 @@ class TestSimulationCallbacks:
         assert callback in sim._step_callbacks
 
 
+class TestSimulationPrompts:
+    """Tests for per-turn prompt construction."""
+
+    async def test_topic_sent_as_stable_prefix(self, mock_db):
+        """Test the topic goes to agents as a prefix, not inside the context."""
+        agents = [Agent(name="Alice", traits=TraitVector()), Agent(name="Bob", traits=TraitVector())]
+        sim = Simulation(name="Test", agents=agents, initial_prompt="Remote work")
+        calls = []
+
+        async def generate(agent, prompt, receiver_id=None, step=0, prefix=None):
+            calls.append((prompt, prefix))
+            return Message(sender_id=agent.id, receiver_id=receiver_id, content="Hello", step=step)
+
+        with patch.object(Agent, "generate_message", generate):
+            await sim.step()
+
+        (first_prompt, first_prefix), (second_prompt, second_prefix) = calls
+        assert first_prompt.startswith("Start a conversation about: Remote work")
+        assert first_prefix is None
+        assert second_prefix == "Topic: Remote work"
+        assert second_prompt.startswith("Recent conversation:")
+        assert "Topic:" not in second_prompt
+
+
+class TestSimulationReflections:
+    """Tests for background reflections at step end."""
+
+    async def test_step_awaits_pending_reflections(self, mock_db):
+        """Test a step waits for background reflections before flushing memories."""
+        agent = Agent(name="Alice", traits=TraitVector())
+        sim = Simulation(name="Test", agents=[agent], initial_prompt="Remote work")
+        finished = []
+
+        async def reflect():
+            await asyncio.sleep(0.01)
+            finished.append(True)
+            return []
+
+        async def generate(agent, prompt, receiver_id=None, step=0, prefix=None):
+            return Message(sender_id=agent.id, receiver_id=receiver_id, content="Hello", step=step)
+
+        agent._memory = Memory()
+        task = asyncio.create_task(reflect())
+        agent._memory._reflection_task = task
+        with patch.object(Agent, "generate_message", generate):
+            await sim.step()
+
+        assert finished == [True]
+        assert agent._memory._reflection_task is None
+
+
 class TestSimulationToDict:
     """Tests for simulation serialization."""
 
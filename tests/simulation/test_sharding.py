@@ -0,0 +1,146 @@
+"""Tests for sharded step execution."""
+
+import asyncio
+
+import pytest
+
+from agentworld.agents.agent import Agent
+from agentworld.core.models import Message
+from agentworld.persistence.database import init_db
+from agentworld.personas.traits import TraitVector
+from agentworld.simulation.runner import Simulation
+from agentworld.simulation.sharding import ShardStrategy, partition_agents, topology_groups
+from agentworld.topology.types import create_topology
+
+
+@pytest.fixture
+def mock_db():
+    """Initialize in-memory database for tests."""
+    init_db(in_memory=True)
+
+
+def _simulation(names: list[str], edges: list[tuple[str, str]], shard_by) -> Simulation:
+    """Simulation whose agent IDs are their names, with a custom topology."""
+    agents = [Agent(name=name, traits=TraitVector(), id=name) for name in names]
+    sim = Simulation(name="Sharded", agents=agents, initial_prompt="Topic", shard_by=shard_by)
+    sim.topology = create_topology("custom", names, edges=edges)
+    return sim
+
+
+def _fake_generate(prompts: dict, delays: dict):
+    """Replacement for Agent.generate_message that records prompts."""
+    async def generate(agent, prompt, receiver_id=None, step=0, prefix=None):
+        prompts[agent.id] = prompt
+        await asyncio.sleep(delays.get(agent.id, 0))
+        return Message(sender_id=agent.id, receiver_id=receiver_id, content=f"{agent.id}@{step}", step=step)
+    return generate
+
+
+class TestPartition:
+    """Tests for shard construction."""
+
+    def test_components(self):
+        """Test connected components become shards in simulation order."""
+        topo = create_topology("custom", list("abcde"), edges=[("d", "b"), ("a", "c")])
+
+        shards = partition_agents(list("abcde"), topology_groups(topo, ShardStrategy.COMPONENT))
+
+        assert [s.agent_ids for s in shards] == [("a", "c"), ("b", "d"), ("e",)]
+        assert [s.index for s in shards] == [0, 1, 2]
+
+    def test_agents_outside_topology_get_own_shard(self):
+        """Test agents missing from every group are still stepped."""
+        shards = partition_agents(["x", "a", "b"], [{"a", "b"}])
+
+        assert [s.agent_ids for s in shards] == [("x",), ("a", "b")]
+
+    def test_communities(self):
+        """Test loosely joined cliques split into communities."""
+        left, right = list("abcd"), list("wxyz")
+        edges = [(u, v) for group in (left, right) for u in group for v in group if u < v]
+        topo = create_topology("custom", left + right, edges=edges + [("a", "w")])
+
+        shards = partition_agents(left + right, topology_groups(topo, ShardStrategy.COMMUNITY))
+
+        assert [set(s.agent_ids) for s in shards] == [set(left), set(right)]
+
+
+class TestShardedStep:
+    """Tests for Simulation._step_sharded."""
+
+    async def test_merge_order_is_deterministic(self, mock_db, monkeypatch):
+        """Test messages commit in simulation order whatever finishes first."""
+        sim = _simulation(list("abcd"), [("a", "c"), ("b", "d")], ShardStrategy.COMPONENT)
+        prompts: dict = {}
+        # The first shard finishes last
+        monkeypatch.setattr(Agent, "generate_message", _fake_generate(prompts, {"a": 0.02}))
+
+        messages = await sim.step()
+
+        assert [m.sender_id for m in messages] == list("abcd")
+        assert [m.sender_id for m in sim.messages] == list("abcd")
+        assert [(m.sender_id, m.receiver_id) for m in messages] == [
+            ("a", "c"), ("b", "d"), ("c", "a"), ("d", "b")
+        ]
+
+    async def test_shards_use_their_own_history(self, mock_db, monkeypatch):
+        """Test a shard's context only contains its own members' messages."""
+        sim = _simulation(list("abcd"), [("a", "c"), ("b", "d")], "component")
+        prompts: dict = {}
+        monkeypatch.setattr(Agent, "generate_message", _fake_generate(prompts, {}))
+
+        await sim.step()
+
+        assert "a@1" in prompts["c"]
+        assert "b@1" not in prompts["c"]
+        assert "b@1" in prompts["d"]
+
+    async def test_committed_messages_visible_in_later_steps(self, mock_db, monkeypatch):
+        """Test other shards' messages from earlier steps stay in context."""
+        sim = _simulation(list("abcd"), [("a", "c"), ("b", "d")], "component")
+        prompts: dict = {}
+        monkeypatch.setattr(Agent, "generate_message", _fake_generate(prompts, {}))
+
+        await sim.step()
+        await sim.step()
+
+        assert "b@1" in prompts["c"]
+        assert "d@1" in prompts["a"]
+        assert "a@2" in prompts["c"]
+        assert "b@2" not in prompts["c"]
+
+    @pytest.mark.parametrize("routing_mode", ["multi_hop", "broadcast"])
+    async def test_requires_direct_routing(self, mock_db, monkeypatch, routing_mode):
+        """Test sharding is refused when messages can leave a shard's neighborhood."""
+        from agentworld.topology.base import RoutingMode
+
+        sim = _simulation(list("abcd"), [("a", "c"), ("b", "d")], "component")
+        sim.topology_graph.routing_mode = RoutingMode(routing_mode)
+        monkeypatch.setattr(Agent, "generate_message", _fake_generate({}, {}))
+
+        with pytest.raises(ValueError, match="direct"):
+            await sim.step()
+        assert sim.current_step == 0
+
+    async def test_cross_shard_messages_delivered_at_commit(self, mock_db, monkeypatch):
+        """Test receivers in other shards get messages after all shards finish."""
+        left, right = list("abcd"), list("wxyz")
+        edges = [(u, v) for group in (left, right) for u in group for v in group if u < v]
+        sim = _simulation(left + right, edges + [("a", "w")], ShardStrategy.COMMUNITY)
+        prompts: dict = {}
+        monkeypatch.setattr(Agent, "generate_message", _fake_generate(prompts, {}))
+
+        received: dict = {}
+
+        def record(agent, message):
+            received.setdefault(agent.id, []).append(message.sender_id)
+
+        monkeypatch.setattr(Agent, "receive_message", record)
+
+        messages = await sim.step()
+
+        assert len(messages) == 8
+        assert "a@1" not in prompts["w"]
+        # w hears from its own shard first, then a's message at COMMIT
+        assert received["w"][-1] == "a"
+        assert received["a"][-1] == "w"
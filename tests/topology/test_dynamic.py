@@ -0,0 +1,174 @@
+"""Tests for topology mutation during runs and incremental cache updates."""
+
+import random
+
+import pytest
+
+from agentworld.core.models import Message
+from agentworld.topology.base import RoutingMode
+from agentworld.topology.dynamic import InteractionRewiringPolicy, TopologyDelta
+from agentworld.topology.graph import TopologyGraph
+from agentworld.topology.routing import RoutingTable
+from agentworld.topology.types import create_topology
+
+
+AGENTS = [f"agent_{i:02d}" for i in range(30)]
+
+
+def _mutate(topology, rng: random.Random, count: int) -> None:
+    """Apply random edge additions and removals through the API."""
+    for _ in range(count):
+        edges = topology.get_all_edges()
+        if edges and rng.random() < 0.5:
+            topology.remove_edge(*rng.choice(edges))
+        else:
+            source, target = rng.sample(AGENTS, 2)
+            topology.add_edge(source, target)
+
+
+def _snapshot(table: RoutingTable) -> dict:
+    """Every sender's recipients."""
+    return {node: table.recipients(node) for node in table.nodes}
+
+
+class TestChangeLog:
+    """Tests for Topology.changes_since."""
+
+    def test_changes_since(self):
+        """Test API mutations are returned in order."""
+        topo = create_topology("hub_spoke", ["hub", "a", "b"])
+        start = topo.fingerprint()
+
+        topo.add_edge("a", "b", weight=0.5)
+        topo.remove_edge("hub", "a")
+
+        changes = topo.changes_since(start)
+        assert [(c.kind, c.source, c.target) for c in changes] == [
+            ("add_edge", "a", "b"),
+            ("remove_edge", "hub", "a"),
+        ]
+        assert changes[0].weight == 0.5
+        assert topo.changes_since(topo.fingerprint()) == []
+
+    def test_unknown_after_direct_edit(self):
+        """Test direct graph edits make the change history unknown."""
+        topo = create_topology("hub_spoke", ["hub", "a", "b"])
+        start = topo.fingerprint()
+
+        topo.add_edge("a", "b")
+        topo.graph.remove_edge("hub", "b")
+
+        assert topo.changes_since(start) is None
+
+
+class TestIncrementalRouting:
+    """Tests for RoutingTable.apply against full recompilation."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    @pytest.mark.parametrize("mode", [RoutingMode.DIRECT_ONLY, RoutingMode.MULTI_HOP])
+    def test_matches_recompile(self, mode, directed):
+        """Test incremental updates agree with a fresh table."""
+        rng = random.Random(4)
+        topo = create_topology("small_world", AGENTS, directed=directed, k=2, p=0.1)
+        graph = TopologyGraph(topo, mode)
+        table = graph.routing_table
+        _snapshot(table)
+
+        for _ in range(20):
+            _mutate(topo, rng, rng.randint(1, 4))
+            assert graph.routing_table is table
+            assert _snapshot(table) == _snapshot(RoutingTable(topo, mode))
+
+    def test_new_node_from_edge(self):
+        """Test an edge to an unseen agent extends the table."""
+        topo = create_topology("mesh", ["a", "b"])
+        graph = TopologyGraph(topo, RoutingMode.BROADCAST)
+        assert graph.routing_table.recipients("a") == ("b",)
+
+        topo.add_edge("b", "c")
+
+        assert graph.routing_table.recipients("a") == ("b", "c")
+
+    def test_node_removal_recompiles(self):
+        """Test node removal falls back to a full recompile."""
+        topo = create_topology("mesh", ["a", "b", "c"])
+        graph = TopologyGraph(topo, RoutingMode.DIRECT_ONLY)
+        table = graph.routing_table
+
+        topo.remove_node("c")
+
+        assert graph.routing_table is not table
+        assert graph.get_valid_recipients("a") == ["b"]
+
+    def test_touched_since(self):
+        """Test only senders whose recipients changed are reported."""
+        topo = create_topology("hub_spoke", ["hub", "a", "b", "c"])
+        graph = TopologyGraph(topo, RoutingMode.DIRECT_ONLY)
+        table = graph.routing_table
+
+        topo.add_edge("a", "b")
+        graph.routing_table
+
+        assert table.touched_since(0) == {"a", "b"}
+        assert table.touched_since(table.revision) == set()
+
+
+class TestIncrementalMetrics:
+    """Tests for locally updated metrics."""
+
+    def test_matches_full_recompute(self):
+        """Test updated metrics agree with a recomputation."""
+        rng = random.Random(9)
+        topo = create_topology("small_world", AGENTS, k=4, p=0.2)
+        topo.get_metrics()
+
+        for _ in range(10):
+            _mutate(topo, rng, 3)
+            actual = topo.get_metrics().to_dict()
+            expected = topo.get_metrics(refresh=True).to_dict()
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    assert actual[key] == pytest.approx(value), key
+                else:
+                    assert actual[key] == value, key
+
+
+class TestInteractionRewiringPolicy:
+    """Tests for the built-in rewiring policy."""
+
+    def test_forms_tie_after_threshold(self):
+        """Test repeated messages create an edge."""
+        topo = create_topology("hub_spoke", ["hub", "a", "b"])
+        policy = InteractionRewiringPolicy(form_threshold=2)
+        messages = [Message(sender_id="a", receiver_id="b", content="hi")]
+
+        assert not policy.rewire(topo, messages, step=1)
+        delta = policy.rewire(topo, messages, step=2)
+
+        assert delta.added == [("a", "b", 1.0)]
+        delta.apply(topo)
+        assert topo.can_communicate("a", "b")
+
+    def test_drops_idle_ties_without_isolating(self):
+        """Test idle edges are dropped unless an endpoint would be isolated."""
+        topo = create_topology("mesh", ["a", "b", "c"])
+        policy = InteractionRewiringPolicy(drop_after=2)
+        talk = [Message(sender_id="a", receiver_id="b", content="hi")]
+
+        policy.rewire(topo, talk, step=1)
+        delta = policy.rewire(topo, talk, step=3)
+        delta.apply(topo)
+
+        assert topo.can_communicate("a", "b")
+        assert len(delta.removed) == 1
+        assert all(topo.get_neighbors(node) for node in ["a", "b", "c"])
+
+    def test_empty_delta(self):
+        """Test an empty delta is falsy and applies cleanly."""
+        topo = create_topology("mesh", ["a", "b"])
+        before = topo.fingerprint()
+
+        TopologyDelta().apply(topo)
+
+        assert not TopologyDelta()
+        assert topo.fingerprint() == before
@@ -262,3 +262,108 @@ class TestGraphAnalysis:
         assert "a" in all_nodes
         assert "b" in all_nodes
         assert "c" in all_nodes
+
+
+class TestRoutingTable:
+    """Tests for the compiled routing table."""
+
+    def test_recipients_sorted(self):
+        """Test recipients are returned in sorted order."""
+        mesh = MeshTopology()
+        mesh.build(["c", "a", "d", "b"])
+
+        for mode in RoutingMode:
+            graph = TopologyGraph(mesh, mode)
+            assert graph.get_valid_recipients("c") == ["a", "b", "d"]
+
+    def test_recompiled_after_mutation(self):
+        """Test routing reflects edges added after the first query."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+        graph = TopologyGraph(hub, RoutingMode.DIRECT_ONLY)
+
+        assert not graph.can_send_message("s1", "s2")
+        hub.add_edge("s1", "s2")
+        assert graph.can_send_message("s1", "s2")
+        assert graph.get_valid_recipients("s1") == ["center", "s2"]
+
+        hub.remove_edge("s1", "s2")
+        assert not graph.can_send_message("s1", "s2")
+
+    def test_recompiled_after_direct_graph_edit(self):
+        """Test edits made directly on the NetworkX graph are noticed."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+        graph = TopologyGraph(hub, RoutingMode.DIRECT_ONLY)
+
+        assert not graph.can_send_message("s1", "s2")
+        hub.graph.add_edge("s1", "s2")
+        assert graph.can_send_message("s1", "s2")
+
+    def test_direct_edit_noticed_without_networkx_cache(self):
+        """Test direct edits are noticed on NetworkX without __networkx_cache__."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+        del hub.graph.__networkx_cache__
+        graph = TopologyGraph(hub, RoutingMode.DIRECT_ONLY)
+
+        assert not graph.can_send_message("s1", "s2")
+        hub.graph.add_edge("s1", "s2")
+        assert graph.can_send_message("s1", "s2")
+
+    def test_recompiled_after_mode_change(self):
+        """Test changing routing mode recompiles the table."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+        graph = TopologyGraph(hub, RoutingMode.DIRECT_ONLY)
+
+        assert not graph.can_send_message("s1", "s2")
+        graph.routing_mode = RoutingMode.MULTI_HOP
+        assert graph.can_send_message("s1", "s2")
+
+    def test_multi_hop_disconnected(self):
+        """Test multi-hop respects connected components."""
+        topo = create_topology(
+            "custom", ["a", "b", "c", "d"], edges=[("a", "b"), ("c", "d")]
+        )
+        graph = TopologyGraph(topo, RoutingMode.MULTI_HOP)
+
+        assert graph.can_send_message("a", "b")
+        assert not graph.can_send_message("a", "c")
+        assert graph.get_valid_recipients("c") == ["d"]
+
+    def test_directed_multi_hop_matches_networkx(self):
+        """Test directed reachability agrees with nx.has_path."""
+        import networkx as nx
+
+        random_graph = nx.gnp_random_graph(30, 0.06, seed=4, directed=True)
+        random_graph = nx.relabel_nodes(random_graph, {i: f"n{i:02d}" for i in random_graph})
+        topo = create_topology("custom", list(random_graph.nodes()), directed=True, graph=random_graph)
+        graph = TopologyGraph(topo, RoutingMode.MULTI_HOP)
+
+        for source in random_graph.nodes():
+            expected = sorted(
+                n for n in random_graph.nodes()
+                if n != source and nx.has_path(random_graph, source, n)
+            )
+            assert graph.get_valid_recipients(source) == expected
+
+    def test_adjacency_matrix(self):
+        """Test boolean adjacency matrix matches edges."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+        table = TopologyGraph(hub).routing_table
+
+        matrix = table.adjacency_matrix
+        center, s1, s2 = (table.index[n] for n in ("center", "s1", "s2"))
+        assert matrix[center, s1] and matrix[s1, center]
+        assert not matrix[s1, s2]
+
+    def test_unknown_sender(self):
+        """Test unknown agents have no recipients outside broadcast."""
+        mesh = MeshTopology()
+        mesh.build(["a", "b"])
+
+        assert TopologyGraph(mesh, RoutingMode.DIRECT_ONLY).get_valid_recipients("x") == []
+        assert TopologyGraph(mesh, RoutingMode.MULTI_HOP).get_valid_recipients("x") == []
+        assert TopologyGraph(mesh, RoutingMode.BROADCAST).get_valid_recipients("x") == ["a", "b"]
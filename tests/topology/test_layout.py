@@ -0,0 +1,143 @@
+"""Tests for server-side topology layouts."""
+
+import numpy as np
+import pytest
+
+from agentworld.topology.layout import LayoutConfig, LayoutEngine, spectral_positions
+from agentworld.topology.sparse import SparseTopology
+from agentworld.topology.types import create_topology
+
+
+AGENTS = [f"agent_{i:03d}" for i in range(120)]
+
+
+def _edge_lengths(layout, topology) -> np.ndarray:
+    """Distances between the endpoints of every edge."""
+    return np.array([
+        np.linalg.norm(
+            layout.positions[layout.index[u]] - layout.positions[layout.index[v]]
+        )
+        for u, v in topology.get_all_edges()
+    ])
+
+
+class TestLayoutComputation:
+    """Tests for full layouts."""
+
+    @pytest.mark.parametrize("algorithm", ["force", "spectral"])
+    def test_neighbors_are_placed_close(self, algorithm):
+        """Test edges are much shorter than the average node distance."""
+        topo = create_topology("small_world", AGENTS, k=4, p=0.05)
+        layout = LayoutEngine(topo, LayoutConfig(algorithm=algorithm)).get_layout()
+
+        assert layout.positions.shape == (120, 2)
+        assert np.isfinite(layout.positions).all()
+        assert np.abs(layout.positions).max() == pytest.approx(1.0)
+
+        rng = np.random.default_rng(0)
+        pairs = rng.integers(0, 120, (500, 2))
+        spread = np.linalg.norm(
+            layout.positions[pairs[:, 0]] - layout.positions[pairs[:, 1]], axis=1
+        ).mean()
+        assert _edge_lengths(layout, topo).mean() < spread / 2
+
+    def test_layout_is_reproducible(self):
+        """Test the same seed gives the same positions."""
+        topo = create_topology("hub_spoke", AGENTS[:30])
+
+        a = LayoutEngine(topo).get_layout().positions
+        b = LayoutEngine(topo).get_layout().positions
+
+        np.testing.assert_allclose(a, b)
+
+    def test_sampled_repulsion_on_large_graphs(self):
+        """Test large graphs use sampled repulsion and stay finite."""
+        topo = SparseTopology.create("scale_free", AGENTS, seed=1)
+        layout = LayoutEngine(topo, LayoutConfig(exact_max_nodes=50)).get_layout()
+
+        assert layout.approximate
+        assert np.isfinite(layout.positions).all()
+
+    def test_spectral_separates_components(self):
+        """Test spectral positions keep two cliques apart."""
+        src = np.array([0, 0, 1, 3, 3, 4])
+        dst = np.array([1, 2, 2, 4, 5, 5])
+        positions = spectral_positions(6, src, dst)
+
+        first, second = positions[:3].mean(axis=0), positions[3:].mean(axis=0)
+        assert np.linalg.norm(first - second) > 0.5
+
+    def test_unknown_algorithm(self):
+        """Test unknown algorithms are rejected."""
+        topo = create_topology("mesh", ["a", "b"])
+
+        with pytest.raises(ValueError):
+            LayoutEngine(topo, LayoutConfig(algorithm="circle")).get_layout()
+
+
+class TestIncrementalLayout:
+    """Tests for layout updates after topology edits."""
+
+    def test_cached_until_topology_changes(self):
+        """Test the layout is reused while the topology is unchanged."""
+        topo = create_topology("mesh", AGENTS[:10])
+        engine = LayoutEngine(topo)
+
+        assert engine.get_layout() is engine.get_layout()
+
+    def test_only_touched_nodes_move(self):
+        """Test edits re-settle only the changed edges' endpoints."""
+        topo = create_topology("small_world", AGENTS, k=4, p=0.05)
+        engine = LayoutEngine(topo)
+        before = engine.get_layout()
+
+        topo.add_edge(AGENTS[0], AGENTS[60])
+        topo.add_edge(AGENTS[5], "newcomer")
+        after = engine.get_layout()
+
+        assert after.version == before.version + 1
+        assert engine.changed_since(before.version) == {
+            AGENTS[0], AGENTS[60], AGENTS[5], "newcomer"
+        }
+        for node in AGENTS[10:50]:
+            assert after.position_of(node) == before.position_of(node)
+        assert after.position_of("newcomer") is not None
+
+    def test_removed_nodes_reported(self):
+        """Test removed nodes appear in the changed set."""
+        topo = create_topology("mesh", AGENTS[:10])
+        engine = LayoutEngine(topo)
+        version = engine.get_layout().version
+
+        topo.remove_node(AGENTS[3])
+
+        assert AGENTS[3] in engine.changed_since(version)
+        assert engine.get_layout().position_of(AGENTS[3]) is None
+
+    def test_direct_edits_force_full_layout(self):
+        """Test unknown changes make clients fetch the full layout."""
+        topo = create_topology("mesh", AGENTS[:10])
+        engine = LayoutEngine(topo)
+        version = engine.get_layout().version
+
+        topo.graph.remove_edge(AGENTS[0], AGENTS[1])
+
+        assert engine.changed_since(version) is None
+
+
+class TestCommunityView:
+    """Tests for the community-collapsed view."""
+
+    def test_collapses_cliques(self):
+        """Test two loosely joined cliques collapse to two communities."""
+        left = [f"l{i}" for i in range(6)]
+        right = [f"r{i}" for i in range(6)]
+        edges = [(a, b) for group in (left, right) for a in group for b in group if a < b]
+        topo = create_topology("custom", left + right, edges=edges + [("l0", "r0")])
+
+        view = LayoutEngine(topo).community_view()
+
+        assert sorted(map(sorted, view.communities)) == [sorted(left), sorted(right)]
+        assert view.edges == [(0, 1, 1)]
+        assert view.positions.shape == (2, 2)
+        assert view.to_dict()["communities"][0]["size"] == 6
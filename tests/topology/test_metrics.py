@@ -1,6 +1,7 @@
 """Tests for TopologyAnalyzer and network metrics."""
 
 import pytest
+import networkx as nx
 
 from agentworld.topology.metrics import TopologyAnalyzer, CentralityMetrics
 from agentworld.topology.types import MeshTopology, HubSpokeTopology, create_topology
@@ -234,3 +235,186 @@ class TestToSummary:
         assert "Nodes" in summary
         assert "Edges" in summary
         assert "Density" in summary
+
+
+class TestMetricsCaching:
+    """Tests for version-keyed metric caching."""
+
+    def test_topology_metrics_cached(self):
+        """Test get_metrics reuses results until the topology changes."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2"])
+
+        first = hub.get_metrics()
+        assert hub.get_metrics() is first
+
+        hub.add_edge("s1", "s2")
+        updated = hub.get_metrics()
+        assert updated is not first
+        assert updated.edge_count == 3
+
+    def test_config_change_invalidates(self):
+        """Test changing accuracy settings recomputes metrics."""
+        mesh = MeshTopology()
+        mesh.build(["a", "b", "c"])
+        first = mesh.get_metrics()
+
+        mesh.metrics_config.exact_max_nodes = 1
+        assert mesh.get_metrics() is not first
+
+    def test_centrality_invalidated_by_mutation(self):
+        """Test centrality is recomputed after edges change."""
+        hub = HubSpokeTopology()
+        hub.build(["center", "s1", "s2", "s3"])
+        analyzer = TopologyAnalyzer(hub)
+
+        before = analyzer.get_centrality()
+        hub.add_edge("s1", "s2")
+        after = analyzer.get_centrality()
+
+        assert after is not before
+        assert after.degree["s1"] > before.degree["s1"]
+
+
+class TestApproximateMetrics:
+    """Tests for sampled metrics on large graphs."""
+
+    def _small_world(self, n: int = 300):
+        graph = nx.connected_watts_strogatz_graph(n, 6, 0.1, seed=1)
+        return create_topology("custom", [], graph=nx.relabel_nodes(graph, str))
+
+    def test_sampled_path_metrics_close_to_exact(self):
+        """Test sampled path length and diameter bound are close to exact."""
+        topology = self._small_world()
+        exact = topology.get_metrics()
+        assert not exact.approximate
+
+        topology.metrics_config.exact_max_nodes = 100
+        topology.metrics_config.path_samples = 64
+        approx = topology.get_metrics()
+
+        assert approx.approximate
+        assert approx.avg_path_length == pytest.approx(exact.avg_path_length, rel=0.1)
+        assert exact.diameter - 1 <= approx.diameter <= exact.diameter
+        assert approx.to_dict()["approximate"] is True
+
+    def test_sampled_centrality(self):
+        """Test pivot-sampled centrality ranks hubs like the exact version."""
+        topology = create_topology(
+            "custom",
+            [],
+            graph=nx.relabel_nodes(nx.barabasi_albert_graph(300, 2, seed=3), str),
+        )
+        exact = TopologyAnalyzer(topology).get_centrality()
+
+        topology.metrics_config.exact_max_nodes = 100
+        topology.metrics_config.centrality_samples = 100
+        approx = TopologyAnalyzer(topology).get_centrality()
+
+        assert approx.approximate and not exact.approximate
+        top_exact = set(sorted(exact.betweenness, key=exact.betweenness.get)[-5:])
+        top_approx = set(sorted(approx.betweenness, key=approx.betweenness.get)[-10:])
+        assert top_exact & top_approx
+        for node in ("0", "1", "150"):
+            assert approx.closeness[node] == pytest.approx(exact.closeness[node], rel=0.15)
+
+
+class TestRandomBaseline:
+    """Tests for Erdos-Renyi baselines."""
+
+    def test_sampled_baseline_is_deterministic(self):
+        """Test the same seed gives the same baseline, serial or parallel."""
+        from agentworld.topology.metrics import _baseline_cache, random_baseline
+
+        serial = random_baseline(250, 1500, num_samples=4, seed=11, max_workers=1)
+        _baseline_cache.clear()
+        parallel = random_baseline(250, 1500, num_samples=4, seed=11, max_workers=2)
+
+        assert serial == parallel
+        assert serial.samples == 4
+
+    def test_baseline_cached(self):
+        """Test repeated requests reuse the cached baseline."""
+        from agentworld.topology.metrics import random_baseline
+
+        first = random_baseline(30, 90, num_samples=3, seed=5)
+        assert random_baseline(30, 90, num_samples=3, seed=5) is first
+
+    def test_baseline_cache_bounded(self, monkeypatch):
+        """Test the cache evicts the least recently used baselines."""
+        from agentworld.topology import metrics
+
+        monkeypatch.setattr(metrics, "BASELINE_CACHE_SIZE", 2)
+        metrics._baseline_cache.clear()
+
+        first = metrics.random_baseline(10, 20, method="analytical")
+        metrics.random_baseline(11, 20, method="analytical")
+        assert metrics.random_baseline(10, 20, method="analytical") is first
+        metrics.random_baseline(12, 20, method="analytical")
+
+        assert len(metrics._baseline_cache) == 2
+        assert (11, 20, False, 0, "analytical", 0, None) not in metrics._baseline_cache
+
+    def test_worker_pool_reused(self):
+        """Test parallel baselines share one lazily created pool."""
+        from agentworld.topology import metrics
+
+        try:
+            metrics.random_baseline(250, 1500, num_samples=2, seed=21, max_workers=2)
+            pool = metrics._baseline_pool
+            metrics.random_baseline(250, 1500, num_samples=2, seed=22, max_workers=2)
+
+            assert pool is not None
+            assert metrics._baseline_pool is pool
+        finally:
+            metrics.shutdown_baseline_pool()
+
+    def test_broken_pool_falls_back_to_serial(self, monkeypatch):
+        """Test a broken worker pool is dropped and samples run in-process."""
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import MagicMock
+
+        from agentworld.topology import metrics
+
+        broken = MagicMock()
+        broken.map.side_effect = BrokenProcessPool("worker died")
+        monkeypatch.setattr(metrics, "_baseline_pool", broken)
+        monkeypatch.setattr(metrics, "_baseline_pool_workers", 2)
+
+        baseline = metrics.random_baseline(250, 1500, num_samples=2, seed=23, max_workers=2)
+        metrics._baseline_cache.clear()
+
+        assert baseline == metrics.random_baseline(250, 1500, num_samples=2, seed=23, max_workers=1)
+        broken.shutdown.assert_called_once()
+        assert metrics._baseline_pool is None
+
+    def test_analytical_close_to_sampled(self):
+        """Test closed-form estimates approximate sampled means."""
+        from agentworld.topology.metrics import random_baseline
+
+        sampled = random_baseline(300, 3000, num_samples=5, seed=1, max_workers=1)
+        analytical = random_baseline(300, 3000, method="analytical")
+
+        assert analytical.clustering == pytest.approx(sampled.clustering, rel=0.2)
+        assert analytical.path_length == pytest.approx(sampled.path_length, rel=0.1)
+
+    def test_unknown_method(self):
+        """Test unknown baseline methods are rejected."""
+        from agentworld.topology.metrics import random_baseline
+
+        with pytest.raises(ValueError):
+            random_baseline(10, 20, method="guess")
+
+    def test_small_world_index(self):
+        """Test a small-world graph scores above 1."""
+        graph = nx.connected_watts_strogatz_graph(200, 8, 0.05, seed=2)
+        topology = create_topology("custom", [], graph=nx.relabel_nodes(graph, str))
+
+        result = TopologyAnalyzer(topology).compare_to_random(
+            num_samples=3, max_workers=1
+        )
+        analytical = TopologyAnalyzer(topology).compare_to_random(method="analytical")
+
+        assert result["small_world_index"] > 1
+        assert analytical["small_world_index"] > 1
+        assert analytical["random_method"] == "analytical"
@@ -0,0 +1,195 @@
+"""Tests for the array-backed SparseTopology."""
+
+import pytest
+import networkx as nx
+
+from agentworld.topology.base import RoutingMode
+from agentworld.topology.graph import TopologyGraph
+from agentworld.topology.sparse import SparseTopology
+from agentworld.topology.types import create_topology
+
+
+AGENTS = [f"agent_{i:02d}" for i in range(40)]
+
+TYPES = [
+    ("mesh", {}),
+    ("hub_spoke", {}),
+    ("hierarchical", {"branching_factor": 3}),
+    ("small_world", {"k": 4, "p": 0.3}),
+    ("scale_free", {"m": 2}),
+]
+
+
+def _reference(sparse: SparseTopology, directed: bool):
+    """NetworkX-backed topology with the same edges."""
+    return create_topology("custom", AGENTS, directed=directed, graph=sparse.to_networkx())
+
+
+class TestSparseBuild:
+    """Tests for generating topologies into CSR form."""
+
+    @pytest.mark.parametrize("topology_type,kwargs", TYPES)
+    def test_edge_counts_match_networkx(self, topology_type, kwargs):
+        """Test deterministic types match their NetworkX counterparts."""
+        sparse = SparseTopology.create(topology_type, AGENTS, seed=1, **kwargs)
+        dense = create_topology(topology_type, AGENTS, **kwargs)
+
+        assert sparse.topology_type == topology_type
+        assert sorted(sparse.get_all_nodes()) == sorted(dense.get_all_nodes())
+        assert sparse.graph.number_of_edges() == dense.graph.number_of_edges()
+
+    def test_hub_spoke_structure(self):
+        """Test hub connects to every spoke and spokes only to the hub."""
+        sparse = SparseTopology.create("hub_spoke", ["a", "b", "c"], hub_id="b")
+
+        assert sorted(sparse.get_neighbors("b")) == ["a", "c"]
+        assert sparse.get_neighbors("a") == ["b"]
+
+    def test_seeded_builds_are_reproducible(self):
+        """Test the same seed produces the same edges."""
+        a = SparseTopology.create("scale_free", AGENTS, seed=7)
+        b = SparseTopology.create("scale_free", AGENTS, seed=7)
+
+        assert a.get_all_edges() == b.get_all_edges()
+
+    def test_small_world_has_no_duplicates_or_loops(self):
+        """Test rewiring never produces self-loops or parallel edges."""
+        sparse = SparseTopology.create("small_world", AGENTS, k=6, p=1.0, seed=3)
+
+        edges = sparse.get_all_edges()
+        assert all(u != v for u, v in edges)
+        assert len({frozenset(e) for e in edges}) == len(edges) == 40 * 3
+
+    def test_create_topology_backend(self):
+        """Test the factory builds sparse topologies on request."""
+        topo = create_topology("mesh", ["a", "b", "c"], backend="sparse")
+
+        assert isinstance(topo, SparseTopology)
+        with pytest.raises(ValueError):
+            create_topology("mesh", ["a"], backend="nope")
+
+
+class TestSparseQueries:
+    """Tests for array-based queries against NetworkX results."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    @pytest.mark.parametrize("topology_type,kwargs", TYPES)
+    def test_metrics_match_networkx(self, topology_type, kwargs, directed):
+        """Test metrics agree with the NetworkX implementation."""
+        sparse = SparseTopology.create(topology_type, AGENTS, directed=directed, seed=2, **kwargs)
+        expected = _reference(sparse, directed).get_metrics().to_dict()
+        actual = sparse.get_metrics().to_dict()
+
+        for key, value in expected.items():
+            if isinstance(value, float):
+                assert actual[key] == pytest.approx(value), key
+            else:
+                assert actual[key] == value, key
+
+    def test_shortest_path(self):
+        """Test paths are valid and of minimal length."""
+        sparse = SparseTopology.create("small_world", AGENTS, k=4, p=0.2, seed=5)
+        graph = sparse.to_networkx()
+
+        path = sparse.get_shortest_path(AGENTS[0], AGENTS[20])
+        assert path[0] == AGENTS[0] and path[-1] == AGENTS[20]
+        assert len(path) == nx.shortest_path_length(graph, AGENTS[0], AGENTS[20]) + 1
+        assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:]))
+        assert sparse.get_shortest_path(AGENTS[0], AGENTS[0]) == [AGENTS[0]]
+        assert sparse.get_shortest_path(AGENTS[0], "missing") is None
+
+    def test_directed_reachability(self):
+        """Test one-way edges limit reachability."""
+        sparse = SparseTopology(directed=True)
+        sparse.build(["a", "b", "c"], edges=[("a", "b"), ("b", "c")])
+
+        assert sparse.can_reach("a", "c")
+        assert not sparse.can_reach("c", "a")
+        assert sparse.can_communicate("a", "b")
+        assert not sparse.can_communicate("b", "a")
+        assert sparse.get_shortest_path("c", "a") is None
+
+    def test_directed_graph_into_undirected_topology(self):
+        """Test a DiGraph source is symmetrised for an undirected topology."""
+        graph = nx.DiGraph([("a", "b"), ("b", "c")])
+        sparse = SparseTopology()
+        sparse.build(["a", "b", "c"], graph=graph)
+
+        assert sorted(sparse.get_neighbors("b")) == ["a", "c"]
+        assert sparse.get_metrics().edge_count == 2
+        assert sparse.can_communicate("b", "a")
+
+    def test_undirected_graph_into_directed_topology(self):
+        """Test an undirected source gives both directions when directed."""
+        sparse = SparseTopology(directed=True)
+        sparse.build(["a", "b"], graph=nx.Graph([("a", "b")]))
+
+        assert sparse.can_communicate("a", "b")
+        assert sparse.can_communicate("b", "a")
+
+    def test_disconnected_metrics(self):
+        """Test path metrics are skipped for disconnected graphs."""
+        sparse = SparseTopology()
+        sparse.build(["a", "b", "c", "d"], edges=[("a", "b"), ("c", "d")])
+
+        metrics = sparse.get_metrics()
+        assert not metrics.is_connected
+        assert metrics.avg_path_length is None
+
+
+class TestSparseInterop:
+    """Tests for lazy NetworkX conversion and mutation."""
+
+    def test_queries_do_not_materialise_graph(self):
+        """Test native queries work without building a NetworkX graph."""
+        sparse = SparseTopology.create("scale_free", AGENTS, seed=0)
+
+        sparse.get_neighbors(AGENTS[0])
+        sparse.can_reach(AGENTS[0], AGENTS[-1])
+        sparse.get_metrics()
+        TopologyGraph(sparse, RoutingMode.DIRECT_ONLY).get_valid_recipients(AGENTS[0])
+
+        assert sparse._graph is None
+
+    def test_mutations_resync_arrays(self):
+        """Test edits through the Topology API update the arrays."""
+        sparse = SparseTopology.create("hub_spoke", ["hub", "s1", "s2"])
+        before = sparse.fingerprint()
+
+        sparse.add_edge("s1", "s2")
+        assert sparse.can_communicate("s1", "s2")
+        assert sparse.get_metrics().edge_count == 3
+        assert sparse.fingerprint() != before
+
+        sparse.remove_node("hub")
+        assert sparse.get_all_nodes() == ["s1", "s2"]
+
+    def test_routing_table_sees_mutations(self):
+        """Test TopologyGraph recompiles after sparse topology edits."""
+        sparse = SparseTopology.create("hub_spoke", ["hub", "s1", "s2"])
+        graph = TopologyGraph(sparse, RoutingMode.DIRECT_ONLY)
+
+        assert not graph.can_send_message("s1", "s2")
+        sparse.add_edge("s1", "s2")
+        assert graph.can_send_message("s1", "s2")
+
+    def test_direct_edits_to_materialised_graph(self):
+        """Test edits made on the materialised graph reach the arrays."""
+        sparse = SparseTopology.create("hub_spoke", ["hub", "s1", "s2"])
+        graph = TopologyGraph(sparse, RoutingMode.DIRECT_ONLY)
+        assert not graph.can_send_message("s1", "s2")
+
+        sparse.graph.add_edge("s1", "s2")
+
+        assert graph.can_send_message("s1", "s2")
+        assert sparse.get_metrics().edge_count == 3
+
+    def test_to_dict_round_trip(self):
+        """Test serialisation matches the NetworkX-backed format."""
+        sparse = SparseTopology.create("hierarchical", AGENTS[:7], branching_factor=2)
+        data = sparse.to_dict()
+
+        assert data["type"] == "hierarchical"
+        assert len(data["edges"]) == 6
+        restored = SparseTopology.from_dict(data)
+        assert restored.graph.number_of_edges() == 6
@@ -5,6 +5,9 @@ import { cn } from '@/lib/utils'
 // Threshold for hiding labels (show only on hover when exceeded)
 const LABEL_THRESHOLD = 20
 
+// Above this many agents, link particles are disabled
+const PARTICLE_THRESHOLD = 200
+
 export interface Agent {
   id: string
   name: string
@@ -25,6 +28,9 @@ export interface Message {
 export interface TopologyGraphProps {
   agents: Agent[]
   messages: Message[]
+  // Precomputed positions from the server; pins nodes and skips the
+  // in-browser force simulation
+  positions?: Record<string, [number, number]>
   selectedAgentId?: string
   onAgentSelect?: (agentId: string) => void
   width?: number
@@ -75,6 +81,7 @@ function getAgentColor(name: string): string {
 export const TopologyGraph = memo(function TopologyGraph({
   agents,
   messages,
+  positions,
   selectedAgentId,
   onAgentSelect,
   width = 400,
@@ -102,14 +109,24 @@ export const TopologyGraph = memo(function TopologyGraph({
 
   // Build graph data
   const graphData = useMemo(() => {
-    const nodes: GraphNode[] = agents.map((agent) => ({
-      id: agent.id,
-      name: agent.name,
-      color: getAgentColor(agent.name),
-      messageCount: agentMessageCounts.get(agent.id) || 0,
-      isSelected: agent.id === selectedAgentId,
-      isHovered: agent.id === hoveredNodeId,
-    }))
+    // Server positions are in [-1, 1]; spread them out with the graph size
+    const layoutScale = Math.max(200, Math.sqrt(agents.length) * 20)
+
+    const nodes: GraphNode[] = agents.map((agent) => {
+      const position = positions?.[agent.id]
+      return {
+        id: agent.id,
+        name: agent.name,
+        color: getAgentColor(agent.name),
+        messageCount: agentMessageCounts.get(agent.id) || 0,
+        isSelected: agent.id === selectedAgentId,
+        isHovered: agent.id === hoveredNodeId,
+        ...(position && {
+          fx: position[0] * layoutScale,
+          fy: position[1] * layoutScale,
+        }),
+      }
+    })
 
     // Build edges from message flow
     const linkMap = new Map<string, GraphLink>()
@@ -140,7 +157,7 @@ export const TopologyGraph = memo(function TopologyGraph({
     const links = Array.from(linkMap.values())
 
     return { nodes, links }
-  }, [agents, messages, selectedAgentId, hoveredNodeId, agentMessageCounts])
+  }, [agents, messages, positions, selectedAgentId, hoveredNodeId, agentMessageCounts])
 
   // Node rendering
   const nodeCanvasObject = useCallback(
@@ -353,10 +370,10 @@ export const TopologyGraph = memo(function TopologyGraph({
         onNodeClick={handleNodeClick}
         onNodeHover={handleNodeHover}
         nodeRelSize={8}
-        linkDirectionalParticles={2}
+        linkDirectionalParticles={agents.length > PARTICLE_THRESHOLD ? 0 : 2}
         linkDirectionalParticleWidth={2}
         linkDirectionalParticleSpeed={0.005}
-        cooldownTicks={100}
+        cooldownTicks={positions ? 0 : 100}
         onEngineStop={() => graphRef.current?.zoomToFit(200)}
         enableNodeDrag={true}
         enableZoomInteraction={true}
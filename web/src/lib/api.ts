@@ -72,6 +72,18 @@ export interface Message {
   timestamp: string | null
 }
 
+export interface TopologyLayout {
+  simulation_id: string
+  algorithm: string
+  version: number
+  full: boolean
+  approximate: boolean
+  node_count: number
+  positions: Record<string, [number, number]>
+  removed: string[]
+  edges: Array<{ source: string; target: string }> | null
+}
+
 export interface Persona {
   id: string
   name: string
@@ -226,6 +238,20 @@ export const api = {
     )
   },
 
+  // Topology
+  getTopologyLayout: async (
+    simulationId: string,
+    params?: { algorithm?: string; since?: number }
+  ) => {
+    const searchParams = new URLSearchParams()
+    if (params?.algorithm) searchParams.set('algorithm', params.algorithm)
+    if (params?.since !== undefined) searchParams.set('since', params.since.toString())
+    const query = searchParams.toString()
+    return request<TopologyLayout>(
+      `/simulations/${simulationId}/topology/layout${query ? `?${query}` : ''}`
+    )
+  },
+
   // Personas
   getPersonas: async (params?: { occupation?: string; limit?: number }) => {
     const searchParams = new URLSearchParams()
@@ -240,7 +266,7 @@ export const api = {
   searchPersonas: async (query: string, limit?: number) => {
     const searchParams = new URLSearchParams({ q: query })
     if (limit) searchParams.set('limit', limit.toString())
-    return request<{ personas: Persona[]; total: number }>(
+    return request<{ personas: Persona[]; total: number; facets: Record<string, number> }>(
       `/personas/search?${searchParams.toString()}`
     )
   },
@@ -21,7 +21,7 @@ import {
   Tooltip,
 } from '@/components/ui'
 import { formatDate, formatCurrency } from '@/lib/utils'
-import { api } from '@/lib/api'
+import { api, type TopologyLayout } from '@/lib/api'
 import {
   useRealtimeStore,
   useIsConnected,
@@ -89,6 +89,21 @@ export default function SimulationDetail() {
     enabled: !!id,
   })
 
+  // Server-side layout; later fetches only return nodes that moved
+  const { data: layout } = useQuery({
+    queryKey: ['simulation', id, 'layout'],
+    queryFn: async () => {
+      const previous = queryClient.getQueryData<TopologyLayout>(['simulation', id, 'layout'])
+      const next = await api.getTopologyLayout(id!, { since: previous?.version })
+      if (next.full || !previous) return next
+      const positions = { ...previous.positions, ...next.positions }
+      for (const nodeId of next.removed) delete positions[nodeId]
+      return { ...next, positions, edges: previous.edges }
+    },
+    enabled: !!id,
+    refetchInterval: isSimulationRunning ? 2000 : false,
+  })
+
   // Fetch memories for selected agent
   const { data: memoriesData, refetch: refetchMemories } = useQuery({
     queryKey: ['simulation', id, 'agent', selectedAgentId, 'memories'],
@@ -338,6 +353,7 @@ export default function SimulationDetail() {
               <TopologyGraph
                 agents={agentsList}
                 messages={messages}
+                positions={layout?.positions}
                 selectedAgentId={selectedAgentId || undefined}
                 onAgentSelect={handleAgentSelect}
                 width={isGraphExpanded ? 800 : 320}
@@ -21,6 +21,7 @@ export type SimulationEventType =
   | 'agent.responded'
   | 'message.created'
   | 'memory.created'
+  | 'events.dropped'
 
 // Event payload interfaces
 export interface BaseEvent {
@@ -73,6 +74,12 @@ export interface SimulationErrorEvent extends BaseEvent {
   error: string
 }
 
+// Sent to a lagging client in place of events it was too slow to receive
+export interface EventsDroppedEvent extends BaseEvent {
+  type: 'events.dropped'
+  dropped: Record<string, number>
+}
+
 export type SimulationEvent =
   | BaseEvent
   | StepEvent
@@ -81,6 +88,13 @@ export type SimulationEvent =
   | MessageCreatedEvent
   | SimulationCompletedEvent
   | SimulationErrorEvent
+  | EventsDroppedEvent
+
+// Several events coalesced into one WebSocket frame
+export interface BatchFrame {
+  type: 'batch'
+  events: SimulationEvent[]
+}
 
 // Live message type for real-time display
 export interface LiveMessage {
@@ -204,7 +218,7 @@ export const useRealtimeStore = create<RealtimeStore>()(
 
         ws.onmessage = (event) => {
           try {
-            const data = JSON.parse(event.data) as SimulationEvent
+            const data = JSON.parse(event.data) as SimulationEvent | BatchFrame
 
             // Handle ping/pong keepalive
             if (data.type === 'ping') {
@@ -212,7 +226,10 @@ export const useRealtimeStore = create<RealtimeStore>()(
               return
             }
 
-            get().handleEvent(data)
+            const events = data.type === 'batch' ? (data as BatchFrame).events : [data as SimulationEvent]
+            for (const item of events) {
+              get().handleEvent(item)
+            }
           } catch (e) {
             console.error('Failed to parse WebSocket message:', event.data, e)
           }
@@ -67,7 +67,9 @@ export const useSimulationStore = create<SimulationState>((set, get) => ({
     ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data)
-        get().addEvent(data)
+        // Events may arrive coalesced into one batch frame
+        const events: SimulationEvent[] = data.type === 'batch' ? data.events : [data]
+        events.forEach((item) => get().addEvent(item))
       } catch {
         console.error('Failed to parse WebSocket message:', event.data)
       }